@@ -0,0 +1,25 @@
+// One token of the backend's structured token report
+export interface Token {
+  type: string
+  value: string | number
+  line: number // 1-based index into the response's sourceLines
+  col: number
+}
+
+// The backend sends one list per field; entry i of each list is token i
+export interface TokenColumns {
+  type: string[]
+  value: (string | number)[]
+  line: number[]
+  col: number[]
+}
+
+export const tokensFromColumns = (columns: TokenColumns | null | undefined): Token[] => {
+  if (!columns) return []
+  return columns.type.map((type, i) => ({
+    type,
+    value: columns.value[i],
+    line: columns.line[i],
+    col: columns.col[i],
+  }))
+}
@@ -0,0 +1,866 @@
+"""Micro-benchmarks for the compiler pipeline.
+
+Run every benchmark with ``python benchmark.py`` or pick some by name,
+e.g. ``python benchmark.py lexer``.  The Gemini call is never made here;
+only the lexing, parsing and semantic stages are measured.  The programs
+come from ``tests/support.py``; the tests check what is timed here gives
+the same results as what it replaces.
+"""
+import concurrent.futures
+import contextlib
+import gc
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+
+import ply.yacc as yacc
+
+from proj.models.finallexer import Lexer
+from proj.models.parser import Parser, parser_pool
+from proj.models.regexlexer import RegexLexer
+from proj.models.line_index import LineIndex
+from proj.models.token_buffer import TokenBuffer
+from proj.models.parallel_lexer import ParallelLexer
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.syntax_tree import Node, NodeBuilder, to_json
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.parse_cache import ParseCache, footprint
+from proj.models.descent_parser import DescentParser
+from proj.models.table_parser import TableParser
+from proj.models.grammar_profile import GrammarProfile
+from proj.models.reparser import reparse
+from proj.models import bytecode, closure_compiler, vm
+from proj.models import tree_codec
+from proj.services.compiler_service import parse_document, parse_source
+from proj import config
+from proj.utilities import diagnostics
+from tests.grammars import RightRecursiveParser, UnrecoveringParser
+from tests.support import (
+    LOOP_PROGRAM, SAMPLE_PROGRAM, as_tuples, descent_result, generate_corpus, generate_program,
+    parse_result, parse_tree, profiled_parse, repeated_program, summed_line_columns, syntax_errors,
+)
+
+BENCHMARKS = {}
+
+def benchmark(func):
+    """Register a benchmark under its name without the ``bench_`` prefix"""
+    BENCHMARKS[func.__name__[len("bench_"):]] = func
+    return func
+
+
+def rate(func, seconds=1.0):
+    """Call func repeatedly for about `seconds` and return calls per second"""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def report(label, value, unit):
+    print(f"  {label:<40} {value:>12,.1f} {unit}")
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the pipeline's console output while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@benchmark
+def bench_lexer():
+    """Lexing stage of one request: token report plus the parser's token stream"""
+
+    def per_request_build():
+        Lexer().analyze_tokens(SAMPLE_PROGRAM)
+        lexer = Lexer().lexer
+        lexer.input(SAMPLE_PROGRAM)
+        for _ in lexer:
+            pass
+
+    def prebuilt_clone():
+        Lexer.prebuilt().analyze_tokens(SAMPLE_PROGRAM)
+        lexer = Lexer.prebuilt().lexer
+        lexer.input(SAMPLE_PROGRAM)
+        for _ in lexer:
+            pass
+
+    with quiet():
+        before = rate(per_request_build)
+        after = rate(prebuilt_clone)
+    report("Lexer() per request", before, "req/s")
+    report("Lexer.prebuilt() clone per request", after, "req/s")
+    report("speedup", after / before, "x")
+
+
+@benchmark
+def bench_parser():
+    """Parsing stage of one request: parser setup plus parse"""
+
+    def yacc_per_request():
+        lexer = Lexer.prebuilt().lexer
+        parser = yacc_parser(lexer)
+        parser.parse(SAMPLE_PROGRAM, lexer=lexer)
+
+    def pooled():
+        lexer = Lexer.prebuilt().lexer
+        with parser_pool.checkout(lexer) as parser:
+            parser.parser.parse(SAMPLE_PROGRAM, lexer=lexer)
+
+    with quiet():
+        parser_pool.warm()
+        before = rate(yacc_per_request)
+        after = rate(pooled)
+    report("yacc.yacc() per request", before, "req/s")
+    report("pooled parser checkout", after, "req/s")
+    report("speedup", after / before, "x")
+
+
+def yacc_parser(lexer):
+    """Build a parser the way every request used to: a full yacc.yacc() call"""
+    owner = object.__new__(Parser)
+    owner.lexer = lexer
+    owner.reset()
+    return yacc.yacc(module=owner)
+
+
+@benchmark
+def bench_lexer_engines():
+    """PLY lexer vs the single-regex engine on a large source"""
+    code = SAMPLE_PROGRAM * 500
+
+    def tokenize(engine):
+        lexer = engine.prebuilt().lexer
+        lexer.input(code)
+        for _ in lexer:
+            pass
+
+    with quiet():
+        ply_rate = rate(lambda: tokenize(Lexer), seconds=2.0)
+        regex_rate = rate(lambda: tokenize(RegexLexer), seconds=2.0)
+    megabytes = len(code) / 1e6
+    report("ply engine", ply_rate * megabytes, "MB/s")
+    report("regex engine", regex_rate * megabytes, "MB/s")
+    report("speedup", regex_rate / ply_rate, "x")
+
+
+def indexed_columns(tokens, code):
+    index = LineIndex(code)
+    return [index.column(tok.lexpos, tok.lineno) for tok in tokens]
+
+
+@benchmark
+def bench_line_index():
+    """Column resolution for every token: re-summing lines vs a LineIndex"""
+    lines_per_copy = SAMPLE_PROGRAM.count("\n")
+    for lines in (2_500, 5_000, 10_000):
+        code = SAMPLE_PROGRAM * (lines // lines_per_copy)
+        lexer = Lexer.prebuilt().lexer
+        lexer.input(code)
+        tokens = list(lexer)
+        before = rate(lambda: summed_line_columns(tokens, code), seconds=0.5)
+        after = rate(lambda: indexed_columns(tokens, code), seconds=0.5)
+        report(f"{lines:,} lines, summing earlier lines", 1000 / before, "ms")
+        report(f"{lines:,} lines, LineIndex", 1000 / after, "ms")
+
+
+def peak_allocated(run):
+    """Most bytes allocated at once while run() executes"""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def allocated(build):
+    """Bytes still allocated by the object build() returns"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+@benchmark
+def bench_token_memory():
+    """Memory held per token: LexToken objects and report strings vs a TokenBuffer"""
+    code = SAMPLE_PROGRAM * 500
+
+    def lex_tokens():
+        lexer = Lexer.prebuilt().lexer
+        lexer.input(code)
+        return list(lexer)
+
+    def lex_tokens_and_report():
+        return lex_tokens(), Lexer.prebuilt().analyze_tokens(code)
+
+    def token_buffer():
+        return TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+
+    count = len(token_buffer())
+    with quiet():
+        report_bytes = allocated(lex_tokens_and_report)
+    report(f"{len(code) / 1e6:.1f} MB source", count, "tokens")
+    report("LexToken list", allocated(lex_tokens) / count, "B/token")
+    report("LexToken list + analyze_tokens report", report_bytes / count, "B/token")
+    report("TokenBuffer", allocated(token_buffer) / count, "B/token")
+
+
+@benchmark
+def bench_incremental_lex():
+    """Re-lexing after a one-character edit: whole source vs TokenBuffer.edit"""
+    lexer = RegexLexer.prebuilt().lexer
+    for copies in (100, 500, 2500):
+        code = SAMPLE_PROGRAM * copies
+        buffer = TokenBuffer.from_lexer(lexer, code)
+        offset = code.index("total - 1", len(code) // 2)
+        edited = buffer.edit(offset, 5, "count", lexer)
+        before = rate(lambda: TokenBuffer.from_lexer(lexer, edited.source), seconds=0.5)
+        after = rate(lambda: buffer.edit(offset, 5, "count", lexer), seconds=0.5)
+        report(f"{len(code) / 1e6:.2f} MB source, full re-lex", 1e6 / before, "µs")
+        report(f"{len(code) / 1e6:.2f} MB source, TokenBuffer.edit", 1e6 / after, "µs")
+
+
+@benchmark
+def bench_token_report():
+    """Token part of the response: legacy strings vs structured columns, size and JSON encode time"""
+    for copies in (1, 50):
+        code = SAMPLE_PROGRAM * copies
+        line_index = LineIndex(code)
+        lexer = Lexer.prebuilt()
+        with quiet():
+            legacy = {"tokens": lexer.analyze_tokens(code, line_index)}
+        tokens, source_lines = TokenBuffer.from_lexer(lexer.lexer, code).report(line_index)
+        structured = {"tokens": tokens, "sourceLines": source_lines}
+        for label, fields in (("legacy", legacy), ("structured", structured)):
+            # jsonify sorts keys, so time the same encoding
+            encoded = json.dumps(fields, sort_keys=True)
+            report(f"{len(code) / 1e3:.0f} KB source, {label}", len(encoded) / 1e3, "KB")
+            encode_rate = rate(lambda: json.dumps(fields, sort_keys=True), seconds=0.5)
+            report(f"{len(code) / 1e3:.0f} KB source, {label} encode", 1e6 / encode_rate, "µs")
+
+
+@benchmark
+def bench_single_pass():
+    """Token report plus parse: lexing once for each vs one TokenBuffer for both"""
+    code = SAMPLE_PROGRAM * 20
+    line_index = LineIndex(code)
+
+    def lex_twice():
+        lexer = Lexer.prebuilt()
+        lexer.analyze_tokens(code, line_index)
+        lex = Lexer.prebuilt().lexer
+        with parser_pool.checkout(lex, line_index) as parser:
+            return parser.parser.parse(code, lexer=lex)
+
+    def lex_once():
+        buffer = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+        buffer.legacy_report(line_index)
+        lex = buffer.feeder()
+        with parser_pool.checkout(lex, line_index) as parser:
+            return parser.parser.parse(code, lexer=lex)
+
+    with quiet():
+        parser_pool.warm()
+        before = rate(lex_twice)
+        after = rate(lex_once)
+    report("lexing for report and parser separately", before, "req/s")
+    report("one TokenBuffer", after, "req/s")
+    report("speedup", after / before, "x")
+
+
+@benchmark
+def bench_stream():
+    """Lexing a file: reading it whole vs streaming it in chunks, peak memory and speed"""
+
+    def whole_file(path):
+        with open(path, encoding="utf-8", newline="") as source:
+            lexer = RegexLexer.prebuilt().lexer
+            lexer.input(source.read())
+            for _ in lexer:
+                pass
+
+    def streamed(path):
+        for _ in RegexLexer.prebuilt().stream(path):
+            pass
+
+    with tempfile.TemporaryDirectory() as directory:
+        for copies in (500, 2500, 12500):
+            path = os.path.join(directory, f"program_{copies}.apl")
+            with open(path, "w", encoding="utf-8", newline="") as source:
+                source.write(SAMPLE_PROGRAM * copies)
+            megabytes = os.path.getsize(path) / 1e6
+            for label, lex_file in (("whole file", whole_file), ("streamed", streamed)):
+                peak = peak_allocated(lambda: lex_file(path))
+                start = time.perf_counter()
+                lex_file(path)
+                speed = megabytes / (time.perf_counter() - start)
+                report(f"{megabytes:.1f} MB file, {label} peak", peak / 1e6, "MB")
+                report(f"{megabytes:.1f} MB file, {label}", speed, "MB/s")
+
+
+@benchmark
+def bench_parallel_lex():
+    """Lexing a large source with the Lexer rules in 1 to N worker processes"""
+    code = SAMPLE_PROGRAM * 5000 + generate_corpus(0, fragments=20000)
+    megabytes = len(code) / 1e6
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        with ParallelLexer(workers) as lexer, quiet():
+            lexer.lex(code[:ParallelLexer.min_chunk_size * workers])  # start the pool
+            start = time.perf_counter()
+            lexer.lex(code)
+            elapsed = time.perf_counter() - start
+        report(f"{megabytes:.1f} MB, {workers} worker(s)", megabytes / elapsed, "MB/s")
+    print(f"  {os.cpu_count()} CPU(s) available")
+
+
+@benchmark
+def bench_diagnostics():
+    """Token analysis with its trace disabled vs enabled, and the cost of a dropped message"""
+    code = SAMPLE_PROGRAM * 20
+    lexer = Lexer.prebuilt()
+    log = diagnostics.get_logger("benchmark")
+    with open(os.devnull, "w") as devnull:
+        diagnostics.configure(devnull)
+        with diagnostics.request_level(diagnostics.WARNING):
+            quiet_rate = rate(lambda: lexer.analyze_tokens(code))
+            dropped = rate(lambda: log.debug("token %s", code), seconds=0.5)
+        with diagnostics.request_level(diagnostics.DEBUG):
+            traced_rate = rate(lambda: lexer.analyze_tokens(code))
+    report("analyze_tokens, level warning", quiet_rate, "calls/s")
+    report("analyze_tokens, level debug", traced_rate, "calls/s")
+    report("dropped log.debug() call", 1e9 / dropped, "ns")
+
+
+@benchmark
+def bench_parser_lists():
+    """Parsing long statement lists: right-recursive (old) vs left-recursive grammar"""
+    per_copy = len(parse_result(Parser, repeated_program(1))[0].statements)
+    for statements in (12500, 25000, 50000):
+        code = repeated_program(statements // per_copy)
+        for label, parser_class in (("right recursive", RightRecursiveParser), ("left recursive", Parser)):
+            with quiet():
+                start = time.perf_counter()
+                tree, errors = parse_result(parser_class, code)
+                elapsed = time.perf_counter() - start
+            report(f"{len(tree.statements):,} statements, {label}", elapsed * 1e3, "ms")
+
+
+def tree_nodes(tree):
+    if isinstance(tree, Node):
+        yield tree
+        for name in tree.fields:
+            yield from tree_nodes(getattr(tree, name))
+    elif isinstance(tree, list):
+        for item in tree:
+            yield from tree_nodes(item)
+
+
+@benchmark
+def bench_syntax_tree():
+    """Syntax tree memory as tuples vs slotted nodes, and the per-request tree work"""
+    code = repeated_program(200)
+
+    def parse():
+        lex = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code).feeder()
+        with parser_pool.checkout(lex) as parser:
+            return parser.parser.parse(code, lexer=lex)
+
+    with quiet():
+        parser_pool.warm()
+        tree = parse()
+    nodes = list(tree_nodes(tree))
+    # The values the nodes and tuples share (names, literals, lists) are left out
+    tuple_bytes = sum(sys.getsizeof((node.tag,) + (None,) * len(node.fields) + (node.line,)) for node in nodes)
+    node_bytes = sum(map(sys.getsizeof, nodes))
+    # Ints above 256 are separate objects; most span lengths are not
+    offsets = {id(value): value for node in nodes for value in (node.lexpos, node.lexlen) if value > 256}
+    span_bytes = sum(map(sys.getsizeof, offsets.values()))
+    report(f"{len(code) / 1e3:.0f} KB source", len(nodes), "nodes")
+    report("tuple", tuple_bytes / len(nodes), "B/node")
+    report("slotted node", node_bytes / len(nodes), "B/node")
+    report("slotted node with its span offsets", (node_bytes + span_bytes) / len(nodes), "B/node")
+
+    with quiet():
+        parse_rate = rate(parse, seconds=0.5)
+    report("parse", 1e3 / parse_rate, "ms")
+    report("to_json for the response", 1e3 / rate(lambda: to_json(tree), seconds=0.5), "ms")
+
+    # Repeated statements would redeclare variables and stop at the first error
+    with quiet():
+        sample = parse_result(Parser, SAMPLE_PROGRAM)[0]
+        interpret_rate = rate(lambda: SemanticAnalyzer().interpret(sample), seconds=0.5)
+    report("interpret SAMPLE_PROGRAM", 1e6 / interpret_rate, "µs")
+
+
+def resident_bytes():
+    """Resident set size of this process (Linux)"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def kept_tree(code, builder):
+    """parse_tree, then leave the pooled parser holding none of the tree or its tokens"""
+    tree = parse_tree(code, builder)
+    parse_tree("", NodeBuilder())
+    return tree
+
+
+def tree_footprint(layout, copies):
+    """Memory and garbage collection cost of one tree of `copies`, by layout.
+
+    Run in a fresh process per layout so the layouts do not share a heap.
+    A tuple tree is converted from a node tree, whose freed memory stays
+    with the allocator, so it gets no resident figure.
+    """
+    code = repeated_program(copies)
+    builder = {"flat": FlatTreeBuilder, "shared": SharedTreeBuilder}.get(layout, NodeBuilder)
+    with quiet():
+        kept_tree(SAMPLE_PROGRAM, builder())
+        gc.collect()
+        before = resident_bytes()
+        tree = kept_tree(code, builder())
+        gc.collect()
+        resident = resident_bytes() - before
+        if layout == "tuples":
+            held = allocated(lambda: as_tuples(tree))
+            tree, resident = as_tuples(tree), None
+        else:
+            held = allocated(lambda: kept_tree(code, builder()))
+    pauses = []
+    for _ in range(5):
+        start = time.perf_counter()
+        gc.collect()
+        pauses.append(time.perf_counter() - start)
+    return held, resident, sorted(pauses)[len(pauses) // 2], len(gc.get_objects())
+
+
+@benchmark
+def bench_flat_tree():
+    """Huge programs as tuples, slotted nodes or a flat array tree: memory, GC pause and speed"""
+    with quiet():
+        parser_pool.warm()
+        sample = parse_tree(SAMPLE_PROGRAM, NodeBuilder())
+        flat_sample = parse_tree(SAMPLE_PROGRAM, FlatTreeBuilder())
+
+    context = multiprocessing.get_context("spawn")
+    for copies in (500, 5000):
+        nodes = len(list(tree_nodes(parse_tree(repeated_program(copies), NodeBuilder()))))
+        print(f"  {copies} copies of SAMPLE_PROGRAM, {nodes:,} nodes:")
+        for layout in ("tuples", "nodes", "flat"):
+            with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+                held, resident, pause, objects = pool.submit(tree_footprint, layout, copies).result()
+            report(f"{layout}, allocated", held / 1e6, "MB")
+            if resident is not None:
+                report(f"{layout}, resident growth", resident / 1e6, "MB")
+            report(f"{layout}, full collection", pause * 1e3, "ms")
+            report(f"{layout}, objects the GC tracks", objects, "")
+
+    code = repeated_program(500)
+    for label, builder in (("nodes", NodeBuilder), ("flat", FlatTreeBuilder)):
+        with quiet():
+            parse_rate = rate(lambda: parse_tree(code, builder()), seconds=0.5)
+            tree = parse_tree(code, builder())
+        report(f"{label}, parse 500 copies", 1e3 / parse_rate, "ms")
+        report(f"{label}, to_json", 1e3 / rate(lambda: to_json(tree), seconds=0.5), "ms")
+    for label, tree in (("nodes", sample), ("flat", flat_sample)):
+        with quiet():
+            interpret_rate = rate(lambda: SemanticAnalyzer().interpret(tree), seconds=0.5)
+        report(f"{label}, interpret SAMPLE_PROGRAM", 1e6 / interpret_rate, "µs")
+
+
+def cached_parse(cache, code):
+    """The parse stage of compile_code: a cache lookup, lexing and parsing on a miss"""
+    key = cache.key(code, "nodes")
+    parsed = cache.get(key)
+    if parsed is None:
+        parsed = parse_source(code, LineIndex(code))
+        cache.put(key, parsed)
+    return parsed
+
+
+@benchmark
+def bench_parse_cache():
+    """Repeated submissions: lexing and parsing every time vs the parse cache"""
+    with quiet():
+        parser_pool.warm()
+    for label, code in (("SAMPLE_PROGRAM", SAMPLE_PROGRAM), ("200 copies", repeated_program(200))):
+        cache = ParseCache(64 * 2**20)
+        with quiet():
+            parsed = cached_parse(cache, code)
+            miss_rate = rate(lambda: parse_source(code, LineIndex(code)), seconds=0.5)
+            hit_rate = rate(lambda: cached_parse(cache, code), seconds=0.5)
+        held = allocated(lambda: parse_source(code, LineIndex(code)))
+        report(f"{label}, lex and parse", 1e6 / miss_rate, "µs")
+        report(f"{label}, cache hit", 1e6 / hit_rate, "µs")
+        report(f"{label}, size estimate vs allocated", parsed.size / held * 100, "%")
+
+    # A class of students: a few exercises submitted over and over, some
+    # programs of their own, and a budget too small to keep them all
+    random.seed(0)
+    exercises = [generate_program(seed, statements=30) for seed in range(20)]
+    own = [generate_program(seed, statements=30) for seed in range(20, 420)]
+    submissions = [
+        random.choice(exercises) if random.random() < 0.8 else random.choice(own)
+        for _ in range(3000)
+    ]
+    for mebibytes in (0, 0.5, 2, 16):
+        cache = ParseCache(int(mebibytes * 2**20))
+        with quiet():
+            start = time.perf_counter()
+            for code in submissions:
+                cached_parse(cache, code)
+            elapsed = time.perf_counter() - start
+        stats = cache.stats()
+        hit_ratio = stats["hits"] / (stats["hits"] + stats["misses"]) * 100
+        report(f"{mebibytes} MiB cache, 3000 submissions", elapsed * 1e3, "ms")
+        report(f"{mebibytes} MiB cache, hits", hit_ratio, "%")
+        report(f"{mebibytes} MiB cache, held", stats["bytes"] / 2**20, "MiB")
+
+
+@benchmark
+def bench_tree_codec():
+    """Moving a tree between processes: pickle and JSON vs the binary tree codec"""
+    with quiet():
+        parser_pool.warm()
+
+    for label, code in (("SAMPLE_PROGRAM", SAMPLE_PROGRAM), ("200 copies", repeated_program(200))):
+        with quiet():
+            tree = parse_tree(code, NodeBuilder())
+        pickled = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        encoded = json.dumps(to_json(tree)).encode()
+        data = tree_codec.encode(tree)
+        for name, size, dump, load in (
+            ("pickle", len(pickled),
+             lambda: pickle.dumps(tree, pickle.HIGHEST_PROTOCOL), lambda: pickle.loads(pickled)),
+            ("JSON", len(encoded),
+             lambda: json.dumps(to_json(tree)).encode(), lambda: json.loads(encoded)),
+            ("tree codec", len(data),
+             lambda: tree_codec.encode(tree), lambda: tree_codec.decode(data)),
+        ):
+            report(f"{label}, {name} size", size / 1e3, "KB")
+            report(f"{label}, {name} encode", 1e6 / rate(dump, seconds=0.5), "µs")
+            report(f"{label}, {name} decode", 1e6 / rate(load, seconds=0.5), "µs")
+        report(f"{label}, tree codec, zlib", len(zlib.compress(data)) / 1e3, "KB")
+
+
+@benchmark
+def bench_parser_engines():
+    """Parsing with the PLY LR tables vs the hand-written descent parser"""
+    with quiet():
+        parser_pool.warm()
+
+    for label, code in (("SAMPLE_PROGRAM", SAMPLE_PROGRAM), ("200 copies", repeated_program(200))):
+        buffer = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+
+        def lr():
+            lex = buffer.feeder()
+            with parser_pool.checkout(lex) as parser:
+                return parser.parser.parse(code, lexer=lex)
+
+        with quiet():
+            lr_rate = rate(lr, seconds=0.5)
+            descent_rate = rate(lambda: DescentParser(buffer, NodeBuilder()).parse(), seconds=0.5)
+        report(f"{label}, LR", len(buffer) * lr_rate / 1e6, "M tokens/s")
+        report(f"{label}, descent", len(buffer) * descent_rate / 1e6, "M tokens/s")
+        report(f"{label}, descent speedup", descent_rate / lr_rate, "x")
+
+    # What compile_code pays: lexing included, and a program with a syntax
+    # error parsed by both engines under "descent"
+    broken = repeated_program(20) + "x = ;"
+    engine = config.PARSER_ENGINE
+    try:
+        for label, code in (("20 copies", repeated_program(20)), ("20 copies + error", broken)):
+            for name in ("lr", "descent"):
+                config.PARSER_ENGINE = name
+                with quiet():
+                    elapsed = 1e3 / rate(lambda: parse_source(code, LineIndex(code)), seconds=0.5)
+                report(f"{label}, parse_source with {name}", elapsed, "ms")
+    finally:
+        config.PARSER_ENGINE = engine
+
+
+@benchmark
+def bench_reparse():
+    """Parsing an edited document: the whole program again vs only the statements edited"""
+    lexer = Lexer.prebuilt().lexer
+    for copies in (20, 200, 2000):
+        code = repeated_program(copies)
+        previous = descent_result(code, lexer)
+        # Renaming keeps every later token where it was; the longer name
+        # ("+2") moves them, so the statements after the edit are copied moved
+        for where, offset, name in (
+            ("start", code.index("total - 1"), "count"),
+            ("middle", code.index("total - 1", len(code) // 2), "count"),
+            ("end", code.rindex("total - 1"), "count"),
+            ("middle+2", code.index("total - 1", len(code) // 2), "counter"),
+        ):
+            edited = code[:offset] + name + code[offset + 5:]
+            with quiet():
+                full = rate(lambda: parse_source(edited, LineIndex(edited), descent=True), seconds=0.3)
+                partial = rate(lambda: reparse(previous, edited, lexer), seconds=0.3)
+            report(f"{copies} copies, {where}, full parse", 1e3 / full, "ms")
+            report(f"{copies} copies, {where}, reparse", 1e3 / partial, "ms")
+
+    # Through the service, as a client sends the same document edited; only
+    # the descent engine reparses, the others lex the edit and parse it all
+    code = repeated_program(200)
+    versions = [code, code.replace("total - 1", "count", 1)]
+    engine = config.PARSER_ENGINE
+    try:
+        for name in ("lr", "descent"):
+            config.PARSER_ENGINE = name
+            with quiet():
+                elapsed = 1e3 / rate(
+                    lambda: [parse_document(name, version, LineIndex(version)) for version in versions],
+                    seconds=0.5,
+                )
+            report(f"200 copies, parse_document per version with {name}", elapsed / len(versions), "ms")
+    finally:
+        config.PARSER_ENGINE = engine
+
+
+@benchmark
+def bench_error_recovery():
+    """Broken programs: PLY's default recovery vs error productions that resynchronize at ; and end"""
+    programs = [generate_program(seed, statements=30, mutations=seed % 4) for seed in range(600)]
+    with quiet():
+        codes = [code for code in programs if parse_result(UnrecoveringParser, code)[1]]
+    for label, parser_class in (("default recovery", UnrecoveringParser), ("error productions", Parser)):
+        with quiet():
+            results = [parse_result(parser_class, code) for code in codes]
+        reported = sum(len(syntax_errors(errors)) for _, errors in results)
+        trees = [tree for tree, _ in results if tree is not None]
+        statements = sum(len(tree.statements) for tree in trees)
+        report(f"{label}, errors per program", reported / len(codes), "")
+        report(f"{label}, partial trees", 100 * len(trees) / len(codes), "%")
+        report(f"{label}, statements kept per tree", statements / max(len(trees), 1), "")
+
+    for label, parser_class in (("default recovery", UnrecoveringParser), ("error productions", Parser)):
+        with quiet():
+            parse_result(parser_class, SAMPLE_PROGRAM)
+            start = time.perf_counter()
+            for code in codes:
+                parse_result(parser_class, code)
+            elapsed = time.perf_counter() - start
+        report(f"{label}, parse time per program", elapsed * 1e3 / len(codes), "ms")
+
+
+def interned_objects(root):
+    """Number of distinct nodes and lists under interned `root`"""
+    seen = set()
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        children = value if isinstance(value, list) else [getattr(value, name) for name in value.fields]
+        stack.extend(child for child in children if isinstance(child, (Node, list)))
+    return len(seen)
+
+
+@benchmark
+def bench_shared_tree():
+    """Repetitive programs as slotted nodes or with each repeated subtree stored once"""
+    with quiet():
+        parser_pool.warm()
+    for label, code in (
+        ("generated", generate_program(7, statements=2000)),
+        ("500 copies", repeated_program(500)),
+    ):
+        with quiet():
+            nodes = parse_tree(code, NodeBuilder())
+            shared = parse_tree(code, SharedTreeBuilder())
+        report(f"{label}, nodes", len(shared.tree), "")
+        report(f"{label}, interned nodes and lists", interned_objects(shared.tree.root), "")
+        report(f"{label}, footprint as nodes", footprint(nodes) / 1e6, "MB")
+        report(f"{label}, footprint shared", footprint(shared) / 1e6, "MB")
+
+    context = multiprocessing.get_context("spawn")
+    for copies in (500, 5000):
+        print(f"  {copies} copies of SAMPLE_PROGRAM:")
+        for layout in ("nodes", "shared"):
+            with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+                held, resident, pause, objects = pool.submit(tree_footprint, layout, copies).result()
+            report(f"{layout}, allocated", held / 1e6, "MB")
+            report(f"{layout}, resident growth", resident / 1e6, "MB")
+            report(f"{layout}, full collection", pause * 1e3, "ms")
+            report(f"{layout}, objects the GC tracks", objects, "")
+
+    code = repeated_program(500)
+    with quiet():
+        sample = parse_tree(SAMPLE_PROGRAM, NodeBuilder())
+        shared_sample = parse_tree(SAMPLE_PROGRAM, SharedTreeBuilder())
+    for label, builder, small in (("nodes", NodeBuilder, sample), ("shared", SharedTreeBuilder, shared_sample)):
+        with quiet():
+            parse_rate = rate(lambda: parse_tree(code, builder()), seconds=0.5)
+            tree = parse_tree(code, builder())
+            interpret_rate = rate(lambda: SemanticAnalyzer().interpret(small), seconds=0.5)
+        report(f"{label}, parse 500 copies", 1e3 / parse_rate, "ms")
+        report(f"{label}, to_json", 1e3 / rate(lambda: to_json(tree), seconds=0.5), "ms")
+        report(f"{label}, interpret SAMPLE_PROGRAM", 1e6 / interpret_rate, "µs")
+
+
+@benchmark
+def bench_table_parser():
+    """The LALR tables run by PLY's LRParser vs by the table driver"""
+    with quiet():
+        parser_pool.warm()
+
+    broken_codes = [generate_program(seed, statements=20, mutations=1 + seed % 3) for seed in range(100)]
+    for label, codes in (
+        ("SAMPLE_PROGRAM", [SAMPLE_PROGRAM]),
+        ("200 copies", [repeated_program(200)]),
+        ("100 broken programs", broken_codes),
+    ):
+        buffers = [TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code) for code in codes]
+        tokens = sum(map(len, buffers))
+
+        def ply():
+            for code, buffer in zip(codes, buffers):
+                lex = buffer.feeder()
+                with parser_pool.checkout(lex) as parser:
+                    parser.parser.parse(code, lexer=lex)
+
+        def table():
+            for buffer in buffers:
+                TableParser(buffer, NodeBuilder()).parse()
+
+        with quiet():
+            ply_rate = rate(ply, seconds=0.5)
+            table_rate = rate(table, seconds=0.5)
+        report(f"{label}, PLY", tokens * ply_rate / 1e3, "k tokens/s")
+        report(f"{label}, table driver", tokens * table_rate / 1e3, "k tokens/s")
+        report(f"{label}, speedup", table_rate / ply_rate, "x")
+
+    code = repeated_program(20)
+    engine = config.PARSER_ENGINE
+    try:
+        for name in ("lr", "table"):
+            config.PARSER_ENGINE = name
+            with quiet():
+                elapsed = 1e3 / rate(lambda: parse_source(code, LineIndex(code)), seconds=0.5)
+            report(f"20 copies, parse_source with {name}", elapsed, "ms")
+    finally:
+        config.PARSER_ENGINE = engine
+
+
+@benchmark
+def bench_grammar_profile():
+    """Where LR parsing time goes by grammar rule, and what profiling it costs"""
+    total = GrammarProfile()
+    with quiet():
+        for seed in range(300):
+            total.merge(profiled_parse(generate_program(seed, statements=20, mutations=seed % 4))[2])
+    for line in total.report(limit=8).splitlines():
+        print(f"  {line}")
+
+    code = repeated_program(20)
+    with quiet():
+        plain = rate(lambda: parse_result(Parser, code), seconds=0.5)
+        profiled = rate(lambda: profiled_parse(code), seconds=0.5)
+    report("20 copies, parse", 1e3 / plain, "ms")
+    report("20 copies, profiled parse", 1e3 / profiled, "ms")
+    report("profiling overhead", plain / profiled, "x")
+
+
+@benchmark
+def bench_closure_compiler():
+    """Running programs by walking the tree or as compiled closures"""
+    with quiet():
+        parser_pool.warm()
+
+    for label, code, scale, unit in (("LOOP_PROGRAM", LOOP_PROGRAM, 1e3, "ms"), ("SAMPLE_PROGRAM", SAMPLE_PROGRAM, 1e6, "µs")):
+        for layout, builder_class in (("nodes", NodeBuilder), ("flat", FlatTreeBuilder), ("shared", SharedTreeBuilder)):
+            with quiet():
+                tree = parse_tree(code, builder_class())
+                compiled = closure_compiler.compile_program(tree)
+                walked = rate(lambda: SemanticAnalyzer().interpret(tree), seconds=1.0)
+                run = rate(lambda: compiled(SemanticAnalyzer()), seconds=1.0)
+                compiling = rate(lambda: closure_compiler.compile_program(tree), seconds=0.5)
+            report(f"{label}, {layout}, tree interpreter", scale / walked, unit)
+            report(f"{label}, {layout}, compiled closures", scale / run, unit)
+            report(f"{label}, {layout}, compiling", scale / compiling, unit)
+            report(f"{label}, {layout}, speedup", run / walked, "x")
+
+
+@benchmark
+def bench_bytecode():
+    """Running programs by walking the tree, as compiled closures or as bytecode"""
+    with quiet():
+        parser_pool.warm()
+    program = bytecode.compile_program(parse_tree(LOOP_PROGRAM, NodeBuilder()))
+    print(f"  LOOP_PROGRAM compiles to {len(program)} instructions and {len(program.consts)} constants;")
+    print("\n".join("  " + line for line in bytecode.disassemble(program).splitlines()[:12]))
+
+    for label, code, scale, unit in (("LOOP_PROGRAM", LOOP_PROGRAM, 1e3, "ms"), ("SAMPLE_PROGRAM", SAMPLE_PROGRAM, 1e6, "µs")):
+        for layout, builder_class in (("nodes", NodeBuilder), ("flat", FlatTreeBuilder), ("shared", SharedTreeBuilder)):
+            with quiet():
+                tree = parse_tree(code, builder_class())
+                closures = closure_compiler.compile_program(tree)
+                program = bytecode.compile_program(tree)
+                walked = rate(lambda: SemanticAnalyzer().interpret(tree), seconds=1.0)
+                closed = rate(lambda: closures(SemanticAnalyzer()), seconds=1.0)
+                run = rate(lambda: vm.execute(program, SemanticAnalyzer()), seconds=1.0)
+                compiling = rate(lambda: bytecode.compile_program(tree), seconds=0.5)
+            report(f"{label}, {layout}, tree interpreter", scale / walked, unit)
+            report(f"{label}, {layout}, compiled closures", scale / closed, unit)
+            report(f"{label}, {layout}, bytecode", scale / run, unit)
+            report(f"{label}, {layout}, compiling", scale / compiling, unit)
+            report(f"{label}, {layout}, speedup", run / walked, "x")
+
+
+def nested_program(depth):
+    """A loop reading and assigning a global variable inside `depth` blocks, each declaring one"""
+    opened = "".join(f"if {n} >= 0 begin let v{n} = {n}; " for n in range(depth))
+    return (
+        f"begin let total = 0; {opened}"
+        "for let i = 1; to 2000 begin total = total + i; end "
+        f"{'end ' * depth}print(total); end"
+    )
+
+
+@benchmark
+def bench_slots():
+    """Variables in frame slots the compiler resolves vs walking the scope dicts, by block nesting"""
+    with quiet():
+        parser_pool.warm()
+    for depth in (0, 4, 16):
+        with quiet():
+            tree = parse_tree(nested_program(depth), NodeBuilder())
+            program = bytecode.compile_program(tree)
+            walked = rate(lambda: SemanticAnalyzer().interpret(tree), seconds=1.0)
+            run = rate(lambda: vm.execute(program, SemanticAnalyzer()), seconds=1.0)
+        report(f"{depth} blocks deep, tree interpreter", 1e3 / walked, "ms")
+        report(f"{depth} blocks deep, bytecode", 1e3 / run, "ms")
+        report(f"{depth} blocks deep, speedup", run / walked, "x")
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        print(f"{name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
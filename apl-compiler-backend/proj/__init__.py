@@ -1,10 +1,24 @@
 from flask import Flask
 from flask_cors import CORS
+
+# Part of every parse cache key: bump it with any change to what the lexer,
+# parser or tree classes produce for the same source
+__version__ = "1.0.0"
+
+
 def create_app():
     app = Flask(__name__)
+
+    from .utilities import diagnostics
+    diagnostics.configure()
     CORS(app, resources={r"/compiler/*": {"origins":[ "http://localhost:5173","https://apl-front-end.vercel.app"]}})
 
     from .controllers.compiler_controller import compiler_bp
     app.register_blueprint(compiler_bp, url_prefix="/compiler")
 
+    # Build the lexer and parser tables once at startup so requests only
+    # pay for a lexer clone and a pooled parser checkout
+    from .services.compiler_service import warm_up
+    warm_up()
+
     return app
@@ -0,0 +1,78 @@
+"""Runtime settings, read once from the environment (or a .env file)"""
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _flag(name, default=False):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Tokenizer engine: "ply" (finallexer.Lexer), "regex" (regexlexer.RegexLexer)
+# or "parallel" (parallel_lexer: the ply rules, with sources of half a megabyte
+# or more split across a pool of worker processes, one per CPU)
+LEXER_ENGINE = os.getenv("APL_LEXER_ENGINE", "ply").strip().lower()
+
+# Parser engine: "lr" (the PLY tables), "table" (the same tables run by
+# table_parser, a driver specialized to this grammar: same trees, messages
+# and recovery, faster) or "descent" (descent_parser, a hand-written parser
+# giving the same trees faster still; programs with syntax errors still go
+# to the LR parser for its messages and recovery)
+PARSER_ENGINE = os.getenv("APL_PARSER_ENGINE", "lr").strip().lower()
+
+# Memory for parse results kept by source, so a program submitted again (a
+# classroom's copies of one exercise) skips lexing and parsing. 0 turns it off.
+PARSE_CACHE_MB = float(os.getenv("APL_PARSE_CACHE_MB", "64"))
+
+# Memory for the latest parse of each document a request names, so its next
+# version is only lexed again around the edit and, with the "descent" parser
+# engine, only reparses the statements the edit changed
+DOCUMENT_CACHE_MB = float(os.getenv("APL_DOCUMENT_CACHE_MB", "16"))
+
+# Syntax tree layout: "nodes" (an object per node), "flat" (parallel
+# arrays, for very large generated programs: less memory, far less GC work,
+# slower to interpret) or "shared" (each repeated subtree stored once, with
+# positions in a side table, for programs repeating the same code)
+SYNTAX_TREE = os.getenv("APL_SYNTAX_TREE", "nodes").strip().lower()
+
+# How programs run: "tree" (SemanticAnalyzer.interpret walks the syntax
+# tree), "closures" (closure_compiler first turns the tree into nested
+# closures, several times faster on loops; same output and errors, though
+# recursion runs out of Python stack somewhat deeper) or
+# "bytecode" (bytecode compiles the tree for the vm dispatch loop, with
+# calls on a frame stack of its own and variables in slots resolved at
+# compile time; same output and errors, except that calls nest up to
+# vm.MAX_CALL_DEPTH deep where the interpreter runs out of Python stack
+# sooner). Only "bytecode" resolves variables: "tree", the default, and
+# "closures" look each one up in the analyzer's scope dicts, innermost
+# first, as the reference the other two are checked against.
+INTERPRETER = os.getenv("APL_INTERPRETER", "tree").strip().lower()
+
+# Default token report format when a request does not pick one:
+# "structured" (type, value, line and col columns plus a source line table) or
+# "legacy" (the three preformatted strings per token older clients expect)
+TOKEN_FORMAT = os.getenv("APL_TOKEN_FORMAT", "structured").strip().lower()
+
+# Write parser.out and regenerate parsetab.py when the grammar changes.
+# Leave off in production so startup only reads the committed tables.
+PARSER_DEBUG = _flag("APL_PARSER_DEBUG")
+
+# Ready parser instances kept around for concurrent requests
+PARSER_POOL_SIZE = int(os.getenv("APL_PARSER_POOL_SIZE", "4"))
+
+# Count the reductions, time in each p_* action, LR states and shifted tokens
+# of every LR parse, served at /grammar-profile (see grammar_profile). Costs
+# parse time; parses by the "table" and "descent" engines are not counted.
+GRAMMAR_PROFILE = _flag("APL_GRAMMAR_PROFILE")
+
+# Diagnostics level: "debug", "info", "warning" or "error". "debug" traces
+# every token and print statement; keep production at "warning".
+LOG_LEVEL = os.getenv("APL_LOG_LEVEL", "warning").strip().lower()
+
+# Let a request raise or lower the level for itself with "logLevel"
+LOG_REQUEST_LEVEL = _flag("APL_LOG_REQUEST_LEVEL")
@@ -1,5 +1,9 @@
-from flask import Blueprint, request, jsonify
-from proj.services.compiler_service import compile_code
+from flask import Blueprint, Response, request, jsonify
+from proj.services.compiler_service import compile_code, TOKEN_FORMATS
+from proj.models.parse_cache import parse_cache
+from proj.models.grammar_profile import grammar_profile
+from proj import config
+from proj.utilities import diagnostics
 
 
 compiler_bp = Blueprint('compiler', __name__)
@@ -13,5 +17,35 @@ def compile():
     code = code.encode().decode('unicode_escape')  # Ensure code is a string
     if not code:
         return jsonify({"error": "No code provided"}), 400
-    result = compile_code(code)
-    return result
\ No newline at end of file
+    token_format = compile_request.get('tokenFormat', config.TOKEN_FORMAT)
+    if token_format not in TOKEN_FORMATS:
+        return jsonify({"error": f"Unknown tokenFormat '{token_format}', expected one of {list(TOKEN_FORMATS)}"}), 400
+    document = compile_request.get('document')
+    if document is not None and not isinstance(document, str):
+        return jsonify({"error": "document must be a string id"}), 400
+    log_level = diagnostics.parse_level(config.LOG_LEVEL)
+    if 'logLevel' in compile_request:
+        if not config.LOG_REQUEST_LEVEL:
+            return jsonify({"error": "Per-request logLevel is disabled on this server"}), 400
+        try:
+            log_level = diagnostics.parse_level(compile_request['logLevel'])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    with diagnostics.request_level(log_level):
+        result = compile_code(code, token_format, document)
+    return result
+
+@compiler_bp.route('/parse-cache', methods=['GET'])
+def parse_cache_stats():
+    """Hit, miss and eviction counters of the parse cache"""
+    return jsonify(parse_cache.stats()), 200
+
+@compiler_bp.route('/grammar-profile', methods=['GET'])
+def grammar_profile_report():
+    """What the LR parser's rules and states cost across requests, as JSON or with ?format=text a report"""
+    if not config.GRAMMAR_PROFILE:
+        return jsonify({"error": "Grammar profiling is off; set APL_GRAMMAR_PROFILE to turn it on"}), 404
+    profile = grammar_profile.snapshot()
+    if request.args.get('format') == 'text':
+        return Response(profile.report(), mimetype='text/plain'), 200
+    return jsonify(profile.to_json()), 200
@@ -0,0 +1,781 @@
+# Compiles a syntax tree to bytecode for vm.execute, and disassembles it.
+#
+# A Code holds one program or function body: its instructions as pairs of
+# words, opcode then argument, in an array('i'), and a constant pool the
+# arguments of LOAD, CONST, CALL and the like index. Jump arguments are
+# word offsets into the same array. Each function definition compiles to a
+# Code of its own, kept in the constant pool of the code defining it.
+#
+# Variables live in the slots of a frame, a list the VM makes for each run
+# of a Code, as resolver lays them out; the instructions naming a variable
+# carry its slots. Entering a block costs nothing, and leaving one that
+# declares anything empties its slots.
+#
+# The interpreter leaves scopes, loops and calls in finally blocks, so an
+# exception leaves the analyzer's stacks as it found them. A Code lists the
+# ranges of its instructions that run inside a scope, a loop or a call's
+# arguments, with the variables of each, for the VM to rebuild the scopes
+# the interpreter would have at an exception and leave them as it does;
+# nothing runs for them otherwise.
+#
+# The bytecode does what SemanticAnalyzer.interpret does, on the same
+# analyzer state, with the same results, errors and line numbers:
+#
+#   - A statement list stops at the first statement setting should_return,
+#     should_break or should_continue: CHECK_FLAGS after each statement jumps
+#     to the end of the list, and loops and calls deal with the flag there.
+#   - line_number is the line of the last node started. The VM keeps it in
+#     a register LINE and LOAD set; a LINE is only emitted before the first
+#     instruction that could raise, jump or hand over to other code, and
+#     not at all when the register is known to hold its line already.
+#
+# A few instructions do the work of the instruction after them too, and
+# then skip it: STORE_CHECK and DECLARE_CHECK that of the CHECK_FLAGS
+# after them, COMPARE_JUMP_IF_FALSE that of the POP_JUMP_IF_FALSE, and
+# ADD_CONST and the like, a CONST's, that of the ADD after it. The
+# instruction skipped stays in place for the jumps that land on it.
+#   - Nodes the interpreter would only report as malformed (an operator the
+#     grammar cannot produce), and which its handler reports on the scope
+#     dicts, have the program handed over to the interpreter by INTERPRET.
+import operator
+from array import array
+
+from .flat_tree import Cursor
+from .resolver import UNSET, FrameLayout, declarations
+from .shared_tree import Occurrence
+from .syntax_tree import (
+    Assign, BinOp, Boolean, Break, Call, Compare, CondExpr, Continue, Declare, Else, ElseIf, For,
+    FunctionDef, GroupedCondition, If, Literal, Logic, NaturalLang, NaturalLangIf, Node, Not,
+    Print, Program, Return, String, Unary, Var, While,
+)
+
+# Opcodes and their arguments; stack effects are before -- after. They are
+# numbered in the order the VM tests for them: the busiest first, those of
+# expressions, assignments and loop iterations, then the rest in runs it
+# tells apart with one comparison each, from CHECK_FLAGS, POP, CALL_SETUP
+# and NL_FETCH. A variable's slots are those resolver.FrameLayout.resolve
+# gives: the first slot and the others to try.
+LOAD = 0               # const (name, line, slot, slots): -- variable's value, as interpret_var reads it
+CONST = 1              # const: -- value
+ADD = 2                # line: left right -- left + right, operands checked
+SUB = 3                # line
+MUL = 4                # line
+DIV = 5                # line
+ADD_CONST = 6          # const: CONST, then the ADD after it
+SUB_CONST = 7          # const
+MUL_CONST = 8          # const
+DIV_CONST = 9          # const
+LINE = 10              # line: the line register becomes line
+STORE = 11             # const (name, line, slot, slots): value -- ; assign to the variable
+STORE_CHECK = 12       # const (name, line, slot, slots): STORE, then the CHECK_FLAGS after it
+COMPARE = 13           # const (operation, op, line): left right -- result
+COMPARE_JUMP_IF_FALSE = 14  # const (operation, op, line): COMPARE, then the POP_JUMP_IF_FALSE after it
+WHILE_NEXT = 15        # target: after the body, jump to target unless it broke or returned
+FOR_ITER = 16          # target: loop -- loop; bind the variable, or jump once past the end
+FOR_NEXT = 17          # target: loop -- loop; unless it broke or returned, step, then as FOR_ITER
+                       # but jumping back to target while in range
+
+CHECK_FLAGS = 18       # target: jump if should_return, should_break or should_continue
+POP_JUMP_IF_FALSE = 19   # target: value -- ; jump unless is_truthy(value)
+JUMP = 20              # target
+EXIT_BLOCK = 21        # const (start, stop, unset): leave a block, its slots emptied
+POP = 22               # value --
+DUP = 23               # value -- value value
+TRUTHY = 24            # value -- is_truthy(value)
+JUMP_IF_FALSE_OR_POP = 25  # target: bool -- bool if jumping, -- otherwise
+JUMP_IF_TRUE_OR_POP = 26   # target
+NOT = 27               # value -- not is_truthy(value)
+POS = 28               # value -- +value
+NEG = 29               # value -- -value
+DECLARE = 30           # const (name, line, slot): value -- ; declare in the innermost block
+DECLARE_CHECK = 31     # const (name, line, slot): DECLARE, then the CHECK_FLAGS after it
+STR = 32               # value -- str(value)
+PRINT = 33             # count: strings -- ; append them joined to compile_results
+
+CALL_SETUP = 34        # const (name, count, line): -- function
+CALL = 35              # const (name, count, line, chain): function arguments -- ; run the body
+                       # in a frame of its own, chain the caller's blocks as FrameLayout.chain gives them
+END_CALL = 36          # -- result; return to the caller
+RETURN_VALUE = 37      # value -- ; set return_value and should_return
+FOR_SETUP = 38         # const (name, line, declared, slot, slots): start end step -- loop; enter a for loop
+WHILE_ENTER = 39       # enter a while loop
+LOOP_EXIT = 40         # leave the loop
+BREAK = 41             # line
+CONTINUE = 42          # line
+NL_FETCH = 43          # const (name, line, message, slot, slots): -- value, None if missing or not numeric
+JUMP_IF_NONE = 44      # target: jump if the value on top is None
+NL_UPDATE = 45         # const (name, line, verb, operation, slot, slots): current operand -- new value, or None
+NL_SET = 46            # const (name, line, slot): value -- ; declare, as "set x to"
+NL_IF_LOAD = 47        # const (name, line, slot, slots): -- get_variable's value
+NL_COMPARE = 48        # const operation: left right -- result, False if either is None
+DEFINE = 49            # const (name, params, body, code)
+INTERPRET = 50         # const node: hand the whole program over to the interpreter
+HALT = 51              # -- ; return the value on top
+
+OPNAMES = [
+    "LOAD", "CONST", "ADD", "SUB", "MUL", "DIV", "ADD_CONST", "SUB_CONST", "MUL_CONST", "DIV_CONST",
+    "LINE", "STORE", "STORE_CHECK", "COMPARE", "COMPARE_JUMP_IF_FALSE", "WHILE_NEXT", "FOR_ITER",
+    "FOR_NEXT", "CHECK_FLAGS", "POP_JUMP_IF_FALSE", "JUMP", "EXIT_BLOCK", "POP", "DUP",
+    "TRUTHY", "JUMP_IF_FALSE_OR_POP", "JUMP_IF_TRUE_OR_POP", "NOT", "POS", "NEG", "DECLARE",
+    "DECLARE_CHECK", "STR", "PRINT", "CALL_SETUP", "CALL", "END_CALL", "RETURN_VALUE", "FOR_SETUP",
+    "WHILE_ENTER", "LOOP_EXIT", "BREAK", "CONTINUE", "NL_FETCH", "JUMP_IF_NONE", "NL_UPDATE",
+    "NL_SET", "NL_IF_LOAD", "NL_COMPARE", "DEFINE", "INTERPRET", "HALT",
+]
+
+# Opcodes whose argument is a jump target, or indexes the constant pool
+JUMPS = {
+    JUMP, POP_JUMP_IF_FALSE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP, JUMP_IF_NONE,
+    CHECK_FLAGS, WHILE_NEXT, FOR_ITER, FOR_NEXT,
+}
+CONSTANT_OPS = {
+    CONST, LOAD, STORE, DECLARE, COMPARE, FOR_SETUP, CALL_SETUP, CALL, DEFINE, NL_SET, NL_FETCH,
+    NL_UPDATE, NL_IF_LOAD, NL_COMPARE, INTERPRET, STORE_CHECK, DECLARE_CHECK, COMPARE_JUMP_IF_FALSE,
+    ADD_CONST, SUB_CONST, MUL_CONST, DIV_CONST, EXIT_BLOCK,
+}
+
+# Opcodes that cannot raise, jump or read the line register: a LINE can
+# wait until after them. STORE and DECLARE could be, but the CHECK_FLAGS
+# after them would then take the LINE and not fuse with them.
+QUIET = {CONST, LOAD, DUP, POP, TRUTHY, NOT, PRINT, EXIT_BLOCK, NL_SET}
+
+# Each opcode the instruction after it can fuse with, and the opcode doing both
+FUSED = {
+    (STORE, CHECK_FLAGS): STORE_CHECK,
+    (DECLARE, CHECK_FLAGS): DECLARE_CHECK,
+    (COMPARE, POP_JUMP_IF_FALSE): COMPARE_JUMP_IF_FALSE,
+    (CONST, ADD): ADD_CONST,
+    (CONST, SUB): SUB_CONST,
+    (CONST, MUL): MUL_CONST,
+    (CONST, DIV): DIV_CONST,
+}
+
+ARITHMETIC = {'+': ADD, '-': SUB, '*': MUL, '/': DIV}
+
+COMPARISONS = {
+    '<': operator.lt, '>': operator.gt, '<=': operator.le,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+# Natural language updates: the operator, how messages name it, and the
+# message when the variable is not numeric. mult names its factor there, as
+# interpret_natural_lang does.
+NATURAL_UPDATES = {
+    ('add', 'to'): ("arg2", operator.add, "add", "🧠💥Cannot add to non-numeric variable '{}' at line {}"),
+    ('sub', 'from'): ("arg2", operator.sub, "subtract", "🧠💥Cannot subtract from non-numeric variable '{}' at line {}"),
+    ('mult', 'by'): ("arg1", operator.mul, "multiply", "🧠💥Cannot multiply non-numeric variable '{}' at line {}"),
+    ('div', 'by'): ("arg1", operator.truediv, "divide", "🧠💥Cannot divide non-numeric variable '{}' at line {}"),
+}
+
+# Kinds run for their effect; any other node in a statement list is an
+# expression whose value is dropped
+STATEMENTS = {
+    node_type.kind for node_type in (
+        Program, Declare, Assign, Print, If, For, While, FunctionDef, Return, Break, Continue,
+        NaturalLang, NaturalLangIf,
+    )
+}
+
+
+class Code:
+    """Bytecode of a program or a function body.
+
+    `code` holds (opcode, argument) pairs; `consts` is the constant pool
+    and `name` what the disassembly calls the code. A run of it has a
+    frame of `size` slots, the variables of the program's global scope or
+    the call's scope in the slots `layout` gives by name. `regions` holds
+    a (start, end, kind, layout) per scope ("scope"), loop ("loop") or
+    call's arguments ("args") the words from start up to end run inside,
+    outermost first, with the slots of the block's variables.
+    """
+
+    __slots__ = ("name", "code", "consts", "size", "layout", "regions")
+
+    def __init__(self, name, code, consts, size, layout, regions):
+        self.name = name
+        self.code = code
+        self.consts = consts
+        self.size = size
+        self.layout = layout
+        self.regions = regions
+
+    def __len__(self):
+        """Number of instructions"""
+        return len(self.code) // 2
+
+    def __repr__(self):
+        return f"<Code {self.name}, {len(self)} instructions>"
+
+
+class Label:
+    """A place in the code jumps go to, and the jump arguments waiting for it"""
+
+    __slots__ = ("position", "fixups")
+
+    def __init__(self):
+        self.position = None
+        self.fixups = []
+
+
+def _is_node(value):
+    return isinstance(value, (Node, Cursor, Occurrence))
+
+
+class Compiler:
+    """Compiles one program or function body into a Code"""
+
+    def __init__(self, name):
+        self.name = name
+        self.code = array("i")
+        self.consts = []
+        self.regions = []
+        self.frame = FrameLayout()
+        self._const_indexes = {}
+        # The line the register is known to hold here, if any
+        self._line = None
+        # The line it must hold before the next instruction that is not QUIET
+        self._pending_line = None
+
+    def finish(self):
+        # Around an offset, outer regions start first, or end last
+        self.regions.sort(key=lambda region: (region[0], -region[1]))
+        return Code(self.name, self.code, self.consts, self.frame.size, self.frame.blocks[0], self.regions)
+
+    # --- assembling ---
+
+    def emit(self, op, arg=0):
+        if op not in QUIET:
+            self.flush_line()
+        self.code.append(op)
+        self.code.append(arg)
+
+    def flush_line(self):
+        if self._pending_line is not None:
+            self.code.append(LINE)
+            self.code.append(self._pending_line)
+            self._line, self._pending_line = self._pending_line, None
+
+    def fuse(self, op):
+        """Fuse the last instruction with an `op` about to follow it, if they have a fused opcode"""
+        if self.code and self._pending_line is None:
+            fused = FUSED.get((self.code[-2], op))
+            if fused is not None:
+                self.code[-2] = fused
+
+    def const(self, value):
+        """Index of `value` in the constant pool, added if it is not there"""
+        # Keyed by type and repr too: 1, 1.0 and True are equal dict keys,
+        # and so are 0.0 and -0.0
+        try:
+            key = (type(value), value, repr(value))
+            index = self._const_indexes.get(key)
+        except TypeError:
+            key = index = None
+        if index is None:
+            index = len(self.consts)
+            self.consts.append(value)
+            if key is not None:
+                self._const_indexes[key] = index
+        return index
+
+    def emit_const(self, op, value):
+        self.emit(op, self.const(value))
+
+    def jump(self, op, label):
+        self.fuse(op)
+        self.emit(op, 0)
+        if label.position is None:
+            label.fixups.append(len(self.code) - 1)
+        else:
+            self.code[-1] = label.position
+
+    def mark(self, label):
+        """Place `label` here; jumps can come in with any line in the register"""
+        self.flush_line()
+        label.position = len(self.code)
+        for fixup in label.fixups:
+            self.code[fixup] = label.position
+        self._line = None
+
+    def region(self, start, kind, layout=None):
+        """What runs from word `start` to here is inside a scope, loop or call's arguments"""
+        self.regions.append((start, len(self.code), kind, layout))
+
+    def close_block(self):
+        """Close the innermost block, emptying its slots if it has any"""
+        start, stop = self.frame.close()
+        if stop > start:
+            self.emit_const(EXIT_BLOCK, (start, stop, (UNSET,) * (stop - start)))
+
+    def variable(self, name, line):
+        """(name, line, slot, slots) of a variable read or assigned here"""
+        return (name, line) + self.frame.resolve(name)
+
+    def line(self, line):
+        """A node of `line` starts: the line register must hold it"""
+        self._pending_line = None if line == self._line else line
+
+    def set_line(self, line):
+        """The instruction just emitted set the line register to `line`"""
+        self._line, self._pending_line = line, None
+
+    def forget_line(self):
+        """Code run here, a function body or a handler, leaves some other line in the register"""
+        self._line = self._pending_line = None
+
+    # --- statements ---
+    #
+    # interpret() returns the value of the last statement run, which only
+    # the program's own statements (and the if bodies among them) hand on:
+    # compiled with keep, a statement leaves that value on the stack, and
+    # without, nothing.
+
+    def program(self, tree):
+        self.frame.open(declarations(tree))
+        self.value(tree, keep=True)
+        self.emit(HALT)
+        return self.finish()
+
+    def value(self, tree, keep=False):
+        """The root of what is compiled: a node, statement list or value, interpreted as interpret() would"""
+        if isinstance(tree, list):
+            self.block(tree, keep)
+        elif _is_node(tree):
+            self.statement(tree, keep)
+        elif keep:
+            self.emit_const(CONST, tree)
+
+    def block(self, statements, keep=False):
+        statements = [statement for statement in statements if statement is not None]
+        if not statements and keep:
+            self.emit_const(CONST, None)
+        end = Label()
+        for n, statement in enumerate(statements):
+            self.statement(statement, keep)
+            if n < len(statements) - 1:
+                self.jump(CHECK_FLAGS, end)
+                if keep:
+                    self.emit(POP)
+        if end.fixups:
+            self.mark(end)
+
+    def statement(self, node, keep=False):
+        if node.kind not in STATEMENTS:
+            self.expression(node)
+            if not keep:
+                self.emit(POP)
+            return
+        compile_node = STATEMENT_COMPILERS.get(node.kind)
+        if compile_node is None or not compile_node(self, node, keep):
+            # Malformed: its handler runs and reports it
+            self.interpreted(node)
+            if not keep:
+                self.emit(POP)
+
+    def interpreted(self, node):
+        self.emit_const(INTERPRET, node)
+        self.forget_line()
+
+    def none(self, keep):
+        """The None a statement returns, if kept"""
+        if keep:
+            self.emit_const(CONST, None)
+
+    def compile_program(self, node, keep):
+        self.line(node.line)
+        self.value(node.statements, keep)
+        return True
+
+    def compile_declare(self, node, keep):
+        self.line(node.line)
+        self.expression(node.value)
+        if keep:
+            self.emit(DUP)
+        self.emit_const(DECLARE, (node.name, node.line, self.frame.declared(node.name)))
+        return True
+
+    def compile_assign(self, node, keep):
+        self.line(node.line)
+        self.expression(node.value)
+        if keep:
+            self.emit(DUP)
+        self.emit_const(STORE, self.variable(node.name, node.line))
+        return True
+
+    def compile_print(self, node, keep):
+        self.line(node.line)
+        for item in node.items:
+            if item.kind == String.kind:
+                # Printed as it is, without being interpreted
+                self.emit_const(CONST, item.value)
+            else:
+                self.expression(item)
+                self.emit(STR)
+        self.emit(PRINT, len(node.items))
+        self.none(keep)
+        return True
+
+    def compile_if(self, node, keep):
+        else_part = node.else_part
+        self.line(node.line)
+        self.expression(node.condition)
+        otherwise, end = Label(), Label()
+        self.jump(POP_JUMP_IF_FALSE, otherwise)
+        self.scoped(node.body, keep)
+        if else_part or keep:
+            self.jump(JUMP, end)
+        self.mark(otherwise)
+        # Kinds rather than classes, so flat_tree cursors match too
+        if else_part and else_part.kind == Else.kind:
+            self.scoped(else_part.body, keep)
+        elif else_part and else_part.kind == ElseIf.kind:
+            # A nested if; it has the same fields, line included
+            self.compile_if(else_part, keep)
+        else:
+            self.none(keep)
+        self.mark(end)
+        return True
+
+    def scoped(self, body, keep):
+        layout = self.frame.open(declarations(body))
+        start = len(self.code)
+        self.value(body, keep)
+        self.region(start, "scope", layout)
+        self.close_block()
+
+    def compile_for(self, node, keep):
+        self.line(node.line)
+        self.expression(node.start_expr)
+        self.expression(node.end_expr)
+        if node.step_expr:
+            self.expression(node.step_expr)
+        else:
+            self.emit_const(CONST, 1)
+        declared = node.binding == 'let'
+        # The loop's scope holds its variable, if declared, and what its body declares
+        layout = self.frame.open(([node.name] if declared else []) + declarations(node.body))
+        self.emit_const(FOR_SETUP, (node.name, node.line, declared) + self.frame.resolve(node.name))
+        loop, done, body = Label(), Label(), Label()
+        self.mark(loop)
+        self.jump(FOR_ITER, done)
+        self.mark(body)
+        self.value(node.body)
+        self.jump(FOR_NEXT, body)
+        self.mark(done)
+        self.emit(POP)
+        self.region(loop.position, "loop", layout)
+        self.emit(LOOP_EXIT)
+        self.close_block()
+        self.none(keep)
+        return True
+
+    def compile_while(self, node, keep):
+        self.line(node.line)
+        layout = self.frame.open(declarations(node.body))
+        self.emit(WHILE_ENTER)
+        loop, done = Label(), Label()
+        # interpret_while never counts its iterations, so its limit never trips
+        self.mark(loop)
+        self.expression(node.condition)
+        self.jump(POP_JUMP_IF_FALSE, done)
+        self.value(node.body)
+        self.jump(WHILE_NEXT, loop)
+        self.mark(done)
+        self.region(loop.position, "loop", layout)
+        self.emit(LOOP_EXIT)
+        self.close_block()
+        self.none(keep)
+        return True
+
+    def compile_function_def(self, node, keep):
+        self.line(node.line)
+        # The body node too, for calls the interpreter makes from a handed-over node
+        function = compile_function(node.name, node.params, node.body)
+        self.emit_const(DEFINE, (node.name, node.params, node.body, function))
+        self.none(keep)
+        return True
+
+    def compile_return(self, node, keep):
+        self.line(node.line)
+        if node.value is None:
+            self.emit_const(CONST, None)
+        else:
+            self.expression(node.value)
+        if keep:
+            self.emit(DUP)
+        self.emit(RETURN_VALUE)
+        return True
+
+    def compile_break(self, node, keep):
+        self.line(node.line)
+        self.emit(BREAK, node.line)
+        self.none(keep)
+        return True
+
+    def compile_continue(self, node, keep):
+        self.line(node.line)
+        self.emit(CONTINUE, node.line)
+        self.none(keep)
+        return True
+
+    def compile_natural_lang(self, node, keep):
+        operation, arg1, connector, arg2, line = node.operation, node.arg1, node.connector, node.arg2, node.line
+        if operation == 'set' and connector == 'to' and isinstance(arg1, str):
+            self.line(line)
+            self.expression(arg2)
+            if keep:
+                self.emit(DUP)
+            self.emit_const(NL_SET, (arg1, line, self.frame.declared(arg1)))
+            return True
+        update = NATURAL_UPDATES.get((operation, connector))
+        if update is None:
+            return False
+        target, combine, verb, message = update
+        name, operand = (arg2, arg1) if target == "arg2" else (arg1, arg2)
+        if not isinstance(name, str):
+            return False
+        self.line(line)
+        end = Label()
+        # Formatted now: it shows the factor node for mult
+        shown = arg2 if operation == 'mult' else name
+        slots = self.frame.resolve(name)
+        self.emit_const(NL_FETCH, (name, line, message.format(shown, line)) + slots)
+        self.jump(JUMP_IF_NONE, end)
+        self.expression(operand)
+        self.emit_const(NL_UPDATE, (name, line, verb, combine) + slots)
+        self.mark(end)
+        if not keep:
+            self.emit(POP)
+        return True
+
+    def compile_natural_lang_if(self, node, keep):
+        operation = COMPARISONS.get(node.op)
+        if operation is None:
+            return False
+        self.line(node.line)
+        self.emit_const(NL_IF_LOAD, self.variable(node.name, node.line))
+        self.expression(node.value)
+        self.emit_const(NL_COMPARE, operation)
+        otherwise, end = Label(), Label()
+        self.jump(POP_JUMP_IF_FALSE, otherwise)
+        self.value(node.body, keep)
+        if keep:
+            self.jump(JUMP, end)
+        self.mark(otherwise)
+        self.none(keep)
+        self.mark(end)
+        return True
+
+    # --- expressions ---
+
+    def expression(self, node):
+        """Code leaving the value interpret(node) returns on the stack"""
+        if not _is_node(node):
+            self.emit_const(CONST, node)
+            return
+        compile_node = EXPRESSION_COMPILERS.get(node.kind)
+        if compile_node is None or not compile_node(self, node):
+            self.interpreted(node)
+
+    def compile_binop(self, node):
+        op = ARITHMETIC.get(node.op)
+        if op is None:
+            return False
+        self.line(node.line)
+        self.expression(node.left)
+        self.expression(node.right)
+        self.fuse(op)
+        self.emit(op, node.line)
+        return True
+
+    def compile_unary(self, node):
+        if node.op not in ('+', '-'):
+            return False
+        self.line(node.line)
+        self.expression(node.operand)
+        self.emit(POS if node.op == '+' else NEG)
+        return True
+
+    def compile_literal(self, node):
+        self.line(node.line)
+        self.emit_const(CONST, node.value)
+        return True
+
+    def compile_boolean(self, node):
+        self.line(node.line)
+        self.emit_const(CONST, node.value == 'true')
+        return True
+
+    def compile_var(self, node):
+        self.line(node.line)
+        self.emit_const(LOAD, self.variable(node.name, node.line))
+        self.set_line(node.line)
+        return True
+
+    def compile_compare(self, node):
+        operation = COMPARISONS.get(node.op)
+        if operation is None:
+            return False
+        self.line(node.line)
+        self.expression(node.left)
+        self.expression(node.right)
+        self.emit_const(COMPARE, (operation, node.op, node.line))
+        return True
+
+    def compile_logic(self, node):
+        if node.op not in ('and', 'or'):
+            return False
+        self.line(node.line)
+        end = Label()
+        self.expression(node.left)
+        self.emit(TRUTHY)
+        self.jump(JUMP_IF_FALSE_OR_POP if node.op == 'and' else JUMP_IF_TRUE_OR_POP, end)
+        self.expression(node.right)
+        self.emit(TRUTHY)
+        self.mark(end)
+        return True
+
+    def compile_not(self, node):
+        if node.op != 'not':
+            return False
+        # interpret_logic leaves the line number alone for not
+        self.expression(node.operand)
+        self.emit(NOT)
+        return True
+
+    def compile_cond_expr(self, node):
+        self.line(node.line)
+        self.expression(node.expression)
+        return True
+
+    def compile_grouped_condition(self, node):
+        self.line(node.line)
+        self.expression(node.condition)
+        return True
+
+    def compile_call(self, node):
+        self.line(node.line)
+        call = (node.name, len(node.args), node.line)
+        self.emit_const(CALL_SETUP, call)
+        # The interpreter enters the call's scope before the arguments
+        start = len(self.code)
+        for arg in node.args:
+            self.expression(arg)
+        self.region(start, "args")
+        self.emit_const(CALL, call + (self.frame.chain(),))
+        self.forget_line()
+        return True
+
+
+STATEMENT_COMPILERS = {
+    Program.kind: Compiler.compile_program,
+    Declare.kind: Compiler.compile_declare,
+    Assign.kind: Compiler.compile_assign,
+    Print.kind: Compiler.compile_print,
+    If.kind: Compiler.compile_if,
+    For.kind: Compiler.compile_for,
+    While.kind: Compiler.compile_while,
+    FunctionDef.kind: Compiler.compile_function_def,
+    Return.kind: Compiler.compile_return,
+    Break.kind: Compiler.compile_break,
+    Continue.kind: Compiler.compile_continue,
+    NaturalLang.kind: Compiler.compile_natural_lang,
+    NaturalLangIf.kind: Compiler.compile_natural_lang_if,
+}
+
+EXPRESSION_COMPILERS = {
+    BinOp.kind: Compiler.compile_binop,
+    Unary.kind: Compiler.compile_unary,
+    Literal.kind: Compiler.compile_literal,
+    Boolean.kind: Compiler.compile_boolean,
+    Var.kind: Compiler.compile_var,
+    Compare.kind: Compiler.compile_compare,
+    Logic.kind: Compiler.compile_logic,
+    Not.kind: Compiler.compile_not,
+    CondExpr.kind: Compiler.compile_cond_expr,
+    GroupedCondition.kind: Compiler.compile_grouped_condition,
+    Call.kind: Compiler.compile_call,
+}
+
+
+def compile_program(tree):
+    """Code running `tree` on a SemanticAnalyzer as its interpret(tree) would"""
+    return Compiler("<program>").program(tree)
+
+
+def compile_function(name, params, body):
+    """Code running a function body, for CALL to switch to"""
+    compiler = Compiler(name)
+    # The call's scope holds the parameters, then what the body declares
+    compiler.frame.open(list(params) + declarations(body))
+    compiler.value(body)
+    compiler.emit(END_CALL)
+    return compiler.finish()
+
+
+def _describe(code, op, arg):
+    """What an instruction's argument stands for, for the disassembly"""
+    if op in JUMPS:
+        return f"-> {arg}"
+    if op not in CONSTANT_OPS:
+        return ""
+    value = code.consts[arg]
+    if op == DEFINE:
+        name, params, _, function = value
+        return f"({name}({', '.join(params)}), {len(function)} instructions)"
+    if op == COMPARE or op == COMPARE_JUMP_IF_FALSE:
+        return f"({value[1]})"
+    if op == NL_UPDATE:
+        return f"({value[2]} {_variable(value[0], value[4])})"
+    if op in (LOAD, STORE, STORE_CHECK, NL_IF_LOAD, DECLARE, DECLARE_CHECK, NL_SET):
+        return f"({_variable(value[0], value[2])})"
+    if op == FOR_SETUP or op == NL_FETCH:
+        return f"({_variable(value[0], value[3])})"
+    if op == EXIT_BLOCK:
+        return f"(slots {value[0]} to {value[1] - 1})"
+    if op == NL_COMPARE:
+        return f"({value.__name__})"
+    if op == INTERPRET:
+        return f"({type(value).__name__} {value.tag})"
+    if isinstance(value, tuple):
+        # (name, ...): the variable or function
+        return f"({value[0]})"
+    return f"({value!r})"
+
+
+def _variable(name, slot):
+    # Slot 0: declared by no block around, so looked for in the callers'
+    return f"{name}@{slot}" if slot else name
+
+
+def _slots(layout):
+    return ", ".join(f"{name}@{slot}" for name, slot in layout.items())
+
+
+# Opcodes without an argument
+_BARE = {
+    POP, DUP, POS, NEG, TRUTHY, NOT, STR, WHILE_ENTER, LOOP_EXIT, END_CALL, RETURN_VALUE, HALT,
+}
+
+
+def disassemble(code):
+    """A listing of `code` and the functions it defines, one instruction per line:
+    word offset, opcode, argument and what the argument stands for, then
+    the frame's slots and the scopes, loops and arguments the code runs in"""
+    lines = []
+    pending = [code]
+    while pending:
+        current = pending.pop(0)
+        if lines:
+            lines.append("")
+        lines.append(f"{current.name}:")
+        words = current.code
+        for offset in range(0, len(words), 2):
+            op, arg = words[offset], words[offset + 1]
+            if op == DEFINE:
+                pending.append(current.consts[arg][3])
+            shown = "" if op in _BARE else str(arg)
+            lines.append(f"{offset:>6}  {OPNAMES[op]:<20} {shown:>5}  {_describe(current, op, arg)}".rstrip())
+        lines.append(f"  frame of {current.size} slots: {_slots(current.layout)}")
+        for start, end, kind, layout in current.regions:
+            lines.append(f"  {kind} {start} to {end}" + (f": {_slots(layout)}" if layout else ""))
+    return "\n".join(lines)
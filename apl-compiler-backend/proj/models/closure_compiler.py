@@ -0,0 +1,726 @@
+# Compiles a syntax tree into nested Python closures that run it on a
+# SemanticAnalyzer exactly as SemanticAnalyzer.interpret would: the same
+# results, errors, line numbers and exceptions, quirks included. The tree is
+# walked once, here; each closure has its node's fields, operator and child
+# closures bound already, so running a loop body again does no dispatch on
+# kinds, no field reads and no isinstance checks on nodes.
+#
+# A closure takes the analyzer it runs on, so a compiled program can run on
+# any number of fresh analyzers. Nodes the interpreter would only report as
+# malformed (an operator the grammar cannot produce) are handed to its
+# handler, which gives the same report, and so are the top-level statements
+# nested too deep to compile, which the handler then runs out of stack in
+# as interpret() does.
+import operator
+
+from .flat_tree import Cursor
+from .semantics import HANDLERS, SemanticAnalyzer
+from .shared_tree import Occurrence
+from .syntax_tree import (
+    NODE_TYPES, Assign, BinOp, Boolean, Break, Call, Compare, CondExpr, Continue, Declare, Else,
+    ElseIf, For, FunctionDef, GroupedCondition, If, Literal, Logic, NaturalLang, NaturalLangIf,
+    Node, Not, Print, Program, Return, String, Unary, Var, While,
+)
+from proj.utilities import diagnostics
+
+log = diagnostics.get_logger(__name__)
+
+is_truthy = SemanticAnalyzer.is_truthy
+
+ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+
+COMPARISONS = {
+    '<': operator.lt, '>': operator.gt, '<=': operator.le,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+
+def compile_program(tree):
+    """A function of a SemanticAnalyzer that runs `tree` on it as its interpret(tree) would"""
+    return _compile(tree)
+
+
+def run(analyzer, tree):
+    """Compile `tree` and run it on `analyzer`; what analyzer.interpret(tree) returns.
+
+    The program runs once: calls recursing without end run out of stack
+    in the closures and raise RecursionError, as they do interpreted.
+    """
+    return compile_program(tree)(analyzer)
+
+
+def _nothing(a):
+    return None
+
+
+def _constant(value):
+    def constant(a):
+        return value
+    return constant
+
+
+def _compile(value):
+    if value is None:
+        return _nothing
+    if isinstance(value, (Node, Cursor, Occurrence)):
+        return COMPILERS[value.kind](value)
+    if isinstance(value, list):
+        return _compile_block(value)
+    return _constant(value)
+
+
+def _interpreted(node):
+    """The interpreter's handler for `node`, run on the analyzer"""
+    handler = HANDLERS[node.kind]
+
+    def interpreted(a):
+        return handler(a, node)
+    return interpreted
+
+
+def _compile_statement(statement):
+    """Compile a top-level statement, or run it with the interpreter's
+    handler if it is nested too deep to compile"""
+    try:
+        return _compile(statement)
+    except RecursionError:
+        log.debug("Interpreting a statement at line %s: nested too deep to compile", statement.line)
+        return _interpreted(statement)
+
+
+def _compile_block(statements, compile=_compile):
+    compiled = tuple(compile(statement) for statement in statements if statement is not None)
+    if not compiled:
+        return _nothing
+    if len(compiled) == 1:
+        # The block returns its one statement's result whatever flag it sets
+        return compiled[0]
+
+    def block(a):
+        result = None
+        for statement in compiled:
+            result = statement(a)
+            if a.should_return or a.should_break or a.should_continue:
+                break
+        return result
+    return block
+
+
+def _exit(stack):
+    # SemanticAnalyzer.exit_scope
+    if len(stack) > 1:
+        stack.pop()
+
+
+# Kinds whose nodes never declare into the innermost scope nor leave the
+# scope stack changed (a natural language set declares, the others update)
+SCOPE_NEUTRAL = {
+    node_type.kind for node_type in (
+        Assign, BinOp, Unary, Literal, Boolean, Var, Print, String, If, Else, ElseIf, While,
+        Compare, GroupedCondition, Logic, Not, CondExpr, Return, Break, Continue, NaturalLang,
+    )
+}
+
+
+def _scoped(body):
+    """Compile a block run in a scope of its own, or without one if nothing in
+    it can tell: a scope no statement declares into stays empty and changes
+    no lookup"""
+    stack = [body]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, (Node, Cursor, Occurrence)):
+            if value.kind not in SCOPE_NEUTRAL or (
+                value.kind == NaturalLang.kind and value.operation == 'set'
+            ):
+                break
+            stack.extend(getattr(value, name) for name in value.fields)
+    else:
+        return _compile(body)
+    compiled = _compile(body)
+
+    def scoped(a):
+        stack = a.scope_stack
+        stack.append({})
+        try:
+            return compiled(a)
+        finally:
+            _exit(stack)
+    return scoped
+
+
+def compile_program_node(node):
+    line, statements = node.line, node.statements
+    if isinstance(statements, list):
+        statements = _compile_block(statements, _compile_statement)
+    else:
+        statements = _compile(statements)
+
+    def program(a):
+        a.line_number = line
+        return statements(a)
+    return program
+
+
+def compile_declare(node):
+    name, line, value = node.name, node.line, _compile(node.value)
+
+    def declare(a):
+        a.line_number = line
+        computed = value(a)
+        if a.loop_stack:
+            # Updated if declared in this scope, declared in it otherwise:
+            # set in the innermost scope either way
+            a.scope_stack[-1][name] = computed
+        else:
+            a.set_variable(name, computed, line)
+        return computed
+    return declare
+
+
+def compile_assign(node):
+    name, line, value = node.name, node.line, _compile(node.value)
+
+    def assign(a):
+        a.line_number = line
+        computed = value(a)
+        for scope in reversed(a.scope_stack):
+            if name in scope:
+                scope[name] = computed
+                break
+        else:
+            # Reports the undefined variable
+            a.update_variable(name, computed, line)
+        return computed
+    return assign
+
+
+def _number(node):
+    """The value and line of a number literal, for an operand folded into its operation; else None"""
+    if isinstance(node, (Node, Cursor, Occurrence)) and node.kind == Literal.kind:
+        if type(node.value) is int or type(node.value) is float:
+            return node.value, node.line
+    return None
+
+
+def compile_binop(node):
+    op, line = node.op, node.line
+    if op != '/' and op not in ARITHMETIC:
+        return _interpreted(node)
+    left, right = _compile(node.left), _compile(node.right)
+
+    number = _number(node.right)
+    if number is not None and not (op == '/' and number[0] == 0):
+        # x + 1: the literal's only effect is on the line number
+        right_val, right_line = number
+        operation = operator.truediv if op == '/' else ARITHMETIC[op]
+
+        def binop_number(a):
+            a.line_number = line
+            left_val = left(a)
+            a.line_number = right_line
+            if type(left_val) is int or type(left_val) is float:
+                return operation(left_val, right_val)
+            return a.binary_operation(op, left_val, right_val, line)
+        return binop_number
+
+    if op == '/':
+        def divide(a):
+            a.line_number = line
+            left_val = left(a)
+            right_val = right(a)
+            if (type(left_val) is int or type(left_val) is float) and (
+                type(right_val) is int or type(right_val) is float
+            ):
+                if right_val == 0:
+                    a.semantic_errors.append(f"🧠💥Division by zero at line {line}")
+                    return None
+                return left_val / right_val
+            return a.binary_operation(op, left_val, right_val, line)
+        return divide
+
+    operation = ARITHMETIC[op]
+
+    def binop(a):
+        a.line_number = line
+        left_val = left(a)
+        right_val = right(a)
+        if (type(left_val) is int or type(left_val) is float) and (
+            type(right_val) is int or type(right_val) is float
+        ):
+            return operation(left_val, right_val)
+        return a.binary_operation(op, left_val, right_val, line)
+    return binop
+
+
+def compile_unary(node):
+    op, line = node.op, node.line
+    if op == '+':
+        operation = operator.pos
+    elif op == '-':
+        operation = operator.neg
+    else:
+        return _interpreted(node)
+    operand = _compile(node.operand)
+
+    def unary(a):
+        a.line_number = line
+        return operation(operand(a))
+    return unary
+
+
+def compile_literal(node):
+    value, line = node.value, node.line
+
+    def literal(a):
+        a.line_number = line
+        return value
+    return literal
+
+
+def compile_boolean(node):
+    value, line = node.value == 'true', node.line
+
+    def boolean(a):
+        a.line_number = line
+        return value
+    return boolean
+
+
+def compile_var(node):
+    name, line = node.name, node.line
+
+    def var(a):
+        a.line_number = line
+        for scope in reversed(a.scope_stack):
+            if name in scope:
+                value = scope[name]
+                break
+        else:
+            # Reports the undefined variable
+            value = a.get_variable(name, line)
+        if value is None:
+            a.semantic_errors.append(f"🧠💥Variable '{name}' does not have a value at line {line}")
+            return None
+        return value
+    return var
+
+
+def compile_print(node):
+    line = node.line
+    # String items are printed as they are, without being interpreted
+    items = tuple(
+        _constant(item.value) if item.kind == String.kind else _compile(item)
+        for item in node.items
+    )
+
+    def print_(a):
+        a.line_number = line
+        output = ' '.join([str(item(a)) for item in items])
+        log.debug("%s", output)
+        a.compile_results.append(output)
+        return None
+    return print_
+
+
+def compile_if(node):
+    line, condition, body = node.line, _compile(node.condition), _scoped(node.body)
+    else_part = node.else_part
+    else_body = else_if = None
+    # Kinds rather than classes, so flat_tree cursors match too
+    if else_part and else_part.kind == Else.kind:
+        else_body = _scoped(else_part.body)
+    elif else_part and else_part.kind == ElseIf.kind:
+        # A nested if; it has the same fields, line included
+        else_if = compile_if(else_part)
+
+    def if_(a):
+        a.line_number = line
+        value = condition(a)
+        if value is True or (value is not False and is_truthy(value)):
+            return body(a)
+        if else_body is not None:
+            return else_body(a)
+        if else_if is not None:
+            return else_if(a)
+        return None
+    return if_
+
+
+def compile_for(node):
+    binding, name, line = node.binding, node.name, node.line
+    start, end, body = _compile(node.start_expr), _compile(node.end_expr), _compile(node.body)
+    step = _compile(node.step_expr) if node.step_expr else _constant(1)
+
+    def for_(a):
+        a.line_number = line
+        start_val = start(a)
+        end_val = end(a)
+        step_val = step(a)
+        stack = a.scope_stack
+        stack.append({})
+        a.loop_stack.append('for')
+        if binding != 'let':
+            # Leaves the scope and loop entered, as interpret_for does
+            if a.get_variable(name, line) is None:
+                return None
+        else:
+            a.set_variable(name, start_val, line)
+        try:
+            current = start_val
+            while (step_val > 0 and current <= end_val) or (step_val < 0 and current >= end_val):
+                for scope in reversed(stack):
+                    if name in scope:
+                        scope[name] = current
+                        break
+                else:
+                    a.update_variable(name, current, line)
+                body(a)
+                if a.should_break:
+                    a.should_break = False
+                    break
+                if a.should_continue:
+                    a.should_continue = False
+                    current += step_val
+                    continue
+                if a.should_return:
+                    break
+                current += step_val
+        finally:
+            a.loop_stack.pop()
+            _exit(stack)
+        return None
+    return for_
+
+
+def compile_while(node):
+    line, condition, body = node.line, _compile(node.condition), _compile(node.body)
+
+    # interpret_while never counts its iterations, so its limit never trips
+    def while_(a):
+        a.line_number = line
+        stack = a.scope_stack
+        stack.append({})
+        a.loop_stack.append('while')
+        try:
+            while True:
+                value = condition(a)
+                if value is not True and (value is False or not is_truthy(value)):
+                    break
+                body(a)
+                if a.should_break:
+                    a.should_break = False
+                    break
+                if a.should_continue:
+                    a.should_continue = False
+                    continue
+                if a.should_return:
+                    break
+        finally:
+            a.loop_stack.pop()
+            _exit(stack)
+        return None
+    return while_
+
+
+def compile_compare(node):
+    op, line = node.op, node.line
+    if op not in COMPARISONS:
+        return _interpreted(node)
+    operation, left, right = COMPARISONS[op], _compile(node.left), _compile(node.right)
+
+    number = _number(node.right)
+    if number is not None:
+        right_val, right_line = number
+
+        def compare_number(a):
+            a.line_number = line
+            left_val = left(a)
+            a.line_number = right_line
+            if left_val is None:
+                a.semantic_errors.append(f"🧠💥Invalid operands for comparison '{op}' at line {line}")
+                return None
+            return operation(left_val, right_val)
+        return compare_number
+
+    def compare(a):
+        a.line_number = line
+        left_val = left(a)
+        right_val = right(a)
+        if left_val is None or right_val is None:
+            a.semantic_errors.append(f"🧠💥Invalid operands for comparison '{op}' at line {line}")
+            return None
+        return operation(left_val, right_val)
+    return compare
+
+
+def compile_logic(node):
+    op, line = node.op, node.line
+    left, right = _compile(node.left), _compile(node.right)
+    if op == 'and':
+        def logic(a):
+            a.line_number = line
+            return is_truthy(left(a)) and is_truthy(right(a))
+    elif op == 'or':
+        def logic(a):
+            a.line_number = line
+            return is_truthy(left(a)) or is_truthy(right(a))
+    else:
+        return _interpreted(node)
+    return logic
+
+
+def compile_not(node):
+    if node.op != 'not':
+        return _interpreted(node)
+    operand = _compile(node.operand)
+
+    # interpret_logic leaves the line number alone for not
+    def not_(a):
+        return not is_truthy(operand(a))
+    return not_
+
+
+def compile_cond_expr(node):
+    line, expression = node.line, _compile(node.expression)
+
+    def cond_expr(a):
+        a.line_number = line
+        return expression(a)
+    return cond_expr
+
+
+def compile_grouped_condition(node):
+    line, condition = node.line, _compile(node.condition)
+
+    def grouped_condition(a):
+        a.line_number = line
+        return condition(a)
+    return grouped_condition
+
+
+def compile_function_def(node):
+    name, params, body, line = node.name, node.params, node.body, node.line
+    compiled = _compile(body)
+
+    def function_def(a):
+        a.line_number = line
+        # The body too, for calls the interpreter makes from a handed-over node
+        a.functions[name] = {'params': params, 'body': body, 'compiled': compiled}
+        return None
+    return function_def
+
+
+def compile_call(node):
+    name, line = node.name, node.line
+    args = tuple(_compile(arg) for arg in node.args)
+
+    def call(a):
+        a.line_number = line
+        functions = a.functions
+        if name not in functions:
+            a.semantic_errors.append(f"🧠💥Function '{name}' is not defined at line {line}")
+        # A KeyError if undefined, as in interpret_call
+        func_def = functions[name]
+        stack = a.scope_stack
+        stack.append({})
+        arg_values = [arg(a) for arg in args]
+        params = func_def['params']
+        if len(arg_values) != len(params):
+            a.semantic_errors.append(
+                f"🧠💥Function '{name}' expects {len(params)} arguments, got {len(arg_values)} at line {line}"
+            )
+        a.call_stack.append(name)
+        try:
+            for param, arg_val in zip(params, arg_values):
+                a.set_variable(param, arg_val, line)
+            # A function the interpreter defined from a handed-over node has no compiled body
+            body = func_def.get('compiled')
+            if body is None:
+                a.interpret(func_def['body'])
+            else:
+                body(a)
+            result = a.return_value
+            a.return_value = None
+            a.should_return = False
+            return result
+        finally:
+            a.call_stack.pop()
+            _exit(stack)
+    return call
+
+
+def compile_return(node):
+    line = node.line
+    value = None if node.value is None else _compile(node.value)
+
+    def return_(a):
+        a.line_number = line
+        a.return_value = None if value is None else value(a)
+        a.should_return = True
+        return a.return_value
+    return return_
+
+
+def compile_break(node):
+    line = node.line
+
+    def break_(a):
+        a.line_number = line
+        if not a.loop_stack:
+            a.semantic_errors.append(f"🧠💥Break statement outside of loop at line {line}")
+        a.should_break = True
+        return None
+    return break_
+
+
+def compile_continue(node):
+    line = node.line
+
+    def continue_(a):
+        a.line_number = line
+        if not a.loop_stack:
+            a.semantic_errors.append(f"🧠💥Continue statement outside of loop at line {line}")
+        a.should_continue = True
+        return None
+    return continue_
+
+
+def _update_numeric(name, value, line, combine, verb, preposition):
+    """The add and subtract forms: `name` = `name` combine `value`"""
+    def update(a):
+        a.line_number = line
+        current_val = a.get_variable(name, line)
+        if current_val is None:
+            return None
+        if not isinstance(current_val, (int, float)):
+            a.semantic_errors.append(
+                f"🧠💥Cannot {verb} {preposition} non-numeric variable '{name}' at line {line}"
+            )
+            return None
+        operand = value(a)
+        if operand is None:
+            return None
+        if not isinstance(operand, (int, float)):
+            a.semantic_errors.append(f"🧠💥Cannot {verb} non-numeric value '{operand}' at line {line}")
+            return None
+        new_val = combine(current_val, operand)
+        a.update_variable(name, new_val, line)
+        return new_val
+    return update
+
+
+def compile_natural_lang(node):
+    operation, arg1, connector, arg2, line = node.operation, node.arg1, node.connector, node.arg2, node.line
+    if operation == 'set' and connector == 'to' and isinstance(arg1, str):
+        value = _compile(arg2)
+
+        def set_(a):
+            a.line_number = line
+            computed = value(a)
+            a.set_variable(arg1, computed, line)
+            return computed
+        return set_
+    if operation == 'add' and connector == 'to' and isinstance(arg2, str):
+        return _update_numeric(arg2, _compile(arg1), line, operator.add, "add", "to")
+    if operation == 'sub' and connector == 'from' and isinstance(arg2, str):
+        return _update_numeric(arg2, _compile(arg1), line, operator.sub, "subtract", "from")
+    if operation == 'mult' and connector == 'by' and isinstance(arg1, str):
+        value = _compile(arg2)
+
+        def multiply(a):
+            a.line_number = line
+            current_val = a.get_variable(arg1, line)
+            if current_val is None:
+                return None
+            if not isinstance(current_val, (int, float)):
+                # interpret_natural_lang names the factor here, not the variable
+                a.semantic_errors.append(f"🧠💥Cannot multiply non-numeric variable '{arg2}' at line {line}")
+                return None
+            mult_val = value(a)
+            if mult_val is None:
+                return None
+            if not isinstance(mult_val, (int, float)):
+                a.semantic_errors.append(f"🧠💥Cannot multiply non-numeric value '{mult_val}' at line {line}")
+                return None
+            new_val = current_val * mult_val
+            a.update_variable(arg1, new_val, line)
+            return new_val
+        return multiply
+    if operation == 'div' and connector == 'by' and isinstance(arg1, str):
+        value = _compile(arg2)
+
+        def divide(a):
+            a.line_number = line
+            current_val = a.get_variable(arg1, line)
+            if current_val is None:
+                return None
+            if not isinstance(current_val, (int, float)):
+                a.semantic_errors.append(f"🧠💥Cannot divide non-numeric variable '{arg1}' at line {line}")
+                return None
+            div_val = value(a)
+            if div_val is None:
+                return None
+            if not isinstance(div_val, (int, float)):
+                a.semantic_errors.append(f"🧠💥Cannot divide non-numeric value '{div_val}' at line {line}")
+                return None
+            if div_val == 0:
+                a.semantic_errors.append(f"🧠💥Division by zero in natural language operation at line {line}")
+                return None
+            new_val = current_val / div_val
+            a.update_variable(arg1, new_val, line)
+            return new_val
+        return divide
+    # A malformed or unknown construct: the handler reports it
+    return _interpreted(node)
+
+
+def compile_natural_lang_if(node):
+    name, op, line = node.name, node.op, node.line
+    if op not in COMPARISONS:
+        return _interpreted(node)
+    operation, value, body = COMPARISONS[op], _compile(node.value), _compile(node.body)
+
+    def natural_lang_if(a):
+        a.line_number = line
+        var_val = a.get_variable(name, line)
+        condition_val = value(a)
+        if var_val is not None and condition_val is not None:
+            if operation(var_val, condition_val):
+                return body(a)
+        return None
+    return natural_lang_if
+
+
+# Compiler for each node kind, indexed by Node.kind; kinds without one are
+# handed to the interpreter's handler, which reports them
+COMPILERS = [_interpreted] * len(NODE_TYPES)
+for node_type, compiler in {
+    Program: compile_program_node,
+    Declare: compile_declare,
+    Assign: compile_assign,
+    BinOp: compile_binop,
+    Unary: compile_unary,
+    Literal: compile_literal,
+    Boolean: compile_boolean,
+    Var: compile_var,
+    Print: compile_print,
+    If: compile_if,
+    For: compile_for,
+    While: compile_while,
+    Compare: compile_compare,
+    GroupedCondition: compile_grouped_condition,
+    Logic: compile_logic,
+    Not: compile_not,
+    CondExpr: compile_cond_expr,
+    FunctionDef: compile_function_def,
+    Call: compile_call,
+    Return: compile_return,
+    Break: compile_break,
+    Continue: compile_continue,
+    NaturalLang: compile_natural_lang,
+    NaturalLangIf: compile_natural_lang_if,
+}.items():
+    COMPILERS[node_type.kind] = compiler
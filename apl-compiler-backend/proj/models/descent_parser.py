@@ -0,0 +1,581 @@
+# Hand-written parser for the grammar in parser.Parser: recursive descent for
+# statements and precedence climbing for expressions and conditions. It reads
+# a TokenBuffer's columns directly instead of LexToken objects and builds the
+# same tree through the same builders as the LR parser, with the same lines
+# and spans.
+#
+# Where the grammar is ambiguous it decides as the LALR tables do:
+#
+#   - every shift/reduce conflict is resolved as a shift, so an expression
+#     takes every "+" or "-" after it (the block after a for loop's bounds
+#     or a condition cannot start with one), a natural language if's
+#     statement list takes every statement after it and an else belongs to
+#     the nearest if
+#   - a STRING in print arguments is a factor, so print gives Literal nodes
+#   - "(" where a condition is expected opens a grouped condition unless
+#     what follows up to its ")" is a plain expression, which is a factor
+#   - only a term can be a function call: "2 * f(x)" and "-f(x)" are errors
+#
+# It gives no syntax errors of its own. On anything the grammar rejects
+# parse() returns None, and the caller runs the LR parser for its messages
+# and error recovery.
+from array import array
+
+from .token_buffer import TYPE_IDS
+from .finallexer import Lexer
+
+BEGIN = TYPE_IDS["KEYWORD_BEGIN"]
+END = TYPE_IDS["KEYWORD_END"]
+LET = TYPE_IDS["KEYWORD_LET"]
+IF = TYPE_IDS["KEYWORD_IF"]
+ELSE = TYPE_IDS["KEYWORD_ELSE"]
+ELSEIF = TYPE_IDS["KEYWORD_ELSEIF"]
+FOR = TYPE_IDS["KEYWORD_FOR"]
+WHILE = TYPE_IDS["KEYWORD_WHILE"]
+PRINT = TYPE_IDS["KEYWORD_PRINT"]
+TRUE = TYPE_IDS["KEYWORD_TRUE"]
+FALSE = TYPE_IDS["KEYWORD_FALSE"]
+FUNCTION = TYPE_IDS["KEYWORD_FUNCTION"]
+RETURN = TYPE_IDS["KEYWORD_RETURN"]
+BREAK = TYPE_IDS["KEYWORD_BREAK"]
+CONTINUE = TYPE_IDS["KEYWORD_CONTINUE"]
+IDENTIFIER = TYPE_IDS["IDENTIFIER"]
+INTEGER = TYPE_IDS["INTEGER"]
+FLOAT = TYPE_IDS["FLOAT"]
+STRING = TYPE_IDS["STRING"]
+PLUS = TYPE_IDS["PLUS_OP"]
+MINUS = TYPE_IDS["MINUS_OP"]
+TIMES = TYPE_IDS["TIMES_OP"]
+DIVIDE = TYPE_IDS["DIVIDE_OP"]
+ASSIGN = TYPE_IDS["ASSIGNMENT_OP"]
+LPAREN = TYPE_IDS["LPAREN"]
+RPAREN = TYPE_IDS["RPAREN"]
+TO = TYPE_IDS["KEYWORD_TO"]
+STEP = TYPE_IDS["KEYWORD_STEP"]
+AND = TYPE_IDS["KEYWORD_AND"]
+OR = TYPE_IDS["KEYWORD_OR"]
+NOT = TYPE_IDS["KEYWORD_NOT"]
+COMMA = TYPE_IDS["COMMA"]
+SEMICOLON = TYPE_IDS["SEMICOLON"]
+SET = TYPE_IDS["SET_KEYWORD_NATURAL_LANG"]
+ADD = TYPE_IDS["ADD_KEYWORD_NATURAL_LANG"]
+SUB = TYPE_IDS["SUB_KEYWORD_NATURAL_LANG"]
+MULT = TYPE_IDS["MULT_KEYWORD_NATURAL_LANG"]
+DIV = TYPE_IDS["DIV_KEYWORD_NATURAL_LANG"]
+FROM = TYPE_IDS["FROM_KEYWORD_NATURAL_LANG"]
+BY = TYPE_IDS["BY_KEYWORD_NATURAL_LANG"]
+IS = TYPE_IDS["IS_KEYWORD_NATURAL_LANG"]
+THEN = TYPE_IDS["THEN_KEYWORD_NATURAL_LANG"]
+
+# Type id past the last token; two of them, for the natural language if's
+# two tokens of lookahead
+EOF = 255
+_EOF_PADDING = array("B", [EOF, EOF])
+
+COMPARISONS = frozenset(
+    TYPE_IDS[name] for name in ("LT_OP", "GT_OP", "LE_OP", "GE_OP", "EQ_OP", "NE_OP")
+)
+# Binding power of the logical operators, from Parser.precedence
+LOGIC_PRECEDENCE = {OR: 1, AND: 2}
+
+# Tokens a statement_list goes on at: those starting a statement or a
+# control statement
+STATEMENT_STARTS = frozenset((
+    IDENTIFIER, INTEGER, FLOAT, STRING, TRUE, FALSE, LPAREN, PLUS, MINUS, LET, PRINT,
+    SET, ADD, SUB, MULT, DIV, IF, FOR, WHILE, RETURN, BREAK, CONTINUE, FUNCTION,
+))
+
+# The natural language statements' verb, and the token between their two operands
+_NATURAL_LANG_CONNECTORS = {SET: TO, ADD: TO, SUB: FROM, MULT: BY, DIV: BY}
+
+
+class Rejected(Exception):
+    """The tokens are not a program of the grammar"""
+
+
+class DescentParser:
+    """Parses one TokenBuffer into a tree built by `builder`.
+
+    Identifiers never need Parser.is_variable_keyword here: the lexers turn
+    every reserved word into its keyword token.
+    """
+
+    def __init__(self, buffer, builder):
+        self.source = buffer.source
+        self.types = buffer.types + _EOF_PADDING
+        # A rule reads where its first token starts before checking it, so
+        # the end of the source stands in for EOF's
+        self.starts = buffer.starts + array("I", [len(buffer.source)] * len(_EOF_PADDING))
+        self.ends = buffer.ends
+        self.lines = buffer.lines
+        self.builder = builder
+        # Next token, and the end offset of the last one taken
+        self.pos = 0
+        self.end = 0
+        # Token index each top-level statement starts at, then that of the
+        # token after the last one, for reparser.reparse
+        self.boundaries = array("I")
+
+    def parse(self):
+        """The finished tree, or None if the grammar rejects the tokens"""
+        try:
+            root = self.program()
+        except (Rejected, RecursionError):
+            # Nesting too deep for Python's stack is left to the LR parser too
+            return None
+        return self.builder.finish(root)
+
+    # --------------------------
+    # TOKENS
+    # --------------------------
+
+    def take(self, type_id):
+        """Consume the next token, which must be of `type_id`, and return its index"""
+        pos = self.pos
+        if self.types[pos] != type_id:
+            raise Rejected
+        self.pos = pos + 1
+        self.end = self.ends[pos]
+        return pos
+
+    def text(self, i):
+        return self.source[self.starts[i]:self.ends[i]]
+
+    def built(self, node, start):
+        """Give a node just built the span from offset `start` to the last token taken"""
+        self.builder.span(node, start, self.end)
+        return node
+
+    # --------------------------
+    # PROGRAM STRUCTURE
+    # --------------------------
+
+    def program(self):
+        builder = self.builder
+        boundaries = self.boundaries
+        if self.types[0] == BEGIN:
+            begin = self.take(BEGIN)
+            statements = self.statement_list(boundaries)
+            boundaries.append(self.pos)
+            self.take(END)
+            node = self.built(builder.Program(statements, self.lines[begin]), self.starts[begin])
+        else:
+            statements = self.statement_list(boundaries)
+            boundaries.append(self.pos)
+            # The LR action reads the line of a nonterminal, which is 0
+            node = builder.Program(statements, 0)
+            # A program without statements has no span
+            if statements:
+                self.built(node, self.starts[0])
+        self.finish_program()
+        return node
+
+    def finish_program(self):
+        """Check nothing follows the program"""
+        if self.types[self.pos] != EOF:
+            raise Rejected
+
+    def statement_list(self, starts=None):
+        """Statements up to the first token that cannot start one, noting where each starts in `starts`"""
+        statements = []
+        types = self.types
+        while types[self.pos] in STATEMENT_STARTS:
+            if starts is not None:
+                starts.append(self.pos)
+            statements.append(self.statement(control=True))
+        return statements
+
+    def block(self):
+        if self.types[self.pos] == BEGIN:
+            self.take(BEGIN)
+            statements = self.statement_list()
+            self.take(END)
+            return statements
+        return [self.statement(control=False)]
+
+    def statement(self, control):
+        """A statement, or with `control` also an if, for or while statement"""
+        types = self.types
+        pos = self.pos
+        kind = types[pos]
+        if kind == IDENTIFIER and types[pos + 1] == ASSIGN:
+            return self.assignment()
+        if kind == LET:
+            return self.declaration()
+        if kind == PRINT:
+            return self.print_statement()
+        if kind in _NATURAL_LANG_CONNECTORS:
+            return self.natural_language()
+        if kind == IF:
+            if types[pos + 1] == IDENTIFIER and types[pos + 2] == IS:
+                return self.natural_language_if()
+            if control:
+                return self.if_statement()
+            raise Rejected
+        if kind == FOR and control:
+            return self.for_statement()
+        if kind == WHILE and control:
+            return self.while_statement()
+        if kind == RETURN:
+            return self.return_statement()
+        if kind == BREAK or kind == CONTINUE:
+            return self.break_statement()
+        if kind == FUNCTION:
+            return self.function_definition()
+        # An expression statement; "f(x);" as a control statement is the same Call
+        node = self.expression()
+        self.take(SEMICOLON)
+        return node
+
+    # --------------------------
+    # ASSIGNMENT & DECLARATION
+    # --------------------------
+
+    def assignment(self):
+        name = self.take(IDENTIFIER)
+        self.take(ASSIGN)
+        value = self.expression()
+        self.take(SEMICOLON)
+        node = self.builder.Assign(self.text(name), value, self.lines[name])
+        return self.built(node, self.starts[name])
+
+    def declaration(self):
+        let = self.take(LET)
+        name = self.take(IDENTIFIER)
+        self.take(ASSIGN)
+        value = self.expression()
+        self.take(SEMICOLON)
+        node = self.builder.Declare(self.text(name), value, self.lines[name])
+        return self.built(node, self.starts[let])
+
+    # --------------------------
+    # EXPRESSIONS
+    # --------------------------
+
+    def expression(self):
+        start = self.starts[self.pos]
+        return self.expression_rest(self.term(), start)
+
+    def expression_rest(self, left, start):
+        """Fold the "+" and "-" operands following `left`, which starts at `start`"""
+        types = self.types
+        builder = self.builder
+        while types[self.pos] == PLUS or types[self.pos] == MINUS:
+            op = self.take(types[self.pos])
+            right = self.term()
+            left = self.built(builder.BinOp(self.text(op), left, right, self.lines[op]), start)
+        return left
+
+    def term(self):
+        types = self.types
+        pos = self.pos
+        start = self.starts[pos]
+        if types[pos] == IDENTIFIER and types[pos + 1] == LPAREN:
+            left = self.function_call()
+        else:
+            left = self.factor()
+        return self.term_rest(left, start)
+
+    def term_rest(self, left, start):
+        """Fold the "*" and "/" operands following `left`, which starts at `start`"""
+        types = self.types
+        builder = self.builder
+        while types[self.pos] == TIMES or types[self.pos] == DIVIDE:
+            op = self.take(types[self.pos])
+            right = self.factor()
+            left = self.built(builder.BinOp(self.text(op), left, right, self.lines[op]), start)
+        return left
+
+    def factor(self):
+        pos = self.pos
+        kind = self.types[pos]
+        builder = self.builder
+        if kind == IDENTIFIER:
+            self.take(kind)
+            node = builder.Var(self.text(pos), self.lines[pos])
+        elif kind == INTEGER:
+            self.take(kind)
+            node = builder.Literal(int(self.text(pos)), self.lines[pos])
+        elif kind == FLOAT:
+            self.take(kind)
+            node = builder.Literal(float(self.text(pos)), self.lines[pos])
+        elif kind == STRING:
+            self.take(kind)
+            node = builder.Literal(Lexer.decode_string(self.text(pos)), self.lines[pos])
+        elif kind == TRUE or kind == FALSE:
+            self.take(kind)
+            node = builder.Boolean(self.text(pos), self.lines[pos])
+        elif kind == LPAREN:
+            self.take(LPAREN)
+            inner = self.expression()
+            self.take(RPAREN)
+            # Grouping builds no node; the inner one keeps its own span
+            return inner
+        elif kind == PLUS or kind == MINUS:
+            self.take(kind)
+            operand = self.factor()
+            node = builder.Unary(self.text(pos), operand, self.lines[pos])
+        else:
+            raise Rejected
+        return self.built(node, self.starts[pos])
+
+    # --------------------------
+    # CONTROL STATEMENTS
+    # --------------------------
+
+    def if_statement(self):
+        start = self.take(IF)
+        condition = self.condition()
+        block = self.block()
+        else_part = self.else_part()
+        node = self.builder.If(condition, block, else_part, self.lines[start])
+        return self.built(node, self.starts[start])
+
+    def else_part(self):
+        """The else or elseif chain after an if's block, or None.
+
+        Read in a loop, since a chain can be longer than the recursion limit
+        allows. Its nodes are built innermost first once the whole chain is
+        read, in the order the LR parser reduces them.
+        """
+        types = self.types
+        branches = []
+        while types[self.pos] == ELSEIF:
+            keyword = self.take(ELSEIF)
+            branches.append((keyword, self.condition(), self.block()))
+        builder = self.builder
+        node = None
+        if types[self.pos] == ELSE:
+            keyword = self.take(ELSE)
+            node = self.built(builder.Else(self.block(), self.lines[keyword]), self.starts[keyword])
+        for keyword, condition, block in reversed(branches):
+            node = builder.ElseIf(condition, block, node, self.lines[keyword])
+            self.built(node, self.starts[keyword])
+        return node
+
+    def for_statement(self):
+        start = self.take(FOR)
+        if self.types[self.pos] == LET:
+            # The declaration's node is built, then taken apart, as in the LR action
+            declared = self.builder.declared(self.declaration())
+            kind = "let"
+            name, first = declared
+        else:
+            kind = None
+            name = self.text(self.take(IDENTIFIER))
+            self.take(ASSIGN)
+            first = self.expression()
+        self.take(TO)
+        last = self.expression()
+        step = None
+        if self.types[self.pos] == STEP:
+            self.take(STEP)
+            step = self.expression()
+        block = self.block()
+        node = self.builder.For(kind, name, first, last, step, block, self.lines[start])
+        return self.built(node, self.starts[start])
+
+    def while_statement(self):
+        start = self.take(WHILE)
+        condition = self.condition()
+        block = self.block()
+        node = self.builder.While(condition, block, self.lines[start])
+        return self.built(node, self.starts[start])
+
+    # --------------------------
+    # CONDITIONS
+    # --------------------------
+
+    def condition(self, min_precedence=1):
+        start = self.starts[self.pos]
+        return self.logic_rest(self.condition_operand(), start, min_precedence)
+
+    def logic_rest(self, left, start, min_precedence):
+        """Fold the "and" and "or" operands following `left` that bind at least `min_precedence`"""
+        types = self.types
+        builder = self.builder
+        while True:
+            precedence = LOGIC_PRECEDENCE.get(types[self.pos], 0)
+            if precedence < min_precedence:
+                return left
+            op = self.take(types[self.pos])
+            # Both are left associative: the right operand stops at the same operator
+            right = self.condition(precedence + 1)
+            left = self.built(builder.Logic(self.text(op), left, right, self.lines[op]), start)
+
+    def condition_operand(self):
+        """A comparison, a lone expression, a "not" or a parenthesized condition"""
+        pos = self.pos
+        kind = self.types[pos]
+        start = self.starts[pos]
+        if kind == NOT:
+            self.take(NOT)
+            # "not" binds tighter than "and" and "or"
+            operand = self.condition_operand()
+            return self.built(self.builder.Not(self.text(pos), operand, self.lines[pos]), start)
+        if kind == LPAREN:
+            is_condition, node = self.parenthesized()
+            if is_condition:
+                return node
+            # A factor in parentheses; the expression goes on after it
+            expression = self.expression_rest(self.term_rest(node, start), start)
+        else:
+            expression = self.expression()
+        return self.comparison(expression, start)
+
+    def comparison(self, left, start):
+        """The condition an expression starting at `start` begins"""
+        pos = self.pos
+        builder = self.builder
+        if self.types[pos] in COMPARISONS:
+            self.take(self.types[pos])
+            right = self.expression()
+            node = builder.Compare(self.text(pos), left, right, self.lines[pos])
+        else:
+            # The LR action reads the line of a nonterminal, which is 0
+            node = builder.CondExpr(left, 0)
+        return self.built(node, start)
+
+    def parenthesized(self):
+        """A "(" where a condition is expected, up to its ")".
+
+        Returns (True, GroupedCondition) if a condition is inside, or
+        (False, inner node) if only an expression is: that is a factor.
+        """
+        lparen = self.take(LPAREN)
+        pos = self.pos
+        kind = self.types[pos]
+        start = self.starts[pos]
+        if kind == NOT:
+            inner = self.condition_operand()
+        else:
+            if kind == LPAREN:
+                is_condition, inner = self.parenthesized()
+                if not is_condition:
+                    inner = self.expression_rest(self.term_rest(inner, start), start)
+            else:
+                is_condition = False
+                inner = self.expression()
+            if not is_condition:
+                if self.types[self.pos] == RPAREN:
+                    self.take(RPAREN)
+                    return False, inner
+                inner = self.comparison(inner, start)
+        inner = self.logic_rest(inner, start, 1)
+        self.take(RPAREN)
+        node = self.builder.GroupedCondition(inner, self.lines[lparen])
+        return True, self.built(node, self.starts[lparen])
+
+    # --------------------------
+    # NATURAL LANGUAGE SUPPORT
+    # --------------------------
+
+    def natural_language(self):
+        """set x to e; add e to x; sub e from x; mult x by e; div x by e"""
+        verb = self.pos
+        kind = self.types[verb]
+        self.take(kind)
+        if kind == ADD or kind == SUB:
+            first = self.expression()
+            connector = self.take(_NATURAL_LANG_CONNECTORS[kind])
+            second = self.text(self.take(IDENTIFIER))
+        else:
+            first = self.text(self.take(IDENTIFIER))
+            connector = self.take(_NATURAL_LANG_CONNECTORS[kind])
+            second = self.expression()
+        self.take(SEMICOLON)
+        node = self.builder.NaturalLang(
+            self.text(verb), first, self.text(connector), second, self.lines[verb]
+        )
+        return self.built(node, self.starts[verb])
+
+    def natural_language_if(self):
+        start = self.take(IF)
+        name = self.take(IDENTIFIER)
+        self.take(IS)
+        op = self.pos
+        if self.types[op] not in COMPARISONS:
+            raise Rejected
+        self.take(self.types[op])
+        value = self.expression()
+        self.take(THEN)
+        statements = self.statement_list()
+        node = self.builder.NaturalLangIf(
+            self.text(name), self.text(op), value, statements, self.lines[start]
+        )
+        return self.built(node, self.starts[start])
+
+    # --------------------------
+    # FUNCTION CALL
+    # --------------------------
+
+    def function_call(self):
+        name = self.take(IDENTIFIER)
+        self.take(LPAREN)
+        arguments = []
+        types = self.types
+        while types[self.pos] != RPAREN:
+            arguments.append(self.expression())
+            if types[self.pos] != COMMA:
+                break
+            # A trailing comma is allowed, as in f(a, b,)
+            self.take(COMMA)
+        self.take(RPAREN)
+        node = self.builder.Call(self.text(name), arguments, self.lines[name])
+        return self.built(node, self.starts[name])
+
+    # --------------------------
+    # PRINT STATEMENT
+    # --------------------------
+
+    def print_statement(self):
+        start = self.take(PRINT)
+        self.take(LPAREN)
+        arguments = [self.expression()]
+        while self.types[self.pos] == COMMA:
+            self.take(COMMA)
+            arguments.append(self.expression())
+        self.take(RPAREN)
+        self.take(SEMICOLON)
+        node = self.builder.Print(arguments, self.lines[start])
+        return self.built(node, self.starts[start])
+
+    # --------------------------
+    # FUNCTION DEFINITION
+    # --------------------------
+
+    def function_definition(self):
+        start = self.take(FUNCTION)
+        name = self.take(IDENTIFIER)
+        self.take(LPAREN)
+        parameters = []
+        if self.types[self.pos] != RPAREN:
+            parameters.append(self.text(self.take(IDENTIFIER)))
+            while self.types[self.pos] == COMMA:
+                self.take(COMMA)
+                parameters.append(self.text(self.take(IDENTIFIER)))
+        self.take(RPAREN)
+        block = self.block()
+        node = self.builder.FunctionDef(self.text(name), parameters, block, self.lines[start])
+        return self.built(node, self.starts[start])
+
+    # --------------------------
+    # CONTROL FLOW STATEMENTS
+    # --------------------------
+
+    def return_statement(self):
+        start = self.take(RETURN)
+        value = None
+        if self.types[self.pos] != SEMICOLON:
+            value = self.expression()
+        self.take(SEMICOLON)
+        return self.built(self.builder.Return(value, self.lines[start]), self.starts[start])
+
+    def break_statement(self):
+        """break; or continue;"""
+        start = self.pos
+        kind = self.types[start]
+        self.take(kind)
+        self.take(SEMICOLON)
+        build = self.builder.Break if kind == BREAK else self.builder.Continue
+        return self.built(build(self.lines[start]), self.starts[start])
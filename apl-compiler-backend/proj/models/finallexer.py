@@ -1,5 +1,12 @@
+import threading
+
 import ply.lex as lex
 
+from proj.utilities import diagnostics
+from .line_index import LineIndex
+
+log = diagnostics.get_logger(__name__)
+
 
 class Lexer:
     # Token names - Updated with specific keyword tokens
@@ -113,10 +120,42 @@ class Lexer:
     t_COMMA = r","
     t_SEMICOLON = r";"
 
+    # Process-wide lexer that per-request clones are copied from
+    _prototype = None
+    _prototype_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the lexer with token definitions and rules"""
         # Initialize the lexer
         self.lexer = lex.lex(module=self)
+        self.reset()
+
+    @classmethod
+    def prebuilt(cls):
+        """Return a fresh clone of the process-wide lexer, building it on first use.
+
+        lex.lex() reflects over the class and compiles the master regex, so it
+        only runs once per process; every request gets its own clone.
+        """
+        if cls.__dict__.get("_prototype") is None:
+            with cls._prototype_lock:
+                if cls.__dict__.get("_prototype") is None:
+                    cls._prototype = cls()
+        return cls._prototype.clone()
+
+    def clone(self):
+        """Return a copy sharing the compiled rules but none of the per-request state"""
+        twin = object.__new__(type(self))
+        twin.lexer = self.lexer.clone(twin)
+        if hasattr(twin.lexer, "lexerrorf"):
+            # ply's clone() rebinds the token rules but not t_error
+            twin.lexer.lexerrorf = twin.t_error
+        twin.reset()
+        return twin
+
+    def reset(self):
+        """Reset line tracking, errors and scope state before lexing a new source"""
+        self.lexer.lineno = 1
         self.expecting_variable = False
         self.declared_variables = []
         self.current_scope = 0
@@ -140,6 +179,9 @@ class Lexer:
         r"-?\d+\.\d+"
         t.value = float(t.value)
         t.lineno = t.lexer.lineno
+        # The value no longer gives the lexeme's length; ply has already moved
+        # lexpos past the match
+        t.endlexpos = t.lexer.lexpos
         return t
 
     # Match integer numbers (including negative)
@@ -147,21 +189,27 @@ class Lexer:
         r"-?\d+"
         t.value = int(t.value)
         t.lineno = t.lexer.lineno
+        t.endlexpos = t.lexer.lexpos
         return t
 
     # Match string literals
     def t_STRING(self, t):
         r'"([^"\\]|\\.)*"'
-        t.value = t.value[1:-1]  # Remove quotes
-        # Handle escape sequences
-        t.value = (
-            t.value.replace("\\n", "\n")
+        t.value = self.decode_string(t.value)
+        t.lineno = t.lexer.lineno
+        t.endlexpos = t.lexer.lexpos
+        return t
+
+    @staticmethod
+    def decode_string(lexeme):
+        """Value of a STRING lexeme: quotes removed and escape sequences resolved"""
+        return (
+            lexeme[1:-1]
+            .replace("\\n", "\n")
             .replace("\\t", "\t")
             .replace('\\"', '"')
             .replace("\\\\", "\\")
         )
-        t.lineno = t.lexer.lineno
-        return t
 
     # Match identifiers and keywords
     def t_IDENTIFIER(self, t):
@@ -191,11 +239,13 @@ class Lexer:
 
     # Error handling rule
     def t_error(self, t):
-        print(
-            f"Illegal character '{t.value[0]}' at line {t.lineno}, position {t.lexpos}"
-        )
+        self.illegal_character(t.value[0], t.lineno, t.lexpos)
         t.lexer.skip(1)
 
+    def illegal_character(self, char, lineno, lexpos):
+        """Report a character no token rule accepts"""
+        log.info("Illegal character '%s' at line %d, position %d", char, lineno, lexpos)
+
     # Test function with line numbers and positions
     def test_lexer(self, code, test_name="", show_format="detailed"):
         """Test the lexer with given code
@@ -205,88 +255,78 @@ class Lexer:
             test_name: Name for the test
             show_format: 'detailed', 'lextoken', or 'simple'
         """
-        self.declared_variables, self.scope_stack, self.current_scope
-
         # Reset state for each test
-        self.declared_variables = []
-        self.current_scope = 0
-        self.scope_stack = [set()]
+        self.reset()
 
         self.lexer.input(code)
-        print(f"=== {test_name} ===")
-        print("Tokenized Output:\n")
+        log.info("=== %s ===", test_name)
+        log.info("Tokenized Output:\n")
         tokens_list = []
 
         for token in self.lexer:
             if token.type != "NEWLINE":  # Skip newlines in output for clarity
                 if show_format == "lextoken":
                     # PLY LexToken format: LexToken(TYPE,'value',line,position)
-                    print(
-                        f"LexToken({token.type},'{token.value}',{token.lineno},{token.lexpos})"
+                    log.info(
+                        "LexToken(%s,'%s',%d,%d)", token.type, token.value, token.lineno, token.lexpos
                     )
                 elif show_format == "detailed":
                     # Detailed format with line and column
-                    print(
-                        f"{token.type}: '{token.value}' (line {token.lineno}, pos {token.lexpos})"
+                    log.info(
+                        "%s: '%s' (line %d, pos %d)", token.type, token.value, token.lineno, token.lexpos
                     )
                 else:
                     # Simple format
-                    print(f"{token.type}: {token.value}")
+                    log.info("%s: %s", token.type, token.value)
                 tokens_list.append(token)
 
-        print(f"\nDeclared variables: {self.declared_variables}")
-        print(f"Final scope level: {self.current_scope}")
+        log.info("\nDeclared variables: %s", self.declared_variables)
+        log.info("Final scope level: %s", self.current_scope)
         return tokens_list
 
-    def analyze_tokens(self, code):
-        """Analyze tokens and show detailed position information"""
-        self.declared_variables, self.scope_stack, self.current_scope
+    def analyze_tokens(self, code, line_index=None):
+        """Analyze tokens and show detailed position information
 
+        Args:
+            code: Source code to tokenize
+            line_index: LineIndex of `code`, shared with the parser when given
+        """
         # Reset state
-        self.declared_variables = []
-        self.current_scope = 0
-        self.scope_stack = [set()]
+        self.reset()
 
-        # Split code into lines for reference
-        lines = code.split("\n")
-        print(lines)
+        # Line start offsets, so a token's column is a single lookup
+        if line_index is None:
+            line_index = LineIndex(code)
+        # Checked once instead of three times per token
+        trace = log.isEnabledFor(diagnostics.DEBUG)
+        if trace:
+            log.debug("%s", code.split("\n"))
 
         self.lexer.input(code)
-        print("Token Analysis with Line Context:\n")
-        print("-" * 60)
+        if trace:
+            log.debug("Token Analysis with Line Context:\n")
+            log.debug("-" * 60)
         output = []
         for token in self.lexer:
             if token.type != "NEWLINE":
-                # Calculate column position
-                line_start = 0
-                for i in range(token.lineno - 1):
-                    if i < len(lines):
-                        line_start += len(lines[i]) + 1  # +1 for newline
-
-                col_pos = token.lexpos - line_start + 1
-
                 # Show token with context
-                print(
-                    f"LexToken({token.type},'{token.value}',{token.lineno},{token.lexpos})"
-                )
+                shown = len(output)
                 output.append(
                     f"LexToken({token.type},'{token.value}',{token.lineno},{token.lexpos})"
                 )
-                if token.lineno <= len(lines):
-                    current_line = lines[token.lineno - 1]
-                    print(f"  Line {token.lineno}: {current_line}")
-                    print(f"  Column {col_pos}: {' ' * (col_pos - 1)}^")
-                    output.append(f"  Line {token.lineno}: {lines[token.lineno-1]}")
+                if token.lineno <= line_index.line_count:
+                    col_pos = line_index.column(token.lexpos, token.lineno)
+                    current_line = line_index.line_text(token.lineno)
+                    output.append(f"  Line {token.lineno}: {current_line}")
                     output.append(f"  Column {col_pos}: {' ' * (col_pos - 1)}^")
+                if trace:
+                    for line in output[shown:]:
+                        log.debug("%s", line)
         return output
 
-    def get_column_position(token, code_lines):
+    @staticmethod
+    def get_column_position(token, line_index):
         """Calculate column position for a token"""
-        if token.lineno <= len(code_lines):
-            line = code_lines[token.lineno - 1]
-            # Find the position within the line
-            line_start_pos = sum(
-                len(code_lines[i]) + 1 for i in range(token.lineno - 1)
-            )
-            return token.lexpos - line_start_pos + 1
+        if token.lineno <= line_index.line_count:
+            return line_index.column(token.lexpos, token.lineno)
         return 0
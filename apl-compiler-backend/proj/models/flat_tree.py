@@ -0,0 +1,271 @@
+# Syntax tree held in parallel arrays, for generated programs big enough that
+# one object per node costs too much memory and too long a garbage collection.
+# The parser builds it through FlatTreeBuilder in place of
+# syntax_tree.NodeBuilder; Cursor reads it back with the attributes the node
+# classes have, so the semantic analyzer and to_json walk either tree.
+from array import array
+
+from .syntax_tree import (
+    NODE_TYPES, Assign, BinOp, Boolean, Call, Compare, Declare, For, FunctionDef, Literal, Logic,
+    NaturalLang, NaturalLangIf, Not, String, Unary, Var,
+)
+
+# Kinds past the node classes' own: a leaf holding one literal pool entry (a
+# name, constant or None) and a list of children
+VALUE = len(NODE_TYPES)
+LIST = VALUE + 1
+
+# No node: the end of a child chain, or no span or pool entry
+NONE = -1
+
+# Classes whose first field is always a name, operator or constant. It is
+# kept in the node's own pool index instead of a VALUE child, which spares
+# a row for nearly every node.
+_OWN_VALUE_TYPES = (
+    Declare, Assign, BinOp, Unary, Literal, Boolean, Var, String, For, Compare, Logic, Not,
+    FunctionDef, Call, NaturalLang, NaturalLangIf,
+)
+_OWNS_VALUE = [cls in _OWN_VALUE_TYPES for cls in NODE_TYPES] + [True, False]
+
+# Where each field of a kind is: OWN for the node's pool index, else its
+# position among the node's children
+OWN = -1
+_FIELD_POSITIONS = [
+    {name: i - _OWNS_VALUE[kind] for i, name in enumerate(cls.fields)}
+    for kind, cls in enumerate(NODE_TYPES)
+]
+
+
+class FlatTree:
+    """Nodes as indexes into parallel arrays.
+
+    A node's pool index holds its first field if its class is one of
+    _OWN_VALUE_TYPES. Its other fields are its children in `fields` order,
+    chained from first_child through next_sibling: a node for each node
+    field, a LIST node for each list and a VALUE leaf for everything else.
+    The arrays are not containers the garbage collector tracks, however many
+    nodes they hold.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.values = array("i")
+        self.lines = array("i")
+        self.lexpos = array("i")
+        self.lexlen = array("i")
+        self.pool = []
+        # Pool index of each value, while the tree is being built
+        self._pooled = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @property
+    def columns(self):
+        return (
+            self.kinds, self.first_child, self.next_sibling, self.values,
+            self.lines, self.lexpos, self.lexlen,
+        )
+
+    @property
+    def nbytes(self):
+        """Bytes the arrays hold, leaving out the literal pool's values"""
+        return sum(column.itemsize * len(column) for column in self.columns)
+
+    def add(self, kind, line=0, value=NONE):
+        """Append a node without children or span and return its index"""
+        self.kinds.append(kind)
+        self.first_child.append(NONE)
+        self.next_sibling.append(NONE)
+        self.values.append(value)
+        self.lines.append(line)
+        self.lexpos.append(NONE)
+        self.lexlen.append(0)
+        return len(self.kinds) - 1
+
+    def intern(self, value):
+        """Pool index of `value`, adding it on first use"""
+        # Keyed by type too: 1, 1.0 and True are equal dict keys
+        key = (type(value), value)
+        index = self._pooled.get(key)
+        if index is None:
+            index = self._pooled[key] = len(self.pool)
+            self.pool.append(value)
+        return index
+
+    def children(self, index):
+        """Indexes of a node's children, in order"""
+        child = self.first_child[index]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    def load(self, index):
+        """What a field holding node `index` reads as"""
+        kind = self.kinds[index]
+        if kind == VALUE:
+            return self.pool[self.values[index]]
+        if kind == LIST:
+            return [self.load(child) for child in self.children(index)]
+        return Cursor(self, index)
+
+    def to_json(self, index):
+        """syntax_tree.to_json of the node at `index`, read straight from the arrays"""
+        kind = self.kinds[index]
+        if kind == VALUE:
+            return self.pool[self.values[index]]
+        if kind == LIST:
+            return [self.to_json(child) for child in self.children(index)]
+        result = [NODE_TYPES[kind].tag]
+        if _OWNS_VALUE[kind]:
+            result.append(self.pool[self.values[index]])
+        for child in self.children(index):
+            result.append(self.to_json(child))
+        result.append(self.lines[index])
+        return result
+
+    def cursor(self, index):
+        return Cursor(self, index)
+
+
+class Cursor:
+    """A FlatTree node read like a syntax_tree node.
+
+    It has the node class's kind, tag and fields, and each field as an
+    attribute: nodes come back as cursors, lists as lists and values as
+    themselves. A cursor is made per read, so hold on to the ones walked often.
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def kind(self):
+        return self.tree.kinds[self.index]
+
+    @property
+    def tag(self):
+        return NODE_TYPES[self.kind].tag
+
+    @property
+    def fields(self):
+        return NODE_TYPES[self.kind].fields
+
+    @property
+    def line(self):
+        return self.tree.lines[self.index]
+
+    @property
+    def lexpos(self):
+        lexpos = self.tree.lexpos[self.index]
+        return None if lexpos == NONE else lexpos
+
+    @property
+    def lexlen(self):
+        if self.tree.lexpos[self.index] == NONE:
+            return None
+        return self.tree.lexlen[self.index]
+
+    @property
+    def endlexpos(self):
+        lexpos = self.tree.lexpos[self.index]
+        return None if lexpos == NONE else lexpos + self.tree.lexlen[self.index]
+
+    def __getattr__(self, name):
+        tree = self.tree
+        index = self.index
+        position = _FIELD_POSITIONS[tree.kinds[index]].get(name)
+        if position is None:
+            raise AttributeError(f"{NODE_TYPES[self.kind].__name__} cursor has no field '{name}'")
+        if position == OWN:
+            return tree.pool[tree.values[index]]
+        child = tree.first_child[index]
+        for _ in range(position):
+            child = tree.next_sibling[child]
+        return tree.load(child)
+
+    def to_json(self):
+        return self.tree.to_json(self.index)
+
+    def __eq__(self, other):
+        if type(other) is not Cursor:
+            return NotImplemented
+        return self.tree is other.tree and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return f"Cursor({NODE_TYPES[self.kind].__name__} #{self.index}, line={self.line})"
+
+
+class FlatTreeBuilder:
+    """Answers the parser's node calls (see syntax_tree.NodeBuilder) with
+    indexes into one FlatTree. Use a new builder for every parse."""
+
+    def __init__(self):
+        self.tree = FlatTree()
+
+    def build(self, kind, fields, line, value=NONE):
+        """Append a node of `kind` with pool index `value` and `fields` as its children"""
+        tree = self.tree
+        node = tree.add(kind, line, value)
+        previous = NONE
+        for field in fields:
+            # Every int an action passes outside a node's own value is an index
+            if type(field) is int:
+                child = field
+            elif type(field) is list:
+                child = self.build(LIST, field, 0)
+            else:
+                child = tree.add(VALUE, 0, tree.intern(field))
+            if previous == NONE:
+                tree.first_child[node] = child
+            else:
+                tree.next_sibling[previous] = child
+            previous = child
+        if previous != NONE:
+            # The child may have been linked into a node taken apart since
+            tree.next_sibling[previous] = NONE
+        return node
+
+    def declared(self, node):
+        """name and value of a Declare that a for loop takes apart"""
+        tree = self.tree
+        return tree.pool[tree.values[node]], tree.first_child[node]
+
+    def span(self, node, lexpos, endlexpos):
+        """Give a node just built its source span; a node passed up keeps its own"""
+        if type(node) is int and self.tree.lexpos[node] == NONE:
+            self.tree.lexpos[node] = lexpos
+            self.tree.lexlen[node] = endlexpos - lexpos
+
+    def finish(self, root):
+        """A cursor on the finished tree's root, or None if parsing built none"""
+        if root is None:
+            return None
+        self.tree._pooled = {}
+        return self.tree.cursor(root)
+
+
+def _builds(node_type):
+    kind = node_type.kind
+    if _OWNS_VALUE[kind]:
+        def build(self, value, *fields_and_line):
+            return self.build(
+                kind, fields_and_line[:-1], fields_and_line[-1], self.tree.intern(value)
+            )
+    else:
+        def build(self, *fields_and_line):
+            return self.build(kind, fields_and_line[:-1], fields_and_line[-1])
+    build.__name__ = node_type.__name__
+    return build
+
+
+for _cls in NODE_TYPES:
+    setattr(FlatTreeBuilder, _cls.__name__, _builds(_cls))
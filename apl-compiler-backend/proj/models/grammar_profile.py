@@ -0,0 +1,144 @@
+# What the LR parser spends its time on, by grammar rule. A Parser built
+# with profiled=True counts, in its `profile`:
+#
+#   - the reductions by each production and the time spent in its p_*
+#     action (the span bookkeeping around it not included)
+#   - the LR states the parser loop is in, one count per step
+#   - the tokens shifted, by type; shifts of error are counted apart
+#
+# With APL_GRAMMAR_PROFILE set the pooled parsers are profiled, and each
+# request's profile is merged into `grammar_profile` when its parser goes
+# back to the pool, so the rules that dominate real traffic can be read off
+# report() or to_json().
+import threading
+from collections import Counter
+
+from . import parsetab
+
+# Each production's "name -> symbols" text and the p_* action reducing it
+PRODUCTIONS = [(text, func) for text, _, _, func, _, _ in parsetab._lr_productions]
+STATE_COUNT = 1 + max(max(parsetab._lr_action), max(parsetab._lr_goto))
+
+
+class GrammarProfile:
+    """Counters of one or many parses.
+
+    `reductions[n]` and `seconds[n]` are the reductions by production `n`
+    (as numbered in parsetab) and the time its action took, `states[s]`
+    the parser loop's steps in state `s`, `shifts` the tokens shifted by
+    type and `errors_shifted` the shifts of error.
+    """
+
+    def __init__(self, parses=0):
+        self._lock = threading.Lock()
+        self._reset(parses)
+
+    def _reset(self, parses):
+        self.parses = parses
+        self.reductions = [0] * len(PRODUCTIONS)
+        self.seconds = [0.0] * len(PRODUCTIONS)
+        self.states = [0] * STATE_COUNT
+        self.shifts = Counter()
+        self.errors_shifted = 0
+
+    def merge(self, other):
+        """Add another profile's counts to this one; safe from concurrent requests"""
+        with self._lock:
+            self.parses += other.parses
+            for n, count in enumerate(other.reductions):
+                self.reductions[n] += count
+                self.seconds[n] += other.seconds[n]
+            for state, count in enumerate(other.states):
+                self.states[state] += count
+            self.shifts.update(other.shifts)
+            self.errors_shifted += other.errors_shifted
+
+    def snapshot(self):
+        """A copy of the counts, to read while requests go on adding to them"""
+        copy = GrammarProfile()
+        with self._lock:
+            copy.merge(self)
+        return copy
+
+    def clear(self):
+        with self._lock:
+            self._reset(0)
+
+    def actions(self):
+        """(action, reductions, seconds) per p_* action, the most time first"""
+        totals = {}
+        for n, (_, func) in enumerate(PRODUCTIONS):
+            if func is not None and self.reductions[n]:
+                reductions, seconds = totals.get(func, (0, 0.0))
+                totals[func] = (reductions + self.reductions[n], seconds + self.seconds[n])
+        return sorted(
+            ((func, reductions, seconds) for func, (reductions, seconds) in totals.items()),
+            key=lambda entry: entry[2],
+            reverse=True,
+        )
+
+    def productions(self):
+        """(production, action, reductions, seconds) per production reduced, the most time first"""
+        return sorted(
+            (
+                (text, func, self.reductions[n], self.seconds[n])
+                for n, (text, func) in enumerate(PRODUCTIONS)
+                if self.reductions[n]
+            ),
+            key=lambda entry: entry[3],
+            reverse=True,
+        )
+
+    def to_json(self):
+        """The counters as JSON-ready dicts, each list sorted the most first"""
+        return {
+            "parses": self.parses,
+            "tokensShifted": sum(self.shifts.values()),
+            "errorsShifted": self.errors_shifted,
+            "actions": [
+                {"action": func, "reductions": reductions, "seconds": seconds}
+                for func, reductions, seconds in self.actions()
+            ],
+            "productions": [
+                {"production": text, "action": func, "reductions": reductions, "seconds": seconds}
+                for text, func, reductions, seconds in self.productions()
+            ],
+            "states": [
+                {"state": state, "steps": steps}
+                for state, steps in sorted(enumerate(self.states), key=lambda entry: -entry[1])
+                if steps
+            ],
+            "shifts": [{"token": token, "shifts": count} for token, count in self.shifts.most_common()],
+        }
+
+    def report(self, limit=15):
+        """The `limit` costliest actions, productions and busiest states and tokens, as text"""
+        total = sum(self.seconds) or 1.0
+        lines = [
+            f"{self.parses} parses, {sum(self.shifts.values())} tokens shifted, "
+            f"{sum(self.reductions)} reductions, {sum(self.seconds) * 1e3:.1f} ms in actions",
+            "",
+            f"{'action':<34} {'reductions':>10} {'ms':>9} {'share':>6} {'µs each':>8}",
+        ]
+        for func, reductions, seconds in self.actions()[:limit]:
+            lines.append(
+                f"{func:<34} {reductions:>10} {seconds * 1e3:>9.2f} "
+                f"{seconds / total:>6.1%} {seconds * 1e6 / reductions:>8.2f}"
+            )
+        lines += ["", f"{'production':<60} {'reductions':>10} {'ms':>9} {'share':>6}"]
+        for text, _, reductions, seconds in self.productions()[:limit]:
+            lines.append(f"{text[:60]:<60} {reductions:>10} {seconds * 1e3:>9.2f} {seconds / total:>6.1%}")
+        steps = sum(self.states) or 1
+        lines += ["", f"{'state':<8} {'steps':>10} {'share':>6}"]
+        busiest = sorted(enumerate(self.states), key=lambda entry: -entry[1])[:limit]
+        for state, count in busiest:
+            if count:
+                lines.append(f"{state:<8} {count:>10} {count / steps:>6.1%}")
+        lines += ["", f"{'token':<30} {'shifts':>10}"]
+        for token, count in self.shifts.most_common(limit):
+            lines.append(f"{token:<30} {count:>10}")
+        return "\n".join(lines)
+
+
+# Every profiled request's counts, when APL_GRAMMAR_PROFILE is set
+grammar_profile = GrammarProfile()
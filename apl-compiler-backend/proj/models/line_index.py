@@ -0,0 +1,36 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineIndex:
+    """Start offset of every line in a source, built once per compile.
+
+    Columns of tokens whose line is already known cost one subtraction and
+    any other offset is resolved with a binary search, so position lookups
+    no longer re-scan the lines before them.
+    """
+
+    def __init__(self, code):
+        self.code = code
+        # Line i (1-based) starts at starts[i - 1]; the +1 accounts for the "\n"
+        self.starts = [0]
+        self.starts.extend(accumulate(len(line) + 1 for line in code.split("\n")[:-1]))
+
+    @property
+    def line_count(self):
+        return len(self.starts)
+
+    def line_text(self, lineno):
+        """Return line `lineno` (1-based) without its newline"""
+        start = self.starts[lineno - 1]
+        end = self.starts[lineno] - 1 if lineno < len(self.starts) else len(self.code)
+        return self.code[start:end]
+
+    def column(self, lexpos, lineno):
+        """1-based column of offset `lexpos` on line `lineno`"""
+        return lexpos - self.starts[lineno - 1] + 1
+
+    def locate(self, lexpos):
+        """Return the (line, column) of offset `lexpos`, both 1-based"""
+        lineno = bisect_right(self.starts, lexpos)
+        return lineno, lexpos - self.starts[lineno - 1] + 1
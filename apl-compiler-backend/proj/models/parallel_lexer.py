@@ -0,0 +1,141 @@
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .finallexer import Lexer
+from .token_buffer import TokenBuffer, _shifted
+
+# Everything that can hold a newline without being a NEWLINE token, plus
+# single-line comments so a quote or "/*" inside one is not misread. Tokens
+# are searched leftmost-first exactly as the lexer meets them, so a newline
+# outside these spans is one the lexer consumes as NEWLINE: lexing can start
+# afresh right after it.
+UNSPLITTABLE_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|/\*[\s\S]*?\*/|//[^\n]*')
+
+
+class _ChunkLexer(Lexer):
+    """Lexer run inside a worker: illegal characters are kept for the parent to report"""
+
+    def illegal_character(self, char, lineno, lexpos):
+        self.errors.append((char, lineno, lexpos))
+
+
+def _lex_chunk(chunk, offset, lineno):
+    """Lex one chunk in a worker, positioned as if lexed as part of the whole source"""
+    lexer = _ChunkLexer.prebuilt()
+    buffer = TokenBuffer.from_lexer(lexer.lexer, chunk)
+    errors = [(char, line + lineno - 1, lexpos + offset) for char, line, lexpos in lexer.errors]
+    return (
+        buffer.types,
+        _shifted(buffer.starts, offset),
+        _shifted(buffer.ends, offset),
+        _shifted(buffer.lines, lineno - 1),
+        errors,
+    )
+
+
+def _warm_worker():
+    _ChunkLexer.prebuilt()
+
+
+def split_source(source, parts):
+    """Cut `source` into up to `parts` pieces after newlines the lexer treats as NEWLINE.
+
+    Returns (offset, lineno) of each piece's start. The line number is the
+    one the lexer would have reached there: newlines inside comments count,
+    newlines inside strings do not.
+    """
+    cuts = [(0, 1)]
+    spans = UNSPLITTABLE_PATTERN.finditer(source)
+    span = next(spans, None)
+    offset, lineno = 0, 1
+    string_newlines = 0
+    for part in range(1, parts):
+        pos = max(len(source) * part // parts, offset)
+        while True:
+            newline = source.find("\n", pos)
+            if newline == -1:
+                return cuts
+            # Skip spans that end before the newline, counting newlines in strings
+            while span is not None and span.end() <= newline:
+                if source.startswith('"', span.start()):
+                    string_newlines += source.count("\n", span.start(), span.end())
+                span = next(spans, None)
+            if span is not None and span.start() <= newline:
+                pos = span.end()
+                continue
+            break
+        cut = newline + 1
+        lineno += source.count("\n", offset, cut) - string_newlines
+        string_newlines = 0
+        offset = cut
+        cuts.append((offset, lineno))
+    return cuts
+
+
+class ParallelLexer:
+    """Tokenizes large sources with the Lexer rules in a pool of worker processes.
+
+    The source is split at newlines outside strings and comments, each piece
+    is lexed in a worker and the pieces' token columns are concatenated, so
+    the result is the TokenBuffer a single Lexer would have produced.
+    """
+
+    # Below this many characters per worker, splitting costs more than it saves
+    min_chunk_size = 1 << 18
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @staticmethod
+    def prebuilt():
+        """A single-process Lexer of the same rules, for what is not worth splitting (edits)"""
+        return Lexer.prebuilt()
+
+    def lex(self, source):
+        """Return the TokenBuffer of `source`, reporting illegal characters in order"""
+        parts = min(self.workers, max(1, len(source) // self.min_chunk_size))
+        if parts == 1:
+            return TokenBuffer.from_lexer(Lexer.prebuilt().lexer, source)
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+        cuts = split_source(source, parts)
+        ends = [offset for offset, _ in cuts[1:]] + [len(source)]
+        futures = [
+            self._pool.submit(_lex_chunk, source[offset:end], offset, lineno)
+            for (offset, lineno), end in zip(cuts, ends)
+        ]
+
+        buffer = TokenBuffer(source)
+        reporter = Lexer.prebuilt()
+        for future in futures:
+            types, starts, chunk_ends, lines, errors = future.result()
+            buffer.types.extend(types)
+            buffer.starts.extend(starts)
+            buffer.ends.extend(chunk_ends)
+            buffer.lines.extend(lines)
+            for error in errors:
+                reporter.illegal_character(*error)
+        return buffer
+
+    def close(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Shared by the requests of a process when APL_LEXER_ENGINE is "parallel";
+# its workers only start once a source is large enough to split
+parallel_lexer = ParallelLexer()
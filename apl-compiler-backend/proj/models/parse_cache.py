@@ -0,0 +1,143 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import proj
+from proj import config
+from . import parsetab
+from .flat_tree import Cursor
+from .shared_tree import Occurrence, SharedTree
+from .syntax_tree import Node
+from .token_buffer import TokenBuffer
+
+
+class ParseResult:
+    """What lexing and parsing one source gave: its tokens, tree and syntax errors.
+
+    With errors, `tree` is what the parser recovered around them, or None.
+    `boundaries` are the token indexes the top-level statements start at,
+    then that of the token after the last one, if the parser recorded them
+    (see reparser.reparse). `size` is worked out unless given.
+    """
+
+    __slots__ = ("buffer", "tree", "errors", "boundaries", "size")
+
+    def __init__(self, buffer, tree, errors, boundaries=None, size=None):
+        self.buffer = buffer
+        self.tree = tree
+        self.errors = errors
+        self.boundaries = boundaries
+        self.size = footprint(buffer, tree, errors, boundaries) if size is None else size
+
+
+def footprint(*values):
+    """Approximate bytes held by `values` and everything they refer to"""
+    seen = set()
+    total = 0
+    # Iterative: a long expression is a deep tree
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if value is None or id(value) in seen:
+            continue
+        seen.add(id(value))
+        total += sys.getsizeof(value)
+        if isinstance(value, Node):
+            stack.extend(getattr(value, name) for name in value.fields)
+            stack.extend((value.lexpos, value.lexlen))
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, TokenBuffer):
+            stack.extend((value.source, value.types, value.starts, value.ends, value.lines))
+        elif isinstance(value, Cursor):
+            stack.extend(value.tree.columns)
+            stack.append(value.tree.pool)
+        elif isinstance(value, Occurrence):
+            stack.append(value.tree)
+        elif isinstance(value, SharedTree):
+            # Interned nodes are counted once, however many places share them
+            stack.extend(value.columns)
+            stack.extend((value.root, value.sizes, value.digests))
+        elif isinstance(value, dict):
+            stack.extend(value)
+            stack.extend(value.values())
+    return total
+
+
+class ParseCache:
+    """Parse results of recent sources, least recently used evicted first.
+
+    Bounded by the approximate memory its entries hold rather than their
+    number, since one large program can outweigh hundreds of small ones.
+    Shared by concurrent requests; entries are only read once stored.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source, layout):
+        """Cache key of `source` parsed into a tree of `layout` by this grammar and compiler"""
+        digest = hashlib.sha256()
+        for part in (parsetab._lr_signature, proj.__version__, layout):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        # A request can decode to lone surrogates
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def get(self, key):
+        """The ParseResult stored under `key`, or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        """Store `result`, evicting the least recently used entries to make room"""
+        if result.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+            self._entries[key] = result
+            self.bytes += result.size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Counters for monitoring: hits, misses, evictions, entries and bytes held"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "maxBytes": self.max_bytes,
+            }
+
+
+parse_cache = ParseCache(int(config.PARSE_CACHE_MB * 2**20))
+
+# The latest ParseResult of each document, keyed by the id a request names it by
+document_cache = ParseCache(int(config.DOCUMENT_CACHE_MB * 2**20))
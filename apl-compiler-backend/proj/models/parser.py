@@ -1,5 +1,20 @@
+import copy
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
 import ply.yacc as yacc
 from .finallexer import Lexer
+from .grammar_profile import GrammarProfile, grammar_profile
+from .syntax_tree import NodeBuilder
+from proj import config
+from proj.utilities import diagnostics
+
+log = diagnostics.get_logger(__name__)
+
+# Builds slotted nodes; it keeps no state, so every parser shares it
+NODE_BUILDER = NodeBuilder()
 
 # --------------------------
 # PROGRAM STRUCTURE
@@ -23,12 +38,82 @@ class Parser:
     ('left', 'TIMES_OP', 'DIVIDE_OP'),
     # ('right', 'UMINUS', 'UPLUS')  # For unary -x or +x
     )
-    def __init__(self,lex):
+    # Whether parses are counted in self.profile (see __init__)
+    profiled = False
+    # Actions whose one-symbol productions only hand that symbol's value up
+    # (term : factor, statement : if_statement, ...), most of the reductions
+    # a parse makes; _bind gives these productions _passed in their place
+    PASSING = frozenset({
+        'p_statement', 'p_assignment_statement', 'p_expression_term',
+        'p_term_factor', 'p_control_statement', 'p_statement_extended',
+        'p_printable_item_expr',
+    })
+    # Validated LALR parser that every instance copies its tables from
+    _template = None
+    _template_lock = threading.Lock()
+
+    def __init__(self,lex,profiled=False):
         self.lexer = lex
-        self.parser = yacc.yacc(module=self)
+        # With `profiled`, every parse counts what it does in self.profile,
+        # a new grammar_profile.GrammarProfile after each reset()
+        self.profiled = profiled
+        self.parser = self._bind(self.build_tables())
+        if profiled:
+            _count_steps(self.parser, self)
+        self.reset()
+        #self.scope_stack = [{}] 
+
+    @classmethod
+    def build_tables(cls):
+        """Validate the grammar and load the LALR tables once per process.
+
+        yacc.yacc() re-checks the grammar and the parsetab signature on every
+        call, so it runs once here. parser.out and parsetab.py are only
+        (re)written when APL_PARSER_DEBUG is set.
+        """
+        if cls._template is None:
+            with cls._template_lock:
+                if cls._template is None:
+                    owner = object.__new__(cls)
+                    owner.reset()
+                    cls._template = yacc.yacc(
+                        module=owner,
+                        debug=config.PARSER_DEBUG,
+                        write_tables=config.PARSER_DEBUG,
+                    )
+        return cls._template
+
+    def _bind(self, template):
+        """Copy the shared LR tables into a parser whose actions call this instance"""
+        parser = copy.copy(template)
+        parser.productions = [copy.copy(prod) for prod in template.productions]
+        for number, prod in enumerate(parser.productions):
+            if not prod.func:
+                continue
+            if prod.len == 1 and prod.func in self.PASSING:
+                action = _passed
+            else:
+                action = _spanning(getattr(self, prod.func), prod.len, self)
+            if self.profiled:
+                action = _timed(action, number, self)
+            prod.callable = action
+        parser.errorfunc = self.p_error
+        return parser
+
+    def reset(self, lex=None, line_index=None, builder=None):
+        """Clear the per-request error state before the instance is reused"""
+        if lex is not None:
+            self.lexer = lex
+        # What the actions build the tree with; NodeBuilder unless the
+        # request asked for a flat_tree.FlatTreeBuilder
+        self.builder = builder if builder is not None else NODE_BUILDER
+        # LineIndex of the source being parsed, used to put columns in errors
+        self.line_index = line_index
         self.parseError = False
         self.parseErrorMessage = []
-        #self.scope_stack = [{}] 
+        self.profile = GrammarProfile(parses=1) if self.profiled else None
+        if hasattr(self, "parser"):
+            self.parser.errorok = True
     # def declare_variable(self, name):
     #     if name in self.scope_stack[-1]:
     #         raise SyntaxError(f"Variable '{name}' already declared in current scope.")
@@ -44,29 +129,34 @@ class Parser:
         """
         Check if the name is a reserved keyword or a natural language keyword.
         """
-        if isinstance(name,tuple):
-            return # Skip if it's a tuple (like a declaration node)
+        if not isinstance(name, str):
+            return # Skip if it's a node (like a declaration)
         if name in self.RESERVED_WORDS:
             self.parseErrorMessage.append(f" ❌'{name}' is a reserved keyword and cannot be used as a variable name at line {line}.")
-            print(f" ❌'{name}' is a reserved keyword and cannot be used as a variable name at line {line}.")
+            log.info(" ❌'%s' is a reserved keyword and cannot be used as a variable name at line %s.", name, line)
             
     def p_program(self,p):
         '''program : KEYWORD_BEGIN statement_list KEYWORD_END
+                | KEYWORD_BEGIN statement_list error KEYWORD_END
                 | statement_list'''
        
-        if len(p) == 4:
-            p[0] = ('program', p[2],p.lineno(1))
+        if len(p) >= 4:
+            p[0] = self.builder.Program(p[2],p.lineno(1))
         else:
-            p[0] = ('program', p[1],p.lineno(1))
+            p[0] = self.builder.Program(p[1],p.lineno(1))
         
 
     def p_statement_list(self,p):
-        '''statement_list : statement statement_list
-                        | control_statement statement_list
+        '''statement_list : statement_list statement
+                        | statement_list control_statement
                         | empty'''
-       
+        # Left recursive: each statement is appended as soon as it is parsed,
+        # so the list is built in place and the LR stack stays shallow
         if len(p) == 3:
-            p[0] = [p[1]] + p[2]
+            # A statement with a syntax error is left out
+            if p[2] is not None:
+                p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -81,6 +171,12 @@ class Parser:
         else:
             p[0] = p[1]
 
+    def p_statement_error(self,p):
+        '''statement : error SEMICOLON'''
+        # p_error has reported what went wrong; parsing picks up again after
+        # the statement's semicolon and the statement is left out of the tree
+        p[0] = None
+
     # --------------------------
     # ASSIGNMENT & DECLARATION
     # --------------------------
@@ -94,12 +190,12 @@ class Parser:
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = ('assign', p[1], p[3],p.lineno(1))
+            p[0] = self.builder.Assign(p[1], p[3],p.lineno(1))
 
     def p_declaration(self,p):
         'declaration : KEYWORD_LET IDENTIFIER ASSIGNMENT_OP expression SEMICOLON'
         self.is_variable_keyword(p[2],   p.lineno(1))
-        p[0] = ('declare', p[2], p[4],p.lineno(2))
+        p[0] = self.builder.Declare(p[2], p[4],p.lineno(2))
 
     # --------------------------
     # EXPRESSIONS
@@ -108,7 +204,7 @@ class Parser:
         '''expression : expression PLUS_OP term
                     | expression MINUS_OP term'''
        
-        p[0] = ('binop', p[2], p[1], p[3],p.lineno(2))
+        p[0] = self.builder.BinOp(p[2], p[1], p[3],p.lineno(2))
 
     def p_expression_term(self,p):
         'expression : term'
@@ -119,7 +215,7 @@ class Parser:
         '''term : term TIMES_OP factor
                 | term DIVIDE_OP factor'''
        
-        p[0] = ('binop', p[2], p[1], p[3],p.lineno(2))
+        p[0] = self.builder.BinOp(p[2], p[1], p[3],p.lineno(2))
 
     def p_term_factor(self,p):
         '''term : factor
@@ -132,13 +228,13 @@ class Parser:
                 | FLOAT 
                 | STRING'''
        
-        p[0] = ('literal', p[1],p.lineno(1))
+        p[0] = self.builder.Literal(p[1],p.lineno(1))
 
     def p_factor_variable(self,p):
         'factor : IDENTIFIER'
         self.is_variable_keyword(p[1],   p.lineno(1))
          
-        p[0] = ('var', p[1], p.lineno(1))
+        p[0] = self.builder.Var(p[1], p.lineno(1))
         
     
 
@@ -146,7 +242,7 @@ class Parser:
         '''factor : KEYWORD_TRUE
                 | KEYWORD_FALSE'''
        
-        p[0] = ('boolean', p[1],p.lineno(1))
+        p[0] = self.builder.Boolean(p[1],p.lineno(1))
 
     def p_factor_grouped(self,p):
         'factor : LPAREN expression RPAREN'
@@ -157,7 +253,7 @@ class Parser:
         '''factor : PLUS_OP factor
                 | MINUS_OP factor'''
        
-        p[0] = ('unary', p[1], p[2],p.lineno(1))
+        p[0] = self.builder.Unary(p[1], p[2],p.lineno(1))
 
     # --------------------------
     # CONTROL STATEMENTS
@@ -173,7 +269,7 @@ class Parser:
     def p_if_statement(self,p):
         'if_statement : KEYWORD_IF condition block else_part'
        
-        p[0] = ('if', p[2], p[3], p[4],p.lineno(1))
+        p[0] = self.builder.If(p[2], p[3], p[4],p.lineno(1))
         
         
 
@@ -183,9 +279,9 @@ class Parser:
                     | empty'''
        
         if len(p) == 3:
-            p[0] = ('else', p[2],p.lineno(1))
+            p[0] = self.builder.Else(p[2],p.lineno(1))
         elif len(p) == 5:
-            p[0] = ('elseif', p[2], p[3], p[4],p.lineno(1))
+            p[0] = self.builder.ElseIf(p[2], p[3], p[4],p.lineno(1))
         else:
             p[0] = None
 
@@ -196,30 +292,34 @@ class Parser:
                         | KEYWORD_FOR declaration KEYWORD_TO expression block '''
         self.is_variable_keyword(p[2],   p.lineno(1))
        
-        if isinstance(p[2], tuple) and p[2][0] == 'declare':
-                # p[2] is a declaration node: ('declare', var, start)
-                var_name = p[2][1]
-                start_expr = p[2][2]
+        if not isinstance(p[2], str):
+                # p[2] is a declaration node: let var = start
+                var_name, start_expr = self.builder.declared(p[2])
                 if len(p) == 6:
                     # FOR declaration TO expression block
-                    p[0] = ('for','let', var_name, start_expr, p[4], None, p[5],p.lineno(1))
+                    p[0] = self.builder.For('let', var_name, start_expr, p[4], None, p[5],p.lineno(1))
                 else:
-                    p[0] = ('for','let', var_name, start_expr, p[4], p[6], p[7],p.lineno(1))
+                    p[0] = self.builder.For('let', var_name, start_expr, p[4], p[6], p[7],p.lineno(1))
         else: 
             if len(p) == 8:
-                p[0] = ('for',None, p[2], p[4], p[6], None, p[7],p.lineno(1))
+                p[0] = self.builder.For(None, p[2], p[4], p[6], None, p[7],p.lineno(1))
             else:
-                p[0] = ('for',None, p[2], p[4], p[6], p[8], p[9],p.lineno(1))
+                p[0] = self.builder.For(None, p[2], p[4], p[6], p[8], p[9],p.lineno(1))
 
     def p_while_statement(self, p):
         'while_statement : KEYWORD_WHILE condition block'
-        p[0] = ('while', p[2], p[3],p.lineno(1))
+        p[0] = self.builder.While(p[2], p[3],p.lineno(1))
 
     def p_block(self,p):
         '''block : KEYWORD_BEGIN statement_list KEYWORD_END
+                | KEYWORD_BEGIN statement_list error KEYWORD_END
                 | statement'''
-        if len(p) == 4:
+        # After a syntax error a block keeps the statements before it and
+        # parsing picks up again at its end
+        if len(p) >= 4:
             p[0] = p[2]
+        elif p[1] is None:
+            p[0] = []
         else:
             p[0] = [p[1]]  # Single statement in a block
 
@@ -234,24 +334,24 @@ class Parser:
                     | expression GE_OP expression
                     | expression EQ_OP expression
                     | expression NE_OP expression'''
-        p[0] = ('compare', p[2], p[1], p[3], p.lineno(2))
+        p[0] = self.builder.Compare(p[2], p[1], p[3], p.lineno(2))
 
     def p_condition_logical(self,p):
         '''condition : condition KEYWORD_AND condition
                     | condition KEYWORD_OR condition
                     | KEYWORD_NOT condition'''
         if len(p) == 4:
-            p[0] = ('logic', p[2], p[1], p[3], p.lineno(2))
+            p[0] = self.builder.Logic(p[2], p[1], p[3], p.lineno(2))
         else:
-            p[0] = ('logic', p[1], p[2],p.lineno(1))
+            p[0] = self.builder.Not(p[1], p[2],p.lineno(1))
 
     def p_condition_expr(self, p):
         'condition : expression'
-        p[0] = ('cond_expr', p[1], p.lineno(1)) 
+        p[0] = self.builder.CondExpr(p[1], p.lineno(1)) 
 
     def p_condition_grouped(self, p):
         'condition : LPAREN condition RPAREN'
-        p[0] = ('grouped_condition', p[2], p.lineno(1))
+        p[0] = self.builder.GroupedCondition(p[2], p.lineno(1))
 
     # --------------------------
     # NATURAL LANGUAGE SUPPORT
@@ -275,7 +375,7 @@ class Parser:
 
         self.is_variable_keyword(var, p.lineno(1))
 
-        p[0] = ('natural_lang', op, p[2], connector, p[4], p.lineno(1))
+        p[0] = self.builder.NaturalLang(op, p[2], connector, p[4], p.lineno(1))
 
     def p_natural_language_if(self, p):
         '''natural_language : KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list
@@ -285,7 +385,7 @@ class Parser:
                             | KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG EQ_OP expression THEN_KEYWORD_NATURAL_LANG statement_list
                             | KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG NE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list'''
         self.is_variable_keyword(p[2],   p.lineno(1))
-        p[0] = ('natural_lang_if', p[2], p[4], p[5], p[7], p.lineno(1))
+        p[0] = self.builder.NaturalLangIf(p[2], p[4], p[5], p[7], p.lineno(1))
 
 
     # --------------------------
@@ -295,19 +395,26 @@ class Parser:
     def p_function_call(self,p):
         'function_call : IDENTIFIER LPAREN parameter_list RPAREN'
         self.is_variable_keyword(p[1],   p.lineno(1))
-        p[0] = ('call', p[1], p[3], p.lineno(1))
+        p[0] = self.builder.Call(p[1], p[3], p.lineno(1))
 
     def p_parameter_list(self,p):
-        '''parameter_list : expression COMMA parameter_list
-                        | expression
+        '''parameter_list : argument_list
+                        | argument_list COMMA
                         | empty'''
+        # A trailing comma is allowed, as in f(a, b,)
+        if p[1] is None:
+            p[0] = []
+        else:
+            p[0] = p[1]
+
+    def p_argument_list(self,p):
+        '''argument_list : argument_list COMMA expression
+                        | expression'''
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
-        elif len(p) == 2:
-            if p[1] is None:
-                p[0] = []
-            else:
-                p[0] = [p[1]]
+            p[1].append(p[3])
+            p[0] = p[1]
+        else:
+            p[0] = [p[1]]
 
     # --------------------------
     # PRINT STATEMENT
@@ -315,12 +422,13 @@ class Parser:
 
     def p_print_statement(self, p):
         '''print_statement : KEYWORD_PRINT LPAREN print_arguments RPAREN SEMICOLON'''
-        p[0] = ('print', p[3], p.lineno(1))  # Store the string or expression to print
+        p[0] = self.builder.Print(p[3], p.lineno(1))  # Store the string or expression to print
 
         
     def p_print_arguments_multiple(self, p):
-        '''print_arguments : printable_item COMMA print_arguments'''
-        p[0] = [p[1]] + p[3]
+        '''print_arguments : print_arguments COMMA printable_item'''
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_print_arguments_single(self, p):
         '''print_arguments : printable_item'''
@@ -328,7 +436,7 @@ class Parser:
 
     def p_printable_item_string(self, p):
         '''printable_item : STRING'''
-        p[0] = ('string', p[1], p.lineno(1))
+        p[0] = self.builder.String(p[1], p.lineno(1))
 
     def p_printable_item_expr(self, p):
         '''printable_item : expression'''
@@ -346,17 +454,19 @@ class Parser:
                            | KEYWORD_FUNCTION IDENTIFIER LPAREN RPAREN block'''
         self.is_variable_keyword(p[2],   p.lineno(1))
         if len(p) == 7:
-            p[0] = ('function_def', p[2], p[4], p[6], p.lineno(1))
+            p[0] = self.builder.FunctionDef(p[2], p[4], p[6], p.lineno(1))
         else:
-            p[0] = ('function_def', p[2], [], p[5],p.lineno(1))
+            p[0] = self.builder.FunctionDef(p[2], [], p[5],p.lineno(1))
 
     def p_parameter_declaration_list(self,p):
-        '''parameter_declaration_list : IDENTIFIER COMMA parameter_declaration_list
+        '''parameter_declaration_list : parameter_declaration_list COMMA IDENTIFIER
                                     | IDENTIFIER'''
-        self.is_variable_keyword(p[1],   p.lineno(1))
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
+            self.is_variable_keyword(p[3],   p.lineno(3))
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
+            self.is_variable_keyword(p[1],   p.lineno(1))
             p[0] = [p[1]]
 
     # --------------------------
@@ -367,17 +477,17 @@ class Parser:
         '''return_statement : KEYWORD_RETURN expression SEMICOLON
                         | KEYWORD_RETURN SEMICOLON'''
         if len(p) == 4:
-            p[0] = ('return', p[2],p.lineno(1))
+            p[0] = self.builder.Return(p[2],p.lineno(1))
         else:
-            p[0] = ('return', None,p.lineno(1))
+            p[0] = self.builder.Return(None,p.lineno(1))
 
     def p_break_statement(self, p):
         'break_statement : KEYWORD_BREAK SEMICOLON'
-        p[0] = ('break',p.lineno(1))
+        p[0] = self.builder.Break(p.lineno(1))
         
     def p_continue_statement(self, p):
         'continue_statement : KEYWORD_CONTINUE SEMICOLON'
-        p[0] = ('continue',p.lineno(1))
+        p[0] = self.builder.Continue(p.lineno(1))
 
     # Update statement rule to include new statements
     def p_statement_extended(self,p):
@@ -397,15 +507,176 @@ class Parser:
 
     def p_error(self,p):
         self.parseError = True
-        if p:
-            value = str(p.value).lower()
-            if value in self.RESERVED_WORDS:
-                msg = f"❌ Syntax Error: '{value}' is a reserved keyword and cannot be used in this context (line {p.lineno})"
-                print(msg)
-                self.parseErrorMessage.append(msg)
-            print(f"\n❌ Syntax Error on line {p.lineno}:")
-            print(f"   Unexpected token '{p.value}' of type {p.type}")
-            self.parseErrorMessage.append(f"❌ Syntax error at line {p.lineno}: Unexpected token '{p.value}' of type {p.type}")
-        else:
-            print("Syntax error at EOF")
-            self.parseErrorMessage.append("Syntax error at EOF")
+        self.parseErrorMessage.extend(syntax_error_messages(p, self.line_index))
+
+
+def syntax_error_messages(p, line_index):
+    """What a syntax error at token `p` (None at the end of the source) is reported as.
+
+    Shared with table_parser.TableParser, which reports the errors PLY would.
+    """
+    if not p:
+        log.info("Syntax error at EOF")
+        return ["Syntax error at EOF"]
+    messages = []
+    location = f"line {p.lineno}"
+    if line_index is not None:
+        location += f", column {line_index.column(p.lexpos, p.lineno)}"
+    value = str(p.value).lower()
+    if value in Parser.RESERVED_WORDS:
+        msg = f"❌ Syntax Error: '{value}' is a reserved keyword and cannot be used in this context ({location})"
+        log.info("%s", msg)
+        messages.append(msg)
+    log.info("\n❌ Syntax Error on %s:", location)
+    log.info("   Unexpected token '%s' of type %s", p.value, p.type)
+    messages.append(f"❌ Syntax error at {location}: Unexpected token '{p.value}' of type {p.type}")
+    return messages
+
+
+def _passed(p):
+    """The action of a production handing its one symbol's value up, with its span"""
+    symbols = p.slice
+    symbol = symbols[1]
+    result = symbols[0]
+    result.value = symbol.value
+    result.lexpos = symbol.lexpos
+    result.endlexpos = symbol.endlexpos
+
+
+def _spanning(action, length, owner):
+    """Wrap the action of a production of `length` symbols to record its source span.
+
+    The span runs from the first token the production matched to the end of
+    its last one. It is stored on the production's symbol, where enclosing
+    productions find it, and given by `owner`'s builder to the node the
+    action built, if it is new.
+    """
+    if length == 0:
+        def spanned(p):
+            action(p)
+            result = p.slice[0]
+            result.lexpos = result.endlexpos = None
+        return spanned
+
+    def spanned(p):
+        action(p)
+        symbols = p.slice
+        start = getattr(symbols[1], "lexpos", None)
+        end = getattr(symbols[length], "endlexpos", None)
+        if start is None or end is None:
+            start, end = _span(symbols, length)
+        result = symbols[0]
+        result.lexpos = start
+        result.endlexpos = end
+        # A program without statements has no span
+        if start is not None:
+            owner.builder.span(result.value, start, end)
+    return spanned
+
+
+def _span(symbols, length):
+    """The (start, end) of `length` symbols some of which, as empty
+    productions do, may have no span"""
+    start = end = None
+    for first in range(1, length + 1):
+        start = getattr(symbols[first], "lexpos", None)
+        if start is not None:
+            for last in range(length, first - 1, -1):
+                symbol = symbols[last]
+                end = getattr(symbol, "endlexpos", None)
+                if end is None:
+                    # A token whose value is its text; the others carry endlexpos
+                    lexpos = getattr(symbol, "lexpos", None)
+                    if lexpos is not None:
+                        end = lexpos + len(symbol.value)
+                if end is not None:
+                    break
+            break
+    return start, end
+
+
+def _timed(action, number, owner):
+    """Wrap the action of production `number` to count it and its time in `owner`'s profile"""
+    clock = time.perf_counter
+
+    def timed(p):
+        start = clock()
+        action(p)
+        profile = owner.profile
+        profile.seconds[number] += clock() - start
+        profile.reductions[number] += 1
+    return timed
+
+
+class _CountedSteps(dict):
+    """LRParser's defaulted states, counting the states its loop is in.
+
+    The loop asks whether its state is defaulted at every step.
+    """
+
+    def __init__(self, defaulted, owner):
+        super().__init__(defaulted)
+        self.owner = owner
+
+    def __contains__(self, state):
+        self.owner.profile.states[state] += 1
+        return dict.__contains__(self, state)
+
+
+class _CountedShifts(dict):
+    """A row of LRParser's action table, counting the shifts it gives by token type"""
+
+    def __init__(self, row, owner):
+        super().__init__(row)
+        self.owner = owner
+
+    def get(self, token_type, default=None):
+        action = dict.get(self, token_type, default)
+        if action is not None and action > 0:
+            profile = self.owner.profile
+            if token_type == "error":
+                profile.errors_shifted += 1
+            else:
+                profile.shifts[token_type] += 1
+        return action
+
+
+def _count_steps(parser, owner):
+    """Give a parser copy tables counting its steps and shifts in `owner`'s profile"""
+    parser.action = {state: _CountedShifts(row, owner) for state, row in parser.action.items()}
+    parser.defaulted_states = _CountedSteps(parser.defaulted_states, owner)
+
+
+class ParserPool:
+    """A small pool of ready Parser instances shared by concurrent requests"""
+
+    def __init__(self, size, profiled=False):
+        self.size = size
+        # Whether the parsers it makes count what they do (see Parser.profile)
+        self.profiled = profiled
+        self._idle = queue.LifoQueue()
+
+    def warm(self):
+        """Fill the pool at startup so no request pays for building a parser"""
+        while self._idle.qsize() < self.size:
+            self._idle.put(Parser(None, self.profiled))
+
+    @contextmanager
+    def checkout(self, lex, line_index=None, builder=None):
+        """Lend out a parser with its error state reset, returning it afterwards"""
+        try:
+            parser = self._idle.get_nowait()
+        except queue.Empty:
+            # All pooled parsers are busy; an extra one only copies the shared tables
+            parser = Parser(None, self.profiled)
+        parser.reset(lex, line_index, builder)
+        try:
+            yield parser
+        finally:
+            if parser.profile is not None:
+                grammar_profile.merge(parser.profile)
+            if self._idle.qsize() < self.size:
+                self._idle.put(parser)
+
+
+parser_pool = ParserPool(config.PARSER_POOL_SIZE, config.GRAMMAR_PROFILE)
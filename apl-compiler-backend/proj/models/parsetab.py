@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightASSIGNMENT_OPleftKEYWORD_ORleftKEYWORD_ANDrightKEYWORD_NOTnonassocLT_OPGT_OPLE_OPGE_OPEQ_OPNE_OPleftPLUS_OPMINUS_OPleftTIMES_OPDIVIDE_OPADD_KEYWORD_NATURAL_LANG ASSIGNMENT_OP BY_KEYWORD_NATURAL_LANG COMMA DIVIDE_OP DIV_KEYWORD_NATURAL_LANG EQ_OP FLOAT FROM_KEYWORD_NATURAL_LANG GE_OP GT_OP IDENTIFIER INTEGER IS_KEYWORD_NATURAL_LANG KEYWORD_AND KEYWORD_BEGIN KEYWORD_BREAK KEYWORD_CONTINUE KEYWORD_ELSE KEYWORD_ELSEIF KEYWORD_END KEYWORD_FALSE KEYWORD_FOR KEYWORD_FUNCTION KEYWORD_IF KEYWORD_LET KEYWORD_NOT KEYWORD_OR KEYWORD_PRINT KEYWORD_RETURN KEYWORD_STEP KEYWORD_TO KEYWORD_TRUE KEYWORD_WHILE LBRACE LE_OP LPAREN LT_OP MINUS_OP MULT_KEYWORD_NATURAL_LANG NEWLINE NE_OP PLUS_OP RBRACE RPAREN SEMICOLON SET_KEYWORD_NATURAL_LANG STRING SUB_KEYWORD_NATURAL_LANG THEN_KEYWORD_NATURAL_LANG TIMES_OPprogram : KEYWORD_BEGIN statement_list KEYWORD_END\n| statement_liststatement_list : statement statement_list\n| control_statement statement_list\n| emptystatement : assignment_statement\n| expression SEMICOLON   \n| print_statement\n| natural_languageassignment_statement : declaration\n| IDENTIFIER ASSIGNMENT_OP expression SEMICOLONdeclaration : KEYWORD_LET IDENTIFIER ASSIGNMENT_OP expression SEMICOLONexpression : expression PLUS_OP term\n| expression MINUS_OP termexpression : termterm : term TIMES_OP factor\n| term DIVIDE_OP factorterm : factor\n| function_callfactor : INTEGER\n| FLOAT \n| STRINGfactor : IDENTIFIERfactor : KEYWORD_TRUE\n| KEYWORD_FALSEfactor : LPAREN expression RPARENfactor : PLUS_OP factor\n| MINUS_OP factorcontrol_statement : if_statement\n| for_statement\n| while_statement\n| function_call SEMICOLONif_statement : KEYWORD_IF condition block else_partelse_part : KEYWORD_ELSE block\n| KEYWORD_ELSEIF condition block else_part\n| emptyfor_statement : KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression block\n| KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression KEYWORD_STEP expression block\n| KEYWORD_FOR declaration KEYWORD_TO expression KEYWORD_STEP expression block \n| KEYWORD_FOR declaration KEYWORD_TO expression block while_statement : KEYWORD_WHILE condition blockblock : KEYWORD_BEGIN statement_list KEYWORD_END\n| statementcondition : expression LT_OP expression\n| expression GT_OP expression\n| expression LE_OP expression\n| expression GE_OP expression\n| expression EQ_OP expression\n| expression NE_OP expressioncondition : condition KEYWORD_AND condition\n| condition KEYWORD_OR condition\n| KEYWORD_NOT conditioncondition : expressioncondition : LPAREN condition RPARENnatural_language : SET_KEYWORD_NATURAL_LANG IDENTIFIER KEYWORD_TO expression SEMICOLON\n| ADD_KEYWORD_NATURAL_LANG expression KEYWORD_TO IDENTIFIER SEMICOLON\n| SUB_KEYWORD_NATURAL_LANG expression FROM_KEYWORD_NATURAL_LANG IDENTIFIER SEMICOLON\n| MULT_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON\n| DIV_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLONnatural_language : KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG EQ_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG NE_OP expression THEN_KEYWORD_NATURAL_LANG statement_listfunction_call : IDENTIFIER LPAREN parameter_list RPARENparameter_list : expression COMMA parameter_list\n| expression\n| emptyprint_statement : KEYWORD_PRINT LPAREN print_arguments RPAREN SEMICOLONprint_arguments : printable_item COMMA print_argumentsprint_arguments : printable_itemprintable_item : STRINGprintable_item : expressionfunction_definition : KEYWORD_FUNCTION IDENTIFIER LPAREN parameter_declaration_list RPAREN block\n| KEYWORD_FUNCTION IDENTIFIER LPAREN RPAREN blockparameter_declaration_list : IDENTIFIER COMMA parameter_declaration_list\n| IDENTIFIERreturn_statement : KEYWORD_RETURN expression SEMICOLON\n| KEYWORD_RETURN SEMICOLONbreak_statement : KEYWORD_BREAK SEMICOLONcontinue_statement : KEYWORD_CONTINUE SEMICOLONstatement : return_statement\n| break_statement\n| continue_statement\n| function_definitionempty :'
+_lr_signature = 'rightASSIGNMENT_OPleftKEYWORD_ORleftKEYWORD_ANDrightKEYWORD_NOTnonassocLT_OPGT_OPLE_OPGE_OPEQ_OPNE_OPleftPLUS_OPMINUS_OPleftTIMES_OPDIVIDE_OPADD_KEYWORD_NATURAL_LANG ASSIGNMENT_OP BY_KEYWORD_NATURAL_LANG COMMA DIVIDE_OP DIV_KEYWORD_NATURAL_LANG EQ_OP FLOAT FROM_KEYWORD_NATURAL_LANG GE_OP GT_OP IDENTIFIER INTEGER IS_KEYWORD_NATURAL_LANG KEYWORD_AND KEYWORD_BEGIN KEYWORD_BREAK KEYWORD_CONTINUE KEYWORD_ELSE KEYWORD_ELSEIF KEYWORD_END KEYWORD_FALSE KEYWORD_FOR KEYWORD_FUNCTION KEYWORD_IF KEYWORD_LET KEYWORD_NOT KEYWORD_OR KEYWORD_PRINT KEYWORD_RETURN KEYWORD_STEP KEYWORD_TO KEYWORD_TRUE KEYWORD_WHILE LBRACE LE_OP LPAREN LT_OP MINUS_OP MULT_KEYWORD_NATURAL_LANG NEWLINE NE_OP PLUS_OP RBRACE RPAREN SEMICOLON SET_KEYWORD_NATURAL_LANG STRING SUB_KEYWORD_NATURAL_LANG THEN_KEYWORD_NATURAL_LANG TIMES_OPprogram : KEYWORD_BEGIN statement_list KEYWORD_END\n| KEYWORD_BEGIN statement_list error KEYWORD_END\n| statement_liststatement_list : statement_list statement\n| statement_list control_statement\n| emptystatement : assignment_statement\n| expression SEMICOLON   \n| print_statement\n| natural_languagestatement : error SEMICOLONassignment_statement : declaration\n| IDENTIFIER ASSIGNMENT_OP expression SEMICOLONdeclaration : KEYWORD_LET IDENTIFIER ASSIGNMENT_OP expression SEMICOLONexpression : expression PLUS_OP term\n| expression MINUS_OP termexpression : termterm : term TIMES_OP factor\n| term DIVIDE_OP factorterm : factor\n| function_callfactor : INTEGER\n| FLOAT \n| STRINGfactor : IDENTIFIERfactor : KEYWORD_TRUE\n| KEYWORD_FALSEfactor : LPAREN expression RPARENfactor : PLUS_OP factor\n| MINUS_OP factorcontrol_statement : if_statement\n| for_statement\n| while_statement\n| function_call SEMICOLONif_statement : KEYWORD_IF condition block else_partelse_part : KEYWORD_ELSE block\n| KEYWORD_ELSEIF condition block else_part\n| emptyfor_statement : KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression block\n| KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression KEYWORD_STEP expression block\n| KEYWORD_FOR declaration KEYWORD_TO expression KEYWORD_STEP expression block \n| KEYWORD_FOR declaration KEYWORD_TO expression block while_statement : KEYWORD_WHILE condition blockblock : KEYWORD_BEGIN statement_list KEYWORD_END\n| KEYWORD_BEGIN statement_list error KEYWORD_END\n| statementcondition : expression LT_OP expression\n| expression GT_OP expression\n| expression LE_OP expression\n| expression GE_OP expression\n| expression EQ_OP expression\n| expression NE_OP expressioncondition : condition KEYWORD_AND condition\n| condition KEYWORD_OR condition\n| KEYWORD_NOT conditioncondition : expressioncondition : LPAREN condition RPARENnatural_language : SET_KEYWORD_NATURAL_LANG IDENTIFIER KEYWORD_TO expression SEMICOLON\n| ADD_KEYWORD_NATURAL_LANG expression KEYWORD_TO IDENTIFIER SEMICOLON\n| SUB_KEYWORD_NATURAL_LANG expression FROM_KEYWORD_NATURAL_LANG IDENTIFIER SEMICOLON\n| MULT_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON\n| DIV_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLONnatural_language : KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG EQ_OP expression THEN_KEYWORD_NATURAL_LANG statement_list\n| KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG NE_OP expression THEN_KEYWORD_NATURAL_LANG statement_listfunction_call : IDENTIFIER LPAREN parameter_list RPARENparameter_list : argument_list\n| argument_list COMMA\n| emptyargument_list : argument_list COMMA expression\n| expressionprint_statement : KEYWORD_PRINT LPAREN print_arguments RPAREN SEMICOLONprint_arguments : print_arguments COMMA printable_itemprint_arguments : printable_itemprintable_item : STRINGprintable_item : expressionfunction_definition : KEYWORD_FUNCTION IDENTIFIER LPAREN parameter_declaration_list RPAREN block\n| KEYWORD_FUNCTION IDENTIFIER LPAREN RPAREN blockparameter_declaration_list : parameter_declaration_list COMMA IDENTIFIER\n| IDENTIFIERreturn_statement : KEYWORD_RETURN expression SEMICOLON\n| KEYWORD_RETURN SEMICOLONbreak_statement : KEYWORD_BREAK SEMICOLONcontinue_statement : KEYWORD_CONTINUE SEMICOLONstatement : return_statement\n| break_statement\n| continue_statement\n| function_definitionempty :'
     
-_lr_action_items = {'KEYWORD_BEGIN':([0,22,39,40,41,42,43,44,54,55,58,61,62,68,69,70,80,83,84,89,90,95,115,125,140,141,142,143,144,145,148,151,152,154,157,159,176,179,196,197,198,199,210,],[2,-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,-53,112,112,-13,-14,-16,-17,-26,-52,-66,-44,-45,-46,-47,-48,-49,112,-50,-51,-54,112,112,112,112,112,112,-18,-18,112,]),'$end':([0,1,3,4,5,6,7,9,10,11,12,13,14,15,16,17,19,46,47,48,51,74,75,76,82,109,113,118,122,124,147,150,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[-87,0,-2,-87,-87,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-3,-4,-7,-32,-80,-81,-82,-1,-87,-43,-79,-41,-11,-33,-36,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,-87,-87,-87,-87,-87,-87,-87,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'IDENTIFIER':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,26,27,28,29,30,31,32,35,36,37,38,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,97,98,99,100,102,103,104,105,106,107,108,109,110,111,112,113,115,118,119,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[20,20,20,20,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,55,-15,55,62,63,62,62,66,67,68,62,77,78,62,81,-18,-20,-21,-22,-24,-25,-3,-4,-7,62,62,-32,62,62,-27,-23,55,55,-28,62,-19,-23,-23,-53,114,62,62,-80,-81,-82,114,-13,-14,-16,-17,-26,62,130,131,62,62,62,62,62,62,62,62,146,-87,62,62,20,-43,-52,-79,155,62,62,-41,62,-11,-66,62,62,62,62,62,62,62,62,-44,-45,-46,-47,-48,-49,-33,114,62,-36,-50,-51,-54,114,114,-70,-55,-56,-57,-58,-59,-34,114,-42,155,114,-76,62,62,-40,62,62,-12,20,20,20,20,20,20,-87,-75,114,114,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,62,-39,114,-38,]),'KEYWORD_PRINT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[24,24,24,24,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,24,-80,-81,-82,24,-13,-14,-16,-17,-26,-87,24,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,24,-36,-50,-51,-54,24,24,-70,-55,-56,-57,-58,-59,-34,24,-42,24,-76,-40,-12,24,24,24,24,24,24,-87,-75,24,24,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,24,-38,]),'SET_KEYWORD_NATURAL_LANG':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[26,26,26,26,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,26,-80,-81,-82,26,-13,-14,-16,-17,-26,-87,26,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,26,-36,-50,-51,-54,26,26,-70,-55,-56,-57,-58,-59,-34,26,-42,26,-76,-40,-12,26,26,26,26,26,26,-87,-75,26,26,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,26,-38,]),'ADD_KEYWORD_NATURAL_LANG':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[27,27,27,27,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,27,-80,-81,-82,27,-13,-14,-16,-17,-26,-87,27,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,27,-36,-50,-51,-54,27,27,-70,-55,-56,-57,-58,-59,-34,27,-42,27,-76,-40,-12,27,27,27,27,27,27,-87,-75,27,27,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,27,-38,]),'SUB_KEYWORD_NATURAL_LANG':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[28,28,28,28,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,28,-80,-81,-82,28,-13,-14,-16,-17,-26,-87,28,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,28,-36,-50,-51,-54,28,28,-70,-55,-56,-57,-58,-59,-34,28,-42,28,-76,-40,-12,28,28,28,28,28,28,-87,-75,28,28,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,28,-38,]),'MULT_KEYWORD_NATURAL_LANG':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[29,29,29,29,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,29,-80,-81,-82,29,-13,-14,-16,-17,-26,-87,29,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,29,-36,-50,-51,-54,29,29,-70,-55,-56,-57,-58,-59,-34,29,-42,29,-76,-40,-12,29,29,29,29,29,29,-87,-75,29,29,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,29,-38,]),'DIV_KEYWORD_NATURAL_LANG':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[30,30,30,30,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,30,-80,-81,-82,30,-13,-14,-16,-17,-26,-87,30,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,30,-36,-50,-51,-54,30,30,-70,-55,-56,-57,-58,-59,-34,30,-42,30,-76,-40,-12,30,30,30,30,30,30,-87,-75,30,30,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,30,-38,]),'KEYWORD_IF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[31,31,31,31,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,108,-80,-81,-82,108,-13,-14,-16,-17,-26,-87,31,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,108,-36,-50,-51,-54,108,108,-70,-55,-56,-57,-58,-59,-34,108,-42,108,-76,-40,-12,31,31,31,31,31,31,-87,-75,108,108,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,108,-38,]),'KEYWORD_RETURN':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[32,32,32,32,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,32,-80,-81,-82,32,-13,-14,-16,-17,-26,-87,32,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,32,-36,-50,-51,-54,32,32,-70,-55,-56,-57,-58,-59,-34,32,-42,32,-76,-40,-12,32,32,32,32,32,32,-87,-75,32,32,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,32,-38,]),'KEYWORD_BREAK':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[33,33,33,33,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,33,-80,-81,-82,33,-13,-14,-16,-17,-26,-87,33,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,33,-36,-50,-51,-54,33,33,-70,-55,-56,-57,-58,-59,-34,33,-42,33,-76,-40,-12,33,33,33,33,33,33,-87,-75,33,33,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,33,-38,]),'KEYWORD_CONTINUE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[34,34,34,34,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,34,-80,-81,-82,34,-13,-14,-16,-17,-26,-87,34,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,34,-36,-50,-51,-54,34,34,-70,-55,-56,-57,-58,-59,-34,34,-42,34,-76,-40,-12,34,34,34,34,34,34,-87,-75,34,34,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,34,-38,]),'KEYWORD_FUNCTION':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[35,35,35,35,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,35,-80,-81,-82,35,-13,-14,-16,-17,-26,-87,35,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,35,-36,-50,-51,-54,35,35,-70,-55,-56,-57,-58,-59,-34,35,-42,35,-76,-40,-12,35,35,35,35,35,35,-87,-75,35,35,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,35,-38,]),'KEYWORD_FOR':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,46,47,48,51,74,75,76,109,112,113,118,122,124,147,150,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[36,36,36,36,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-3,-4,-7,-32,-80,-81,-82,-87,36,-43,-79,-41,-11,-33,-36,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,36,36,36,36,36,36,-87,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'KEYWORD_WHILE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,46,47,48,51,74,75,76,109,112,113,118,122,124,147,150,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[37,37,37,37,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-3,-4,-7,-32,-80,-81,-82,-87,37,-43,-79,-41,-11,-33,-36,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,37,37,37,37,37,37,-87,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'KEYWORD_LET':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,22,36,39,40,41,42,43,44,46,47,48,51,54,55,58,61,62,68,69,70,74,75,76,80,83,84,89,90,95,109,112,113,115,118,122,124,125,140,141,142,143,144,145,147,148,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,183,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,209,210,211,],[38,38,38,38,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-15,38,-18,-20,-21,-22,-24,-25,-3,-4,-7,-32,-27,-23,-28,-19,-23,-23,-53,38,-80,-81,-82,38,-13,-14,-16,-17,-26,-87,38,-43,-52,-79,-41,-11,-66,-44,-45,-46,-47,-48,-49,-33,38,-36,-50,-51,-54,38,38,-70,-55,-56,-57,-58,-59,-34,38,-42,38,-76,-40,-12,38,38,38,38,38,38,-87,-75,38,38,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,-39,38,-38,]),'INTEGER':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[40,40,40,40,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,40,-15,40,40,40,40,40,40,40,-18,-20,-21,-22,-24,-25,-3,-4,-7,40,40,-32,40,40,-27,-23,40,40,-28,40,-19,-23,-23,-53,40,40,40,-80,-81,-82,40,-13,-14,-16,-17,-26,40,40,40,40,40,40,40,40,40,-87,40,40,40,-43,-52,-79,40,40,-41,40,-11,-66,40,40,40,40,40,40,40,40,-44,-45,-46,-47,-48,-49,-33,40,40,-36,-50,-51,-54,40,40,-70,-55,-56,-57,-58,-59,-34,40,-42,40,-76,40,40,-40,40,40,-12,40,40,40,40,40,40,-87,-75,40,40,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,40,-39,40,-38,]),'FLOAT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[41,41,41,41,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,41,-15,41,41,41,41,41,41,41,-18,-20,-21,-22,-24,-25,-3,-4,-7,41,41,-32,41,41,-27,-23,41,41,-28,41,-19,-23,-23,-53,41,41,41,-80,-81,-82,41,-13,-14,-16,-17,-26,41,41,41,41,41,41,41,41,41,-87,41,41,41,-43,-52,-79,41,41,-41,41,-11,-66,41,41,41,41,41,41,41,41,-44,-45,-46,-47,-48,-49,-33,41,41,-36,-50,-51,-54,41,41,-70,-55,-56,-57,-58,-59,-34,41,-42,41,-76,41,41,-40,41,41,-12,41,41,41,41,41,41,-87,-75,41,41,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,41,-39,41,-38,]),'STRING':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[42,42,42,42,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,42,-15,42,42,42,42,42,42,42,-18,-20,-21,-22,-24,-25,-3,-4,-7,42,42,-32,42,42,-27,-23,42,42,-28,93,-19,-23,-23,-53,42,42,42,-80,-81,-82,42,-13,-14,-16,-17,-26,42,42,42,42,42,42,42,42,42,-87,42,42,42,-43,-52,-79,42,42,-41,42,-11,-66,42,93,42,42,42,42,42,42,-44,-45,-46,-47,-48,-49,-33,42,42,-36,-50,-51,-54,42,42,-70,-55,-56,-57,-58,-59,-34,42,-42,42,-76,42,42,-40,42,42,-12,42,42,42,42,42,42,-87,-75,42,42,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,42,-39,42,-38,]),'KEYWORD_TRUE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[43,43,43,43,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,43,-15,43,43,43,43,43,43,43,-18,-20,-21,-22,-24,-25,-3,-4,-7,43,43,-32,43,43,-27,-23,43,43,-28,43,-19,-23,-23,-53,43,43,43,-80,-81,-82,43,-13,-14,-16,-17,-26,43,43,43,43,43,43,43,43,43,-87,43,43,43,-43,-52,-79,43,43,-41,43,-11,-66,43,43,43,43,43,43,43,43,-44,-45,-46,-47,-48,-49,-33,43,43,-36,-50,-51,-54,43,43,-70,-55,-56,-57,-58,-59,-34,43,-42,43,-76,43,43,-40,43,43,-12,43,43,43,43,43,43,-87,-75,43,43,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,43,-39,43,-38,]),'KEYWORD_FALSE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[44,44,44,44,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,44,-15,44,44,44,44,44,44,44,-18,-20,-21,-22,-24,-25,-3,-4,-7,44,44,-32,44,44,-27,-23,44,44,-28,44,-19,-23,-23,-53,44,44,44,-80,-81,-82,44,-13,-14,-16,-17,-26,44,44,44,44,44,44,44,44,44,-87,44,44,44,-43,-52,-79,44,44,-41,44,-11,-66,44,44,44,44,44,44,44,44,-44,-45,-46,-47,-48,-49,-33,44,44,-36,-50,-51,-54,44,44,-70,-55,-56,-57,-58,-59,-34,44,-42,44,-76,44,44,-40,44,44,-12,44,44,44,44,44,44,-87,-75,44,44,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,44,-39,44,-38,]),'LPAREN':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,68,69,70,71,72,74,75,76,77,80,83,84,89,90,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,114,115,118,120,121,122,123,124,125,126,128,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,159,162,164,165,166,167,168,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[25,25,25,25,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,53,25,-15,25,59,25,25,25,72,25,72,-18,-20,-21,-22,-24,-25,-3,-4,-7,25,25,-32,25,25,-27,-23,25,25,-28,25,-19,53,53,-53,25,72,72,-80,-81,-82,119,25,-13,-14,-16,-17,-26,25,25,25,25,25,25,25,25,25,-87,72,72,25,-43,53,-52,-79,25,25,-41,25,-11,-66,25,25,25,25,25,25,25,25,-44,-45,-46,-47,-48,-49,-33,25,72,-36,-50,-51,-54,25,25,-70,-55,-56,-57,-58,-59,-34,25,-42,25,-76,25,25,-40,25,25,-12,25,25,25,25,25,25,-87,-75,25,25,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,25,-39,25,-38,]),'PLUS_OP':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,64,65,68,69,70,71,72,73,74,75,76,80,83,84,85,87,89,90,93,94,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,114,115,117,118,120,121,122,123,124,125,126,128,129,132,133,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,158,159,160,162,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[21,21,21,21,-5,-6,49,-8,-9,-83,-84,-85,-86,-29,-30,-31,-19,-10,-23,21,-15,21,21,21,21,21,21,21,-18,-20,-21,-22,-24,-25,-3,-4,-7,21,21,-32,21,21,-27,-23,21,21,-28,21,49,-19,-23,49,49,-23,49,21,21,21,49,-80,-81,-82,21,-13,-14,49,49,-16,-17,-22,49,-26,21,21,21,21,21,21,21,21,21,-87,21,21,21,-43,-23,-52,49,-79,21,21,-41,21,-11,-66,21,21,49,49,49,21,21,21,21,21,21,49,49,49,49,49,49,-33,21,21,-36,-50,-51,-54,21,49,184,49,-70,-55,-56,-57,-58,-59,49,49,49,49,49,49,-34,21,-42,21,-76,21,21,-40,21,21,-12,21,21,21,21,21,21,-87,-75,184,184,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,21,-39,184,-38,]),'MINUS_OP':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,27,28,31,32,37,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,64,65,68,69,70,71,72,73,74,75,76,80,83,84,85,87,89,90,93,94,95,96,99,100,102,103,104,105,106,107,109,110,111,112,113,114,115,117,118,120,121,122,123,124,125,126,128,129,132,133,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,154,157,158,159,160,162,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,],[23,23,23,23,-5,-6,50,-8,-9,-83,-84,-85,-86,-29,-30,-31,-19,-10,-23,23,-15,23,23,23,23,23,23,23,-18,-20,-21,-22,-24,-25,-3,-4,-7,23,23,-32,23,23,-27,-23,23,23,-28,23,50,-19,-23,50,50,-23,50,23,23,23,50,-80,-81,-82,23,-13,-14,50,50,-16,-17,-22,50,-26,23,23,23,23,23,23,23,23,23,-87,23,23,23,-43,-23,-52,50,-79,23,23,-41,23,-11,-66,23,23,50,50,50,23,23,23,23,23,23,50,50,50,50,50,50,-33,23,23,-36,-50,-51,-54,23,50,185,50,-70,-55,-56,-57,-58,-59,50,50,50,50,50,50,-34,23,-42,23,-76,23,23,-40,23,23,-12,23,23,23,23,23,23,-87,-75,185,185,-18,-18,-60,-61,-62,-63,-64,-65,-35,-37,23,-39,185,-38,]),'KEYWORD_END':([2,4,5,6,7,9,10,11,12,13,14,15,16,17,19,45,46,47,48,51,74,75,76,109,112,113,118,122,124,147,150,153,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[-87,-87,-87,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,82,-3,-4,-7,-32,-80,-81,-82,-87,-87,-43,-79,-41,-11,-33,-36,177,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,-87,-87,-87,-87,-87,-87,-87,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'KEYWORD_ELSE':([4,5,6,7,9,10,11,12,13,14,15,16,17,19,46,47,48,51,74,75,76,109,113,118,122,124,147,150,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[-87,-87,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-3,-4,-7,-32,-80,-81,-82,148,-43,-79,-41,-11,-33,-36,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,-87,-87,-87,-87,-87,-87,148,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'KEYWORD_ELSEIF':([4,5,6,7,9,10,11,12,13,14,15,16,17,19,46,47,48,51,74,75,76,109,113,118,122,124,147,150,162,164,165,166,167,168,175,177,180,183,186,187,188,189,190,191,192,193,195,200,201,202,203,204,205,206,207,209,211,],[-87,-87,-5,-6,-8,-9,-83,-84,-85,-86,-29,-30,-31,-10,-3,-4,-7,-32,-80,-81,-82,149,-43,-79,-41,-11,-33,-36,-70,-55,-56,-57,-58,-59,-34,-42,-76,-40,-12,-87,-87,-87,-87,-87,-87,149,-75,-60,-61,-62,-63,-64,-65,-35,-37,-39,-38,]),'SEMICOLON':([8,18,20,22,32,33,34,39,40,41,42,43,44,54,55,58,61,62,73,83,84,85,89,90,95,114,125,127,129,130,131,132,133,160,198,199,],[48,51,-23,-15,74,75,76,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,118,-13,-14,124,-16,-17,-26,-23,-66,162,164,165,166,167,168,186,-18,-18,]),'TIMES_OP':([18,20,22,39,40,41,42,43,44,54,55,58,61,62,68,83,84,89,90,93,95,114,125,198,199,],[-19,-23,56,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,56,56,-16,-17,-22,-26,-23,-66,-18,-18,]),'DIVIDE_OP':([18,20,22,39,40,41,42,43,44,54,55,58,61,62,68,83,84,89,90,93,95,114,125,198,199,],[-19,-23,57,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,57,57,-16,-17,-22,-26,-23,-66,-18,-18,]),'ASSIGNMENT_OP':([20,78,81,114,],[52,120,123,52,]),'RPAREN':([22,39,40,41,42,43,44,53,54,55,58,60,61,62,69,83,84,86,87,88,89,90,91,92,93,94,95,115,116,117,119,125,126,140,141,142,143,144,145,151,152,154,155,156,161,163,194,],[-15,-18,-20,-21,-22,-24,-25,-87,-27,-23,-28,95,-19,-23,-53,-13,-14,125,-68,-69,-16,-17,127,-72,-22,-74,-26,-52,154,95,157,-66,-87,-44,-45,-46,-47,-48,-49,-50,-51,-54,-78,179,-67,-71,-77,]),'KEYWORD_TO':([22,39,40,41,42,43,44,54,55,58,61,62,63,64,79,83,84,89,90,95,125,158,186,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,96,97,121,-13,-14,-16,-17,-26,-66,181,-12,]),'FROM_KEYWORD_NATURAL_LANG':([22,39,40,41,42,43,44,54,55,58,61,62,65,83,84,89,90,95,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,98,-13,-14,-16,-17,-26,-66,]),'LT_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,102,-13,-14,-16,-17,-26,134,102,-66,]),'GT_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,103,-13,-14,-16,-17,-26,135,103,-66,]),'LE_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,104,-13,-14,-16,-17,-26,136,104,-66,]),'GE_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,105,-13,-14,-16,-17,-26,137,105,-66,]),'EQ_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,106,-13,-14,-16,-17,-26,138,106,-66,]),'NE_OP':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,83,84,89,90,95,101,117,125,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,107,-13,-14,-16,-17,-26,139,107,-66,]),'KEYWORD_AND':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,70,80,83,84,89,90,95,115,116,117,125,140,141,142,143,144,145,151,152,154,176,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,-53,110,110,-13,-14,-16,-17,-26,-52,110,-53,-66,-44,-45,-46,-47,-48,-49,-50,110,-54,110,]),'KEYWORD_OR':([22,39,40,41,42,43,44,54,55,58,61,62,68,69,70,80,83,84,89,90,95,115,116,117,125,140,141,142,143,144,145,151,152,154,176,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-23,-53,111,111,-13,-14,-16,-17,-26,-52,111,-53,-66,-44,-45,-46,-47,-48,-49,-50,-51,-54,111,]),'COMMA':([22,39,40,41,42,43,44,54,55,58,61,62,83,84,87,89,90,92,93,94,95,125,155,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-13,-14,126,-16,-17,128,-22,-74,-26,-66,178,]),'KEYWORD_STEP':([22,39,40,41,42,43,44,54,55,58,61,62,83,84,89,90,95,125,159,196,198,199,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-13,-14,-16,-17,-26,-66,182,208,-18,-18,]),'THEN_KEYWORD_NATURAL_LANG':([22,39,40,41,42,43,44,54,55,58,61,62,83,84,89,90,95,125,169,170,171,172,173,174,],[-15,-18,-20,-21,-22,-24,-25,-27,-23,-28,-19,-23,-13,-14,-16,-17,-26,-66,187,188,189,190,191,192,]),'KEYWORD_NOT':([31,37,71,72,110,111,149,],[71,71,71,71,71,71,71,]),'BY_KEYWORD_NATURAL_LANG':([66,67,],[99,100,]),'IS_KEYWORD_NATURAL_LANG':([68,146,],[101,101,]),}
+_lr_action_items = {'KEYWORD_BEGIN':([0,24,41,42,43,44,45,46,56,57,60,63,64,70,71,72,82,85,86,92,93,98,118,128,143,144,145,146,147,148,151,154,155,157,160,162,179,182,201,202,203,204,215,],[2,-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,-56,115,115,-15,-16,-18,-19,-28,-55,-69,-47,-48,-49,-50,-51,-52,115,-53,-54,-57,115,115,115,115,115,115,-20,-20,115,]),'error':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,12,-6,48,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,12,-85,-86,-87,12,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,12,-38,-53,-54,181,-57,12,12,-75,-58,-59,-60,-61,-62,-36,12,-44,12,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,12,12,-20,-20,12,12,12,12,12,12,-37,-39,-41,12,-40,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,116,118,121,122,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,22,-6,22,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,57,-17,57,64,65,64,64,68,69,70,64,79,80,64,83,-20,-22,-23,-24,-26,-27,-8,64,64,-11,-34,64,64,-29,-25,57,57,-30,64,-21,-25,-25,-56,117,64,64,-85,-86,-87,117,-15,-16,-18,-19,-28,64,133,134,64,64,64,64,64,64,64,64,149,-92,64,64,-92,-46,-55,-84,158,64,64,-43,64,-13,-69,64,64,64,64,64,64,64,64,-47,-48,-49,-50,-51,-52,-35,117,64,-38,-53,-54,22,-57,117,117,-75,-58,-59,-60,-61,-62,-36,117,-44,117,200,-81,64,64,-42,64,64,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,117,117,-20,-20,22,22,22,22,22,22,-37,-39,64,-41,117,-40,]),'KEYWORD_PRINT':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,26,-6,26,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,26,-85,-86,-87,26,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,26,-38,-53,-54,26,-57,26,26,-75,-58,-59,-60,-61,-62,-36,26,-44,26,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,26,26,-20,-20,26,26,26,26,26,26,-37,-39,-41,26,-40,]),'SET_KEYWORD_NATURAL_LANG':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,28,-6,28,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,28,-85,-86,-87,28,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,28,-38,-53,-54,28,-57,28,28,-75,-58,-59,-60,-61,-62,-36,28,-44,28,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,28,28,-20,-20,28,28,28,28,28,28,-37,-39,-41,28,-40,]),'ADD_KEYWORD_NATURAL_LANG':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,29,-6,29,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,29,-85,-86,-87,29,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,29,-38,-53,-54,29,-57,29,29,-75,-58,-59,-60,-61,-62,-36,29,-44,29,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,29,29,-20,-20,29,29,29,29,29,29,-37,-39,-41,29,-40,]),'SUB_KEYWORD_NATURAL_LANG':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,30,-6,30,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,30,-85,-86,-87,30,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,30,-38,-53,-54,30,-57,30,30,-75,-58,-59,-60,-61,-62,-36,30,-44,30,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,30,30,-20,-20,30,30,30,30,30,30,-37,-39,-41,30,-40,]),'MULT_KEYWORD_NATURAL_LANG':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,31,-6,31,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,31,-85,-86,-87,31,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,31,-38,-53,-54,31,-57,31,31,-75,-58,-59,-60,-61,-62,-36,31,-44,31,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,31,31,-20,-20,31,31,31,31,31,31,-37,-39,-41,31,-40,]),'DIV_KEYWORD_NATURAL_LANG':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,32,-6,32,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,32,-85,-86,-87,32,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,32,-38,-53,-54,32,-57,32,32,-75,-58,-59,-60,-61,-62,-36,32,-44,32,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,32,32,-20,-20,32,32,32,32,32,32,-37,-39,-41,32,-40,]),'KEYWORD_IF':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,33,-6,33,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,111,-85,-86,-87,111,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,111,-38,-53,-54,33,-57,111,111,-75,-58,-59,-60,-61,-62,-36,111,-44,111,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,111,111,-20,-20,33,33,33,33,33,33,-37,-39,-41,111,-40,]),'KEYWORD_RETURN':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,34,-6,34,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,34,-85,-86,-87,34,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,34,-38,-53,-54,34,-57,34,34,-75,-58,-59,-60,-61,-62,-36,34,-44,34,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,34,34,-20,-20,34,34,34,34,34,34,-37,-39,-41,34,-40,]),'KEYWORD_BREAK':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,35,-6,35,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,35,-85,-86,-87,35,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,35,-38,-53,-54,35,-57,35,35,-75,-58,-59,-60,-61,-62,-36,35,-44,35,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,35,35,-20,-20,35,35,35,35,35,35,-37,-39,-41,35,-40,]),'KEYWORD_CONTINUE':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,36,-6,36,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,36,-85,-86,-87,36,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,36,-38,-53,-54,36,-57,36,36,-75,-58,-59,-60,-61,-62,-36,36,-44,36,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,36,36,-20,-20,36,36,36,36,36,36,-37,-39,-41,36,-40,]),'KEYWORD_FUNCTION':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,37,-6,37,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,37,-85,-86,-87,37,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,37,-38,-53,-54,37,-57,37,37,-75,-58,-59,-60,-61,-62,-36,37,-44,37,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,37,37,-20,-20,37,37,37,37,37,37,-37,-39,-41,37,-40,]),'KEYWORD_FOR':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,49,52,53,76,77,78,112,115,116,121,125,127,150,153,156,165,167,168,169,170,171,178,180,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-92,-92,38,-6,38,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-8,-11,-34,-85,-86,-87,-92,-92,-46,-84,-43,-13,-35,-38,38,-75,-58,-59,-60,-61,-62,-36,-44,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,38,38,38,38,38,38,-37,-39,-41,-40,]),'KEYWORD_WHILE':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,49,52,53,76,77,78,112,115,116,121,125,127,150,153,156,165,167,168,169,170,171,178,180,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-92,-92,39,-6,39,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-8,-11,-34,-85,-86,-87,-92,-92,-46,-84,-43,-13,-35,-38,39,-75,-58,-59,-60,-61,-62,-36,-44,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,39,39,39,39,39,39,-37,-39,-41,-40,]),'KEYWORD_LET':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,24,38,41,42,43,44,45,46,49,52,53,56,57,60,63,64,70,71,72,76,77,78,82,85,86,92,93,98,112,115,116,118,121,125,127,128,143,144,145,146,147,148,150,151,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,187,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,214,215,216,],[-92,-92,40,-6,40,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-17,40,-20,-22,-23,-24,-26,-27,-8,-11,-34,-29,-25,-30,-21,-25,-25,-56,40,-85,-86,-87,40,-15,-16,-18,-19,-28,-92,-92,-46,-55,-84,-43,-13,-69,-47,-48,-49,-50,-51,-52,-35,40,-38,-53,-54,40,-57,40,40,-75,-58,-59,-60,-61,-62,-36,40,-44,40,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,40,40,-20,-20,40,40,40,40,40,40,-37,-39,-41,40,-40,]),'INTEGER':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,42,-6,42,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,42,-17,42,42,42,42,42,42,42,-20,-22,-23,-24,-26,-27,-8,42,42,-11,-34,42,42,-29,-25,42,42,-30,42,-21,-25,-25,-56,42,42,42,-85,-86,-87,42,-15,-16,-18,-19,-28,42,42,42,42,42,42,42,42,42,-92,42,42,-92,-46,-55,-84,42,42,-43,42,-13,-69,42,42,42,42,42,42,42,42,-47,-48,-49,-50,-51,-52,-35,42,42,-38,-53,-54,42,-57,42,42,-75,-58,-59,-60,-61,-62,-36,42,-44,42,-81,42,42,-42,42,42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,42,42,-20,-20,42,42,42,42,42,42,-37,-39,42,-41,42,-40,]),'FLOAT':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,43,-6,43,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,43,-17,43,43,43,43,43,43,43,-20,-22,-23,-24,-26,-27,-8,43,43,-11,-34,43,43,-29,-25,43,43,-30,43,-21,-25,-25,-56,43,43,43,-85,-86,-87,43,-15,-16,-18,-19,-28,43,43,43,43,43,43,43,43,43,-92,43,43,-92,-46,-55,-84,43,43,-43,43,-13,-69,43,43,43,43,43,43,43,43,-47,-48,-49,-50,-51,-52,-35,43,43,-38,-53,-54,43,-57,43,43,-75,-58,-59,-60,-61,-62,-36,43,-44,43,-81,43,43,-42,43,43,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,43,43,-20,-20,43,43,43,43,43,43,-37,-39,43,-41,43,-40,]),'STRING':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,44,-6,44,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,44,-17,44,44,44,44,44,44,44,-20,-22,-23,-24,-26,-27,-8,44,44,-11,-34,44,44,-29,-25,44,44,-30,96,-21,-25,-25,-56,44,44,44,-85,-86,-87,44,-15,-16,-18,-19,-28,44,44,44,44,44,44,44,44,44,-92,44,44,-92,-46,-55,-84,44,44,-43,44,-13,-69,44,96,44,44,44,44,44,44,-47,-48,-49,-50,-51,-52,-35,44,44,-38,-53,-54,44,-57,44,44,-75,-58,-59,-60,-61,-62,-36,44,-44,44,-81,44,44,-42,44,44,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,44,44,-20,-20,44,44,44,44,44,44,-37,-39,44,-41,44,-40,]),'KEYWORD_TRUE':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,45,-6,45,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,45,-17,45,45,45,45,45,45,45,-20,-22,-23,-24,-26,-27,-8,45,45,-11,-34,45,45,-29,-25,45,45,-30,45,-21,-25,-25,-56,45,45,45,-85,-86,-87,45,-15,-16,-18,-19,-28,45,45,45,45,45,45,45,45,45,-92,45,45,-92,-46,-55,-84,45,45,-43,45,-13,-69,45,45,45,45,45,45,45,45,-47,-48,-49,-50,-51,-52,-35,45,45,-38,-53,-54,45,-57,45,45,-75,-58,-59,-60,-61,-62,-36,45,-44,45,-81,45,45,-42,45,45,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,45,45,-20,-20,45,45,45,45,45,45,-37,-39,45,-41,45,-40,]),'KEYWORD_FALSE':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,46,-6,46,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,46,-17,46,46,46,46,46,46,46,-20,-22,-23,-24,-26,-27,-8,46,46,-11,-34,46,46,-29,-25,46,46,-30,46,-21,-25,-25,-56,46,46,46,-85,-86,-87,46,-15,-16,-18,-19,-28,46,46,46,46,46,46,46,46,46,-92,46,46,-92,-46,-55,-84,46,46,-43,46,-13,-69,46,46,46,46,46,46,46,46,-47,-48,-49,-50,-51,-52,-35,46,46,-38,-53,-54,46,-57,46,46,-75,-58,-59,-60,-61,-62,-36,46,-44,46,-81,46,46,-42,46,46,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,46,46,-20,-20,46,46,46,46,46,46,-37,-39,46,-41,46,-40,]),'LPAREN':([0,2,3,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,70,71,72,73,74,76,77,78,79,82,85,86,92,93,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,117,118,121,123,124,125,126,127,128,129,131,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,162,165,167,168,169,170,171,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,27,-6,27,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,55,27,-17,27,61,27,27,27,74,27,74,-20,-22,-23,-24,-26,-27,-8,27,27,-11,-34,27,27,-29,-25,27,27,-30,27,-21,55,55,-56,27,74,74,-85,-86,-87,122,27,-15,-16,-18,-19,-28,27,27,27,27,27,27,27,27,27,-92,74,74,-92,-46,55,-55,-84,27,27,-43,27,-13,-69,27,27,27,27,27,27,27,27,-47,-48,-49,-50,-51,-52,-35,27,74,-38,-53,-54,27,-57,27,27,-75,-58,-59,-60,-61,-62,-36,27,-44,27,-81,27,27,-42,27,27,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,27,27,-20,-20,27,27,27,27,27,27,-37,-39,27,-41,27,-40,]),'PLUS_OP':([0,2,3,4,5,6,7,8,9,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,70,71,72,73,74,75,76,77,78,82,85,86,87,91,92,93,96,97,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,117,118,120,121,123,124,125,126,127,128,129,131,132,135,136,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,23,-6,23,-4,-5,-7,50,-9,-10,-88,-89,-90,-91,-31,-32,-33,-21,-12,-25,23,-17,23,23,23,23,23,23,23,-20,-22,-23,-24,-26,-27,-8,23,23,-11,-34,23,23,-29,-25,23,23,-30,23,50,-21,-25,50,50,-25,50,23,23,23,50,-85,-86,-87,23,-15,-16,50,50,-18,-19,-24,50,-28,23,23,23,23,23,23,23,23,23,-92,23,23,-92,-46,-25,-55,50,-84,23,23,-43,23,-13,-69,23,23,50,50,50,23,23,23,23,23,23,50,50,50,50,50,50,-35,23,23,-38,-53,-54,23,-57,23,50,188,50,50,-75,-58,-59,-60,-61,-62,50,50,50,50,50,50,-36,23,-44,23,-81,23,23,-42,23,23,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,188,188,-20,-20,23,23,23,23,23,23,-37,-39,23,-41,188,-40,]),'MINUS_OP':([0,2,3,4,5,6,7,8,9,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,33,34,39,41,42,43,44,45,46,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,70,71,72,73,74,75,76,77,78,82,85,86,87,91,92,93,96,97,98,99,102,103,105,106,107,108,109,110,112,113,114,115,116,117,118,120,121,123,124,125,126,127,128,129,131,132,135,136,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,156,157,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,],[-92,-92,25,-6,25,-4,-5,-7,51,-9,-10,-88,-89,-90,-91,-31,-32,-33,-21,-12,-25,25,-17,25,25,25,25,25,25,25,-20,-22,-23,-24,-26,-27,-8,25,25,-11,-34,25,25,-29,-25,25,25,-30,25,51,-21,-25,51,51,-25,51,25,25,25,51,-85,-86,-87,25,-15,-16,51,51,-18,-19,-24,51,-28,25,25,25,25,25,25,25,25,25,-92,25,25,-92,-46,-25,-55,51,-84,25,25,-43,25,-13,-69,25,25,51,51,51,25,25,25,25,25,25,51,51,51,51,51,51,-35,25,25,-38,-53,-54,25,-57,25,51,189,51,51,-75,-58,-59,-60,-61,-62,51,51,51,51,51,51,-36,25,-44,25,-81,25,25,-42,25,25,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,189,189,-20,-20,25,25,25,25,25,25,-37,-39,25,-41,189,-40,]),'$end':([0,1,3,4,6,7,8,10,11,13,14,15,16,17,18,19,21,47,49,52,53,76,77,78,84,112,116,121,125,127,150,153,165,167,168,169,170,171,178,180,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-92,0,-3,-6,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-1,-8,-11,-34,-85,-86,-87,-2,-92,-46,-84,-43,-13,-35,-38,-75,-58,-59,-60,-61,-62,-36,-44,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,-63,-64,-65,-66,-67,-68,-37,-39,-41,-40,]),'KEYWORD_END':([2,4,5,6,7,8,10,11,13,14,15,16,17,18,19,21,48,49,52,53,76,77,78,112,115,116,121,125,127,150,153,156,165,167,168,169,170,171,178,180,181,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-92,-6,47,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,84,-8,-11,-34,-85,-86,-87,-92,-92,-46,-84,-43,-13,-35,-38,180,-75,-58,-59,-60,-61,-62,-36,-44,198,-81,-42,-14,-92,-92,-92,-92,-92,-92,-92,-45,-80,-63,-64,-65,-66,-67,-68,-37,-39,-41,-40,]),'KEYWORD_ELSE':([4,6,7,8,10,11,13,14,15,16,17,18,19,21,49,52,53,76,77,78,112,116,121,125,127,150,153,165,167,168,169,170,171,178,180,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-6,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-8,-11,-34,-85,-86,-87,151,-46,-84,-43,-13,-35,-38,-75,-58,-59,-60,-61,-62,-36,-44,-81,-42,-14,-92,-92,-92,-92,-92,-92,151,-45,-80,-63,-64,-65,-66,-67,-68,-37,-39,-41,-40,]),'KEYWORD_ELSEIF':([4,6,7,8,10,11,13,14,15,16,17,18,19,21,49,52,53,76,77,78,112,116,121,125,127,150,153,165,167,168,169,170,171,178,180,184,187,190,191,192,193,194,195,196,197,198,199,205,206,207,208,209,210,211,212,214,216,],[-6,-4,-5,-7,-9,-10,-88,-89,-90,-91,-31,-32,-33,-12,-8,-11,-34,-85,-86,-87,152,-46,-84,-43,-13,-35,-38,-75,-58,-59,-60,-61,-62,-36,-44,-81,-42,-14,-92,-92,-92,-92,-92,-92,152,-45,-80,-63,-64,-65,-66,-67,-68,-37,-39,-41,-40,]),'SEMICOLON':([9,12,20,22,24,34,35,36,41,42,43,44,45,46,48,56,57,60,63,64,75,85,86,87,92,93,98,117,128,130,132,133,134,135,136,163,181,203,204,],[49,52,53,-25,-17,76,77,78,-20,-22,-23,-24,-26,-27,52,-29,-25,-30,-21,-25,121,-15,-16,127,-18,-19,-28,-25,-69,165,167,168,169,170,171,190,52,-20,-20,]),'TIMES_OP':([20,22,24,41,42,43,44,45,46,56,57,60,63,64,70,85,86,92,93,96,98,117,128,203,204,],[-21,-25,58,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,58,58,-18,-19,-24,-28,-25,-69,-20,-20,]),'DIVIDE_OP':([20,22,24,41,42,43,44,45,46,56,57,60,63,64,70,85,86,92,93,96,98,117,128,203,204,],[-21,-25,59,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,59,59,-18,-19,-24,-28,-25,-69,-20,-20,]),'ASSIGNMENT_OP':([22,80,83,117,],[54,123,126,54,]),'RPAREN':([24,41,42,43,44,45,46,55,56,57,60,62,63,64,71,85,86,88,89,90,91,92,93,94,95,96,97,98,118,119,120,122,128,129,143,144,145,146,147,148,154,155,157,158,159,164,166,200,],[-17,-20,-22,-23,-24,-26,-27,-92,-29,-25,-30,98,-21,-25,-56,-15,-16,128,-70,-72,-74,-18,-19,130,-77,-24,-79,-28,-55,157,98,160,-69,-71,-47,-48,-49,-50,-51,-52,-53,-54,-57,-83,182,-73,-76,-82,]),'KEYWORD_TO':([24,41,42,43,44,45,46,56,57,60,63,64,65,66,81,85,86,92,93,98,128,161,190,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,99,100,124,-15,-16,-18,-19,-28,-69,185,-14,]),'FROM_KEYWORD_NATURAL_LANG':([24,41,42,43,44,45,46,56,57,60,63,64,67,85,86,92,93,98,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,101,-15,-16,-18,-19,-28,-69,]),'LT_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,105,-15,-16,-18,-19,-28,137,105,-69,]),'GT_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,106,-15,-16,-18,-19,-28,138,106,-69,]),'LE_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,107,-15,-16,-18,-19,-28,139,107,-69,]),'GE_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,108,-15,-16,-18,-19,-28,140,108,-69,]),'EQ_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,109,-15,-16,-18,-19,-28,141,109,-69,]),'NE_OP':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,85,86,92,93,98,104,120,128,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,110,-15,-16,-18,-19,-28,142,110,-69,]),'KEYWORD_AND':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,72,82,85,86,92,93,98,118,119,120,128,143,144,145,146,147,148,154,155,157,179,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,-56,113,113,-15,-16,-18,-19,-28,-55,113,-56,-69,-47,-48,-49,-50,-51,-52,-53,113,-57,113,]),'KEYWORD_OR':([24,41,42,43,44,45,46,56,57,60,63,64,70,71,72,82,85,86,92,93,98,118,119,120,128,143,144,145,146,147,148,154,155,157,179,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-25,-56,114,114,-15,-16,-18,-19,-28,-55,114,-56,-69,-47,-48,-49,-50,-51,-52,-53,-54,-57,114,]),'COMMA':([24,41,42,43,44,45,46,56,57,60,63,64,85,86,89,91,92,93,94,95,96,97,98,128,158,159,164,166,200,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-15,-16,129,-74,-18,-19,131,-77,-24,-79,-28,-69,-83,183,-73,-76,-82,]),'KEYWORD_STEP':([24,41,42,43,44,45,46,56,57,60,63,64,85,86,92,93,98,128,162,201,203,204,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-15,-16,-18,-19,-28,-69,186,213,-20,-20,]),'THEN_KEYWORD_NATURAL_LANG':([24,41,42,43,44,45,46,56,57,60,63,64,85,86,92,93,98,128,172,173,174,175,176,177,],[-17,-20,-22,-23,-24,-26,-27,-29,-25,-30,-21,-25,-15,-16,-18,-19,-28,-69,191,192,193,194,195,196,]),'KEYWORD_NOT':([33,39,73,74,113,114,152,],[73,73,73,73,73,73,73,]),'BY_KEYWORD_NATURAL_LANG':([68,69,],[102,103,]),'IS_KEYWORD_NATURAL_LANG':([70,149,],[104,104,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,2,4,5,112,187,188,189,190,191,192,],[3,45,46,47,153,200,201,202,203,204,205,]),'statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[4,4,4,4,113,113,4,113,113,113,113,113,4,4,4,4,4,4,113,113,113,]),'control_statement':([0,2,4,5,112,187,188,189,190,191,192,],[5,5,5,5,5,5,5,5,5,5,5,]),'empty':([0,2,4,5,53,109,112,126,187,188,189,190,191,192,193,],[6,6,6,6,88,150,6,88,6,6,6,6,6,6,150,]),'assignment_statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'expression':([0,2,4,5,25,27,28,31,32,37,52,53,59,70,71,72,80,96,99,100,102,103,104,105,106,107,110,111,112,120,121,123,126,128,134,135,136,137,138,139,148,149,157,159,176,179,181,182,187,188,189,190,191,192,196,197,208,210,],[8,8,8,8,60,64,65,69,73,69,85,87,94,8,69,117,8,129,132,133,140,141,142,143,144,145,69,69,8,158,159,160,87,94,169,170,171,172,173,174,8,69,8,8,8,8,196,197,8,8,8,8,8,8,8,8,210,8,]),'print_statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'natural_language':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'return_statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'break_statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'continue_statement':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'function_definition':([0,2,4,5,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'if_statement':([0,2,4,5,112,187,188,189,190,191,192,],[15,15,15,15,15,15,15,15,15,15,15,]),'for_statement':([0,2,4,5,112,187,188,189,190,191,192,],[16,16,16,16,16,16,16,16,16,16,16,]),'while_statement':([0,2,4,5,112,187,188,189,190,191,192,],[17,17,17,17,17,17,17,17,17,17,17,]),'function_call':([0,2,4,5,25,27,28,31,32,37,49,50,52,53,59,70,71,72,80,96,99,100,102,103,104,105,106,107,110,111,112,120,121,123,126,128,134,135,136,137,138,139,148,149,157,159,176,179,181,182,184,185,187,188,189,190,191,192,196,197,208,210,],[18,18,18,18,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,18,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,18,18,18,18,18,18,61,61,61,61,]),'declaration':([0,2,4,5,36,70,80,112,148,157,159,176,179,187,188,189,190,191,192,196,197,210,],[19,19,19,19,79,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'term':([0,2,4,5,25,27,28,31,32,37,49,50,52,53,59,70,71,72,80,96,99,100,102,103,104,105,106,107,110,111,112,120,121,123,126,128,134,135,136,137,138,139,148,149,157,159,176,179,181,182,184,185,187,188,189,190,191,192,196,197,208,210,],[22,22,22,22,22,22,22,22,22,22,83,84,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,83,84,22,22,22,22,22,22,22,22,22,22,]),'factor':([0,2,4,5,21,23,25,27,28,31,32,37,49,50,52,53,56,57,59,70,71,72,80,96,99,100,102,103,104,105,106,107,110,111,112,120,121,123,126,128,134,135,136,137,138,139,148,149,157,159,176,179,181,182,184,185,187,188,189,190,191,192,196,197,208,210,],[39,39,39,39,54,58,39,39,39,39,39,39,39,39,39,39,89,90,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,198,199,39,39,39,39,39,39,39,39,39,39,]),'condition':([31,37,71,72,110,111,149,],[70,80,115,116,151,152,176,]),'parameter_list':([53,126,],[86,161,]),'print_arguments':([59,128,],[91,163,]),'printable_item':([59,128,],[92,92,]),'block':([70,80,148,157,159,176,179,196,197,210,],[109,122,175,180,183,193,195,207,209,211,]),'else_part':([109,193,],[147,206,]),'parameter_declaration_list':([119,178,],[156,194,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,2,115,191,192,193,194,195,196,],[3,5,156,205,206,207,208,209,210,]),'empty':([0,2,55,112,115,191,192,193,194,195,196,197,],[4,4,90,153,4,4,4,4,4,4,4,153,]),'statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[6,6,116,116,116,6,116,116,116,116,116,116,6,6,6,6,6,6,116,]),'control_statement':([3,5,156,205,206,207,208,209,210,],[7,7,7,7,7,7,7,7,7,]),'assignment_statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'expression':([3,5,27,29,30,33,34,39,54,55,61,72,73,74,82,99,102,103,105,106,107,108,109,110,113,114,123,124,126,129,131,137,138,139,140,141,142,151,152,156,160,162,179,182,185,186,201,202,205,206,207,208,209,210,213,215,],[9,9,62,66,67,71,75,71,87,91,97,9,71,120,9,132,135,136,143,144,145,146,147,148,71,71,161,162,163,164,97,172,173,174,175,176,177,9,71,9,9,9,9,9,201,202,9,9,9,9,9,9,9,9,215,9,]),'print_statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'natural_language':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'return_statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'break_statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'continue_statement':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'function_definition':([3,5,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'if_statement':([3,5,156,205,206,207,208,209,210,],[17,17,17,17,17,17,17,17,17,]),'for_statement':([3,5,156,205,206,207,208,209,210,],[18,18,18,18,18,18,18,18,18,]),'while_statement':([3,5,156,205,206,207,208,209,210,],[19,19,19,19,19,19,19,19,19,]),'function_call':([3,5,27,29,30,33,34,39,50,51,54,55,61,72,73,74,82,99,102,103,105,106,107,108,109,110,113,114,123,124,126,129,131,137,138,139,140,141,142,151,152,156,160,162,179,182,185,186,188,189,201,202,205,206,207,208,209,210,213,215,],[20,20,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,20,63,63,63,63,63,63,63,63,63,63,20,20,20,20,20,20,63,63,]),'declaration':([3,5,38,72,82,151,156,160,162,179,182,201,202,205,206,207,208,209,210,215,],[21,21,81,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'term':([3,5,27,29,30,33,34,39,50,51,54,55,61,72,73,74,82,99,102,103,105,106,107,108,109,110,113,114,123,124,126,129,131,137,138,139,140,141,142,151,152,156,160,162,179,182,185,186,188,189,201,202,205,206,207,208,209,210,213,215,],[24,24,24,24,24,24,24,24,85,86,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,85,86,24,24,24,24,24,24,24,24,24,24,]),'factor':([3,5,23,25,27,29,30,33,34,39,50,51,54,55,58,59,61,72,73,74,82,99,102,103,105,106,107,108,109,110,113,114,123,124,126,129,131,137,138,139,140,141,142,151,152,156,160,162,179,182,185,186,188,189,201,202,205,206,207,208,209,210,213,215,],[41,41,56,60,41,41,41,41,41,41,41,41,41,41,92,93,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,203,204,41,41,41,41,41,41,41,41,41,41,]),'condition':([33,39,73,74,113,114,152,],[72,82,118,119,154,155,179,]),'parameter_list':([55,],[88,]),'argument_list':([55,],[89,]),'print_arguments':([61,],[94,]),'printable_item':([61,131,],[95,166,]),'block':([72,82,151,160,162,179,182,201,202,215,],[112,125,178,184,187,197,199,212,214,216,]),'else_part':([112,197,],[150,211,]),'parameter_declaration_list':([122,],[159,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,91 +27,96 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> KEYWORD_BEGIN statement_list KEYWORD_END','program',3,'p_program','parser.py',54),
-  ('program -> statement_list','program',1,'p_program','parser.py',55),
-  ('statement_list -> statement statement_list','statement_list',2,'p_statement_list','parser.py',64),
-  ('statement_list -> control_statement statement_list','statement_list',2,'p_statement_list','parser.py',65),
-  ('statement_list -> empty','statement_list',1,'p_statement_list','parser.py',66),
-  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',74),
-  ('statement -> expression SEMICOLON','statement',2,'p_statement','parser.py',75),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',76),
-  ('statement -> natural_language','statement',1,'p_statement','parser.py',77),
-  ('assignment_statement -> declaration','assignment_statement',1,'p_assignment_statement','parser.py',89),
-  ('assignment_statement -> IDENTIFIER ASSIGNMENT_OP expression SEMICOLON','assignment_statement',4,'p_assignment_statement','parser.py',90),
-  ('declaration -> KEYWORD_LET IDENTIFIER ASSIGNMENT_OP expression SEMICOLON','declaration',5,'p_declaration','parser.py',100),
-  ('expression -> expression PLUS_OP term','expression',3,'p_expression_binop','parser.py',108),
-  ('expression -> expression MINUS_OP term','expression',3,'p_expression_binop','parser.py',109),
-  ('expression -> term','expression',1,'p_expression_term','parser.py',114),
-  ('term -> term TIMES_OP factor','term',3,'p_term_binop','parser.py',119),
-  ('term -> term DIVIDE_OP factor','term',3,'p_term_binop','parser.py',120),
-  ('term -> factor','term',1,'p_term_factor','parser.py',125),
-  ('term -> function_call','term',1,'p_term_factor','parser.py',126),
-  ('factor -> INTEGER','factor',1,'p_factor_number','parser.py',131),
-  ('factor -> FLOAT','factor',1,'p_factor_number','parser.py',132),
-  ('factor -> STRING','factor',1,'p_factor_number','parser.py',133),
-  ('factor -> IDENTIFIER','factor',1,'p_factor_variable','parser.py',138),
-  ('factor -> KEYWORD_TRUE','factor',1,'p_factor_boolean','parser.py',146),
-  ('factor -> KEYWORD_FALSE','factor',1,'p_factor_boolean','parser.py',147),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_grouped','parser.py',152),
-  ('factor -> PLUS_OP factor','factor',2,'p_factor_unary','parser.py',157),
-  ('factor -> MINUS_OP factor','factor',2,'p_factor_unary','parser.py',158),
-  ('control_statement -> if_statement','control_statement',1,'p_control_statement','parser.py',167),
-  ('control_statement -> for_statement','control_statement',1,'p_control_statement','parser.py',168),
-  ('control_statement -> while_statement','control_statement',1,'p_control_statement','parser.py',169),
-  ('control_statement -> function_call SEMICOLON','control_statement',2,'p_control_statement','parser.py',170),
-  ('if_statement -> KEYWORD_IF condition block else_part','if_statement',4,'p_if_statement','parser.py',174),
-  ('else_part -> KEYWORD_ELSE block','else_part',2,'p_else_part','parser.py',181),
-  ('else_part -> KEYWORD_ELSEIF condition block else_part','else_part',4,'p_else_part','parser.py',182),
-  ('else_part -> empty','else_part',1,'p_else_part','parser.py',183),
-  ('for_statement -> KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression block','for_statement',7,'p_for_statement','parser.py',193),
-  ('for_statement -> KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression KEYWORD_STEP expression block','for_statement',9,'p_for_statement','parser.py',194),
-  ('for_statement -> KEYWORD_FOR declaration KEYWORD_TO expression KEYWORD_STEP expression block','for_statement',7,'p_for_statement','parser.py',195),
-  ('for_statement -> KEYWORD_FOR declaration KEYWORD_TO expression block','for_statement',5,'p_for_statement','parser.py',196),
-  ('while_statement -> KEYWORD_WHILE condition block','while_statement',3,'p_while_statement','parser.py',215),
-  ('block -> KEYWORD_BEGIN statement_list KEYWORD_END','block',3,'p_block','parser.py',219),
-  ('block -> statement','block',1,'p_block','parser.py',220),
-  ('condition -> expression LT_OP expression','condition',3,'p_condition_comparison','parser.py',231),
-  ('condition -> expression GT_OP expression','condition',3,'p_condition_comparison','parser.py',232),
-  ('condition -> expression LE_OP expression','condition',3,'p_condition_comparison','parser.py',233),
-  ('condition -> expression GE_OP expression','condition',3,'p_condition_comparison','parser.py',234),
-  ('condition -> expression EQ_OP expression','condition',3,'p_condition_comparison','parser.py',235),
-  ('condition -> expression NE_OP expression','condition',3,'p_condition_comparison','parser.py',236),
-  ('condition -> condition KEYWORD_AND condition','condition',3,'p_condition_logical','parser.py',240),
-  ('condition -> condition KEYWORD_OR condition','condition',3,'p_condition_logical','parser.py',241),
-  ('condition -> KEYWORD_NOT condition','condition',2,'p_condition_logical','parser.py',242),
-  ('condition -> expression','condition',1,'p_condition_expr','parser.py',249),
-  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition_grouped','parser.py',253),
-  ('natural_language -> SET_KEYWORD_NATURAL_LANG IDENTIFIER KEYWORD_TO expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',261),
-  ('natural_language -> ADD_KEYWORD_NATURAL_LANG expression KEYWORD_TO IDENTIFIER SEMICOLON','natural_language',5,'p_natural_language','parser.py',262),
-  ('natural_language -> SUB_KEYWORD_NATURAL_LANG expression FROM_KEYWORD_NATURAL_LANG IDENTIFIER SEMICOLON','natural_language',5,'p_natural_language','parser.py',263),
-  ('natural_language -> MULT_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',264),
-  ('natural_language -> DIV_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',265),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',281),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',282),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',283),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',284),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG EQ_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',285),
-  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG NE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',286),
-  ('function_call -> IDENTIFIER LPAREN parameter_list RPAREN','function_call',4,'p_function_call','parser.py',296),
-  ('parameter_list -> expression COMMA parameter_list','parameter_list',3,'p_parameter_list','parser.py',301),
-  ('parameter_list -> expression','parameter_list',1,'p_parameter_list','parser.py',302),
-  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',303),
-  ('print_statement -> KEYWORD_PRINT LPAREN print_arguments RPAREN SEMICOLON','print_statement',5,'p_print_statement','parser.py',317),
-  ('print_arguments -> printable_item COMMA print_arguments','print_arguments',3,'p_print_arguments_multiple','parser.py',322),
-  ('print_arguments -> printable_item','print_arguments',1,'p_print_arguments_single','parser.py',326),
-  ('printable_item -> STRING','printable_item',1,'p_printable_item_string','parser.py',330),
-  ('printable_item -> expression','printable_item',1,'p_printable_item_expr','parser.py',334),
-  ('function_definition -> KEYWORD_FUNCTION IDENTIFIER LPAREN parameter_declaration_list RPAREN block','function_definition',6,'p_function_definition','parser.py',345),
-  ('function_definition -> KEYWORD_FUNCTION IDENTIFIER LPAREN RPAREN block','function_definition',5,'p_function_definition','parser.py',346),
-  ('parameter_declaration_list -> IDENTIFIER COMMA parameter_declaration_list','parameter_declaration_list',3,'p_parameter_declaration_list','parser.py',354),
-  ('parameter_declaration_list -> IDENTIFIER','parameter_declaration_list',1,'p_parameter_declaration_list','parser.py',355),
-  ('return_statement -> KEYWORD_RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',367),
-  ('return_statement -> KEYWORD_RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',368),
-  ('break_statement -> KEYWORD_BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',375),
-  ('continue_statement -> KEYWORD_CONTINUE SEMICOLON','continue_statement',2,'p_continue_statement','parser.py',379),
-  ('statement -> return_statement','statement',1,'p_statement_extended','parser.py',384),
-  ('statement -> break_statement','statement',1,'p_statement_extended','parser.py',385),
-  ('statement -> continue_statement','statement',1,'p_statement_extended','parser.py',386),
-  ('statement -> function_definition','statement',1,'p_statement_extended','parser.py',387),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',395),
+  ('program -> KEYWORD_BEGIN statement_list KEYWORD_END','program',3,'p_program','parser.py',114),
+  ('program -> KEYWORD_BEGIN statement_list error KEYWORD_END','program',4,'p_program','parser.py',115),
+  ('program -> statement_list','program',1,'p_program','parser.py',116),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',125),
+  ('statement_list -> statement_list control_statement','statement_list',2,'p_statement_list','parser.py',126),
+  ('statement_list -> empty','statement_list',1,'p_statement_list','parser.py',127),
+  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',139),
+  ('statement -> expression SEMICOLON','statement',2,'p_statement','parser.py',140),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',141),
+  ('statement -> natural_language','statement',1,'p_statement','parser.py',142),
+  ('statement -> error SEMICOLON','statement',2,'p_statement_error','parser.py',150),
+  ('assignment_statement -> declaration','assignment_statement',1,'p_assignment_statement','parser.py',160),
+  ('assignment_statement -> IDENTIFIER ASSIGNMENT_OP expression SEMICOLON','assignment_statement',4,'p_assignment_statement','parser.py',161),
+  ('declaration -> KEYWORD_LET IDENTIFIER ASSIGNMENT_OP expression SEMICOLON','declaration',5,'p_declaration','parser.py',171),
+  ('expression -> expression PLUS_OP term','expression',3,'p_expression_binop','parser.py',179),
+  ('expression -> expression MINUS_OP term','expression',3,'p_expression_binop','parser.py',180),
+  ('expression -> term','expression',1,'p_expression_term','parser.py',185),
+  ('term -> term TIMES_OP factor','term',3,'p_term_binop','parser.py',190),
+  ('term -> term DIVIDE_OP factor','term',3,'p_term_binop','parser.py',191),
+  ('term -> factor','term',1,'p_term_factor','parser.py',196),
+  ('term -> function_call','term',1,'p_term_factor','parser.py',197),
+  ('factor -> INTEGER','factor',1,'p_factor_number','parser.py',202),
+  ('factor -> FLOAT','factor',1,'p_factor_number','parser.py',203),
+  ('factor -> STRING','factor',1,'p_factor_number','parser.py',204),
+  ('factor -> IDENTIFIER','factor',1,'p_factor_variable','parser.py',209),
+  ('factor -> KEYWORD_TRUE','factor',1,'p_factor_boolean','parser.py',217),
+  ('factor -> KEYWORD_FALSE','factor',1,'p_factor_boolean','parser.py',218),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_grouped','parser.py',223),
+  ('factor -> PLUS_OP factor','factor',2,'p_factor_unary','parser.py',228),
+  ('factor -> MINUS_OP factor','factor',2,'p_factor_unary','parser.py',229),
+  ('control_statement -> if_statement','control_statement',1,'p_control_statement','parser.py',238),
+  ('control_statement -> for_statement','control_statement',1,'p_control_statement','parser.py',239),
+  ('control_statement -> while_statement','control_statement',1,'p_control_statement','parser.py',240),
+  ('control_statement -> function_call SEMICOLON','control_statement',2,'p_control_statement','parser.py',241),
+  ('if_statement -> KEYWORD_IF condition block else_part','if_statement',4,'p_if_statement','parser.py',245),
+  ('else_part -> KEYWORD_ELSE block','else_part',2,'p_else_part','parser.py',252),
+  ('else_part -> KEYWORD_ELSEIF condition block else_part','else_part',4,'p_else_part','parser.py',253),
+  ('else_part -> empty','else_part',1,'p_else_part','parser.py',254),
+  ('for_statement -> KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression block','for_statement',7,'p_for_statement','parser.py',264),
+  ('for_statement -> KEYWORD_FOR IDENTIFIER ASSIGNMENT_OP expression KEYWORD_TO expression KEYWORD_STEP expression block','for_statement',9,'p_for_statement','parser.py',265),
+  ('for_statement -> KEYWORD_FOR declaration KEYWORD_TO expression KEYWORD_STEP expression block','for_statement',7,'p_for_statement','parser.py',266),
+  ('for_statement -> KEYWORD_FOR declaration KEYWORD_TO expression block','for_statement',5,'p_for_statement','parser.py',267),
+  ('while_statement -> KEYWORD_WHILE condition block','while_statement',3,'p_while_statement','parser.py',285),
+  ('block -> KEYWORD_BEGIN statement_list KEYWORD_END','block',3,'p_block','parser.py',289),
+  ('block -> KEYWORD_BEGIN statement_list error KEYWORD_END','block',4,'p_block','parser.py',290),
+  ('block -> statement','block',1,'p_block','parser.py',291),
+  ('condition -> expression LT_OP expression','condition',3,'p_condition_comparison','parser.py',306),
+  ('condition -> expression GT_OP expression','condition',3,'p_condition_comparison','parser.py',307),
+  ('condition -> expression LE_OP expression','condition',3,'p_condition_comparison','parser.py',308),
+  ('condition -> expression GE_OP expression','condition',3,'p_condition_comparison','parser.py',309),
+  ('condition -> expression EQ_OP expression','condition',3,'p_condition_comparison','parser.py',310),
+  ('condition -> expression NE_OP expression','condition',3,'p_condition_comparison','parser.py',311),
+  ('condition -> condition KEYWORD_AND condition','condition',3,'p_condition_logical','parser.py',315),
+  ('condition -> condition KEYWORD_OR condition','condition',3,'p_condition_logical','parser.py',316),
+  ('condition -> KEYWORD_NOT condition','condition',2,'p_condition_logical','parser.py',317),
+  ('condition -> expression','condition',1,'p_condition_expr','parser.py',324),
+  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition_grouped','parser.py',328),
+  ('natural_language -> SET_KEYWORD_NATURAL_LANG IDENTIFIER KEYWORD_TO expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',336),
+  ('natural_language -> ADD_KEYWORD_NATURAL_LANG expression KEYWORD_TO IDENTIFIER SEMICOLON','natural_language',5,'p_natural_language','parser.py',337),
+  ('natural_language -> SUB_KEYWORD_NATURAL_LANG expression FROM_KEYWORD_NATURAL_LANG IDENTIFIER SEMICOLON','natural_language',5,'p_natural_language','parser.py',338),
+  ('natural_language -> MULT_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',339),
+  ('natural_language -> DIV_KEYWORD_NATURAL_LANG IDENTIFIER BY_KEYWORD_NATURAL_LANG expression SEMICOLON','natural_language',5,'p_natural_language','parser.py',340),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',356),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GT_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',357),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG LE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',358),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG GE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',359),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG EQ_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',360),
+  ('natural_language -> KEYWORD_IF IDENTIFIER IS_KEYWORD_NATURAL_LANG NE_OP expression THEN_KEYWORD_NATURAL_LANG statement_list','natural_language',7,'p_natural_language_if','parser.py',361),
+  ('function_call -> IDENTIFIER LPAREN parameter_list RPAREN','function_call',4,'p_function_call','parser.py',371),
+  ('parameter_list -> argument_list','parameter_list',1,'p_parameter_list','parser.py',376),
+  ('parameter_list -> argument_list COMMA','parameter_list',2,'p_parameter_list','parser.py',377),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',378),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',386),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',387),
+  ('print_statement -> KEYWORD_PRINT LPAREN print_arguments RPAREN SEMICOLON','print_statement',5,'p_print_statement','parser.py',399),
+  ('print_arguments -> print_arguments COMMA printable_item','print_arguments',3,'p_print_arguments_multiple','parser.py',404),
+  ('print_arguments -> printable_item','print_arguments',1,'p_print_arguments_single','parser.py',409),
+  ('printable_item -> STRING','printable_item',1,'p_printable_item_string','parser.py',413),
+  ('printable_item -> expression','printable_item',1,'p_printable_item_expr','parser.py',417),
+  ('function_definition -> KEYWORD_FUNCTION IDENTIFIER LPAREN parameter_declaration_list RPAREN block','function_definition',6,'p_function_definition','parser.py',428),
+  ('function_definition -> KEYWORD_FUNCTION IDENTIFIER LPAREN RPAREN block','function_definition',5,'p_function_definition','parser.py',429),
+  ('parameter_declaration_list -> parameter_declaration_list COMMA IDENTIFIER','parameter_declaration_list',3,'p_parameter_declaration_list','parser.py',437),
+  ('parameter_declaration_list -> IDENTIFIER','parameter_declaration_list',1,'p_parameter_declaration_list','parser.py',438),
+  ('return_statement -> KEYWORD_RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',452),
+  ('return_statement -> KEYWORD_RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',453),
+  ('break_statement -> KEYWORD_BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',460),
+  ('continue_statement -> KEYWORD_CONTINUE SEMICOLON','continue_statement',2,'p_continue_statement','parser.py',464),
+  ('statement -> return_statement','statement',1,'p_statement_extended','parser.py',469),
+  ('statement -> break_statement','statement',1,'p_statement_extended','parser.py',470),
+  ('statement -> continue_statement','statement',1,'p_statement_extended','parser.py',471),
+  ('statement -> function_definition','statement',1,'p_statement_extended','parser.py',472),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',480),
 ]
@@ -0,0 +1,215 @@
+import re
+
+from ply.lex import LexToken
+
+from .finallexer import Lexer
+
+
+class RegexTokenizer:
+    """Token source with the same interface as a PLY lexer object.
+
+    All rules of finallexer.Lexer live in one compiled alternation. Rules
+    that can match at the same position keep PLY's relative order (comments
+    before "/", FLOAT before INTEGER before "-"), so every input produces the
+    same tokens; rules that never overlap go first by frequency. Keywords are
+    a single dict lookup and operators a second one, instead of a Python call
+    per rule.
+    """
+
+    master = re.compile(
+        r"""
+        [ \t\r]*
+        (?: (?P<IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)
+        | (?P<NEWLINE>\n+)
+        | (?P<COMMENT_MULTILINE>/\*[\s\S]*?\*/)
+        | (?P<COMMENT_SINGLE>//[^\n]*)
+        | (?P<FLOAT>-?\d+\.\d+)
+        | (?P<INTEGER>-?\d+)
+        | (?P<STRING>"(?:[^"\\]|\\.)*")
+        | (?P<OPERATOR><=|>=|==|!=|[-+*/()<>={},;])
+        | (?P<ERROR>[\s\S])
+        )?
+        """,
+        re.VERBOSE,
+    )
+
+    operators = {
+        "<=": "LE_OP",
+        ">=": "GE_OP",
+        "==": "EQ_OP",
+        "!=": "NE_OP",
+        "<": "LT_OP",
+        ">": "GT_OP",
+        "=": "ASSIGNMENT_OP",
+        "+": "PLUS_OP",
+        "-": "MINUS_OP",
+        "*": "TIMES_OP",
+        "/": "DIVIDE_OP",
+        "(": "LPAREN",
+        ")": "RPAREN",
+        "{": "LBRACE",
+        "}": "RBRACE",
+        ",": "COMMA",
+        ";": "SEMICOLON",
+    }
+
+    # Keywords win over natural language keywords, as in Lexer.t_IDENTIFIER
+    reserved = {**Lexer.natural_language_keywords, **Lexer.keywords}
+
+    # Characters read per chunk by stream()
+    chunk_size = 1 << 16
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.lineno = 1
+        self.lexpos = 0
+        self.lexdata = ""
+        self._tokens = None
+
+    def clone(self, owner=None):
+        """Return a tokenizer with its own position state, optionally for a new owner"""
+        return RegexTokenizer(owner if owner is not None else self.owner)
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self._tokens = None
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def token(self):
+        if self._tokens is None:
+            # Start lazily so lexpos can be moved after input(), as with PLY
+            self._tokens = self._scan(self.master.finditer(self.lexdata, self.lexpos))
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+    def stream(self, reader, chunk_size=None):
+        """Yield the tokens of the text `reader.read()` returns, one chunk at a time.
+
+        Only the unlexed end of the previous chunk is kept, so memory does not
+        grow with the input. Token positions are offsets into the whole text.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        self.lexpos = 0
+        self._tokens = None
+        base = 0
+        pending = ""
+        eof = False
+        while not eof:
+            chunk = reader.read(chunk_size)
+            eof = not chunk
+            data = pending + chunk
+            yield from self._scan(self._settled(data, eof), base)
+            pending = data[self._resume:]
+            base += self._resume
+
+    def _settled(self, data, eof):
+        """Matches in `data` that no text after it could change.
+
+        A match is held back, with the rest of `data`, when it ends within two
+        characters of the chunk end ("1." may become "1.5"), or when it is
+        the fallback for a string or "/*" comment whose end was not read yet.
+        Such a construct is kept until its end or EOF arrives. `_resume` is
+        set to where the unsettled text starts.
+        """
+        limit = len(data) - 2
+        for m in self.master.finditer(data):
+            if not eof and (
+                m.end() > limit
+                or (m.lastgroup == "ERROR" and m.group("ERROR") == '"')
+                or (
+                    m.lastgroup == "OPERATOR"
+                    and m.group("OPERATOR") == "/"
+                    and data.startswith("*", m.end())
+                )
+            ):
+                self._resume = m.start()
+                return
+            yield m
+        self._resume = len(data)
+
+    def _scan(self, matches, base=0):
+        operators = self.operators
+        reserved = self.reserved
+        decode_string = Lexer.decode_string
+        for m in matches:
+            kind = m.lastgroup
+            if kind is None:
+                # Trailing ignored characters
+                continue
+            text = m.group(kind)
+            if kind == "NEWLINE":
+                self.lineno += len(text)
+                continue
+            if kind == "COMMENT_MULTILINE":
+                self.lineno += text.count("\n")
+                continue
+            if kind == "COMMENT_SINGLE":
+                continue
+
+            tok = LexToken()
+            tok.lineno = self.lineno
+            tok.lexpos = base + m.start(kind)
+            self.lexpos = base + m.end()
+            if kind == "IDENTIFIER":
+                tok.type = reserved.get(text, "IDENTIFIER")
+                tok.value = text
+            elif kind == "OPERATOR":
+                tok.type = operators[text]
+                tok.value = text
+            elif kind == "INTEGER":
+                tok.type = kind
+                tok.value = int(text)
+                tok.endlexpos = self.lexpos
+            elif kind == "FLOAT":
+                tok.type = kind
+                tok.value = float(text)
+                tok.endlexpos = self.lexpos
+            elif kind == "STRING":
+                tok.type = kind
+                tok.value = decode_string(text)
+                tok.endlexpos = self.lexpos
+            else:
+                # Same reporting as the PLY engine; t_error skips the character
+                tok.type = "error"
+                tok.value = text
+                tok.lexer = self
+                self.lexpos = tok.lexpos
+                self.owner.t_error(tok)
+                continue
+            yield tok
+
+
+class RegexLexer(Lexer):
+    """Lexer backed by RegexTokenizer instead of ply.lex"""
+
+    def __init__(self):
+        """Initialize the lexer with the single-regex tokenizer"""
+        self.lexer = RegexTokenizer(self)
+        self.reset()
+
+    def stream(self, source, chunk_size=None):
+        """Tokenize a file without loading it whole
+
+        Args:
+            source: Path of a UTF-8 source file, or an object whose read(n)
+                returns the next n characters
+            chunk_size: Characters read at a time
+        """
+        self.reset()
+        if hasattr(source, "read"):
+            yield from self.lexer.stream(source, chunk_size)
+        else:
+            # newline="" keeps "\r\n" as written, like lexing the file's text
+            with open(source, encoding="utf-8", newline="") as reader:
+                yield from self.lexer.stream(reader, chunk_size)
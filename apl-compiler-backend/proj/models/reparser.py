@@ -0,0 +1,180 @@
+# Reparsing an edited program one top-level statement at a time.
+#
+# A ParseResult from the descent parser records the token each top-level
+# statement starts at. When the same document comes back edited, the edit
+# is found by comparing the two sources, the tokens are updated with
+# TokenBuffer.edit, and only the statements the edit reaches are parsed
+# again:
+#
+#   - a statement before the edit is kept as it is if its tokens and the
+#     token after it, which the parser looked at to end it, are unchanged
+#   - parsing restarts at the first statement that is not, and stops as
+#     soon as a statement ends where an old one started in the unchanged
+#     text after the edit
+#   - the statements from there on are the old ones, copied with their
+#     spans and lines moved by the edit (or shared, if it moved nothing),
+#     as TokenBuffer.edit copies the tokens after the edit
+from array import array
+from bisect import bisect_left
+
+from .descent_parser import BEGIN, END, STATEMENT_STARTS, DescentParser, Rejected
+from .parse_cache import ParseResult, footprint
+from .syntax_tree import Node, NodeBuilder, shifted
+from .token_buffer import _shifted
+
+# Characters compared per slice while looking for the edit
+_BLOCK = 4096
+
+
+def source_edit(old, new):
+    """The one edit turning `old` into `new`: (offset, deleted, inserted).
+
+    It spans everything between the two sources' common prefix and suffix.
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    # Whole blocks first, so most of the text is compared by slices
+    while prefix + _BLOCK <= limit and old[prefix:prefix + _BLOCK] == new[prefix:prefix + _BLOCK]:
+        prefix += _BLOCK
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    limit -= prefix
+    suffix = 0
+    while (
+        suffix + _BLOCK <= limit
+        and old[len(old) - suffix - _BLOCK:len(old) - suffix]
+        == new[len(new) - suffix - _BLOCK:len(new) - suffix]
+    ):
+        suffix += _BLOCK
+    while suffix < limit and old[len(old) - suffix - 1] == new[len(new) - suffix - 1]:
+        suffix += 1
+    return prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+
+def _same_tokens(old, new, start, stop):
+    """Whether tokens `start` to `stop` of two buffers are the same"""
+    return (
+        old.types[start:stop] == new.types[start:stop]
+        and old.starts[start:stop] == new.starts[start:stop]
+        and old.ends[start:stop] == new.ends[start:stop]
+        and old.lines[start:stop] == new.lines[start:stop]
+    )
+
+
+def _resync(old, new, first, delta):
+    """The first token of `old` from index `first` on that `new` has too, moved `delta` characters.
+
+    From there on the two sources are the same text, so they lex into the
+    same tokens. Returns that token's index in each buffer; the ends of the
+    buffers always line up.
+    """
+    i = first
+    j = bisect_left(new.starts, old.starts[first] + delta) if first < len(old) else len(new)
+    while i < len(old) and j < len(new):
+        moved = old.starts[i] + delta
+        if new.starts[j] == moved:
+            return i, j
+        if new.starts[j] < moved:
+            j += 1
+        else:
+            i += 1
+    return len(old), len(new)
+
+
+def relex(old, source, lexer):
+    """The tokens of `source`, an edited version of TokenBuffer `old`'s source,
+    lexed again only around the edit, and the edit: (buffer, (offset, deleted, inserted))"""
+    edit = source_edit(old.source, source)
+    return old.edit(*edit, lexer), edit
+
+
+def reparse(previous, source, lexer, relexed=None):
+    """ParseResult for `source`, reusing what it can of `previous`, an earlier version's.
+
+    `relexed` is what relex gave for the two, if the caller has it. Returns
+    None when the edited program needs a full parse instead: `previous` had
+    no recorded statements or no node tree, the edit reaches the program's
+    first token, or the program now has a syntax error, whose messages only
+    the LR parser gives.
+    """
+    old = previous.buffer
+    boundaries = previous.boundaries
+    if boundaries is None or not isinstance(previous.tree, Node):
+        return None
+    if source == old.source:
+        return previous
+    if relexed is None:
+        relexed = relex(old, source, lexer)
+    buffer, (offset, deleted, inserted) = relexed
+
+    # Tokens ending before the edit are the old ones if they lex the same:
+    # TokenBuffer.edit copied all but the last of them, unless some lexing
+    # errors made it re-lex everything
+    unchanged = bisect_left(old.ends, offset)
+    if not _same_tokens(old, buffer, min(buffer.kept, unchanged), unchanged):
+        unchanged = 0
+    if unchanged == 0:
+        # Whether the program is wrapped in begin and end may have changed
+        return None
+    delta = len(inserted) - deleted
+    old_sync, sync = _resync(old, buffer, bisect_left(old.starts, offset + deleted), delta)
+    moved_by = sync - old_sync
+    line_delta = buffer.lines[sync] - old.lines[old_sync] if sync < len(buffer) else 0
+
+    # Statements whose tokens and next token all come before the edit
+    kept = max(bisect_left(boundaries, unchanged) - 1, 0)
+    old_statements = previous.tree.statements
+    builder = NodeBuilder()
+    parser = DescentParser(buffer, builder)
+    parser.pos = boundaries[kept]
+    starts = array("I")
+    statements = []
+    types = parser.types
+    resumed = len(boundaries)
+    try:
+        while True:
+            pos = parser.pos
+            if pos >= sync:
+                # The old statements take over if one started here
+                i = bisect_left(boundaries, pos - moved_by, kept)
+                if i < len(boundaries) and boundaries[i] == pos - moved_by:
+                    resumed = i
+                    break
+            if types[pos] not in STATEMENT_STARTS:
+                break
+            starts.append(pos)
+            statements.append(parser.statement(control=True))
+        if resumed == len(boundaries):
+            # The edit reaches the end of the program
+            starts.append(parser.pos)
+            if types[0] == BEGIN:
+                parser.take(END)
+            parser.finish_program()
+    except (Rejected, RecursionError):
+        return None
+
+    reparsed = statements
+    statements = old_statements[:kept] + reparsed
+    starts = boundaries[:kept] + starts
+    if resumed < len(boundaries):
+        old_tail = old_statements[resumed:]
+        if delta or line_delta:
+            old_tail = [shifted(statement, delta, line_delta) for statement in old_tail]
+        statements += old_tail
+        starts.extend(_shifted(boundaries[resumed:], moved_by))
+
+    end = starts[-1]
+    if types[0] == BEGIN:
+        tree = builder.Program(statements, buffer.lines[0])
+        builder.span(tree, buffer.starts[0], buffer.ends[end])
+    else:
+        tree = builder.Program(statements, 0)
+        if statements:
+            builder.span(tree, buffer.starts[0], buffer.ends[end - 1])
+    # The previous result's, less what was replaced and plus what replaced it
+    size = (
+        previous.size
+        - footprint(old, boundaries, *old_statements[kept:resumed])
+        + footprint(buffer, starts, *reparsed)
+    )
+    return ParseResult(buffer, tree, [], starts, size)
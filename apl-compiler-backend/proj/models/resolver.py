@@ -0,0 +1,99 @@
+# Resolves the variables of a program or function body to slots of one
+# list, its frame, for the bytecode VM to read and write by index instead of
+# walking the analyzer's stack of scope dicts. Only the VM, which runs with
+# APL_INTERPRETER=bytecode, uses them: SemanticAnalyzer and the closures
+# keep the scope dicts, and so does any program the VM hands over to them.
+#
+# Each block the interpreter runs in a scope of its own (the program or
+# function body, an if or else body, a loop) is given a slot per name it
+# declares, those of a block after those of the blocks around it; blocks
+# that are never open together share slots. A variable read, assigned or
+# declared resolves to the slots of its name in the open blocks, innermost
+# first: the scope walk finds the first of them holding a value, or, when
+# none does, goes on into the callers' scopes, as calls see their callers'
+# variables; the VM binds a name found there once per call, not per
+# reference. A block declaring nothing needs no slots and nothing done on
+# entering or leaving it.
+#
+# Slot 0 of a frame is never set: names no open block declares resolve to
+# it, so that reading them always takes the way on to the callers.
+from .flat_tree import Cursor
+from .shared_tree import Occurrence
+from .syntax_tree import Declare, NaturalLang, NaturalLangIf, Node, Program
+
+
+class _Unset:
+    """A slot with no variable in it"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+def declarations(body):
+    """Names declared into the scope `body` runs in, in order: by let and
+    "set x to", in the body itself or what it runs in the same scope"""
+    if isinstance(body, list):
+        return [name for statement in body for name in declarations(statement)]
+    if not isinstance(body, (Node, Cursor, Occurrence)):
+        return []
+    kind = body.kind
+    if kind == Declare.kind:
+        return [body.name]
+    if kind == NaturalLang.kind:
+        if body.operation == 'set' and body.connector == 'to' and isinstance(body.arg1, str):
+            return [body.arg1]
+        return []
+    if kind == NaturalLangIf.kind:
+        return declarations(body.body)
+    if kind == Program.kind:
+        return declarations(body.statements)
+    return []
+
+
+class FrameLayout:
+    """The slots of one program's or function body's frame, given out to
+    its blocks as the compiler opens and closes them"""
+
+    def __init__(self):
+        self.size = 1
+        # name -> slot of each open block, innermost last
+        self.blocks = []
+        self._next = 1
+
+    def open(self, names):
+        """Open a block declaring `names`; their slots, by name"""
+        layout = {}
+        for name in names:
+            if name not in layout:
+                layout[name] = self._next
+                self._next += 1
+        self.size = max(self.size, self._next)
+        self.blocks.append(layout)
+        return layout
+
+    def close(self):
+        """Close the innermost block, its slots free for the next; the (start, stop) of them"""
+        layout = self.blocks.pop()
+        stop = self._next
+        self._next -= len(layout)
+        return self._next, stop
+
+    def resolve(self, name):
+        """The slot of `name` in the innermost open block declaring it (0 if
+        none does), and those in the blocks around that, innermost first"""
+        slots = tuple(layout[name] for layout in reversed(self.blocks) if name in layout)
+        return (slots[0], slots[1:]) if slots else (0, ())
+
+    def declared(self, name):
+        """The slot `name` is declared to in the innermost block"""
+        return self.blocks[-1][name]
+
+    def chain(self):
+        """The name -> slot of each open block declaring anything, innermost
+        first: where a call made here finds its caller's variables"""
+        return tuple(layout for layout in reversed(self.blocks) if layout)
@@ -1,7 +1,23 @@
 from proj.models.finallexer import Lexer
 from proj.models.parser import Parser
+from proj.models.flat_tree import Cursor
+from proj.models.shared_tree import Occurrence
+from proj.models.syntax_tree import (
+    NODE_TYPES, Assign, BinOp, Boolean, Break, Call, Compare, CondExpr, Continue, Declare, Else,
+    ElseIf, For, FunctionDef, GroupedCondition, If, Literal, Logic, NaturalLang, NaturalLangIf,
+    Node, Not, Print, Program, Return, String, Unary, Var, While,
+)
+from proj.utilities import diagnostics
 import sys
 
+log = diagnostics.get_logger(__name__)
+
+# What running a program changes on the analyzer, saved to start over from
+STATE = (
+    "compile_results", "semantic_errors", "functions", "scope_stack", "call_stack", "loop_stack",
+    "return_value", "should_return", "should_break", "should_continue", "line_number",
+)
+
 class SemanticAnalyzer:
     def __init__(self):
         self.variables = {}  # Variable storage
@@ -16,6 +32,18 @@ class SemanticAnalyzer:
         self.semantic_errors = []  # List to collect semantic errors
         self.compile_results = []  # Store results of compilation
         self.line_number = 0
+
+    def save_state(self):
+        """A copy of what running a program changes, for restore_state"""
+        saved = {name: _copy(getattr(self, name)) for name in STATE}
+        # Declaring writes into the scopes themselves
+        saved["scope_stack"] = [scope.copy() for scope in self.scope_stack]
+        return saved
+
+    def restore_state(self, saved):
+        """Put back the state save_state returned, to run a program over"""
+        for name, value in saved.items():
+            setattr(self, name, value)
     
     def is_variable_declared(self,var_name):
         """Check if variable is declared in current scopes"""
@@ -38,7 +66,7 @@ class SemanticAnalyzer:
             if name in scope:
                 return scope[name]
         self.semantic_errors.append(f"🧠💥Variable '{name}' is not defined at line {line}")
-        print(f"Variable '{name}' is not defined at line {line}")
+        log.info("Variable '%s' is not defined at line %s", name, line)
         self.should_break = True
         return None
         
@@ -68,58 +96,9 @@ class SemanticAnalyzer:
         if node is None:
             return None
             
-        if isinstance(node, tuple):
-            node_type = node[0]
-            
-            # Dispatch to appropriate handler based on node type
-            if node_type == 'program':
-                return self.interpret_program(node)
-            elif node_type == 'declare':
-                return self.interpret_declare(node)
-            elif node_type == 'assign':
-                return self.interpret_assign(node)
-            elif node_type == 'binop':
-                return self.interpret_binop(node)
-            elif node_type == 'unary':
-                return self.interpret_unary(node)
-            elif node_type == 'literal':
-                return self.interpret_literal(node)
-            elif node_type == 'boolean':
-                return self.interpret_boolean(node)
-            elif node_type == 'var':
-                return self.interpret_var(node)
-            elif node_type == 'print':
-                return self.interpret_print(node)
-            elif node_type == 'if':
-                return self.interpret_if(node)
-            elif node_type == 'for':
-                return self.interpret_for(node)
-            elif node_type == 'while':
-                return self.interpret_while(node)
-            elif node_type == 'compare':
-                return self.interpret_compare(node)
-            elif node_type == 'grouped_condition':
-                return self.grouped_condition(node)
-            elif node_type == 'logic':
-                return self.interpret_logic(node)
-            elif node_type == 'cond_expr':
-                return self.interpret_cond_expr(node)
-            elif node_type == 'function_def':
-                return self.interpret_function_def(node)
-            elif node_type == 'call':
-                return self.interpret_call(node)
-            elif node_type == 'return':
-                return self.interpret_return(node)
-            elif node_type == 'break':
-                return self.interpret_break(node)
-            elif node_type == 'continue':
-                return self.interpret_continue(node)
-            elif node_type == 'natural_lang':
-                return self.interpret_natural_lang(node)
-            elif node_type == 'natural_lang_if':
-                return self.interpret_natural_lang_if(node)
-            else:
-                self.semantic_errors.append(f"🧠💥Unknown node type: {node_type}")
+        if isinstance(node, (Node, Cursor, Occurrence)):
+            # Dispatch to the handler for the node's kind
+            return HANDLERS[node.kind](self, node)
         elif isinstance(node, list):
             # Handle statement lists
             result = None
@@ -132,16 +111,21 @@ class SemanticAnalyzer:
             return result
         else:
             return node
+
+    def interpret_unknown(self, node):
+        """Report a node kind that is not interpreted on its own"""
+        self.semantic_errors.append(f"🧠💥Unknown node type: {node.tag}")
+
     # Interpret the main program node
     def interpret_program(self, node):
         """Interpret the main program"""
-        _, statements,line = node
+        statements, line = node.statements, node.line
         self.line_number = line
         return self.interpret(statements)
         
     def interpret_declare(self, node):
         """Handle variable declarations: let x = 5"""
-        _, var_name, value,line = node
+        var_name, value, line = node.name, node.value, node.line
         self.line_number = line
         computed_value = self.interpret(value)
         if self.loop_stack:
@@ -157,7 +141,7 @@ class SemanticAnalyzer:
         
     def interpret_assign(self, node):
         """Handle variable assignments: x = 10"""
-        _, var_name, value,line = node
+        var_name, value, line = node.name, node.value, node.line
         self.line_number = line
         computed_value = self.interpret(value)
         self.update_variable(var_name, computed_value,line)
@@ -165,10 +149,14 @@ class SemanticAnalyzer:
         
     def interpret_binop(self, node):
         """Handle binary operations: +, -, *, /"""
-        _, op, left, right,line = node
+        op, left, right, line = node.op, node.left, node.right, node.line
         self.line_number = line
         left_val = self.interpret(left)
         right_val = self.interpret(right)
+        return self.binary_operation(op, left_val, right_val, line)
+
+    def binary_operation(self, op, left_val, right_val, line):
+        """Apply binary operator `op` to evaluated operands, reporting operands it does not take"""
         if left_val is None or right_val is None:
             self.semantic_errors.append(f"🧠💥Invalid operands for binary operation '{op}' at line {line}")
             return None
@@ -197,7 +185,7 @@ class SemanticAnalyzer:
             
     def interpret_unary(self, node):
         """Handle unary operations: +x, -x"""
-        _, op, operand,line = node
+        op, operand, line = node.op, node.operand, node.line
         self.line_number = line
         value = self.interpret(operand)
         
@@ -210,19 +198,19 @@ class SemanticAnalyzer:
             
     def interpret_literal(self, node):
         """Handle number literals"""
-        _, value,line = node
+        value, line = node.value, node.line
         self.line_number = line
         return value
         
     def interpret_boolean(self, node):
         """Handle boolean literals"""
-        _, value , line = node
+        value, line = node.value, node.line
         self.line_number = line
         return value == 'true'
         
     def interpret_var(self, node):
         """Handle variable references"""
-        _, var_name,line = node
+        var_name, line = node.name, node.line
         self.line_number = line
         val=self.get_variable(var_name,line)
         if val is None:
@@ -232,23 +220,23 @@ class SemanticAnalyzer:
         
     def interpret_print(self, node):
         """Handle print statements"""
-        _, items,line = node
+        items, line = node.items, node.line
         self.line_number = line
         output = []
         for item in items:
-            if isinstance(item,tuple) and item[0] == 'string':
+            if item.kind == String.kind:
                 # String literal
-                output.append(item[1])
+                output.append(item.value)
             else:
                 # Expression to evaluate
                 output.append(str(self.interpret(item)))
-        print(' '.join(output))
+        log.debug("%s", ' '.join(output))
         self.compile_results.append(' '.join(output))
         return None
         
     def interpret_if(self, node):
         """Handle if statements"""
-        _, condition, then_block, else_part,line = node
+        condition, then_block, else_part, line = node.condition, node.body, node.else_part, node.line
         self.line_number = line
         
         condition_result = self.interpret(condition)
@@ -261,25 +249,25 @@ class SemanticAnalyzer:
                 self.exit_scope()
             return result
         elif else_part:
-            if else_part[0] == 'else':
-                _, else_block,line = else_part
+            # Kinds rather than classes, so flat_tree cursors match too
+            if else_part.kind == Else.kind:
+                else_block, line = else_part.body, else_part.line
                 self.enter_scope()
                 try:
                     result = self.interpret(else_block)
                 finally:
                     self.exit_scope()
                 return result
-            elif else_part[0] == 'elseif':
-                # Treat elseif as a nested if
-                _, elif_condition, elif_block, elif_else,line = else_part
-                elif_node = ('if', elif_condition, elif_block, elif_else)
-                return self.interpret(elif_node)
+            elif else_part.kind == ElseIf.kind:
+                # Treat elseif as a nested if; it has the same fields, line included
+                return self.interpret_if(else_part)
         
         return None
         
     def interpret_for(self, node):
         """Handle for loops"""
-        _,type,var_name, start_expr, end_expr, step_expr, body,line = node
+        binding, var_name, line = node.binding, node.name, node.line
+        start_expr, end_expr, step_expr, body = node.start_expr, node.end_expr, node.step_expr, node.body
         self.line_number = line
 
         start_val = self.interpret(start_expr)
@@ -287,11 +275,11 @@ class SemanticAnalyzer:
         step_val = self.interpret(step_expr) if step_expr else 1
         self.enter_scope()
         self.loop_stack.append('for')
-        if type != 'let':
+        if binding != 'let':
             val=self.get_variable(var_name,line)
             if val is None:
                 return None
-        elif type == 'let':
+        elif binding == 'let':
             self.set_variable(var_name, start_val,line)
         # self.enter_scope()
         # self.loop_stack.append('for')
@@ -320,7 +308,7 @@ class SemanticAnalyzer:
         
     def interpret_while(self, node):
         """Handle while loops"""
-        _, condition, body,line = node
+        condition, body, line = node.condition, node.body, node.line
         self.line_number = line
         
         self.enter_scope()
@@ -350,7 +338,7 @@ class SemanticAnalyzer:
         
     def interpret_compare(self, node):
         """Handle comparison operations"""
-        _, op, left, right,line = node
+        op, left, right, line = node.op, node.left, node.right, node.line
         self.line_number = line
         left_val = self.interpret(left)
         right_val = self.interpret(right)
@@ -375,31 +363,31 @@ class SemanticAnalyzer:
             
     def interpret_logic(self, node):
         """Handle logical operations"""
-        if len(node) == 5:
-            _, op, left, right,line = node
+        if node.kind == Logic.kind:
+            op, left, right, line = node.op, node.left, node.right, node.line
             self.line_number = line
             if op == 'and':
                 return self.is_truthy(self.interpret(left)) and self.is_truthy(self.interpret(right))
             elif op == 'or':
                 return self.is_truthy(self.interpret(left)) or self.is_truthy(self.interpret(right))
         else:
-            _, op, operand,line = node
+            op, operand, line = node.op, node.operand, node.line
             if op == 'not':
                 return not self.is_truthy(self.interpret(operand))
                 
         self.semantic_errors.append(f"🧠💥Unknown logical operator: {node} at line {line}")
     
     def interpret_cond_expr(self,node):
-        _,condition, line = node
+        condition, line = node.expression, node.line
         self.line_number = line
         return self.interpret(condition)
     def grouped_condition(self, node):
-        _, condition, line = node
+        condition, line = node.condition, node.line
         self.line_number = line
         return self.interpret(condition)
     def interpret_function_def(self, node):
         """Handle function definitions"""
-        _, func_name, params, body,line = node
+        func_name, params, body, line = node.name, node.params, node.body, node.line
         self.line_number = line
         self.functions[func_name] = {
             'params': params,
@@ -409,7 +397,7 @@ class SemanticAnalyzer:
         
     def interpret_call(self, node):
         """Handle function calls"""
-        _, func_name, args,line = node
+        func_name, args, line = node.name, node.args, node.line
         self.line_number = line
         
         if func_name not in self.functions:
@@ -449,7 +437,7 @@ class SemanticAnalyzer:
             
     def interpret_return(self, node):
         """Handle return statements"""
-        _, value,line = node
+        value, line = node.value, node.line
         self.line_number = line
         if value is not None:
             self.return_value = self.interpret(value)
@@ -460,7 +448,7 @@ class SemanticAnalyzer:
         
     def interpret_break(self, node):
         """Handle break statements"""
-        _, line = node
+        line = node.line
         self.line_number = line
         if not self.loop_stack:
             self.semantic_errors.append(f"🧠💥Break statement outside of loop at line {line}")
@@ -469,7 +457,7 @@ class SemanticAnalyzer:
         
     def interpret_continue(self, node):
         """Handle continue statements"""
-        _, line = node
+        line = node.line
         self.line_number = line
         if not self.loop_stack:
            self.semantic_errors.append(f"🧠💥Continue statement outside of loop at line {line}")
@@ -478,7 +466,7 @@ class SemanticAnalyzer:
         
     def interpret_natural_lang(self, node):
         """Handle natural language constructs"""
-        _, operation, arg1, connector, arg2, line = node
+        operation, arg1, connector, arg2, line = node.operation, node.arg1, node.connector, node.arg2, node.line
         self.line_number = line
         if operation == 'set' and connector == 'to':
             # "set x to 5" -> x = 5
@@ -576,7 +564,7 @@ class SemanticAnalyzer:
         
     def interpret_natural_lang_if(self, node):
         """Handle natural language if statements"""
-        _, var_name, op, value, statement, line = node
+        var_name, op, value, statement, line = node.name, node.op, node.value, node.body, node.line
         self.line_number = line
         
         var_val = self.get_variable(var_name,line)
@@ -601,7 +589,8 @@ class SemanticAnalyzer:
                 return self.interpret(statement)
         return None
         
-    def is_truthy(self, value):
+    @staticmethod
+    def is_truthy(value):
         """Determine if a value is truthy"""
         if isinstance(value, bool):
             return value
@@ -611,3 +600,39 @@ class SemanticAnalyzer:
             return len(value) > 0
         else:
             return value is not None
+
+
+def _copy(value):
+    return value.copy() if isinstance(value, (list, dict)) else value
+
+
+# Handler for each node kind, indexed by Node.kind. Else, ElseIf and String
+# are only meaningful inside their parent node.
+HANDLERS = [SemanticAnalyzer.interpret_unknown] * len(NODE_TYPES)
+for node_type, handler in {
+    Program: SemanticAnalyzer.interpret_program,
+    Declare: SemanticAnalyzer.interpret_declare,
+    Assign: SemanticAnalyzer.interpret_assign,
+    BinOp: SemanticAnalyzer.interpret_binop,
+    Unary: SemanticAnalyzer.interpret_unary,
+    Literal: SemanticAnalyzer.interpret_literal,
+    Boolean: SemanticAnalyzer.interpret_boolean,
+    Var: SemanticAnalyzer.interpret_var,
+    Print: SemanticAnalyzer.interpret_print,
+    If: SemanticAnalyzer.interpret_if,
+    For: SemanticAnalyzer.interpret_for,
+    While: SemanticAnalyzer.interpret_while,
+    Compare: SemanticAnalyzer.interpret_compare,
+    GroupedCondition: SemanticAnalyzer.grouped_condition,
+    Logic: SemanticAnalyzer.interpret_logic,
+    Not: SemanticAnalyzer.interpret_logic,
+    CondExpr: SemanticAnalyzer.interpret_cond_expr,
+    FunctionDef: SemanticAnalyzer.interpret_function_def,
+    Call: SemanticAnalyzer.interpret_call,
+    Return: SemanticAnalyzer.interpret_return,
+    Break: SemanticAnalyzer.interpret_break,
+    Continue: SemanticAnalyzer.interpret_continue,
+    NaturalLang: SemanticAnalyzer.interpret_natural_lang,
+    NaturalLangIf: SemanticAnalyzer.interpret_natural_lang_if,
+}.items():
+    HANDLERS[node_type.kind] = handler
@@ -0,0 +1,277 @@
+# Syntax tree storing each structurally identical subtree once, for generated
+# and copy-pasted programs that repeat the same statements and expressions.
+# SharedTreeBuilder parses into syntax_tree nodes and then interns them: every
+# distinct subtree becomes one node without positions, and the line and span
+# of each place it occurs go into a side table. Occurrence reads an interned
+# node at one of those places with the attributes the node classes have, so
+# the semantic analyzer and to_json walk it like any other tree.
+import hashlib
+from array import array
+
+from .syntax_tree import Node, NodeBuilder
+
+# No span
+NONE = -1
+
+# What a field or list item walked into gives back once it is interned
+_VISIT = 0
+_NODE = 1
+_LIST = 2
+
+
+class SharedTree:
+    """Interned nodes, and the positions of every node in the program.
+
+    Interned nodes are syntax_tree nodes with line 0 and no span, and so are
+    their children; a subtree occurring many times is one object, so nothing
+    may change them. The `index`th entries of `lines`, `lexpos` and `lexlen`
+    are the positions of a node of the program, counting in depth-first order
+    (a node, then its fields in order) through every occurrence.
+
+    `sizes` holds the number of nodes in each interned node or list by the
+    object's id, unless it is 1, as it is for every leaf. `digests` holds
+    the structural hashes worked out so far (see digest).
+    """
+
+    def __init__(self):
+        self.root = None
+        self.lines = array("I")
+        self.lexpos = array("i")
+        self.lexlen = array("i")
+        self.sizes = {}
+        self.digests = {}
+
+    def __len__(self):
+        return len(self.lines)
+
+    @property
+    def columns(self):
+        return self.lines, self.lexpos, self.lexlen
+
+    def size(self, value):
+        """Number of nodes in interned `value`: 0 for anything but a node or list"""
+        if isinstance(value, (Node, list)):
+            return self.sizes.get(id(value), 1)
+        return 0
+
+    def digest(self, value):
+        """Hash of interned `value`'s structure, the same for equal subtrees in every process and program"""
+        digests = self.digests
+        # Iterative, children first: a long expression is a deep tree
+        stack = [value]
+        while stack:
+            top = stack[-1]
+            if id(top) in digests:
+                stack.pop()
+                continue
+            children = top if isinstance(top, list) else [getattr(top, name) for name in top.fields]
+            pending = [
+                child for child in children
+                if isinstance(child, (Node, list)) and id(child) not in digests
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            # Not the tag: Logic and Not share theirs
+            head = "list" if isinstance(top, list) else type(top).__name__
+            digests[id(top)] = _digest(head, children, digests)
+        return digests[id(value)]
+
+    def load(self, value, index):
+        """What a field holding interned `value` reads as, its first node being node `index`"""
+        if isinstance(value, Node):
+            return Occurrence(self, value, index)
+        if isinstance(value, list):
+            items = []
+            for item in value:
+                items.append(self.load(item, index))
+                index += self.size(item)
+            return items
+        return value
+
+    def to_json(self, value, index):
+        """syntax_tree.to_json of `value` read at node `index`"""
+        if isinstance(value, list):
+            result = []
+            for item in value:
+                result.append(self.to_json(item, index))
+                index += self.size(item)
+            return result
+        if not isinstance(value, Node):
+            return value
+        result = [value.tag]
+        child = index + 1
+        for name in value.fields:
+            field = getattr(value, name)
+            result.append(self.to_json(field, child))
+            child += self.size(field)
+        result.append(self.lines[index])
+        return result
+
+
+def _digest(head, values, digests):
+    """Hash of a node or list from its children's hashes and its values' types and reprs"""
+    digest = hashlib.blake2b(head.encode(), digest_size=16)
+    for value in values:
+        if isinstance(value, (Node, list)):
+            digest.update(b"\x01")
+            digest.update(digests[id(value)])
+        else:
+            # repr never holds a NUL, so it ends the value
+            digest.update(f"\x02{type(value).__name__}:{value!r}\x00".encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _key(value):
+    """What an interned node or list is keyed by for a child: the child's identity, or its value"""
+    if isinstance(value, (Node, list)):
+        return id(value)
+    # Keyed by type too: 1, 1.0 and True are equal dict keys
+    return type(value), value
+
+
+def intern(root):
+    """A SharedTree of the syntax_tree nodes under `root`"""
+    tree = SharedTree()
+    lines, lexpos, lexlen = tree.lines, tree.lexpos, tree.lexlen
+    sizes = tree.sizes
+    interned = {}
+    # Interned fields and list items waiting for the node or list holding them
+    values = []
+    # Iterative: a long expression is a deep tree
+    stack = [(_VISIT, root)]
+    while stack:
+        step, value = stack.pop()
+        if step == _VISIT:
+            if isinstance(value, Node):
+                lines.append(value.line)
+                if value.lexpos is None:
+                    lexpos.append(NONE)
+                    lexlen.append(0)
+                else:
+                    lexpos.append(value.lexpos)
+                    lexlen.append(value.lexlen)
+                stack.append((_NODE, value))
+                stack.extend((_VISIT, getattr(value, name)) for name in reversed(value.fields))
+            elif isinstance(value, list):
+                stack.append((_LIST, value))
+                stack.extend((_VISIT, item) for item in reversed(value))
+            else:
+                values.append(value)
+            continue
+
+        count = len(value.fields) if step == _NODE else len(value)
+        children = values[len(values) - count:]
+        del values[len(values) - count:]
+        if step == _NODE:
+            key = (value.kind, *map(_key, children))
+        else:
+            key = (None, *map(_key, children))
+        shared = interned.get(key)
+        if shared is None:
+            if step == _NODE:
+                shared = type(value)(*children, 0)
+                size = 1
+            else:
+                shared = children
+                size = 0
+            interned[key] = shared
+            size += sum(map(tree.size, children))
+            if size != 1:
+                sizes[id(shared)] = size
+        values.append(shared)
+    tree.root = values[0]
+    return tree
+
+
+class Occurrence:
+    """An interned node at one place in the program, read like a syntax_tree node.
+
+    It has the node class's kind, tag and fields and the place's line and
+    span, and each field as an attribute: nodes come back as occurrences,
+    lists as lists and values as themselves. `digest` is the same for every
+    occurrence of the same subtree, wherever and in whatever program it is.
+    """
+
+    __slots__ = ("tree", "node", "index")
+
+    def __init__(self, tree, node, index):
+        self.tree = tree
+        self.node = node
+        self.index = index
+
+    @property
+    def kind(self):
+        return self.node.kind
+
+    @property
+    def tag(self):
+        return self.node.tag
+
+    @property
+    def fields(self):
+        return self.node.fields
+
+    @property
+    def line(self):
+        return self.tree.lines[self.index]
+
+    @property
+    def lexpos(self):
+        lexpos = self.tree.lexpos[self.index]
+        return None if lexpos == NONE else lexpos
+
+    @property
+    def lexlen(self):
+        if self.tree.lexpos[self.index] == NONE:
+            return None
+        return self.tree.lexlen[self.index]
+
+    @property
+    def endlexpos(self):
+        lexpos = self.tree.lexpos[self.index]
+        return None if lexpos == NONE else lexpos + self.tree.lexlen[self.index]
+
+    @property
+    def digest(self):
+        return self.tree.digest(self.node)
+
+    def __getattr__(self, name):
+        node = self.node
+        if name not in node.fields:
+            raise AttributeError(f"{type(node).__name__} occurrence has no field '{name}'")
+        tree = self.tree
+        index = self.index + 1
+        for field in node.fields:
+            value = getattr(node, field)
+            if field == name:
+                return tree.load(value, index)
+            index += tree.size(value)
+
+    def to_json(self):
+        return self.tree.to_json(self.node, self.index)
+
+    def __eq__(self, other):
+        if type(other) is not Occurrence:
+            return NotImplemented
+        return self.tree is other.tree and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return f"Occurrence({type(self.node).__name__} #{self.index}, line={self.line})"
+
+
+class SharedTreeBuilder(NodeBuilder):
+    """Answers the parser's node calls like NodeBuilder, then interns the
+    finished tree. Use a new builder for every parse."""
+
+    @staticmethod
+    def finish(root):
+        """An occurrence of the interned tree's root, or None if parsing built none"""
+        if root is None:
+            return None
+        tree = intern(root)
+        return Occurrence(tree, tree.root, 0)
@@ -0,0 +1,473 @@
+# Node classes of the syntax tree the parser builds, in NODE_TYPES order.
+# A node's `kind` is its class's index there, so the semantic analyzer
+# dispatches with one list lookup instead of comparing string tags.
+NODE_TYPES = []
+
+
+def _node_type(cls):
+    cls.kind = len(NODE_TYPES)
+    NODE_TYPES.append(cls)
+    return cls
+
+
+class Node:
+    """Base of every syntax tree node.
+
+    `fields` names the node's children and values in the order the old tuple
+    tree had them; `tag` was that tuple's first element. Every node also has
+    the line the parser reports for it and its source span: the offset of
+    its first token (`lexpos`) and the length up to the end of its last one
+    (`lexlen`). The parser fills the span in after building the node.
+    """
+
+    # A length rather than an end offset: most are small enough to be
+    # shared int objects, where every end offset would be a separate one
+    __slots__ = ("line", "lexpos", "lexlen")
+    kind = None
+    tag = None
+    fields = ()
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.fields + Node.__slots__
+        )
+
+    __hash__ = None
+
+    @property
+    def endlexpos(self):
+        """Offset just past the node's last token"""
+        if self.lexpos is None:
+            return None
+        return self.lexpos + self.lexlen
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values}, line={self.line})"
+
+
+@_node_type
+class Program(Node):
+    __slots__ = fields = ("statements",)
+    tag = "program"
+
+    def __init__(self, statements, line):
+        self.statements = statements
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Declare(Node):
+    """let name = value;"""
+    __slots__ = fields = ("name", "value")
+    tag = "declare"
+
+    def __init__(self, name, value, line):
+        self.name = name
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Assign(Node):
+    """name = value;"""
+    __slots__ = fields = ("name", "value")
+    tag = "assign"
+
+    def __init__(self, name, value, line):
+        self.name = name
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class BinOp(Node):
+    __slots__ = fields = ("op", "left", "right")
+    tag = "binop"
+
+    def __init__(self, op, left, right, line):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Unary(Node):
+    __slots__ = fields = ("op", "operand")
+    tag = "unary"
+
+    def __init__(self, op, operand, line):
+        self.op = op
+        self.operand = operand
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Literal(Node):
+    """An integer, float or string constant"""
+    __slots__ = fields = ("value",)
+    tag = "literal"
+
+    def __init__(self, value, line):
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Boolean(Node):
+    """true or false, kept as the keyword text"""
+    __slots__ = fields = ("value",)
+    tag = "boolean"
+
+    def __init__(self, value, line):
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Var(Node):
+    __slots__ = fields = ("name",)
+    tag = "var"
+
+    def __init__(self, name, line):
+        self.name = name
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Print(Node):
+    __slots__ = fields = ("items",)
+    tag = "print"
+
+    def __init__(self, items, line):
+        self.items = items
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class String(Node):
+    """A string printed as is rather than evaluated"""
+    __slots__ = fields = ("value",)
+    tag = "string"
+
+    def __init__(self, value, line):
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class If(Node):
+    """if condition body, with an Else, an ElseIf or None as else_part"""
+    __slots__ = fields = ("condition", "body", "else_part")
+    tag = "if"
+
+    def __init__(self, condition, body, else_part, line):
+        self.condition = condition
+        self.body = body
+        self.else_part = else_part
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Else(Node):
+    __slots__ = fields = ("body",)
+    tag = "else"
+
+    def __init__(self, body, line):
+        self.body = body
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class ElseIf(Node):
+    """Has the fields of If, so it can be interpreted as one"""
+    __slots__ = fields = ("condition", "body", "else_part")
+    tag = "elseif"
+
+    def __init__(self, condition, body, else_part, line):
+        self.condition = condition
+        self.body = body
+        self.else_part = else_part
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class For(Node):
+    """for [let] name = start_expr to end_expr [step step_expr] body
+
+    `binding` is "let" when the loop declares its variable, else None.
+    """
+    __slots__ = fields = ("binding", "name", "start_expr", "end_expr", "step_expr", "body")
+    tag = "for"
+
+    def __init__(self, binding, name, start_expr, end_expr, step_expr, body, line):
+        self.binding = binding
+        self.name = name
+        self.start_expr = start_expr
+        self.end_expr = end_expr
+        self.step_expr = step_expr
+        self.body = body
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class While(Node):
+    __slots__ = fields = ("condition", "body")
+    tag = "while"
+
+    def __init__(self, condition, body, line):
+        self.condition = condition
+        self.body = body
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Compare(Node):
+    __slots__ = fields = ("op", "left", "right")
+    tag = "compare"
+
+    def __init__(self, op, left, right, line):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Logic(Node):
+    """condition and/or condition"""
+    __slots__ = fields = ("op", "left", "right")
+    tag = "logic"
+
+    def __init__(self, op, left, right, line):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Not(Node):
+    """not condition; `op` is always "not", as in the old tuple"""
+    __slots__ = fields = ("op", "operand")
+    tag = "logic"
+
+    def __init__(self, op, operand, line):
+        self.op = op
+        self.operand = operand
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class CondExpr(Node):
+    """An expression used as a condition"""
+    __slots__ = fields = ("expression",)
+    tag = "cond_expr"
+
+    def __init__(self, expression, line):
+        self.expression = expression
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class GroupedCondition(Node):
+    __slots__ = fields = ("condition",)
+    tag = "grouped_condition"
+
+    def __init__(self, condition, line):
+        self.condition = condition
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class FunctionDef(Node):
+    __slots__ = fields = ("name", "params", "body")
+    tag = "function_def"
+
+    def __init__(self, name, params, body, line):
+        self.name = name
+        self.params = params
+        self.body = body
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Call(Node):
+    __slots__ = fields = ("name", "args")
+    tag = "call"
+
+    def __init__(self, name, args, line):
+        self.name = name
+        self.args = args
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Return(Node):
+    """return [value]; value is None for a bare return"""
+    __slots__ = fields = ("value",)
+    tag = "return"
+
+    def __init__(self, value, line):
+        self.value = value
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Break(Node):
+    __slots__ = fields = ()
+    tag = "break"
+
+    def __init__(self, line):
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class Continue(Node):
+    __slots__ = fields = ()
+    tag = "continue"
+
+    def __init__(self, line):
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class NaturalLang(Node):
+    """set/add/sub/mult/div, with arg1 and arg2 either side of the connector word"""
+    __slots__ = fields = ("operation", "arg1", "connector", "arg2")
+    tag = "natural_lang"
+
+    def __init__(self, operation, arg1, connector, arg2, line):
+        self.operation = operation
+        self.arg1 = arg1
+        self.connector = connector
+        self.arg2 = arg2
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+@_node_type
+class NaturalLangIf(Node):
+    """if name is op value then body"""
+    __slots__ = fields = ("name", "op", "value", "body")
+    tag = "natural_lang_if"
+
+    def __init__(self, name, op, value, body, line):
+        self.name = name
+        self.op = op
+        self.value = value
+        self.body = body
+        self.line = line
+        self.lexpos = self.lexlen = None
+
+
+class NodeBuilder:
+    """What the parser's actions build the tree with: one object per node.
+
+    An action calls builder.BinOp(op, left, right, line) and so on for every
+    class above, so flat_tree.FlatTreeBuilder can answer the same calls by
+    appending to arrays instead.
+    """
+
+    @staticmethod
+    def declared(node):
+        """name and value of a Declare that a for loop takes apart"""
+        return node.name, node.value
+
+    @staticmethod
+    def span(node, lexpos, endlexpos):
+        """Give a node just built its source span; a node passed up keeps its own"""
+        if isinstance(node, Node) and node.lexpos is None:
+            node.lexpos = lexpos
+            node.lexlen = endlexpos - lexpos
+
+    @staticmethod
+    def finish(root):
+        """The tree to hand to the semantic analyzer once parsing returns `root`"""
+        return root
+
+
+for _cls in NODE_TYPES:
+    setattr(NodeBuilder, _cls.__name__, _cls)
+
+
+def to_json(tree):
+    """The tree as parseTree has always been sent: [tag, *fields, line] per node.
+
+    Takes slotted nodes, flat_tree cursors and shared_tree occurrences alike.
+    """
+    if isinstance(tree, list):
+        return [to_json(item) for item in tree]
+    if tree is None or isinstance(tree, (str, int, float)):
+        return tree
+    if not isinstance(tree, Node):
+        # A flat_tree cursor or shared_tree occurrence, which reads its arrays directly
+        return tree.to_json()
+    result = [tree.tag]
+    for name in tree.fields:
+        result.append(to_json(getattr(tree, name)))
+    result.append(tree.line)
+    return result
+
+
+def shifted(tree, offset, lines):
+    """Copy of a tree of nodes with its spans `offset` characters and its lines `lines` lines on.
+
+    Line 0, which a CondExpr always has, is no position and stays 0.
+    """
+    # Iterative: a long expression is a deep tree. Each node is copied with
+    # its old children, which are then swapped for their copies.
+    root = [tree]
+    stack = [(root, 0)]
+    while stack:
+        holder, key = stack.pop()
+        value = holder[key] if type(holder) is list else getattr(holder, key)
+        if type(value) is list:
+            copy = value[:]
+            stack.extend((copy, i) for i in range(len(copy)))
+        elif isinstance(value, Node):
+            fields = value.fields
+            copy = type(value)(
+                *[getattr(value, name) for name in fields],
+                value.line + lines if value.line else 0,
+            )
+            if value.lexpos is not None:
+                copy.lexpos = value.lexpos + offset
+                copy.lexlen = value.lexlen
+            stack.extend((copy, name) for name in fields)
+        else:
+            continue
+        if type(holder) is list:
+            holder[key] = copy
+        else:
+            setattr(holder, key, copy)
+    return root[0]
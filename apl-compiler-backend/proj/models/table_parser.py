@@ -0,0 +1,511 @@
+# LR driver for the grammar in parser.Parser, running the LALR tables PLY
+# generated into parsetab.py without going through ply.yacc.
+#
+# The tables are loaded once into flat integer arrays indexed by state and
+# symbol id: a terminal's id is its token type id (TYPE_IDS), followed by
+# $end and error; nonterminals are numbered in the order of the goto table.
+# Tokens come straight from a TokenBuffer's columns, so no LexToken or
+# YaccSymbol is made for them, and each production reduces through a small
+# function below that builds what its p_* action builds, given the values
+# and lines of its symbols. Productions passing their only symbol's value
+# up, like "term : factor", only change the state.
+#
+# Errors are reported and recovered from exactly as LRParser.parse does,
+# with the same p_error messages. Identifiers never need
+# Parser.is_variable_keyword here: the lexers turn every reserved word into
+# its keyword token.
+from array import array
+
+from . import parsetab
+from .finallexer import Lexer
+from .parser import syntax_error_messages
+from .token_buffer import TOKEN_TYPES, TYPE_IDS
+
+# Symbol ids past the tokens'
+EOF = len(TOKEN_TYPES)
+ERROR = EOF + 1
+
+# Actions as LRParser encodes them: a state to shift to, minus a production
+# to reduce by, or 0 to accept; and no action, a syntax error
+ACCEPT = 0
+NO_ACTION = 2**31 - 1
+
+# Tokens shifted after a syntax error before another one is reported, as yacc.error_count
+ERROR_COUNT = 3
+
+# How a token's text becomes its value, as TokenBuffer.value converts it
+_CONVERSIONS = [None] * (ERROR + 1)
+_CONVERSIONS[TYPE_IDS["INTEGER"]] = int
+_CONVERSIONS[TYPE_IDS["FLOAT"]] = float
+_CONVERSIONS[TYPE_IDS["STRING"]] = Lexer.decode_string
+
+
+# --------------------------
+# REDUCTIONS
+# --------------------------
+#
+# Each takes the builder, the values of the production's symbols as p[1]..
+# p[n] (p[0] is the value below them, and len(p) is what it is in the p_*
+# action) and their lines the same way, and returns the production's value.
+# A nonterminal's line is 0, as p.lineno gives for one.
+
+def _first(b, p, lines):
+    return p[1]
+
+
+def _none(b, p, lines):
+    return None
+
+
+def _program(b, p, lines):
+    if len(p) >= 4:
+        return b.Program(p[2], lines[1])
+    return b.Program(p[1], lines[1])
+
+
+def _statement_list(b, p, lines):
+    if len(p) == 3:
+        # A statement with a syntax error is left out
+        if p[2] is not None:
+            p[1].append(p[2])
+        return p[1]
+    return []
+
+
+def _assignment_statement(b, p, lines):
+    if len(p) == 2:
+        return p[1]
+    return b.Assign(p[1], p[3], lines[1])
+
+
+def _declaration(b, p, lines):
+    return b.Declare(p[2], p[4], lines[2])
+
+
+def _binop(b, p, lines):
+    return b.BinOp(p[2], p[1], p[3], lines[2])
+
+
+def _literal(b, p, lines):
+    return b.Literal(p[1], lines[1])
+
+
+def _variable(b, p, lines):
+    return b.Var(p[1], lines[1])
+
+
+def _boolean(b, p, lines):
+    return b.Boolean(p[1], lines[1])
+
+
+def _second(b, p, lines):
+    return p[2]
+
+
+def _unary(b, p, lines):
+    return b.Unary(p[1], p[2], lines[1])
+
+
+def _if_statement(b, p, lines):
+    return b.If(p[2], p[3], p[4], lines[1])
+
+
+def _else_part(b, p, lines):
+    if len(p) == 3:
+        return b.Else(p[2], lines[1])
+    if len(p) == 5:
+        return b.ElseIf(p[2], p[3], p[4], lines[1])
+    return None
+
+
+def _for_statement(b, p, lines):
+    if not isinstance(p[2], str):
+        # p[2] is a declaration node: let var = start
+        var_name, start_expr = b.declared(p[2])
+        if len(p) == 6:
+            return b.For('let', var_name, start_expr, p[4], None, p[5], lines[1])
+        return b.For('let', var_name, start_expr, p[4], p[6], p[7], lines[1])
+    if len(p) == 8:
+        return b.For(None, p[2], p[4], p[6], None, p[7], lines[1])
+    return b.For(None, p[2], p[4], p[6], p[8], p[9], lines[1])
+
+
+def _while_statement(b, p, lines):
+    return b.While(p[2], p[3], lines[1])
+
+
+def _block(b, p, lines):
+    if len(p) >= 4:
+        return p[2]
+    if p[1] is None:
+        return []
+    return [p[1]]
+
+
+def _comparison(b, p, lines):
+    return b.Compare(p[2], p[1], p[3], lines[2])
+
+
+def _logical(b, p, lines):
+    if len(p) == 4:
+        return b.Logic(p[2], p[1], p[3], lines[2])
+    return b.Not(p[1], p[2], lines[1])
+
+
+def _condition_expr(b, p, lines):
+    return b.CondExpr(p[1], lines[1])
+
+
+def _condition_grouped(b, p, lines):
+    return b.GroupedCondition(p[2], lines[1])
+
+
+def _natural_language(b, p, lines):
+    return b.NaturalLang(p[1].lower(), p[2], p[3].lower(), p[4], lines[1])
+
+
+def _natural_language_if(b, p, lines):
+    return b.NaturalLangIf(p[2], p[4], p[5], p[7], lines[1])
+
+
+def _function_call(b, p, lines):
+    return b.Call(p[1], p[3], lines[1])
+
+
+def _parameter_list(b, p, lines):
+    if p[1] is None:
+        return []
+    return p[1]
+
+
+def _appended(b, p, lines):
+    # argument_list, print_arguments and parameter_declaration_list
+    if len(p) == 4:
+        p[1].append(p[3])
+        return p[1]
+    return [p[1]]
+
+
+def _print_statement(b, p, lines):
+    return b.Print(p[3], lines[1])
+
+
+def _printable_string(b, p, lines):
+    return b.String(p[1], lines[1])
+
+
+def _function_definition(b, p, lines):
+    if len(p) == 7:
+        return b.FunctionDef(p[2], p[4], p[6], lines[1])
+    return b.FunctionDef(p[2], [], p[5], lines[1])
+
+
+def _return_statement(b, p, lines):
+    if len(p) == 4:
+        return b.Return(p[2], lines[1])
+    return b.Return(None, lines[1])
+
+
+def _break_statement(b, p, lines):
+    return b.Break(lines[1])
+
+
+def _continue_statement(b, p, lines):
+    return b.Continue(lines[1])
+
+
+# The reduction standing in for each p_* action of parser.Parser
+REDUCTIONS = {
+    "p_program": _program,
+    "p_statement_list": _statement_list,
+    "p_statement": _first,
+    "p_statement_error": _none,
+    "p_assignment_statement": _assignment_statement,
+    "p_declaration": _declaration,
+    "p_expression_binop": _binop,
+    "p_expression_term": _first,
+    "p_term_binop": _binop,
+    "p_term_factor": _first,
+    "p_factor_number": _literal,
+    "p_factor_variable": _variable,
+    "p_factor_boolean": _boolean,
+    "p_factor_grouped": _second,
+    "p_factor_unary": _unary,
+    "p_control_statement": _first,
+    "p_if_statement": _if_statement,
+    "p_else_part": _else_part,
+    "p_for_statement": _for_statement,
+    "p_while_statement": _while_statement,
+    "p_block": _block,
+    "p_condition_comparison": _comparison,
+    "p_condition_logical": _logical,
+    "p_condition_expr": _condition_expr,
+    "p_condition_grouped": _condition_grouped,
+    "p_natural_language": _natural_language,
+    "p_natural_language_if": _natural_language_if,
+    "p_function_call": _function_call,
+    "p_parameter_list": _parameter_list,
+    "p_argument_list": _appended,
+    "p_print_statement": _print_statement,
+    "p_print_arguments_multiple": _appended,
+    "p_print_arguments_single": _appended,
+    "p_printable_item_string": _printable_string,
+    "p_printable_item_expr": _first,
+    "p_function_definition": _function_definition,
+    "p_parameter_declaration_list": _appended,
+    "p_return_statement": _return_statement,
+    "p_break_statement": _break_statement,
+    "p_continue_statement": _continue_statement,
+    "p_statement_extended": _first,
+    "p_empty": _none,
+}
+
+
+# --------------------------
+# TABLES
+# --------------------------
+
+class Tables:
+    """LALR tables in the layout parsetab.py writes, as flat integer arrays.
+
+    `action[state * columns + terminal]` and `goto[state * nonterminals +
+    nonterminal]` (-1 for none) are LRParser's action and goto tables,
+    `defaults[state]` the reduction a state makes whatever the lookahead,
+    or NO_ACTION. Production `n` has `lengths[n]` symbols, makes a
+    `lhs[n]` and reduces through `reductions[n]`, None for one passing its
+    only symbol's value up unchanged.
+    """
+
+    def __init__(self, lr_action, lr_goto, lr_productions):
+        terminals = {name: type_id for name, type_id in TYPE_IDS.items()}
+        terminals["$end"] = EOF
+        terminals["error"] = ERROR
+        nonterminal_names = sorted({name for row in lr_goto.values() for name in row})
+        nonterminal_ids = {name: i for i, name in enumerate(nonterminal_names)}
+        states = 1 + max(max(lr_action), max(lr_goto))
+
+        self.columns = ERROR + 1
+        self.nonterminals = len(nonterminal_names)
+        self.action = array("i", [NO_ACTION]) * (states * self.columns)
+        self.goto = array("i", [-1]) * (states * self.nonterminals)
+        self.defaults = array("i", [NO_ACTION]) * states
+        for state, row in lr_action.items():
+            for name, action in row.items():
+                self.action[state * self.columns + terminals[name]] = action
+            # LRParser.set_defaulted_states: a state with nothing to do but
+            # one reduction makes it without reading a token
+            actions = list(row.values())
+            if len(actions) == 1 and actions[0] < 0:
+                self.defaults[state] = actions[0]
+        for state, row in lr_goto.items():
+            for name, target in row.items():
+                self.goto[state * self.nonterminals + nonterminal_ids[name]] = target
+
+        # States entered by shifting error, whose symbol on the stack is error
+        self.error_states = frozenset(
+            action for row in lr_action.values()
+            for name, action in row.items() if name == "error" and action > 0
+        )
+
+        self.lengths = array("B")
+        self.lhs = array("H")
+        self.reductions = []
+        for _, name, length, func, _, _ in lr_productions:
+            self.lengths.append(length)
+            # S' -> program is accepted, never reduced
+            self.lhs.append(nonterminal_ids.get(name, 0))
+            reduction = None
+            if func is not None:
+                try:
+                    reduction = REDUCTIONS[func]
+                except KeyError:
+                    raise ValueError(f"table_parser has no reduction for parser.Parser.{func}") from None
+            if reduction is _first and length == 1:
+                reduction = None
+            self.reductions.append(reduction)
+
+    @classmethod
+    def load(cls, module=parsetab):
+        """Tables of a generated parsetab module"""
+        return cls(module._lr_action, module._lr_goto, module._lr_productions)
+
+
+TABLES = Tables.load()
+
+
+# --------------------------
+# DRIVER
+# --------------------------
+
+def _matched(starts, ends, base):
+    """Span of the symbols from `base` up, skipping those at either end that matched nothing"""
+    for first in range(base, len(starts)):
+        if starts[first] is not None:
+            for last in range(len(ends) - 1, first - 1, -1):
+                if ends[last] is not None:
+                    return starts[first], ends[last]
+    return None, None
+
+
+class TableParser:
+    """Parses one TokenBuffer with the LR tables into a tree built by `builder`.
+
+    After parse(), `errors` holds the syntax error messages, as
+    Parser.parseErrorMessage would; `line_index` puts columns in them.
+    """
+
+    def __init__(self, buffer, builder, line_index=None, tables=TABLES):
+        self.buffer = buffer
+        self.builder = builder
+        self.line_index = line_index
+        self.tables = tables
+        self.errors = []
+
+    def parse(self):
+        """The finished tree, what was recovered around syntax errors, or None"""
+        return self.builder.finish(self.run())
+
+    def run(self):
+        """The value the program reduces to, as LRParser.parse returns it"""
+        tables = self.tables
+        action = tables.action
+        goto = tables.goto
+        defaults = tables.defaults
+        columns = tables.columns
+        nonterminals = tables.nonterminals
+        lengths = tables.lengths
+        lhs = tables.lhs
+        reductions = tables.reductions
+        builder = self.builder
+        span = builder.span
+
+        buffer = self.buffer
+        source = buffer.source
+        types = buffer.types
+        token_starts = buffer.starts
+        token_ends = buffer.ends
+        token_lines = buffer.lines
+        count = len(types)
+        conversions = _CONVERSIONS
+
+        # One entry per symbol on the stack, above the starting state's:
+        # the state, and the symbol's value, line and source span (None for
+        # a symbol that matched nothing)
+        states = [0]
+        values = [None]
+        lines = [0]
+        starts = [None]
+        ends = [None]
+        state = 0
+        # The lookahead's symbol id, -1 until a token is read, and the index
+        # of its token; while error is the lookahead, the token it stands in
+        # front of waits in `held`
+        lookahead = -1
+        index = 0
+        held = -1
+        pos = 0
+        errorcount = 0
+
+        while True:
+            act = defaults[state]
+            if act == NO_ACTION:
+                if lookahead < 0:
+                    if held >= 0:
+                        lookahead, index, held = types[held], held, -1
+                    elif pos < count:
+                        lookahead, index = types[pos], pos
+                        pos += 1
+                    else:
+                        lookahead = EOF
+                act = action[state * columns + lookahead]
+
+            if act < 0:
+                prod = -act
+                reduction = reductions[prod]
+                if reduction is None:
+                    # The symbol stays as it is, under the production's name
+                    state = goto[states[-2] * nonterminals + lhs[prod]]
+                    states[-1] = state
+                    continue
+                length = lengths[prod]
+                base = len(states) - length
+                value = reduction(builder, values[base - 1:], lines[base - 1:])
+                state = goto[states[base - 1] * nonterminals + lhs[prod]]
+                if length:
+                    # From the first token the production matched to the end of its last one
+                    start = starts[base]
+                    end = ends[-1]
+                    if start is None or end is None:
+                        start, end = _matched(starts, ends, base)
+                    if start is not None:
+                        span(value, start, end)
+                    del states[base + 1:], values[base + 1:], lines[base + 1:]
+                    del starts[base + 1:], ends[base + 1:]
+                    states[base] = state
+                    values[base] = value
+                    lines[base] = 0
+                    starts[base] = start
+                    ends[base] = end
+                else:
+                    states.append(state)
+                    values.append(value)
+                    lines.append(0)
+                    starts.append(None)
+                    ends.append(None)
+                continue
+
+            if act != NO_ACTION:
+                if act == ACCEPT:
+                    return values[-1]
+                states.append(act)
+                state = act
+                if lookahead == ERROR:
+                    # error sits where the token after it starts
+                    values.append(None)
+                    lines.append(token_lines[held])
+                    starts.append(token_starts[held])
+                    ends.append(token_starts[held])
+                else:
+                    start = token_starts[index]
+                    end = token_ends[index]
+                    convert = conversions[lookahead]
+                    text = source[start:end]
+                    values.append(text if convert is None else convert(text))
+                    lines.append(token_lines[index])
+                    starts.append(start)
+                    ends.append(end)
+                lookahead = -1
+                if errorcount:
+                    errorcount -= 1
+                continue
+
+            # A syntax error, recovered from as LRParser.parse does. Only the
+            # first of errors less than ERROR_COUNT shifted tokens apart is
+            # reported; error is never the lookahead when one is.
+            if errorcount == 0:
+                token = None if lookahead == EOF else buffer.lex_token(index)
+                self.errors.extend(syntax_error_messages(token, self.line_index))
+            errorcount = ERROR_COUNT
+
+            if len(states) <= 1 and lookahead != EOF:
+                # Nothing to pop: drop the token and start over
+                lookahead = held = -1
+                state = 0
+                continue
+            if lookahead == EOF:
+                return None
+            if lookahead != ERROR:
+                if states[-1] in tables.error_states:
+                    # Discard tokens until one can follow error
+                    lookahead = -1
+                    continue
+                held = index
+                lookahead = ERROR
+            else:
+                # Pop states until one can shift error
+                states.pop()
+                values.pop()
+                lines.pop()
+                starts.pop()
+                ends.pop()
+                state = states[-1]
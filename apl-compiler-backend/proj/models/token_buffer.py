@@ -0,0 +1,276 @@
+import re
+from array import array
+from bisect import bisect_left
+
+from ply.lex import LexToken
+
+from .finallexer import Lexer
+
+# A token's type id is its position in Lexer.tokens
+TOKEN_TYPES = Lexer.tokens
+TYPE_IDS = {name: type_id for type_id, name in enumerate(TOKEN_TYPES)}
+
+INTEGER_ID = TYPE_IDS["INTEGER"]
+FLOAT_ID = TYPE_IDS["FLOAT"]
+STRING_ID = TYPE_IDS["STRING"]
+DIVIDE_ID = TYPE_IDS["DIVIDE_OP"]
+TIMES_ID = TYPE_IDS["TIMES_OP"]
+
+# What can sit between two tokens besides whitespace: comments and characters
+# the lexer rejected. Only a rejected '"' matters for re-lexing.
+GAP_PATTERN = re.compile(r'/\*[\s\S]*?\*/|//[^\n]*|"')
+
+
+class TokenBuffer:
+    """The tokens of one source, stored column-wise.
+
+    Each token costs one byte of type id and three 32-bit integers (start
+    offset, end offset, line) instead of a LexToken object. Token text and
+    values are not stored; they are sliced out of the source and converted
+    only when asked for.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.types = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.lines = array("I")
+        # Offsets of unmatched '"' and unterminated '/*', found on first edit
+        self._hazards = None
+        # Leading tokens copied unchanged from the buffer this one is an edit of
+        self.kept = 0
+
+    @classmethod
+    def from_lexer(cls, lexer, source):
+        """Tokenize `source` with a PLY-style lexer object and keep its tokens"""
+        buffer = cls(source)
+        type_ids = TYPE_IDS
+        add_type = buffer.types.append
+        add_start = buffer.starts.append
+        add_end = buffer.ends.append
+        add_line = buffer.lines.append
+        lexer.input(source)
+        lexer.lineno = 1
+        token = lexer.token
+        tok = token()
+        while tok is not None:
+            add_type(type_ids[tok.type])
+            add_start(tok.lexpos)
+            # Both engines leave lexpos just past the token they returned
+            add_end(lexer.lexpos)
+            add_line(tok.lineno)
+            tok = token()
+        return buffer
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return TOKEN_TYPES[self.types[i]]
+
+    def text(self, i):
+        """The token's source text, sliced on demand"""
+        return self.source[self.starts[i]:self.ends[i]]
+
+    def value(self, i):
+        """The token's value exactly as the lexer would have produced it"""
+        type_id = self.types[i]
+        text = self.source[self.starts[i]:self.ends[i]]
+        if type_id == INTEGER_ID:
+            return int(text)
+        if type_id == FLOAT_ID:
+            return float(text)
+        if type_id == STRING_ID:
+            return Lexer.decode_string(text)
+        return text
+
+    def lex_token(self, i):
+        """Materialize token `i` as a LexToken"""
+        tok = LexToken()
+        tok.type = TOKEN_TYPES[self.types[i]]
+        tok.value = self.value(i)
+        tok.lineno = self.lines[i]
+        tok.lexpos = self.starts[i]
+        tok.endlexpos = self.ends[i]
+        return tok
+
+    def __iter__(self):
+        return map(self.lex_token, range(len(self.types)))
+
+    def edit(self, offset, deleted, inserted, lexer):
+        """Return the buffer for the source with an edit applied, re-lexing near it only.
+
+        `deleted` characters at `offset` are replaced by `inserted`. Lexing
+        restarts one token before the edit, because a token's match can look
+        one character past its end ("1." vs "1.5"). It stops as soon as a new
+        token starts where an old token started, shifted by the edit, since
+        lexing from there sees exactly the old text. Tokens before the
+        restart point and after that point are copied, not re-lexed.
+
+        An unmatched '"' or an unterminated '/*' before the restart point
+        failed to match because of text arbitrarily far ahead, possibly
+        including the edit. The whole source is then re-lexed.
+        """
+        source = self.source[:offset] + inserted + self.source[offset + deleted:]
+        delta = len(inserted) - deleted
+        hazards = self.hazards()
+
+        first = bisect_left(self.ends, offset) - 1
+        if first < 0:
+            # The edit comes before the end of the first token
+            first, restart, lineno = 0, 0, 1
+        else:
+            restart, lineno = self.starts[first], self.lines[first]
+        if hazards and hazards[0] < restart:
+            return TokenBuffer.from_lexer(lexer, source)
+
+        result = TokenBuffer(source)
+        result.kept = first
+        result.types = self.types[:first]
+        result.starts = self.starts[:first]
+        result.ends = self.ends[:first]
+        result.lines = self.lines[:first]
+
+        lexer.input(source)
+        lexer.lexpos = restart
+        lexer.lineno = lineno
+        edit_end = offset + len(inserted)
+        resync = len(self)
+        line_delta = 0
+        tok = lexer.token()
+        while tok is not None:
+            if tok.lexpos >= edit_end:
+                j = bisect_left(self.starts, tok.lexpos - delta, first)
+                if j < len(self) and self.starts[j] == tok.lexpos - delta:
+                    resync = j
+                    line_delta = tok.lineno - self.lines[j]
+                    break
+            result.types.append(TYPE_IDS[tok.type])
+            result.starts.append(tok.lexpos)
+            result.ends.append(lexer.lexpos)
+            result.lines.append(tok.lineno)
+            tok = lexer.token()
+        relexed_end = len(result)
+
+        if resync < len(self):
+            result.types.extend(self.types[resync:])
+            result.starts.extend(_shifted(self.starts[resync:], delta))
+            result.ends.extend(_shifted(self.ends[resync:], delta))
+            result.lines.extend(_shifted(self.lines[resync:], line_delta))
+
+        # Carry the hazards over instead of scanning the whole source again
+        old_end = self.starts[resync] if resync < len(self) else len(self.source) + 1
+        result._hazards = (
+            result._scan_hazards(first, relexed_end + 1)
+            + [h + delta for h in hazards[bisect_left(hazards, old_end):]]
+        )
+        return result
+
+    def hazards(self):
+        """Sorted offsets of lexing failures that depend on text far ahead"""
+        if self._hazards is None:
+            self._hazards = self._scan_hazards(0, len(self) + 1)
+        return self._hazards
+
+    def _scan_hazards(self, first, stop):
+        """Find hazards in the gaps before tokens first..stop-1 (index len(self) is EOF)"""
+        found = []
+        source = self.source
+        for i in range(first, min(stop, len(self) + 1)):
+            gap_start = self.ends[i - 1] if i > 0 else 0
+            gap_end = self.starts[i] if i < len(self) else len(source)
+            if source.find('"', gap_start, gap_end) != -1:
+                found.extend(
+                    m.start()
+                    for m in GAP_PATTERN.finditer(source, gap_start, gap_end)
+                    if m.group() == '"'
+                )
+            # "/" directly followed by "*" only lexes apart when no "*/" follows
+            if (
+                0 < i < len(self)
+                and self.types[i - 1] == DIVIDE_ID
+                and self.types[i] == TIMES_ID
+                and gap_start == gap_end
+            ):
+                found.append(self.starts[i - 1])
+        return found
+
+    def feeder(self):
+        """Return a token source the PLY parser can consume via parse(lexer=...)"""
+        return TokenFeeder(self)
+
+    def report(self, line_index):
+        """Token types, values, lines and columns as parallel lists, plus the source lines
+
+        The structured token report: entry i of every list describes token i
+        and a line is a 1-based index into the source lines.
+        """
+        line_starts = line_index.starts
+        tokens = {
+            "type": list(map(TOKEN_TYPES.__getitem__, self.types)),
+            "value": list(map(self.value, range(len(self)))),
+            "line": self.lines.tolist(),
+            "col": [
+                start - line_starts[line - 1] + 1
+                for start, line in zip(self.starts, self.lines)
+            ],
+        }
+        return tokens, self.source.split("\n")
+
+    def legacy_report(self, line_index):
+        """The token report as Lexer.analyze_tokens formats it: three strings per token"""
+        output = []
+        for i in range(len(self)):
+            token_type = TOKEN_TYPES[self.types[i]]
+            lexpos, lineno = self.starts[i], self.lines[i]
+            output.append(f"LexToken({token_type},'{self.value(i)}',{lineno},{lexpos})")
+            if lineno <= line_index.line_count:
+                col_pos = line_index.column(lexpos, lineno)
+                output.append(f"  Line {lineno}: {line_index.line_text(lineno)}")
+                output.append(f"  Column {col_pos}: {' ' * (col_pos - 1)}^")
+        return output
+
+
+def _shifted(column, delta):
+    """Copy of an array column with `delta` added to every entry"""
+    if not delta:
+        return column
+    return array(column.typecode, map(delta.__add__, column))
+
+
+class TokenFeeder:
+    """Adapter implementing the part of the PLY lexer protocol yacc uses.
+
+    Tokens are materialized one at a time as the parser asks for them, so
+    only the parser's lookahead exists as LexToken objects.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.index = 0
+        self.lineno = 1
+        self.lexpos = 0
+
+    def input(self, data):
+        """Restart from the first token; the source is fixed by the buffer"""
+        self.index = 0
+
+    def token(self):
+        i = self.index
+        if i >= len(self.buffer.types):
+            return None
+        self.index = i + 1
+        tok = self.buffer.lex_token(i)
+        self.lineno = tok.lineno
+        self.lexpos = self.buffer.ends[i]
+        return tok
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
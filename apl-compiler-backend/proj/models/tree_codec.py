@@ -0,0 +1,204 @@
+# Compact binary encoding of a syntax tree, for caching trees across
+# processes and shipping them to workers without pickling deep structures.
+#
+#   magic b"APLT", format version (varint)
+#   string table: count, then each string as its UTF-8 length and bytes
+#   the root value
+#
+# A value is a varint tag followed by its payload:
+#
+#   NONE_TAG                        -
+#   LIST_TAG                        count, then the items
+#   STRING_TAG                      index into the string table
+#   INT_TAG                         zigzag varint
+#   FLOAT_TAG                       8-byte little-endian double
+#   NODE_TAG + kind                 line, span, then the node's fields in order
+#
+# A node's line is a zigzag delta from the line of the node before it, and
+# its span a zigzag delta of lexpos from the node before it that had one
+# (doubled plus one; 0 for no span) followed by lexlen. Nodes come in
+# depth-first order, so both deltas are mostly small.
+import struct
+
+from .flat_tree import Cursor
+from .shared_tree import Occurrence
+from .syntax_tree import NODE_TYPES, Node, NodeBuilder
+
+MAGIC = b"APLT"
+# Bump whenever the layout above or NODE_TYPES' order changes
+FORMAT_VERSION = 1
+
+NONE_TAG = 0
+LIST_TAG = 1
+STRING_TAG = 2
+INT_TAG = 3
+FLOAT_TAG = 4
+NODE_TAG = 5
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+class _Encoder:
+    def __init__(self):
+        self.body = bytearray()
+        self.strings = {}
+        self.line = 0
+        self.lexpos = 0
+
+    def value(self, value):
+        out = self.body
+        if value is None:
+            out.append(NONE_TAG)
+        elif isinstance(value, (Node, Cursor, Occurrence)):
+            _write_varint(out, NODE_TAG + value.kind)
+            _write_varint(out, _zigzag(value.line - self.line))
+            self.line = value.line
+            lexpos = value.lexpos
+            if lexpos is None:
+                out.append(0)
+            else:
+                _write_varint(out, _zigzag(lexpos - self.lexpos) * 2 + 1)
+                _write_varint(out, value.lexlen)
+                self.lexpos = lexpos
+            for name in value.fields:
+                self.value(getattr(value, name))
+        elif isinstance(value, list):
+            out.append(LIST_TAG)
+            _write_varint(out, len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, str):
+            index = self.strings.get(value)
+            if index is None:
+                index = self.strings[value] = len(self.strings)
+            out.append(STRING_TAG)
+            _write_varint(out, index)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            out.append(INT_TAG)
+            _write_varint(out, _zigzag(value))
+        elif isinstance(value, float):
+            out.append(FLOAT_TAG)
+            out += _DOUBLE.pack(value)
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__} in a syntax tree")
+
+
+def encode(tree):
+    """Encode a tree of syntax_tree nodes, or a flat_tree cursor or shared_tree occurrence, as bytes"""
+    encoder = _Encoder()
+    encoder.value(tree)
+    out = bytearray(MAGIC)
+    _write_varint(out, FORMAT_VERSION)
+    _write_varint(out, len(encoder.strings))
+    # Dicts keep insertion order, which is index order
+    for string in encoder.strings:
+        data = string.encode("utf-8", "surrogatepass")
+        _write_varint(out, len(data))
+        out += data
+    out += encoder.body
+    return bytes(out)
+
+
+class _Decoder:
+    def __init__(self, data, builder):
+        self.data = data
+        self.position = 0
+        self.builder = builder
+        self.constructors = [getattr(builder, cls.__name__) for cls in NODE_TYPES]
+        self.strings = []
+        self.line = 0
+        self.lexpos = 0
+
+    def varint(self):
+        data = self.data
+        byte = data[self.position]
+        self.position += 1
+        # Tags, most deltas and most string indexes fit in one byte
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[self.position]
+            self.position += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value(self):
+        tag = self.varint()
+        if NODE_TAG <= tag < NODE_TAG + len(NODE_TYPES):
+            node_type = NODE_TYPES[tag - NODE_TAG]
+            self.line += _unzigzag(self.varint())
+            line = self.line
+            span = self.varint()
+            lexpos = lexlen = None
+            if span:
+                self.lexpos += _unzigzag(span >> 1)
+                lexpos = self.lexpos
+                lexlen = self.varint()
+            fields = [self.value() for _ in node_type.fields]
+            node = self.constructors[node_type.kind](*fields, line)
+            if lexpos is not None:
+                self.builder.span(node, lexpos, lexpos + lexlen)
+            return node
+        if tag == STRING_TAG:
+            return self.strings[self.varint()]
+        if tag == LIST_TAG:
+            return [self.value() for _ in range(self.varint())]
+        if tag == NONE_TAG:
+            return None
+        if tag == INT_TAG:
+            return _unzigzag(self.varint())
+        if tag == FLOAT_TAG:
+            (value,) = _DOUBLE.unpack_from(self.data, self.position)
+            self.position += _DOUBLE.size
+            return value
+        raise ValueError(f"Unknown tag {tag} at byte {self.position}")
+
+
+def decode(data, builder=None):
+    """Rebuild an encoded tree through `builder` (NodeBuilder by default, a FlatTreeBuilder or a SharedTreeBuilder)"""
+    if builder is None:
+        builder = NodeBuilder()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not an encoded syntax tree")
+    decoder = _Decoder(data, builder)
+    decoder.position = len(MAGIC)
+    try:
+        version = decoder.varint()
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Syntax tree format version {version}, this compiler reads {FORMAT_VERSION}"
+            )
+        for _ in range(decoder.varint()):
+            length = decoder.varint()
+            start = decoder.position
+            decoder.position += length
+            if decoder.position > len(data):
+                raise IndexError
+            decoder.strings.append(
+                bytes(data[start:decoder.position]).decode("utf-8", "surrogatepass")
+            )
+        tree = decoder.value()
+    except (IndexError, struct.error):
+        raise ValueError("Encoded syntax tree is truncated") from None
+    if decoder.position != len(data):
+        raise ValueError(f"{len(data) - decoder.position} bytes after the encoded syntax tree")
+    return builder.finish(tree)
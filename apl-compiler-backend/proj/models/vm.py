@@ -0,0 +1,498 @@
+# Runs bytecode compiled by bytecode.compile_program on a SemanticAnalyzer:
+# the analyzer holds the functions, flags, loops, results and errors, as it
+# does when it interprets, and the VM reports as its methods would. A call
+# runs in the same loop, on a stack of frames, instead of recursing, so
+# calls nest as deep as MAX_CALL_DEPTH however little Python stack is left.
+#
+# Variables are not in the analyzer's scope dicts while the VM runs but in
+# the slots of frames, one per run of a program or function body, laid out
+# by resolver. The scopes the interpreter would leave are written back when
+# the program ends, normally or by an exception.
+from . import bytecode
+from .bytecode import (
+    ADD, ADD_CONST, BREAK, CALL, CALL_SETUP, CHECK_FLAGS, COMPARE, COMPARE_JUMP_IF_FALSE, CONST,
+    CONTINUE, DECLARE, DECLARE_CHECK, DEFINE, DIV, DIV_CONST, DUP, END_CALL, EXIT_BLOCK, FOR_ITER,
+    FOR_NEXT, FOR_SETUP, HALT, INTERPRET, JUMP, JUMP_IF_FALSE_OR_POP, JUMP_IF_NONE,
+    JUMP_IF_TRUE_OR_POP, LINE, LOAD, LOOP_EXIT, MUL, NEG, NL_COMPARE, NL_FETCH, NL_IF_LOAD, NL_SET,
+    NL_UPDATE, NOT, POP, POP_JUMP_IF_FALSE, POS, PRINT, RETURN_VALUE, STORE, STORE_CHECK, STR, SUB,
+    TRUTHY, WHILE_ENTER, WHILE_NEXT,
+)
+from .resolver import UNSET
+from .semantics import HANDLERS, SemanticAnalyzer
+from proj.utilities import diagnostics
+
+log = diagnostics.get_logger(__name__)
+
+is_truthy = SemanticAnalyzer.is_truthy
+
+# Calls the VM nests before it stops the program with an error
+MAX_CALL_DEPTH = 1000
+
+
+class Deoptimized(Exception):
+    """The program does what only the interpreter's scope dicts can show"""
+
+
+def run(analyzer, tree):
+    """Compile `tree` and run it on `analyzer`, as analyzer.interpret(tree) would.
+
+    The few programs the VM cannot run (see execute), and those nested too
+    deep to compile, are interpreted instead, from the analyzer as it was.
+    The handler runs rather than interpret(), so that the interpreter is
+    as deep in the stack as under analyzer.interpret(tree).
+    """
+    if analyzer.scope_stack != [{}]:
+        # Variables from before, which only the scope dicts hold
+        return HANDLERS[tree.kind](analyzer, tree)
+    try:
+        program = bytecode.compile_program(tree)
+    except RecursionError as reason:
+        log.debug("Interpreting instead: %s", reason)
+        return HANDLERS[tree.kind](analyzer, tree)
+    saved = analyzer.save_state()
+    try:
+        return execute(program, analyzer)
+    except Deoptimized as reason:
+        log.debug("Interpreting instead: %s", reason)
+        analyzer.restore_state(saved)
+        return HANDLERS[tree.kind](analyzer, tree)
+
+
+def execute(program, a):
+    """Run Code `program` on SemanticAnalyzer `a`, its scope stack a single
+    empty scope, returning what interpret() would.
+
+    Calls nest up to MAX_CALL_DEPTH deep; a call deeper reports a semantic
+    error and raises RecursionError, where the interpreter would run out of
+    Python stack somewhat sooner. An exception leaves the scopes, loops and
+    calls it goes through, as the interpreter's finally blocks do.
+
+    A for loop over a variable without a value, which the interpreter
+    leaves with its scope still entered, and a node only the interpreter
+    can report raise Deoptimized, the analyzer left part way.
+    """
+    running = program
+    code, consts = program.code, program.consts
+    pc = 0
+    # Where the callers' scopes have each variable looked for beyond the frame
+    bound = {}
+    line = a.line_number
+    stack = []
+    push, pop = stack.append, stack.pop
+    frame = [UNSET] * program.size
+    # (Code, pc, frame, chain, bound) of each caller, chain what its
+    # call found variables in, as CALL has it
+    frames = []
+    try:
+        while True:
+            op = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+            # The busiest first, then the rest by runs of opcodes: see bytecode
+            if op == LOAD:
+                name, line, slot, slots = consts[arg]
+                value = frame[slot]
+                if value is UNSET:
+                    value = _get(a, frame, frames, bound, name, line, slots)
+                if value is None:
+                    a.semantic_errors.append(f"🧠💥Variable '{name}' does not have a value at line {line}")
+                push(value)
+            elif op == CONST:
+                push(consts[arg])
+            elif ADD <= op <= DIV_CONST:
+                if op <= DIV:
+                    right = pop()
+                    where = arg
+                else:
+                    # The CONST of the right operand, then the ADD or the like after it
+                    right = consts[arg]
+                    where = code[pc + 1]
+                    pc += 2
+                    op -= ADD_CONST - ADD
+                left = pop()
+                if (type(left) is int or type(left) is float) and (type(right) is int or type(right) is float):
+                    if op == ADD:
+                        push(left + right)
+                    elif op == SUB:
+                        push(left - right)
+                    elif op == MUL:
+                        push(left * right)
+                    elif right == 0:
+                        a.semantic_errors.append(f"🧠💥Division by zero at line {where}")
+                        push(None)
+                    else:
+                        push(left / right)
+                else:
+                    push(a.binary_operation("+-*/"[op - ADD], left, right, where))
+            elif op == LINE:
+                line = arg
+            elif op == STORE_CHECK or op == STORE:
+                name, var_line, slot, slots = consts[arg]
+                value = pop()
+                if frame[slot] is not UNSET:
+                    frame[slot] = value
+                else:
+                    _set(a, frame, frames, bound, name, value, var_line, slots)
+                if op == STORE_CHECK:
+                    if a.should_return or a.should_break or a.should_continue:
+                        pc = code[pc + 1]
+                    else:
+                        pc += 2
+            elif op == COMPARE_JUMP_IF_FALSE or op == COMPARE:
+                operation, symbol, compare_line = consts[arg]
+                right = pop()
+                left = pop()
+                if left is None or right is None:
+                    a.semantic_errors.append(
+                        f"🧠💥Invalid operands for comparison '{symbol}' at line {compare_line}"
+                    )
+                    value = None
+                else:
+                    value = operation(left, right)
+                if op == COMPARE:
+                    push(value)
+                elif value is True or (value is not False and is_truthy(value)):
+                    pc += 2
+                else:
+                    pc = code[pc + 1]
+            elif op == WHILE_NEXT:
+                if a.should_break:
+                    a.should_break = False
+                elif a.should_continue:
+                    a.should_continue = False
+                    pc = arg
+                elif not a.should_return:
+                    pc = arg
+            elif op == FOR_NEXT or op == FOR_ITER:
+                loop = stack[-1]
+                if op == FOR_NEXT:
+                    if a.should_break:
+                        a.should_break = False
+                        continue
+                    if a.should_continue:
+                        a.should_continue = False
+                    elif a.should_return:
+                        continue
+                    loop[0] += loop[2]
+                current, end_val, step_val = loop[0], loop[1], loop[2]
+                if (step_val > 0 and current <= end_val) or (step_val < 0 and current >= end_val):
+                    slot = loop[5]
+                    if frame[slot] is not UNSET:
+                        frame[slot] = current
+                    else:
+                        _set(a, frame, frames, bound, loop[3], current, loop[4], loop[6])
+                    if op == FOR_NEXT:
+                        pc = arg
+                elif op == FOR_ITER:
+                    pc = arg
+            elif op < POP:
+                if op == CHECK_FLAGS:
+                    if a.should_return or a.should_break or a.should_continue:
+                        pc = arg
+                elif op == POP_JUMP_IF_FALSE:
+                    value = pop()
+                    if value is not True and (value is False or not is_truthy(value)):
+                        pc = arg
+                elif op == JUMP:
+                    pc = arg
+                elif op == EXIT_BLOCK:
+                    start, stop, unset = consts[arg]
+                    frame[start:stop] = unset
+            elif op < CALL_SETUP:
+                if op == POP:
+                    pop()
+                elif op == DUP:
+                    push(stack[-1])
+                elif op == TRUTHY:
+                    stack[-1] = is_truthy(stack[-1])
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if stack[-1]:
+                        pop()
+                    else:
+                        pc = arg
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if stack[-1]:
+                        pc = arg
+                    else:
+                        pop()
+                elif op == NOT:
+                    stack[-1] = not is_truthy(stack[-1])
+                elif op == POS:
+                    stack[-1] = +stack[-1]
+                elif op == NEG:
+                    stack[-1] = -stack[-1]
+                elif op == DECLARE_CHECK or op == DECLARE:
+                    name, var_line, slot = consts[arg]
+                    value = pop()
+                    if a.loop_stack or frame[slot] is UNSET:
+                        # In a loop, updated if declared in this scope and
+                        # declared in it otherwise: set either way
+                        frame[slot] = value
+                    else:
+                        _redeclared(a, name, var_line)
+                    if op == DECLARE_CHECK:
+                        if a.should_return or a.should_break or a.should_continue:
+                            pc = code[pc + 1]
+                        else:
+                            pc += 2
+                elif op == STR:
+                    stack[-1] = str(stack[-1])
+                elif op == PRINT:
+                    output = ' '.join(stack[len(stack) - arg:])
+                    del stack[len(stack) - arg:]
+                    log.debug("%s", output)
+                    a.compile_results.append(output)
+            elif op < NL_FETCH:
+                if op == CALL_SETUP:
+                    name, _, call_line = consts[arg]
+                    functions = a.functions
+                    if name not in functions:
+                        a.semantic_errors.append(f"🧠💥Function '{name}' is not defined at line {call_line}")
+                    # A KeyError if undefined, as in interpret_call
+                    push(functions[name])
+                elif op == CALL:
+                    name, count, call_line, chain = consts[arg]
+                    arg_values = stack[len(stack) - count:]
+                    del stack[len(stack) - count:]
+                    func_def = pop()
+                    params = func_def['params']
+                    if count != len(params):
+                        a.semantic_errors.append(
+                            f"🧠💥Function '{name}' expects {len(params)} arguments, got {count} at line {call_line}"
+                        )
+                    if len(frames) >= MAX_CALL_DEPTH:
+                        message = (
+                            f"🧠💥Maximum call depth of {MAX_CALL_DEPTH} exceeded calling '{name}' at line {call_line}"
+                        )
+                        a.semantic_errors.append(message)
+                        raise RecursionError(message)
+                    a.call_stack.append(name)
+                    function = func_def.get('code')
+                    if function is None:
+                        # Defined before the program ran
+                        function = func_def['code'] = bytecode.compile_function(name, params, func_def['body'])
+                    # The call's scope, its parameters declared in it
+                    variables = [UNSET] * function.size
+                    layout = function.layout
+                    for param, arg_val in zip(params, arg_values):
+                        slot = layout[param]
+                        if variables[slot] is UNSET:
+                            variables[slot] = arg_val
+                        else:
+                            _redeclared(a, param, call_line)
+                    frames.append((running, pc, frame, chain, bound))
+                    running, frame, bound = function, variables, {}
+                    code, consts, pc = running.code, running.consts, 0
+                elif op == END_CALL:
+                    result = a.return_value
+                    a.return_value = None
+                    a.should_return = False
+                    a.call_stack.pop()
+                    running, pc, frame, _, bound = frames.pop()
+                    code, consts = running.code, running.consts
+                    push(result)
+                elif op == RETURN_VALUE:
+                    a.return_value = pop()
+                    a.should_return = True
+                elif op == FOR_SETUP:
+                    name, for_line, declared, slot, slots = consts[arg]
+                    step_val = pop()
+                    end_val = pop()
+                    start_val = pop()
+                    a.loop_stack.append('for')
+                    if declared:
+                        # In the loop's scope, new and empty
+                        frame[slot] = start_val
+                    else:
+                        value = frame[slot]
+                        if value is UNSET:
+                            value = _get(a, frame, frames, bound, name, for_line, slots)
+                        if value is None:
+                            # interpret_for returns with the loop and its scope
+                            # entered, and the scopes after are not the blocks'
+                            raise Deoptimized(f"for loop over '{name}', without a value, at line {for_line}")
+                    push([start_val, end_val, step_val, name, for_line, slot, slots])
+                elif op == WHILE_ENTER:
+                    a.loop_stack.append('while')
+                elif op == LOOP_EXIT:
+                    a.loop_stack.pop()
+                elif op == BREAK:
+                    if not a.loop_stack:
+                        a.semantic_errors.append(f"🧠💥Break statement outside of loop at line {arg}")
+                    a.should_break = True
+                elif op == CONTINUE:
+                    if not a.loop_stack:
+                        a.semantic_errors.append(f"🧠💥Continue statement outside of loop at line {arg}")
+                    a.should_continue = True
+            elif op == NL_FETCH:
+                name, nl_line, message, slot, slots = consts[arg]
+                value = frame[slot]
+                if value is UNSET:
+                    value = _get(a, frame, frames, bound, name, nl_line, slots)
+                if value is not None and not isinstance(value, (int, float)):
+                    a.semantic_errors.append(message)
+                    value = None
+                push(value)
+            elif op == JUMP_IF_NONE:
+                if stack[-1] is None:
+                    pc = arg
+            elif op == NL_UPDATE:
+                name, nl_line, verb, operation, slot, slots = consts[arg]
+                operand = pop()
+                current = pop()
+                if operand is None:
+                    push(None)
+                elif not isinstance(operand, (int, float)):
+                    a.semantic_errors.append(f"🧠💥Cannot {verb} non-numeric value '{operand}' at line {nl_line}")
+                    push(None)
+                elif verb == "divide" and operand == 0:
+                    a.semantic_errors.append(f"🧠💥Division by zero in natural language operation at line {nl_line}")
+                    push(None)
+                else:
+                    value = operation(current, operand)
+                    if frame[slot] is not UNSET:
+                        frame[slot] = value
+                    else:
+                        _set(a, frame, frames, bound, name, value, nl_line, slots)
+                    push(value)
+            elif op == NL_SET:
+                name, nl_line, slot = consts[arg]
+                value = pop()
+                if frame[slot] is UNSET:
+                    frame[slot] = value
+                else:
+                    _redeclared(a, name, nl_line)
+            elif op == NL_IF_LOAD:
+                name, nl_line, slot, slots = consts[arg]
+                value = frame[slot]
+                if value is UNSET:
+                    value = _get(a, frame, frames, bound, name, nl_line, slots)
+                push(value)
+            elif op == NL_COMPARE:
+                right = pop()
+                left = pop()
+                push(left is not None and right is not None and consts[arg](left, right))
+            elif op == DEFINE:
+                name, params, body, function = consts[arg]
+                # The body too, for calls the interpreter makes from a handed-over node
+                a.functions[name] = {'params': params, 'body': body, 'code': function}
+            elif op == INTERPRET:
+                node = consts[arg]
+                raise Deoptimized(f"{type(node).__name__} {node.tag}, for its handler")
+            elif op == HALT:
+                a.scope_stack[:] = [_variables(running.layout, frame)]
+                return pop()
+            else:
+                raise ValueError(f"Unknown opcode {op} at {pc - 2}")
+    except Deoptimized:
+        raise
+    except BaseException:
+        _unwind(a, running, pc - 2, frame, frames)
+        raise
+    finally:
+        a.line_number = line
+
+
+def _lookup(frame, frames, bound, name, slots):
+    """The frame and slot of `name` the scope walk finds after the first
+    slot tried: the other `slots` of the frame, then the callers' in the
+    blocks their calls were made in; None and 0 if it finds none"""
+    for slot in slots:
+        if frame[slot] is not UNSET:
+            return frame, slot
+    found = bound.get(name)
+    if found is None:
+        found = _outer(frames, bound, name)
+    return found
+
+
+def _outer(frames, bound, name):
+    """Find `name` in the callers' scopes, and bind it for the call `bound`
+    is of and each call between it and the caller it is found in.
+
+    The callers do not run until the call returns, so which of their slots
+    are set stays as it is: a call walks them for a name once at most, and
+    the walk from a call made in it stops at the first call that has.
+    """
+    unbound = [bound]
+    found = None, 0
+    for level in range(len(frames) - 1, -1, -1):
+        _, _, caller, chain, caller_bound = frames[level]
+        for layout in chain:
+            slot = layout.get(name)
+            if slot is not None and caller[slot] is not UNSET:
+                found = caller, slot
+                break
+        else:
+            known = caller_bound.get(name)
+            if known is None:
+                unbound.append(caller_bound)
+                continue
+            found = known
+        break
+    for calls in unbound:
+        calls[name] = found
+    return found
+
+
+def _get(a, frame, frames, bound, name, line, slots):
+    """The variable's value, as get_variable gives it"""
+    found, slot = _lookup(frame, frames, bound, name, slots)
+    if found is not None:
+        return found[slot]
+    a.semantic_errors.append(f"🧠💥Variable '{name}' is not defined at line {line}")
+    log.info("Variable '%s' is not defined at line %s", name, line)
+    a.should_break = True
+    return None
+
+
+def _set(a, frame, frames, bound, name, value, line, slots):
+    """Assign the variable, as update_variable does"""
+    found, slot = _lookup(frame, frames, bound, name, slots)
+    if found is not None:
+        found[slot] = value
+    else:
+        a.semantic_errors.append(f"🧠💥 Variable '{name}' is not defined at line {line}")
+        a.should_break = True
+
+
+def _redeclared(a, name, line):
+    """Report a variable declared again in its scope, as set_variable does"""
+    a.semantic_errors.append(f"🧠💥Variable '{name}' already declared in current scope at line {line}")
+    a.should_break = True
+
+
+def _variables(layout, frame):
+    """The scope dict of a block's slots"""
+    return {name: frame[slot] for name, slot in layout.items() if frame[slot] is not UNSET}
+
+
+def _unwind(a, running, offset, frame, frames):
+    """Leave the scopes, loops and calls an exception at `offset` of `running`
+    goes through, as the interpreter's finally blocks do, and give the
+    analyzer the scope dicts they leave"""
+    levels = [(caller_code, pc - 2, caller) for caller_code, pc, caller, _, _ in frames]
+    levels.append((running, offset, frame))
+    # The interpreter's scopes at the exception, and what entered each
+    # after the global scope: a call, or a region around the offset
+    scopes, entered = [], []
+    for depth, (current, at, variables) in enumerate(levels):
+        scopes.append(_variables(current.layout, variables))
+        if depth:
+            entered.append("call")
+        for start, end, kind, layout in current.regions:
+            if start <= at < end:
+                scopes.append(_variables(layout, variables) if layout else {})
+                entered.append(kind)
+    # Innermost first, each leaves whatever scope is on top, as exit_scope
+    # does; a call's scope is not left if its arguments raised
+    for kind in reversed(entered):
+        if kind == "args":
+            continue
+        if kind == "loop":
+            a.loop_stack.pop()
+        elif kind == "call":
+            a.call_stack.pop()
+        if len(scopes) > 1:
+            scopes.pop()
+    a.scope_stack[:] = scopes
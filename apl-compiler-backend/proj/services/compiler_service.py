@@ -1,17 +1,173 @@
 from proj.models.semantics import SemanticAnalyzer
-from proj.models.parser import Parser
+from proj.models import closure_compiler, vm
+from proj.models.parser import parser_pool
+from proj.models.descent_parser import DescentParser
+from proj.models.table_parser import TableParser
+from proj.models.parse_cache import ParseResult, document_cache, parse_cache
+from proj.models.reparser import relex, reparse
 from proj.models.finallexer import Lexer
+from proj.models.regexlexer import RegexLexer
+from proj.models.parallel_lexer import ParallelLexer, parallel_lexer
+from proj.models.line_index import LineIndex
+from proj.models.token_buffer import TokenBuffer
+from proj.models.syntax_tree import NodeBuilder, to_json
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.shared_tree import SharedTreeBuilder
 from proj.utilities.gemini_handler import Gemini_Handler
+from proj import config
+from proj.utilities import diagnostics
 import asyncio
 from flask import jsonify
 
+log = diagnostics.get_logger(__name__)
 
-def compile_code(code: str) -> str:
+LEXER_ENGINES = {"ply": Lexer, "regex": RegexLexer, "parallel": ParallelLexer}
+
+TREE_BUILDERS = {"nodes": NodeBuilder, "flat": FlatTreeBuilder, "shared": SharedTreeBuilder}
+
+PARSER_ENGINES = ("lr", "table", "descent")
+
+INTERPRETERS = {"tree": SemanticAnalyzer.interpret, "closures": closure_compiler.run, "bytecode": vm.run}
+
+TOKEN_FORMATS = ("structured", "legacy")
+
+
+def lexer_engine():
+    """Return the Lexer class selected by APL_LEXER_ENGINE"""
+    try:
+        return LEXER_ENGINES[config.LEXER_ENGINE]
+    except KeyError:
+        raise ValueError(
+            f"Unknown APL_LEXER_ENGINE '{config.LEXER_ENGINE}', expected one of {sorted(LEXER_ENGINES)}"
+        ) from None
+
+
+def tree_builder():
+    """Return a new builder for the tree layout selected by APL_SYNTAX_TREE"""
+    try:
+        return TREE_BUILDERS[config.SYNTAX_TREE]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown APL_SYNTAX_TREE '{config.SYNTAX_TREE}', expected one of {sorted(TREE_BUILDERS)}"
+        ) from None
+
+
+def parser_engine():
+    """Return the parser engine selected by APL_PARSER_ENGINE"""
+    if config.PARSER_ENGINE not in PARSER_ENGINES:
+        raise ValueError(
+            f"Unknown APL_PARSER_ENGINE '{config.PARSER_ENGINE}', expected one of {sorted(PARSER_ENGINES)}"
+        )
+    return config.PARSER_ENGINE
+
+
+def interpreter():
+    """Return how APL_INTERPRETER runs a tree: a function of a SemanticAnalyzer and the tree"""
+    try:
+        return INTERPRETERS[config.INTERPRETER]
+    except KeyError:
+        raise ValueError(
+            f"Unknown APL_INTERPRETER '{config.INTERPRETER}', expected one of {sorted(INTERPRETERS)}"
+        ) from None
+
+
+def warm_up():
+    """Build the lexer and parser tables once so requests only pay for clones and checkouts"""
+    lexer_engine().prebuilt()
+    parser_pool.warm()
+
+
+def tokenize(code):
+    """Lex `code` into a TokenBuffer with the engine APL_LEXER_ENGINE selects"""
+    engine = lexer_engine()
+    if engine is ParallelLexer:
+        return parallel_lexer.lex(code)
+    return TokenBuffer.from_lexer(engine.prebuilt().lexer, code)
+
+
+def token_fields(buffer, line_index, token_format):
+    """Response fields holding the token report in the requested format"""
+    if token_format == "legacy":
+        return {"tokens": buffer.legacy_report(line_index)}
+    tokens, source_lines = buffer.report(line_index)
+    return {"tokens": tokens, "sourceLines": source_lines}
+
+
+def parse_source(code, line_index, descent=None, buffer=None):
+    """Lex and parse `code` into a ParseResult.
+
+    `descent` picks the descent parser, which also records where the
+    top-level statements start, over the LR parser; APL_PARSER_ENGINE
+    decides between the three if it is None. `buffer` holds the tokens of
+    `code` when the caller has lexed it already.
+    """
+    # Lex once; the report and the parser read the same tokens
+    tokenBuffer = buffer if buffer is not None else tokenize(code)
+    if descent is None:
+        engine = parser_engine()
+    else:
+        engine = "descent" if descent else "lr"
+    if engine == "table":
+        parser = TableParser(tokenBuffer, tree_builder(), line_index)
+        tree = parser.parse()
+        return ParseResult(tokenBuffer, tree, parser.errors)
+    if engine == "descent":
+        parser = DescentParser(tokenBuffer, tree_builder())
+        tree = parser.parse()
+        if tree is not None:
+            return ParseResult(tokenBuffer, tree, [], parser.boundaries)
+        # A syntax error: the LR parser reports it, as it would have anyway
+    lex = tokenBuffer.feeder()
+    builder = tree_builder()
+    with parser_pool.checkout(lex, line_index, builder) as parserInstance:
+        try:
+            parseResult = builder.finish(
+                parserInstance.parser.parse(code, lexer=lex, debug=False)
+            )
+        except Exception as e:
+            # Check if parserInstance has an error message
+            if parserInstance.parseErrorMessage:
+                return ParseResult(tokenBuffer, None, parserInstance.parseErrorMessage)
+            return ParseResult(tokenBuffer, None, [f"Syntax Error present: {str(e)}"])
+        # After syntax errors the tree holds the statements parsed around
+        # them, or is None if recovery ran into the end of the source
+        return ParseResult(tokenBuffer, parseResult, parserInstance.parseErrorMessage)
+
+
+def parse_document(document, code, line_index):
+    """Parse the latest version of `document`, reusing what it can of the last one.
+
+    The tokens are lexed again only around the edit. Only the descent
+    engine records where the top-level statements start, so only under it
+    are just the statements the edit reaches parsed again; the other
+    engines parse each version whole.
+    """
+    previous = document_cache.get(document)
+    parsed = buffer = None
+    if previous is not None and previous.buffer.source != code:
+        # Only the tokens around the edit are lexed again, whether or not
+        # the statements can be reparsed
+        lexer = lexer_engine().prebuilt().lexer
+        relexed = relex(previous.buffer, code, lexer)
+        buffer = relexed[0]
+        parsed = reparse(previous, code, lexer, relexed)
+    elif previous is not None:
+        parsed = previous
+    if parsed is None:
+        parsed = parse_source(code, line_index, buffer=buffer)
+    document_cache.put(document, parsed)
+    return parsed
+
+
+def compile_code(code: str, token_format: str = config.TOKEN_FORMAT, document: str = None) -> str:
     """
     Compiles the given code by parsing it and performing semantic analysis.
     
     Args:
         code (str): The code to compile.
+        token_format (str): "structured" or "legacy" token report.
+        document (str): Id of the document `code` is a version of, if the
+            client edits one; its previous version's parse is reused.
     
     Returns:
         str: The result of the compilation, which could be an error message or a success message.
@@ -22,42 +178,41 @@ def compile_code(code: str) -> str:
 
         ai_explanation = gemini.generate_explanation(code)
 
-        lexInstance = Lexer()
-        lexOutput = lexInstance.analyze_tokens(code)
-      
-        # PARSE CODE
-        lex= Lexer().lexer
-        try:
-            parserInstance = Parser(lex)
-            parseResult = parserInstance.parser.parse(code, lexer=lex, debug=False)
-        except Exception as e:
-        # Check if parserInstance has an error message
-            if parserInstance.parseErrorMessage:
-                message = parserInstance.parseErrorMessage
-            else:
-                # Fallback error using internal line number if available
-                line = 1
-                message = [f"Syntax Error present: {str(e)}"]
-            
-            return jsonify({
-                "tokens": lexOutput,
-                "parseTree": None,
-                "explanation": ai_explanation,
-                "output": message
-            }), 200
-            
-        if parserInstance.parseErrorMessage:
+        # Line start offsets shared by the token report and parser errors
+        line_index = LineIndex(code)
+
+        if document is not None:
+            parsed = parse_document(document, code, line_index)
+        else:
+            # A source seen before is neither lexed nor parsed again
+            cache_key = parse_cache.key(code, config.SYNTAX_TREE)
+            parsed = parse_cache.get(cache_key)
+            if parsed is None:
+                parsed = parse_source(code, line_index)
+                parse_cache.put(cache_key, parsed)
+
+        lexOutput = token_fields(parsed.buffer, line_index, token_format)
+        if log.isEnabledFor(diagnostics.DEBUG):
+            for line in parsed.buffer.legacy_report(line_index):
+                log.debug("%s", line)
+
+        if parsed.errors:
             return jsonify({
-                "tokens": lexOutput,
-                "parseTree": None,
+                **lexOutput,
+                "parseTree": to_json(parsed.tree) if parsed.tree is not None else None,
                 "explanation": ai_explanation,
-                "output": parserInstance.parseErrorMessage
+                "output": parsed.errors
             }), 200
+        parseResult = parsed.tree
+
+        # The tree as the nested lists clients read
+        parseTree = to_json(parseResult)
 
         # Perform semantic analysis
+        interpret = interpreter()
         try:
             semantic_analyzer = SemanticAnalyzer()
-            semantic_analyzer.interpret(parseResult)
+            interpret(semantic_analyzer, parseResult)
         except Exception as e:
         # Check if semantic analyzer has error message
             if  semantic_analyzer.semantic_errors:
@@ -67,23 +222,23 @@ def compile_code(code: str) -> str:
                 message = [ f"Semantic Error at line {line}: {str(e)}" ]
 
             return jsonify({
-                "tokens": lexOutput,
-                "parseTree": parseResult,
+                **lexOutput,
+                "parseTree": parseTree,
                 "explanation": ai_explanation,
                 "output": message
             }), 200
 
         if semantic_analyzer.semantic_errors:
             return jsonify({
-                "tokens": lexOutput,
-                "parseTree": parseResult,
+                **lexOutput,
+                "parseTree": parseTree,
                 "explanation": ai_explanation,
                 "output": semantic_analyzer.semantic_errors
             }), 200
             
         return jsonify({
-        "tokens": lexOutput, 
-        "parseTree": parseResult,
+        **lexOutput, 
+        "parseTree": parseTree,
         "explanation": ai_explanation,
         "output": semantic_analyzer.compile_results
         }), 200
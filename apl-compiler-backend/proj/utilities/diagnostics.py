@@ -0,0 +1,80 @@
+"""Leveled diagnostics for the compiler pipeline, built on the logging module.
+
+Every stage logs through get_logger() instead of printing. Messages below
+the active level are dropped before they are formatted: the check is one
+context variable lookup, so disabled diagnostics cost almost nothing on hot
+paths. The level comes from APL_LOG_LEVEL and can be changed for a single
+request with request_level().
+"""
+import contextvars
+import logging
+import sys
+from contextlib import contextmanager
+
+from proj import config
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+ROOT_LOGGER = "apl"
+
+
+def parse_level(name):
+    """Return the level called `name` (e.g. "debug"), raising ValueError if unknown"""
+    try:
+        return LEVELS[str(name).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown log level '{name}', expected one of {list(LEVELS)}") from None
+
+
+# Active level for the current request, or the process default outside one
+_level = contextvars.ContextVar("apl_log_level", default=parse_level(config.LOG_LEVEL))
+
+# The stdlib loggers pass everything; the context variable decides
+logging.getLogger(ROOT_LOGGER).setLevel(DEBUG)
+
+
+class _LevelGate(logging.LoggerAdapter):
+    """Logger adapter that also checks the level of the current request"""
+
+    def isEnabledFor(self, level):
+        return level >= _level.get() and self.logger.isEnabledFor(level)
+
+    # The per-token and per-statement messages: drop them before entering logging
+    def debug(self, msg, *args, **kwargs):
+        if DEBUG >= _level.get():
+            self.log(DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        if INFO >= _level.get():
+            self.log(INFO, msg, *args, **kwargs)
+
+
+def get_logger(name):
+    """Logger named after a module, e.g. "apl.models.parser" for proj.models.parser"""
+    name = name.removeprefix("proj.")
+    return _LevelGate(logging.getLogger(f"{ROOT_LOGGER}.{name}"), {})
+
+
+@contextmanager
+def request_level(level):
+    """Use `level` for diagnostics logged inside the block, e.g. for one request"""
+    token = _level.set(level)
+    try:
+        yield
+    finally:
+        _level.reset(token)
+
+
+def configure(stream=None):
+    """Send diagnostics to `stream` (stdout by default), once per process"""
+    logger = logging.getLogger(ROOT_LOGGER)
+    if not logger.handlers:
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
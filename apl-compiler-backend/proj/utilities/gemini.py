@@ -1,8 +1,11 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from gemini_handler import generate_explanation # Import the function from gemini_handler.py
+import logging
 import os
 
+log = logging.getLogger("apl.gemini")
+
 app = Flask(__name__)
 # Enable CORS for all origins, allowing your frontend to make requests
 CORS(app)
@@ -29,23 +32,24 @@ def explain_code():
     if not user_input:
         return jsonify({"error": "No input provided"}), 400
 
-    print(f"\n--- Received User Input for Explanation ---")
-    print(user_input)
-    print("-------------------------------------------\n")
+    log.info("\n--- Received User Input for Explanation ---")
+    log.info("%s", user_input)
+    log.info("-------------------------------------------\n")
 
     # Call the Gemini handler to get the AI explanation
     ai_explanation = generate_explanation(user_input)
 
     # Print the AI explanation to the terminal (as requested by the user)
-    print("\n--- AI Explanation (Printed to Terminal) ---")
-    print(ai_explanation)
-    print("--------------------------------------------\n")
+    log.info("\n--- AI Explanation (Printed to Terminal) ---")
+    log.info("%s", ai_explanation)
+    log.info("--------------------------------------------\n")
 
     # You might also want to send this explanation back to the frontend
     # if you want to display it in the UI, but for now, we're focusing on terminal output.
     return jsonify({"message": "Explanation processed and printed to terminal.", "explanation": ai_explanation})
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # Run the Flask app
     # Set host to '0.0.0.0' to make it accessible from other devices on the network
     # Set debug to True for development, but False for production
@@ -5,6 +5,21 @@ from dotenv import load_dotenv
 import aiofiles  # async file operations
 from pathlib import Path
 import json
+import logging
+
+# gemini.py runs this module as a script of its own, outside the proj
+# package, so it logs through the logging module alone; APL_LOG_LEVEL sets
+# its level as it does the package's diagnostics
+log = logging.getLogger("apl.utilities.gemini_handler")
+log.setLevel(getattr(logging, os.getenv("APL_LOG_LEVEL", "warning").strip().upper(), logging.WARNING))
+
+
+def _masked(secret):
+    """A secret reduced to its last four characters, safe to log"""
+    if not secret:
+        return repr(secret)
+    # Short secrets would be given away by their last characters
+    return "*" * 8 + (secret[-4:] if len(secret) > 8 else "")
 
 
 class Gemini_Handler:
@@ -17,14 +32,14 @@ class Gemini_Handler:
         # The API key is loaded from the environment variable GEMINI_API_KEY
         try:
             self.API_KEY = os.getenv("GEMINI_API_KEY")
-            print(f"Using Gemini API Key: {self.API_KEY}")  # Debugging line to check if API key is loaded
+            log.debug("Using Gemini API Key: %s", _masked(self.API_KEY))  # Debugging line to check if API key is loaded
             if not self.API_KEY:
                 raise ValueError("GEMINI_API_KEY not found in environment variables.")
             # genai.configure(api_key=API_KEY)
             self.client = genai.Client(api_key=self.API_KEY)
         except ValueError as e:
-            print(f"Error configuring Gemini API: {e}")
-            print("Please ensure you have a .env file in your backend directory with GEMINI_API_KEY=YOUR_API_KEY_HERE")
+            log.warning("Error configuring Gemini API: %s", e)
+            log.warning("Please ensure you have a .env file in your backend directory with GEMINI_API_KEY=YOUR_API_KEY_HERE")
             # Exit or handle the error appropriately if the API key is critical for the application to run.
             # For this example, we'll allow it to continue but the generate_explanation function will fail.
 
@@ -102,7 +117,7 @@ class Gemini_Handler:
                     # thinking_config=types.ThinkingConfig(thinking_budget=-0)
                 ),
             )
-            print(f"AI Explanation Response: {response.text.strip()}")  # Debugging line to check response
+            log.debug("AI Explanation Response: %s", response.text.strip())  # Debugging line to check response
 
             return  "\n" + response.text.strip() + "\n" 
         except Exception as e:
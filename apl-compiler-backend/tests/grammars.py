@@ -0,0 +1,95 @@
+"""The grammar as it was before later changes, for tests and benchmarks to compare against"""
+import ply.yacc as yacc
+
+from proj.models.parser import Parser
+
+
+def defined_at(method):
+    """Give a replacement grammar action the source line of `method`.
+
+    PLY orders rules by the line their function starts on, and the first
+    rule and reduce/reduce conflict resolution depend on that order.
+    """
+    def pin(func):
+        func.__code__ = func.__code__.replace(co_firstlineno=method.__code__.co_firstlineno)
+        return func
+    return pin
+
+
+class ReferenceParser(Parser):
+    """A variant of the grammar with LR tables of its own, built quietly in memory"""
+
+    _template = None
+
+    @classmethod
+    def build_tables(cls):
+        if cls.__dict__.get("_template") is None:
+            owner = object.__new__(cls)
+            owner.reset()
+            cls._template = yacc.yacc(
+                module=owner, debug=False, write_tables=False, errorlog=yacc.NullLogger()
+            )
+        return cls._template
+
+
+class RightRecursiveParser(ReferenceParser):
+    """The grammar as it was before its lists became left recursive"""
+
+    _template = None
+    p_argument_list = None
+
+    @defined_at(Parser.p_statement_list)
+    def p_statement_list(self, p):
+        '''statement_list : statement statement_list
+                        | control_statement statement_list
+                        | empty'''
+        if len(p) == 3:
+            p[0] = p[2] if p[1] is None else [p[1]] + p[2]
+        else:
+            p[0] = []
+
+    @defined_at(Parser.p_parameter_list)
+    def p_parameter_list(self, p):
+        '''parameter_list : expression COMMA parameter_list
+                        | expression
+                        | empty'''
+        if len(p) == 4:
+            p[0] = [p[1]] + p[3]
+        elif p[1] is None:
+            p[0] = []
+        else:
+            p[0] = [p[1]]
+
+    @defined_at(Parser.p_print_arguments_multiple)
+    def p_print_arguments_multiple(self, p):
+        '''print_arguments : printable_item COMMA print_arguments'''
+        p[0] = [p[1]] + p[3]
+
+    @defined_at(Parser.p_parameter_declaration_list)
+    def p_parameter_declaration_list(self, p):
+        '''parameter_declaration_list : IDENTIFIER COMMA parameter_declaration_list
+                                    | IDENTIFIER'''
+        self.is_variable_keyword(p[1], p.lineno(1))
+        if len(p) == 4:
+            p[0] = [p[1]] + p[3]
+        else:
+            p[0] = [p[1]]
+
+
+class UnrecoveringParser(ReferenceParser):
+    """The grammar as it was before its error productions"""
+
+    _template = None
+    p_statement_error = None
+
+    @defined_at(Parser.p_program)
+    def p_program(self, p):
+        '''program : KEYWORD_BEGIN statement_list KEYWORD_END
+                | statement_list'''
+        p[0] = self.builder.Program(p[2] if len(p) == 4 else p[1], p.lineno(1))
+
+    @defined_at(Parser.p_block)
+    def p_block(self, p):
+        '''block : KEYWORD_BEGIN statement_list KEYWORD_END
+                | statement'''
+        p[0] = p[2] if len(p) == 4 else [p[1]]
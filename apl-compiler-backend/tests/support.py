@@ -0,0 +1,541 @@
+"""Programs and helpers shared by the tests and by benchmark.py.
+
+The generators are seeded, so a failing test names a program that can be
+rebuilt and run on its own.
+"""
+import os
+import random
+import re
+
+from proj.models.descent_parser import DescentParser
+from proj.models.finallexer import Lexer
+from proj.models.line_index import LineIndex
+from proj.models.parse_cache import ParseResult
+from proj.models.parser import Parser, parser_pool
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.syntax_tree import Node, NodeBuilder
+from proj.models.token_buffer import TokenBuffer
+
+SAMPLE_PROGRAM = """begin
+    let total = 2 + 5;
+    if total > 15
+    begin
+        print("Total is greater than 15:", total);
+    end
+
+    for let i = 1; to 5
+    begin
+        print("Loop index:", i);
+    end
+
+    while total > 0
+    begin
+        total = total - 1;
+    end
+    /* Multiline comment
+       spanning lines */
+    set f to 100;
+    let a = 10;
+    let b = 20;
+    function mad(a, b)
+    begin
+        let u = 500000;
+        let d = a + b + u;
+        return d;
+    end
+    let result = mad(a, f);
+    print("After adding", a, "and", b, "The result is:", result);
+
+    function r(a)
+    begin
+        if a > 10
+        begin
+            return "Limit reached";
+        end
+        else
+        begin
+            return r(a + 1);
+        end
+    end
+    let q = r(1);
+    print("Result of recursive function:", q);
+end
+"""
+
+
+# Lexeme fragments for generated lexer corpora, including the awkward cases:
+# keyword prefixes, signed numbers, escapes, unterminated strings and comments
+# and characters no rule accepts.
+CORPUS_FRAGMENTS = [
+    "let", "x", "total_2", "_tmp", "iffy", "endless", "set", "to", "by", "then",
+    "begin", "end", "if", "elseif", "else", "for", "while", "print", "function",
+    "return", "break", "continue", "true", "false", "and", "or", "not", "step",
+    "0", "42", "-7", "3.14", "-0.5", "1.", ".5", "x-1", "a--2",
+    "+", "-", "*", "/", "=", "==", "!=", "<", "<=", ">", ">=", "(", ")", "{", "}",
+    ",", ";", '"hi"', '"a\\"b"', '"tab\\tnew\\nline"', '"multi\nline"', '"open',
+    "// note", "// \"quoted", "/* block */", "/* multi\n line */", "/* open",
+    "@", "#", "$", ".", "'", "\\",
+    " ", "  ", "\t", "\n", "\n\n", "\r\n",
+]
+
+
+def generate_corpus(seed, fragments=2000):
+    """Build a pseudo-random source text from CORPUS_FRAGMENTS"""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(fragments):
+        parts.append(rng.choice(CORPUS_FRAGMENTS))
+        parts.append(rng.choice(("", " ", " ", "\n")))
+    return "".join(parts)
+
+
+# Identifiers for generated programs; "f" and "g" double as function names
+PROGRAM_NAMES = ["a", "b", "x", "total", "n_1", "f", "g"]
+COMPARISONS = ["<", ">", "<=", ">=", "==", "!="]
+
+
+def generate_program(seed, statements=200, mutations=0):
+    """Build a pseudo-random program using every statement and expression form of the grammar.
+
+    Tokens are separated by spaces or newlines. `mutations` times a random
+    token is then dropped, doubled or swapped with the next one, which
+    mostly leaves syntax errors for the parser to report.
+    """
+    rng = random.Random(seed)
+    tokens = []
+    out = tokens.extend
+
+    def factor(depth):
+        choice = rng.randrange(7 if depth > 0 else 5)
+        if choice == 0:
+            out([str(rng.randint(-9, 99))])
+        elif choice == 1:
+            out([f"{rng.randint(0, 9)}.{rng.randint(0, 99)}"])
+        elif choice == 2:
+            out([rng.choice(['"s"', '"a b"', '"q\\"uote"'])])
+        elif choice == 3:
+            out([rng.choice(PROGRAM_NAMES)])
+        elif choice == 4:
+            out([rng.choice(["true", "false"])])
+        elif choice == 5:
+            out(["("])
+            expression(depth - 1)
+            out([")"])
+        else:
+            out([rng.choice(["+", "-"])])
+            factor(depth - 1)
+
+    def call(depth):
+        out([rng.choice(PROGRAM_NAMES), "("])
+        arguments = rng.randint(0, 3)
+        for i in range(arguments):
+            if i:
+                out([","])
+            expression(depth - 1)
+        if arguments and rng.random() < 0.2:
+            out([","])
+        out([")"])
+
+    def expression(depth):
+        choice = rng.randrange(4 if depth > 0 else 1)
+        if choice == 0:
+            factor(depth)
+        elif choice == 1:
+            call(depth)
+        else:
+            expression(depth - 1)
+            out([rng.choice(["+", "-", "*", "/"])])
+            factor(depth - 1)
+
+    def condition(depth):
+        choice = rng.randrange(5 if depth > 0 else 2)
+        if choice == 0:
+            expression(depth)
+            out([rng.choice(COMPARISONS)])
+            expression(depth)
+        elif choice == 1:
+            expression(depth)
+        elif choice == 2:
+            out(["not"])
+            condition(depth - 1)
+        elif choice == 3:
+            condition(depth - 1)
+            out([rng.choice(["and", "or"])])
+            condition(depth - 1)
+        else:
+            out(["("])
+            condition(depth - 1)
+            out([")"])
+
+    def block(depth):
+        if depth > 0 and rng.random() < 0.7:
+            out(["begin"])
+            statement_list(depth - 1, rng.randint(0, 3))
+            out(["end"])
+        else:
+            statement(depth - 1, alone=True)
+
+    def statement(depth, alone=False):
+        name = rng.choice(PROGRAM_NAMES)
+        choice = rng.randrange(12 if depth > 0 else 10)
+        if choice == 2 and alone:
+            # A block's expression statement would continue the condition before it
+            choice = 0
+        if choice == 0:
+            out(["let", name, "="])
+            expression(2)
+            out([";"])
+        elif choice == 1:
+            out([name, "="])
+            expression(2)
+            out([";"])
+        elif choice == 2:
+            expression(2)
+            out([";"])
+        elif choice == 3:
+            out(["print", "("])
+            for i in range(rng.randint(1, 4)):
+                if i:
+                    out([","])
+                expression(1)
+            out([")", ";"])
+        elif choice == 4:
+            out(["set", name, "to"])
+            expression(1)
+            out([";"])
+        elif choice == 5:
+            verb, connector = rng.choice([("add", "to"), ("sub", "from")])
+            out([verb])
+            expression(1)
+            out([connector, name, ";"])
+        elif choice == 6:
+            out([rng.choice(["mult", "div"]), name, "by"])
+            expression(1)
+            out([";"])
+        elif choice == 7:
+            out(["return"])
+            if rng.random() < 0.7:
+                expression(1)
+            out([";"])
+        elif choice == 8:
+            out([rng.choice(["break", "continue"]), ";"])
+        elif choice == 9:
+            out(["let", name, "="])
+            factor(0)
+            out([";"])
+        elif choice == 10:
+            out(["function", rng.choice(["f", "g"]), "("])
+            for i in range(rng.randint(0, 3)):
+                if i:
+                    out([","])
+                out([rng.choice(PROGRAM_NAMES)])
+            out([")"])
+            block(depth)
+        else:
+            # Its statement list runs to the end of the enclosing one
+            out(["if", name, "is", rng.choice(COMPARISONS)])
+            expression(1)
+            out(["then"])
+            statement_list(depth - 1, rng.randint(0, 2))
+
+    def control_statement(depth):
+        choice = rng.randrange(4)
+        if choice == 0:
+            out(["if"])
+            condition(2)
+            block(depth)
+            for _ in range(rng.choice([0, 0, 1, 2])):
+                out(["elseif"])
+                condition(1)
+                block(depth)
+            if rng.random() < 0.5:
+                out(["else"])
+                block(depth)
+        elif choice == 1:
+            name = rng.choice(PROGRAM_NAMES)
+            declare = rng.random() < 0.5
+            out(["for", "let", name, "="] if declare else ["for", name, "="])
+            expression(1)
+            if declare:
+                out([";"])
+            out(["to"])
+            expression(1)
+            if rng.random() < 0.5:
+                out(["step"])
+                expression(1)
+            block(depth)
+        elif choice == 2:
+            out(["while"])
+            condition(2)
+            block(depth)
+        else:
+            call(2)
+            out([";"])
+
+    def statement_list(depth, count):
+        for _ in range(count):
+            if depth > 0 and rng.random() < 0.3:
+                control_statement(depth)
+            else:
+                statement(depth)
+
+    wrapped = rng.random() < 0.5
+    if wrapped:
+        out(["begin"])
+    statement_list(3, statements)
+    if wrapped:
+        out(["end"])
+
+    for _ in range(mutations if tokens else 0):
+        i = rng.randrange(len(tokens))
+        change = rng.randrange(3)
+        if change == 0:
+            del tokens[i]
+        elif change == 1:
+            tokens.insert(i, tokens[i])
+        elif i + 1 < len(tokens):
+            tokens[i], tokens[i + 1] = tokens[i + 1], tokens[i]
+        if not tokens:
+            break
+    return "".join(token + rng.choice([" ", " ", "  ", "\n"]) for token in tokens)
+
+
+def repeated_program(copies):
+    """One program holding the top-level statements of SAMPLE_PROGRAM `copies` times"""
+    body = SAMPLE_PROGRAM[len("begin\n"):-len("end\n")]
+    return "begin\n" + body * copies + "end\n"
+
+
+# For and while loops over arithmetic, in a function and at the top level
+LOOP_PROGRAM = """begin
+    function triangle(n)
+    begin
+        let sum = 0;
+        let j = 0;
+        while j < n
+        begin
+            j = j + 1;
+            sum = sum + j;
+        end
+        return sum;
+    end
+    let total = 0;
+    let squares = 0;
+    for let i = 1; to 2000
+    begin
+        total = total + i * 2 - 1;
+        squares = squares + i * i / 4;
+        if total > 1000000 and i != 0
+        begin
+            total = total - 1000000;
+        end
+    end
+    let k = 0;
+    while k < 1000
+    begin
+        k = k + 1;
+        add k to squares;
+        if k == 500
+        begin
+            continue;
+        end
+    end
+    let largest = 0;
+    for let m = 1; to 120
+    begin
+        let t = triangle(m);
+        if t > largest
+        begin
+            largest = t;
+        end
+    end
+    print("total", total, "squares", squares, "largest", largest);
+end
+"""
+
+
+# Where the grammar is ambiguous or surprising, for the parser engines to agree on
+ENGINE_EDGE_CASES = [
+    "if (a) x;", "if (a) < b x;", "if ((a)) < b x;", "if ((a) < b) x;", "if ((a < b)) x;",
+    "if (a) and b x;", "if (not a) x;", "if not a and b or c x;", "if a or b and not c < d x;",
+    "while (a) (b);", "while (a + 1) * 2 > (3) (b);", "if (((a)) and ((b) < (c))) x;",
+    "if a < b < c x;", "if (a + (b < c)) x;",
+    "x = f(1) * 2 + -g() / +3;", "x = 2 * f(1);", "x = -f(1);", "f(1,);", "f(a)(b);", "- - - 3;",
+    'print("a", 1 + "b", f(2,));', "print();",
+    "for i = 1 to 10 -x;", "for i = 1 to 10 step 2 print(i);", "for let i = 1; to 10 step - 1 begin end",
+    "if x is < 3 then", "if x is < 3 then a = 1; b = 2;", "begin if x is == 3 then a = 1; end",
+    "if c a = 1; elseif d b = 2; elseif e c = 3; else d = 4;",
+    "if c if x is < 1 then if d y; else z; elseif e w;", "while c if d x;",
+    "function f(a,) x;", "", "begin end", "begin end x;", "let x = 1; end",
+]
+
+
+def random_source_edit(rng, code):
+    """(offset, deleted, inserted) for a random edit of `code`.
+
+    Mostly statement-sized: a span between two semicolons dropped, copied
+    elsewhere or swapped for a new statement, or one word renamed; now and
+    then a stray character, which usually breaks the program.
+    """
+    semicolons = [i + 1 for i, c in enumerate(code) if c == ";"] or [len(code)]
+    start = rng.choice(semicolons)
+    end = rng.choice(semicolons)
+    start, end = min(start, end), max(start, end)
+    change = rng.randrange(5)
+    if change == 0:
+        return start, end - start, ""
+    if change == 1:
+        return rng.choice(semicolons), 0, code[start:end]
+    if change == 2:
+        fresh = generate_program(rng.random(), statements=rng.randint(1, 3))
+        fresh = fresh.replace("begin", "", 1).rsplit("end", 1)[0] if fresh.startswith("begin") else fresh
+        return start, 0, " " + fresh
+    if change == 3:
+        words = [m for m in re.finditer(r"[a-z_]\w*|\d+", code) if m.group() not in ("begin", "end")]
+        if words:
+            word = rng.choice(words)
+            return word.start(), len(word.group()), rng.choice(PROGRAM_NAMES + ["7", "12.5"])
+    offset = rng.randint(0, len(code))
+    return offset, rng.randint(0, 2), rng.choice(["", ";", "x", "(", " ", "\n", "/*"])
+
+
+# Programs running out of stack, in calls without end or in expressions
+# and statements nested too deep to compile, after other statements have
+# run; the expressions span one line or one line per operator
+DEEP_PROGRAMS = [
+    "begin function f(n) return f(n + 1); print(f(1)); end",
+    "let a = 1;\nfunction f(n) return f(n + 1);\nprint(f(1));",
+    "let x = 1" + " + 1" * 3000 + ";\nprint(x);",
+    "print(5);\nlet y = 2;\nlet x = 1" + "\n+ 1" * 3000 + ";\nprint(x);",
+    "function g() return 1" + " + 1" * 3000 + ";\nprint(7);\nprint(g());",
+    "let i = 0;\nwhile i < 2 begin i = i + 1; print(i" + " * 1" * 3000 + "); end",
+    "let k = 3;\nif k" + " - 1" * 3000 + " > 0 then print(k);",
+    "let k = 1;\n" + "while k < 2 begin\n" * 800 + "k = k + 1;\n" + "end\n" * 800,
+]
+
+# A function calling itself `depth` times, around an expression or not: the
+# interpreter runs out of stack at some depth between the least and the most
+RECURSIVE_PROGRAMS = [
+    f"function r(a)\nbegin\nif a > {depth}\nbegin\nreturn a;\nend\nelse\nbegin\nreturn {call};\nend\nend\n"
+    f"print(r(1));"
+    for depth in range(40, 200, 8) for call in ("r(a + 1)", "1 + r(a + 1) * 1")
+]
+
+
+# Where the slots the bytecode resolves variables to must find what the
+# interpreter's scope walk finds: shadowing, declarations late in a loop,
+# calls reading and assigning their callers' variables, redeclarations, an
+# exception leaving scopes, and for loops over variables without a value,
+# which the VM hands over to the interpreter
+SCOPE_EDGE_CASES = [
+    "function f() return x + 1; let x = 1; if x > 0 begin let x = 10; print(f()); end print(f());",
+    "let x = 1; let n = 0; while n < 3 begin print(x); let x = n * 5; n = n + 1; end print(x);",
+    "let n = 0; while n < 3 begin n = n + 1; if n > 0 begin print(m); let m = n; end end",
+    "let a = 1; let a = 2; print(a);",
+    "function g(a, a) return a; print(g(1, 2));",
+    "function inc() counter = counter + 1; let counter = 0; for let i = 1; to 5 inc(); print(counter);",
+    "function bump() begin add 5 to total; set local to 3; set local to 4; end let total = 1; bump(); print(total);",
+    "function fact(n) begin if n <= 1 return base; return n * fact(n - 1); end let base = 1; print(fact(6));",
+    "function h() return nope; print(h()); print(missing); missing = 3;",
+    "let i = 0; for i = 1 to 4 begin let i = 100; print(i); end print(i);",
+    "function f(n) begin if n > 0 begin let y = 3; return n + \"s\" * 2; end end "
+    "let z = 1; if z == 1 begin let w = 2; print(f(1, f(2))); end",
+    "let x = 1; while x < 3 begin for q = 1 to 3 print(q); x = x + 1; end let x = 5; print(x);",
+    "function nothing() return; let q = nothing(); for q = 1 to 3 print(q); let y = 2; let y = 3;",
+    "function show() print(v); function outer() begin let v = 2; show(); end let v = 1; show(); outer(); show();",
+    "function inner() begin total = total + 1; print(total); end function middle() begin inner(); inner(); end "
+    "let total = 0; middle(); middle(); print(total);",
+    "let k = 0; function peek() print(k); let n = 0; while n < 2 begin n = n + 1; peek(); let k = n * 10; peek(); end",
+    "function down(n) begin if n > 0 begin let seed = n; return down(n - 1); end return seed; end "
+    "let seed = 7; print(down(5));",
+]
+
+
+def example_programs():
+    """The programs written out in test.py, which runs them when imported"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test.py")
+    with open(path, encoding="utf-8") as source:
+        return re.findall(r'"""(.*?)"""', source.read(), re.S)
+
+
+def token_tuples(lexer, code):
+    lexer.input(code)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer]
+
+
+def summed_line_columns(tokens, code):
+    """Token columns the way analyze_tokens used to find them: re-summing earlier lines"""
+    lines = code.split("\n")
+    columns = []
+    for tok in tokens:
+        line_start = 0
+        for i in range(tok.lineno - 1):
+            if i < len(lines):
+                line_start += len(lines[i]) + 1
+        columns.append(tok.lexpos - line_start + 1)
+    return columns
+
+
+def buffer_columns(buffer):
+    return buffer.types, buffer.starts, buffer.ends, buffer.lines
+
+
+def parse_tree(code, builder):
+    """Parse `code` with a pooled parser building through `builder`"""
+    lex = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code).feeder()
+    with parser_pool.checkout(lex, None, builder) as parser:
+        return builder.finish(parser.parser.parse(code, lexer=lex))
+
+
+def as_tuples(tree):
+    """The tree in the tuple form the parser used to build"""
+    if isinstance(tree, Node):
+        return (tree.tag, *(as_tuples(getattr(tree, name)) for name in tree.fields), tree.line)
+    if isinstance(tree, list):
+        return [as_tuples(item) for item in tree]
+    return tree
+
+
+def parse_result(parser_class, code):
+    """The tree and error messages a fresh parser_class instance gives for `code`"""
+    lexer = Lexer.prebuilt().lexer
+    parser = parser_class(lexer)
+    parser.reset(lexer, LineIndex(code))
+    tree = parser.parser.parse(code, lexer=lexer)
+    return tree, parser.parseErrorMessage
+
+
+def profiled_parse(code):
+    """The tree, error messages and profile a profiled parser gives for `code`"""
+    lexer = Lexer.prebuilt().lexer
+    parser = Parser(lexer, profiled=True)
+    parser.reset(lexer, LineIndex(code))
+    tree = parser.parser.parse(code, lexer=lexer)
+    return tree, parser.parseErrorMessage, parser.profile
+
+
+def syntax_errors(messages):
+    """The messages of `messages` that report a syntax error, not the reserved word notes"""
+    return [message for message in messages if "Syntax error" in message]
+
+
+def descent_result(code, lexer):
+    """ParseResult of a full descent parse of `code`, or None if it has a syntax error"""
+    buffer = TokenBuffer.from_lexer(lexer, code)
+    parser = DescentParser(buffer, NodeBuilder())
+    tree = parser.parse()
+    return None if tree is None else ParseResult(buffer, tree, [], parser.boundaries)
+
+
+def analyzed(tree, interpret):
+    """Everything `interpret` leaves on a new SemanticAnalyzer after running `tree`, exception included"""
+    analyzer = SemanticAnalyzer()
+    try:
+        result = interpret(analyzer, tree)
+    except Exception as e:
+        result = repr(e)
+    return (
+        result, analyzer.compile_results, analyzer.semantic_errors, analyzer.line_number,
+        analyzer.scope_stack, analyzer.loop_stack, analyzer.call_stack, analyzer.return_value,
+        analyzer.should_return, analyzer.should_break, analyzer.should_continue,
+    )
@@ -0,0 +1,74 @@
+"""The bytecode VM leaves the analyzer exactly as interpreting does
+
+Except for calls nested deeper than the interpreter's Python stack allows:
+the VM runs those up to MAX_CALL_DEPTH and then stops with its own error.
+"""
+import pytest
+
+from proj.models import bytecode, vm
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.syntax_tree import NodeBuilder
+from tests.support import (
+    DEEP_PROGRAMS, LOOP_PROGRAM, RECURSIVE_PROGRAMS, SAMPLE_PROGRAM, analyzed, example_programs,
+    generate_program, parse_tree,
+)
+
+# The first two DEEP_PROGRAMS recurse without end
+ENDLESS = DEEP_PROGRAMS[:2]
+PROGRAMS = example_programs() + [LOOP_PROGRAM, SAMPLE_PROGRAM] + DEEP_PROGRAMS[2:] + [
+    generate_program(seed, statements=30, mutations=seed % 3) for seed in range(300)
+]
+BUILDERS = pytest.mark.parametrize(
+    "builder_class", [NodeBuilder, FlatTreeBuilder, SharedTreeBuilder], ids=lambda cls: cls.__name__
+)
+
+
+@BUILDERS
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_vm_matches_interpreter(code, builder_class):
+    tree = parse_tree(code, builder_class())
+    assert analyzed(tree, vm.run) == analyzed(tree, SemanticAnalyzer.interpret)
+
+
+@pytest.mark.parametrize("code", RECURSIVE_PROGRAMS, ids=range(len(RECURSIVE_PROGRAMS)))
+def test_recursion_below_max_call_depth(code):
+    analyzer = SemanticAnalyzer()
+    vm.run(analyzer, parse_tree(code, NodeBuilder()))
+    depth = int(code.split("if a > ")[1].split()[0])
+    # r(1) returns depth + 1, plus 1 per call inside an expression
+    expected = depth + 1 + (depth if "1 + r" in code else 0)
+    assert analyzer.compile_results == [str(expected)]
+    assert analyzer.semantic_errors == []
+
+
+@pytest.mark.parametrize("code, line", list(zip(ENDLESS, [1, 2])))
+def test_max_call_depth(code, line):
+    result = analyzed(parse_tree(code, NodeBuilder()), vm.run)
+    message = f"🧠💥Maximum call depth of {vm.MAX_CALL_DEPTH} exceeded calling 'f' at line {line}"
+    assert result[0] == repr(RecursionError(message))
+    assert result[1:4] == ([], [message], line)
+    # Left as the interpreter's finally blocks leave it: every call returned from
+    assert result[5:7] == ([], [])
+
+
+def test_program_runs_again():
+    program = bytecode.compile_program(parse_tree(LOOP_PROGRAM, NodeBuilder()))
+    first, second = SemanticAnalyzer(), SemanticAnalyzer()
+    vm.execute(program, first)
+    vm.execute(program, second)
+    assert first.compile_results == second.compile_results == ["total 1000000 squares 667667250.0 largest 7260"]
+
+
+def test_disassembly():
+    program = bytecode.compile_program(parse_tree("let a = 1; print(a + 2);", NodeBuilder()))
+    listing = bytecode.disassemble(program).splitlines()
+    assert [line.split()[1] for line in listing[1:-1]] == [
+        "CONST", "DUP", "LINE", "DECLARE_CHECK", "CHECK_FLAGS", "POP",
+        "LOAD", "ADD_CONST", "ADD", "STR", "PRINT", "CONST", "HALT",
+    ]
+    assert listing[-1] == "  frame of 2 slots: a@1"
+    analyzer = SemanticAnalyzer()
+    vm.execute(program, analyzer)
+    assert analyzer.compile_results == ["3"]
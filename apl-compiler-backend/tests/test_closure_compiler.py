@@ -0,0 +1,58 @@
+"""Compiled closures leave the analyzer exactly as interpreting does"""
+import pytest
+
+from proj.models import closure_compiler
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.syntax_tree import NodeBuilder
+from tests.support import (
+    DEEP_PROGRAMS, LOOP_PROGRAM, SAMPLE_PROGRAM, analyzed, example_programs, generate_program, parse_tree,
+)
+
+# The first two DEEP_PROGRAMS recurse without end
+ENDLESS = DEEP_PROGRAMS[:2]
+PROGRAMS = example_programs() + [LOOP_PROGRAM, SAMPLE_PROGRAM] + DEEP_PROGRAMS[2:] + [
+    generate_program(seed, statements=30, mutations=seed % 3) for seed in range(300)
+]
+BUILDERS = pytest.mark.parametrize(
+    "builder_class", [NodeBuilder, FlatTreeBuilder, SharedTreeBuilder], ids=lambda cls: cls.__name__
+)
+
+
+@BUILDERS
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_closures_match_interpreter(code, builder_class):
+    # Results, output, errors, line number, stacks and flags all match
+    tree = parse_tree(code, builder_class())
+    assert analyzed(tree, closure_compiler.run) == analyzed(tree, SemanticAnalyzer.interpret)
+
+
+@BUILDERS
+@pytest.mark.parametrize("code", ENDLESS, ids=range(len(ENDLESS)))
+def test_endless_recursion_runs_out_of_stack(code, builder_class):
+    # Closures nest fewer Python calls per call than the interpreter, so
+    # only the scopes left where each ran out can differ
+    tree = parse_tree(code, builder_class())
+    got, expected = analyzed(tree, closure_compiler.run), analyzed(tree, SemanticAnalyzer.interpret)
+    assert got[0] == repr(RecursionError("maximum recursion depth exceeded"))
+    assert got[:4] == expected[:4]
+    assert got[5:] == expected[5:]
+
+
+def test_program_runs_once():
+    code = "print(5);\nfunction f(n) return f(n + 1);\nprint(f(1));"
+    analyzer = SemanticAnalyzer()
+    with pytest.raises(RecursionError):
+        closure_compiler.run(analyzer, parse_tree(code, NodeBuilder()))
+    assert analyzer.compile_results == ["5"]
+    assert analyzer.call_stack == []
+
+
+def test_compiled_program_runs_again():
+    compiled = closure_compiler.compile_program(parse_tree(LOOP_PROGRAM, NodeBuilder()))
+    first, second = SemanticAnalyzer(), SemanticAnalyzer()
+    compiled(first)
+    compiled(second)
+    assert first.compile_results == second.compile_results
+    assert first.compile_results[-1] == "total 1000000 squares 667667250.0 largest 7260"
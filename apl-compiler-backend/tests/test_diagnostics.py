@@ -0,0 +1,79 @@
+"""Diagnostics below the request's level are dropped before logging sees them"""
+import logging
+import threading
+
+import pytest
+
+from proj.utilities import diagnostics
+
+log = diagnostics.get_logger("proj.tests.diagnostics")
+
+
+@pytest.fixture
+def records(caplog):
+    caplog.set_level(logging.DEBUG, logger=diagnostics.ROOT_LOGGER)
+    return caplog
+
+
+def messages(caplog):
+    return [(record.levelname, record.getMessage()) for record in caplog.records]
+
+
+def test_logger_names_drop_the_package():
+    assert log.logger.name == "apl.tests.diagnostics"
+
+
+def test_request_level_gates_messages(records):
+    with diagnostics.request_level(diagnostics.WARNING):
+        log.debug("hidden %s", "debug")
+        log.info("hidden %s", "info")
+        log.warning("shown %s", "warning")
+        assert not log.isEnabledFor(diagnostics.INFO)
+    with diagnostics.request_level(diagnostics.DEBUG):
+        log.debug("shown %s", "debug")
+        assert log.isEnabledFor(diagnostics.DEBUG)
+    assert messages(records) == [("WARNING", "shown warning"), ("DEBUG", "shown debug")]
+
+
+def test_messages_below_the_level_are_not_formatted(records):
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    with diagnostics.request_level(diagnostics.ERROR):
+        log.debug("%s", Exploding())
+        log.info("%s", Exploding())
+    assert messages(records) == []
+
+
+def test_request_level_is_restored(records):
+    with diagnostics.request_level(diagnostics.DEBUG):
+        with diagnostics.request_level(diagnostics.ERROR):
+            log.info("hidden")
+        log.info("shown")
+    assert messages(records) == [("INFO", "shown")]
+
+
+def test_request_level_is_per_thread(records):
+    entered, logged = threading.Event(), threading.Event()
+
+    def quiet_request():
+        with diagnostics.request_level(diagnostics.ERROR):
+            entered.set()
+            logged.wait()
+            log.info("hidden")
+
+    thread = threading.Thread(target=quiet_request)
+    thread.start()
+    entered.wait()
+    with diagnostics.request_level(diagnostics.INFO):
+        log.info("shown")
+    logged.set()
+    thread.join()
+    assert messages(records) == [("INFO", "shown")]
+
+
+def test_parse_level():
+    assert diagnostics.parse_level(" Debug ") == diagnostics.DEBUG
+    with pytest.raises(ValueError, match="Unknown log level 'loud'"):
+        diagnostics.parse_level("loud")
@@ -0,0 +1,30 @@
+"""Error productions change nothing on valid programs and only add to broken ones' reports"""
+import pytest
+
+from proj.models.parser import Parser
+from tests.grammars import UnrecoveringParser
+from tests.support import generate_program, parse_result, syntax_errors
+
+
+@pytest.mark.parametrize("seed", range(600))
+def test_generated_program(seed):
+    code = generate_program(seed, statements=30, mutations=seed % 4)
+    tree, errors = parse_result(Parser, code)
+    old_tree, old_errors = parse_result(UnrecoveringParser, code)
+    if old_errors:
+        # Both detect the first error at the same token
+        assert syntax_errors(errors)[0] == syntax_errors(old_errors)[0]
+    else:
+        assert not errors
+        assert tree == old_tree
+
+
+def test_resynchronizes_at_semicolons():
+    code = "let a = 1;\nlet b = ;\nprint(a);\nlet c = * 2;\nprint(c);"
+    tree, errors = parse_result(Parser, code)
+    assert syntax_errors(errors) == [
+        "❌ Syntax error at line 2, column 9: Unexpected token ';' of type SEMICOLON",
+        "❌ Syntax error at line 4, column 9: Unexpected token '*' of type TIMES_OP",
+    ]
+    assert [statement.tag for statement in tree.statements] == ["declare", "print", "print"]
+    assert [statement.line for statement in tree.statements] == [1, 3, 5]
@@ -0,0 +1,36 @@
+"""Flat array trees export and run as node trees do"""
+import pytest
+
+from proj.models.flat_tree import Cursor, FlatTreeBuilder
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.syntax_tree import NodeBuilder, to_json
+from tests.support import SAMPLE_PROGRAM, generate_program, parse_tree
+
+PROGRAMS = [SAMPLE_PROGRAM] + [generate_program(seed, statements=40) for seed in range(300)]
+
+
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_to_json_matches_across_layouts(code):
+    nodes = to_json(parse_tree(code, NodeBuilder()))
+    assert to_json(parse_tree(code, FlatTreeBuilder())) == nodes
+    assert to_json(parse_tree(code, SharedTreeBuilder())) == nodes
+
+
+def test_flat_tree_interprets_like_nodes():
+    results = []
+    for builder in (NodeBuilder(), FlatTreeBuilder()):
+        analyzer = SemanticAnalyzer()
+        analyzer.interpret(parse_tree(SAMPLE_PROGRAM, builder))
+        results.append((analyzer.compile_results, analyzer.semantic_errors))
+    assert results[0] == results[1]
+
+
+def test_nodes_are_array_rows():
+    root = parse_tree("let a = 1; let b = 1.0; print(a);", FlatTreeBuilder())
+    assert isinstance(root, Cursor)
+    # Equal values of different types are pooled apart
+    assert root.tree.pool == [1, "a", 1.0, "b"]
+    declare = root.statements[0]
+    assert (declare.tag, declare.name, declare.line, declare.lexpos, declare.endlexpos) == ("declare", "a", 1, 0, 10)
+    assert all(len(column) == len(root.tree) for column in root.tree.columns)
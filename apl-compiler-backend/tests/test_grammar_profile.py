@@ -0,0 +1,44 @@
+"""Profiling the grammar changes no parse, and its counters add up"""
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.grammar_profile import GrammarProfile
+from proj.models.parser import Parser
+from proj.models.token_buffer import TokenBuffer
+from tests.support import generate_program, parse_result, profiled_parse
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_profiled_parse_matches(seed):
+    code = generate_program(seed, statements=20, mutations=seed % 4)
+    tree, errors, profile = profiled_parse(code)
+    assert (tree, errors) == parse_result(Parser, code)
+    assert profile.parses == 1
+    if not errors:
+        # Every token is shifted once, and the parser loop takes one step
+        # per shift, one per reduction and one to accept
+        tokens = len(TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code))
+        assert sum(profile.shifts.values()) == tokens
+        assert profile.errors_shifted == 0
+        assert sum(profile.states) == tokens + sum(profile.reductions) + 1
+
+
+def test_merge_adds_counts():
+    profiles = [profiled_parse(generate_program(seed, statements=20))[2] for seed in range(3)]
+    total = GrammarProfile()
+    for profile in profiles:
+        total.merge(profile)
+    assert total.parses == 3
+    assert total.reductions == [sum(counts) for counts in zip(*(p.reductions for p in profiles))]
+    assert total.shifts == sum((p.shifts for p in profiles), start=type(total.shifts)())
+    summary = total.to_json()
+    assert summary["tokensShifted"] == sum(total.shifts.values())
+    assert sum(entry["reductions"] for entry in summary["productions"]) == sum(total.reductions)
+    total.clear()
+    assert total.parses == 0 and not total.shifts
+
+
+def test_syntax_errors_shift_error():
+    _, errors, profile = profiled_parse("let a = ;\nprint(a);")
+    assert errors
+    assert profile.errors_shifted == 1
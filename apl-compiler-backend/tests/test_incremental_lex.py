@@ -0,0 +1,52 @@
+"""Re-lexing around an edit gives the buffer lexing the edited source does"""
+import random
+
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.regexlexer import RegexLexer
+from proj.models.token_buffer import TokenBuffer
+from tests.support import SAMPLE_PROGRAM, buffer_columns, generate_corpus
+
+ENGINES = pytest.mark.parametrize("engine", [Lexer, RegexLexer], ids=lambda engine: engine.__name__)
+
+
+@ENGINES
+@pytest.mark.parametrize("seed", range(200))
+def test_chained_edits_match_full_lex(engine, seed):
+    lexer = engine.prebuilt().lexer
+    rng = random.Random(seed)
+    code = generate_corpus(seed, fragments=100)
+    buffer = TokenBuffer.from_lexer(lexer, code)
+    for _ in range(6):
+        offset = rng.randint(0, len(code))
+        deleted = rng.randint(0, min(8, len(code) - offset))
+        inserted = generate_corpus(rng.random(), fragments=rng.randint(0, 3))
+        buffer = buffer.edit(offset, deleted, inserted, lexer)
+        code = buffer.source
+        expected = TokenBuffer.from_lexer(lexer, code)
+        assert buffer_columns(buffer) == buffer_columns(expected)
+        assert buffer.hazards() == expected.hazards()
+
+
+@ENGINES
+def test_edit_keeps_tokens_before_it(engine):
+    lexer = engine.prebuilt().lexer
+    code = SAMPLE_PROGRAM * 10
+    buffer = TokenBuffer.from_lexer(lexer, code)
+    offset = code.index("total - 1", len(code) // 2)
+    edited = buffer.edit(offset, 5, "count", lexer)
+    assert edited.source == code[:offset] + "count" + code[offset + 5:]
+    assert buffer_columns(edited) == buffer_columns(TokenBuffer.from_lexer(lexer, edited.source))
+    assert edited.kept > len(buffer) // 2
+
+
+@ENGINES
+def test_opened_comment_reaches_past_the_edited_line(engine):
+    lexer = engine.prebuilt().lexer
+    code = SAMPLE_PROGRAM * 3
+    buffer = TokenBuffer.from_lexer(lexer, code)
+    edited = buffer.edit(code.index("let a"), 0, "/*", lexer)
+    expected = TokenBuffer.from_lexer(lexer, edited.source)
+    assert buffer_columns(edited) == buffer_columns(expected)
+    assert len(edited) < len(buffer)
@@ -0,0 +1,57 @@
+"""Per-request lexer clones share the compiled rules and nothing else"""
+import threading
+
+from proj.models.finallexer import Lexer
+from tests.support import SAMPLE_PROGRAM, generate_program, token_tuples
+
+
+def test_prebuilt_returns_a_new_clone_each_time():
+    first, second = Lexer.prebuilt(), Lexer.prebuilt()
+    assert first is not second
+    assert first.lexer is not second.lexer
+    # ply's clone() leaves t_error bound to the prototype unless rebound
+    assert first.lexer.lexerrorf.__self__ is first
+
+
+def test_clones_lex_interleaved_as_alone():
+    sources = [SAMPLE_PROGRAM, generate_program(1, statements=20)]
+    alone = [token_tuples(Lexer.prebuilt().lexer, source) for source in sources]
+    lexers = [Lexer.prebuilt().lexer for _ in sources]
+    for lexer, source in zip(lexers, sources):
+        lexer.input(source)
+    interleaved = [[], []]
+    done = set()
+    while len(done) < len(lexers):
+        for n, lexer in enumerate(lexers):
+            tok = None if n in done else lexer.token()
+            if tok is None:
+                done.add(n)
+            else:
+                interleaved[n].append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    assert interleaved == alone
+
+
+def test_clone_starts_from_a_reset_state():
+    used = Lexer.prebuilt()
+    token_tuples(used.lexer, "let a = 1;\nlet b = 2;\n")
+    used.scope_stack.append({"a"})
+    twin = used.clone()
+    assert twin.lexer.lineno == 1
+    assert twin.scope_stack == [set()] and twin.errors == []
+    assert used.scope_stack == [set(), {"a"}]
+
+
+def test_clones_in_threads():
+    source = generate_program(2, statements=50)
+    expected = token_tuples(Lexer.prebuilt().lexer, source)
+    results = []
+
+    def lex():
+        results.append(token_tuples(Lexer.prebuilt().lexer, source))
+
+    threads = [threading.Thread(target=lex) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 8
@@ -0,0 +1,30 @@
+"""The regex tokenizer emits exactly the PLY lexer's tokens"""
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.regexlexer import RegexLexer
+from tests.support import SAMPLE_PROGRAM, generate_corpus, token_tuples
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_generated_corpus(seed):
+    reference = Lexer.prebuilt().lexer
+    candidate = RegexLexer.prebuilt().lexer
+    code = generate_corpus(seed, fragments=200)
+    assert token_tuples(candidate, code) == token_tuples(reference, code)
+    assert candidate.lineno == reference.lineno
+
+
+def test_sample_program():
+    reference = Lexer.prebuilt().lexer
+    candidate = RegexLexer.prebuilt().lexer
+    expected = token_tuples(reference, SAMPLE_PROGRAM)
+    assert token_tuples(candidate, SAMPLE_PROGRAM) == expected
+    assert len(expected) > 100
+
+
+def test_keyword_prefixes_and_signed_numbers():
+    code = 'iffy = -7 + 3.14; print("a\\"b") // note'
+    tokens = token_tuples(RegexLexer.prebuilt().lexer, code)
+    assert tokens == token_tuples(Lexer.prebuilt().lexer, code)
+    assert [value for _, value, _, _ in tokens][:5] == ["iffy", "=", -7, "+", 3.14]
@@ -0,0 +1,52 @@
+"""LineIndex finds the lines and columns re-summing the lines before them did"""
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.line_index import LineIndex
+from tests.support import SAMPLE_PROGRAM, generate_program, summed_line_columns
+
+SOURCES = [
+    SAMPLE_PROGRAM * 3,
+    generate_program(0, statements=50),
+    "let a = 1;\r\n\r\nprint(a);\r\n",
+    "\n\n  let a = 1;\n\n",
+    "/* a comment\nover lines */ let a = \"x\ny\"; print(a);",
+]
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_columns_match_summing_lines(code):
+    lexer = Lexer.prebuilt().lexer
+    lexer.input(code)
+    tokens = list(lexer)
+    index = LineIndex(code)
+    assert [index.column(tok.lexpos, tok.lineno) for tok in tokens] == summed_line_columns(tokens, code)
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_locate_every_offset(code):
+    index = LineIndex(code)
+    assert [index.locate(offset) for offset in range(len(code) + 1)] == [
+        (code.count("\n", 0, offset) + 1, offset - code.rfind("\n", 0, offset))
+        for offset in range(len(code) + 1)
+    ]
+
+
+def test_lines():
+    index = LineIndex("let a = 1;\n\nprint(a);")
+    assert index.starts == [0, 11, 12]
+    assert index.line_count == 3
+    assert [index.line_text(n) for n in (1, 2, 3)] == ["let a = 1;", "", "print(a);"]
+    assert index.locate(0) == (1, 1)
+    # The newline ending a line is its last column
+    assert index.locate(10) == (1, 11)
+    assert index.locate(11) == (2, 1)
+    assert index.locate(18) == (3, 7)
+    assert index.column(18, 3) == 7
+
+
+def test_trailing_newline_and_empty_source():
+    assert LineIndex("a\n").line_count == 2
+    assert LineIndex("a\n").line_text(2) == ""
+    empty = LineIndex("")
+    assert (empty.line_count, empty.line_text(1), empty.locate(0)) == (1, "", (1, 1))
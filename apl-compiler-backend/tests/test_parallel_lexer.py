@@ -0,0 +1,76 @@
+"""Lexing in worker processes gives the TokenBuffer a single Lexer does"""
+import logging
+from bisect import bisect_left
+
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.parallel_lexer import ParallelLexer, split_source
+from proj.models.token_buffer import TokenBuffer
+from proj.utilities import diagnostics
+from tests.support import SAMPLE_PROGRAM, buffer_columns, generate_corpus, generate_program
+
+SOURCES = (
+    [generate_corpus(seed, fragments=600) for seed in range(20)]
+    + [generate_program(seed, statements=60) for seed in range(10)]
+    + [SAMPLE_PROGRAM * 4, 'let s = "a\nb\nc";\n/* x\n"\n*/\nprint(s);\n' * 20]
+)
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    with ParallelLexer(5) as lexer:
+        yield lexer
+
+
+def lex_in(lexer, source, parts):
+    """Lex `source` split into `parts` chunks"""
+    lexer.min_chunk_size = len(source) // parts
+    return lexer.lex(source)
+
+
+@pytest.mark.parametrize("parts", [2, 3, 5])
+@pytest.mark.parametrize("source", SOURCES, ids=range(len(SOURCES)))
+def test_matches_serial_lexer(lexer, source, parts):
+    expected = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, source)
+    assert buffer_columns(lex_in(lexer, source, parts)) == buffer_columns(expected)
+
+
+@pytest.mark.parametrize("source", SOURCES, ids=range(len(SOURCES)))
+def test_split_points_restart_the_lexer(source):
+    # Lexing from a cut, at the cut's line, gives the tokens the whole
+    # source has from there on
+    whole = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, source)
+    for offset, lineno in split_source(source, 7)[1:]:
+        assert source[offset - 1] == "\n"
+        lexer = Lexer.prebuilt().lexer
+        lexer.input(source)
+        lexer.lexpos, lexer.lineno = offset, lineno
+        first = bisect_left(whole.starts, offset)
+        tail = [(tok.lexpos, tok.lineno) for tok in lexer]
+        assert tail == list(zip(whole.starts[first:], whole.lines[first:]))
+
+
+def test_no_cut_inside_strings_or_comments():
+    source = 'let s = "one\ntwo";\n/* three\nfour */\nprint(s);\n'
+    assert split_source(source, 20) == [(0, 1), (19, 2), (36, 4), (46, 5)]
+
+
+def test_small_sources_stay_in_process(lexer):
+    lexer.min_chunk_size = ParallelLexer.min_chunk_size
+    assert buffer_columns(lexer.lex(SAMPLE_PROGRAM)) == buffer_columns(
+        TokenBuffer.from_lexer(Lexer.prebuilt().lexer, SAMPLE_PROGRAM)
+    )
+
+
+def test_illegal_characters_reported_in_order(lexer, caplog):
+    source = "".join(f"let x{n} = {n} {'@#$'[n % 3]};\n" for n in range(300))
+    caplog.set_level(logging.INFO, logger=diagnostics.ROOT_LOGGER)
+    with diagnostics.request_level(diagnostics.INFO):
+        lex_in(lexer, source, 5)
+        parallel = [record.getMessage() for record in caplog.records]
+        caplog.clear()
+        TokenBuffer.from_lexer(Lexer.prebuilt().lexer, source)
+        serial = [record.getMessage() for record in caplog.records]
+    assert len(parallel) == 300
+    assert parallel == serial
@@ -0,0 +1,78 @@
+"""The parse cache: what its keys tell apart, what it evicts and what it counts"""
+import proj
+from proj.models.line_index import LineIndex
+from proj.models.parse_cache import ParseCache, ParseResult
+from proj.services.compiler_service import parse_source
+from tests.support import SAMPLE_PROGRAM, repeated_program
+
+
+def sized(size):
+    return ParseResult(None, None, [], size=size)
+
+
+def test_key_separates_sources_and_layouts():
+    key = ParseCache.key(SAMPLE_PROGRAM, "nodes")
+    assert ParseCache.key(SAMPLE_PROGRAM, "nodes") == key
+    assert ParseCache.key(SAMPLE_PROGRAM + " ", "nodes") != key
+    assert len({ParseCache.key(SAMPLE_PROGRAM, layout) for layout in ("nodes", "flat", "shared")}) == 3
+
+
+def test_key_changes_with_the_compiler_version(monkeypatch):
+    key = ParseCache.key(SAMPLE_PROGRAM, "nodes")
+    monkeypatch.setattr(proj, "__version__", proj.__version__ + ".1")
+    assert ParseCache.key(SAMPLE_PROGRAM, "nodes") != key
+
+
+def test_key_takes_lone_surrogates():
+    assert ParseCache.key("print(\"\udc80\");", "nodes") != ParseCache.key("print(\"\");", "nodes")
+
+
+def test_hit_returns_the_stored_result():
+    cache = ParseCache(64 * 2**20)
+    key = cache.key(SAMPLE_PROGRAM, "nodes")
+    assert cache.get(key) is None
+    parsed = parse_source(SAMPLE_PROGRAM, LineIndex(SAMPLE_PROGRAM))
+    cache.put(key, parsed)
+    assert cache.get(key) is parsed
+    assert cache.get(key) is parsed
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (2, 1, 1, parsed.size)
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = ParseCache(250)
+    cache.put("a", sized(100))
+    cache.put("b", sized(100))
+    cache.get("a")
+    cache.put("c", sized(100))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    # One large entry can push out several small ones
+    cache.put("d", sized(200))
+    assert [key for key in "acd" if cache.get(key) is not None] == ["d"]
+    stats = cache.stats()
+    assert (stats["evictions"], stats["entries"], stats["bytes"], stats["maxBytes"]) == (3, 1, 200, 250)
+
+
+def test_replacing_an_entry_counts_its_size_once():
+    cache = ParseCache(250)
+    cache.put("a", sized(100))
+    cache.put("a", sized(150))
+    assert cache.stats()["bytes"] == 150
+
+
+def test_result_larger_than_the_cache_is_not_stored():
+    cache = ParseCache(100)
+    cache.put("a", sized(50))
+    cache.put("b", sized(101))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 0
+
+
+def test_size_estimate_grows_with_the_program():
+    small, large = (
+        parse_source(code, LineIndex(code)) for code in (repeated_program(1), repeated_program(3))
+    )
+    assert small.tree is not None and large.tree is not None
+    assert 0 < small.size < large.size
@@ -0,0 +1,55 @@
+"""The descent parser builds the LR parser's trees and rejects what it rejects"""
+import pytest
+
+from proj.models.descent_parser import DescentParser
+from proj.models.finallexer import Lexer
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.parser import parser_pool
+from proj.models.syntax_tree import NodeBuilder
+from proj.models.token_buffer import TokenBuffer
+from tests.support import ENGINE_EDGE_CASES, example_programs, generate_program
+
+PROGRAMS = ENGINE_EDGE_CASES + example_programs() + [
+    generate_program(seed, statements=6, mutations=seed % 4) for seed in range(2000)
+]
+
+
+def engine_trees(code, builder_class):
+    """The trees the LR and descent parsers build for `code`, the LR one None on a syntax error"""
+    buffer = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+    lex = buffer.feeder()
+    builder = builder_class()
+    with parser_pool.checkout(lex, None, builder) as parser:
+        try:
+            tree = builder.finish(parser.parser.parse(code, lexer=lex))
+        except Exception:
+            tree = None
+        if parser.parseErrorMessage:
+            tree = None
+    return tree, DescentParser(buffer, builder_class()).parse()
+
+
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_descent_parser_matches_lr_parser(code):
+    # Node trees compare with their lines and spans
+    expected, actual = engine_trees(code, NodeBuilder)
+    assert actual == expected
+    # Flat trees compare array by array, which also checks the nodes are
+    # built in the same order
+    expected, actual = engine_trees(code, FlatTreeBuilder)
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual.index == expected.index
+        assert actual.tree.columns == expected.tree.columns
+        assert actual.tree.pool == expected.tree.pool
+
+
+def test_generated_programs_are_valid_and_broken():
+    accepted = sum(engine_trees(code, NodeBuilder)[0] is not None for code in PROGRAMS)
+    assert 0.2 * len(PROGRAMS) < accepted < 0.8 * len(PROGRAMS)
+
+
+@pytest.mark.parametrize("code", ["if a < b < c x;", "x = ;", "begin end x;", "f(a)(b);"])
+def test_both_reject(code):
+    assert engine_trees(code, NodeBuilder) == (None, None)
@@ -0,0 +1,38 @@
+"""The left-recursive lists parse programs as the old grammar did"""
+import pytest
+
+from proj.models.parser import Parser
+from tests.grammars import RightRecursiveParser
+from tests.support import SAMPLE_PROGRAM, generate_program, parse_result, repeated_program
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_generated_program(seed):
+    code = generate_program(seed, statements=30, mutations=seed % 4)
+    expected_tree, expected_errors = parse_result(RightRecursiveParser, code)
+    actual_tree, actual_errors = parse_result(Parser, code)
+    if expected_errors:
+        # Recovering pops the statements a right-recursive list still holds
+        # on the stack, so the two only agree up to the first error
+        assert actual_errors[:1] == expected_errors[:1]
+    else:
+        assert (actual_tree, actual_errors) == (expected_tree, expected_errors)
+
+
+def test_long_statement_list():
+    per_copy = len(parse_result(Parser, SAMPLE_PROGRAM)[0].statements)
+    tree, errors = parse_result(Parser, repeated_program(500))
+    assert not errors
+    assert len(tree.statements) == 500 * per_copy
+    assert tree == parse_result(RightRecursiveParser, repeated_program(500))[0]
+
+
+def test_argument_and_parameter_order():
+    code = 'function f(a, b, c) return a; print("x", 1, f(1, 2, 3));'
+    tree, errors = parse_result(Parser, code)
+    assert not errors
+    function, printed = tree.statements
+    assert function.params == ["a", "b", "c"]
+    assert [item.value for item in printed.items[:2]] == ["x", 1]
+    assert [arg.value for arg in printed.items[2].args] == [1, 2, 3]
+    assert tree == parse_result(RightRecursiveParser, code)[0]
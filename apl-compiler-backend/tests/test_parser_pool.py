@@ -0,0 +1,46 @@
+"""Pooled parsers share the LR tables and come out of the pool reset"""
+from proj.models.finallexer import Lexer
+from proj.models.parser import ParserPool
+from proj.models.syntax_tree import NodeBuilder, to_json
+from tests.support import SAMPLE_PROGRAM, parse_tree
+
+
+def parse(parser, code):
+    lexer = Lexer.prebuilt().lexer
+    parser.reset(lexer)
+    return parser.parser.parse(code, lexer=lexer)
+
+
+def test_checkout_reuses_the_last_returned_parser():
+    pool = ParserPool(2)
+    pool.warm()
+    lexer = Lexer.prebuilt().lexer
+    with pool.checkout(lexer) as first:
+        pass
+    with pool.checkout(lexer) as again:
+        assert again is first
+
+
+def test_checkout_resets_the_error_state():
+    pool = ParserPool(1)
+    with pool.checkout(Lexer.prebuilt().lexer) as parser:
+        parse(parser, "let a = ;")
+        assert parser.parseErrorMessage
+    with pool.checkout(Lexer.prebuilt().lexer) as reused:
+        assert reused is parser
+        assert (reused.parseError, reused.parseErrorMessage) == (False, [])
+        tree = reused.parser.parse(SAMPLE_PROGRAM, lexer=reused.lexer)
+        assert reused.parseErrorMessage == []
+    assert to_json(tree) == to_json(parse_tree(SAMPLE_PROGRAM, NodeBuilder()))
+
+
+def test_busy_pool_lends_extra_parsers_without_growing():
+    pool = ParserPool(1)
+    pool.warm()
+    lexer = Lexer.prebuilt().lexer
+    with pool.checkout(lexer) as first, pool.checkout(lexer) as second:
+        assert second is not first
+        # Parsers copy the tables built once per process, not rebuild them
+        assert second.parser.action is first.parser.action
+        assert second.parser.errorfunc.__self__ is second
+    assert pool._idle.qsize() == 1
@@ -0,0 +1,134 @@
+"""Reparsing after an edit builds the tree and boundaries a full parse does"""
+import random
+
+import pytest
+
+from proj import config
+from proj.models.finallexer import Lexer
+from proj.models.line_index import LineIndex
+from proj.models.reparser import reparse
+from proj.services.compiler_service import parse_document, parse_source
+from tests.support import buffer_columns, descent_result, generate_program, random_source_edit, repeated_program
+
+SEEDS = 300
+EDITS = 8
+
+
+def chained_edits(seed, lexer):
+    """Reparse `EDITS` random edits of a generated program, one after the other.
+
+    Yields what became of each edit: "reparsed", "declined" (a full parse
+    is needed, as when the edit reaches the first token), "rejected" (the
+    edited program has a syntax error, which reparse rightly refuses) or
+    "broken" with what went wrong. An edit leaving a syntax error is undone
+    before the next one.
+    """
+    rng = random.Random(seed)
+    previous = None
+    while previous is None:
+        code = generate_program(rng.random(), statements=rng.randint(1, 12))
+        previous = descent_result(code, lexer)
+    for _ in range(EDITS):
+        offset, deleted, inserted = random_source_edit(rng, code)
+        edited = code[:offset] + inserted + code[offset + deleted:]
+        expected = descent_result(edited, lexer)
+        result = reparse(previous, edited, lexer)
+        if expected is None:
+            yield ("rejected",) if result is None else ("broken", "accepted a syntax error", edited)
+            continue
+        if result is None:
+            if offset <= previous.buffer.ends[0] or not previous.tree.statements:
+                yield ("declined",)
+            else:
+                yield ("broken", "declined an edit after the first token", edited)
+            result = expected
+        elif result.tree != expected.tree:
+            yield ("broken", "tree", edited)
+        elif result.boundaries != expected.boundaries:
+            yield ("broken", "boundaries", edited)
+        elif buffer_columns(result.buffer) != buffer_columns(expected.buffer):
+            yield ("broken", "tokens", edited)
+        else:
+            yield ("reparsed",)
+        code, previous = edited, result
+
+
+@pytest.fixture(scope="module")
+def outcomes():
+    lexer = Lexer.prebuilt().lexer
+    found = {"reparsed": 0, "declined": 0, "rejected": 0, "broken": []}
+    for seed in range(SEEDS):
+        for outcome in chained_edits(seed, lexer):
+            if outcome[0] == "broken":
+                found["broken"].append((seed, *outcome[1:]))
+            else:
+                found[outcome[0]] += 1
+    return found
+
+
+def test_reparse_matches_full_parse(outcomes):
+    assert outcomes["broken"] == []
+
+
+def test_reparse_rarely_declines(outcomes):
+    # Only edits reaching the first token of a program are declined
+    valid = outcomes["reparsed"] + outcomes["declined"]
+    assert outcomes["reparsed"] > 0
+    assert outcomes["declined"] <= valid // 100
+
+
+@pytest.mark.parametrize("where", ["start", "middle", "end"])
+@pytest.mark.parametrize("name", ["count", "counter"])
+def test_renamed_variable(where, name):
+    lexer = Lexer.prebuilt().lexer
+    code = repeated_program(20)
+    offset = {
+        "start": code.index("total - 1"),
+        "middle": code.index("total - 1", len(code) // 2),
+        "end": code.rindex("total - 1"),
+    }[where]
+    edited = code[:offset] + name + code[offset + 5:]
+    result = reparse(descent_result(code, lexer), edited, lexer)
+    assert result is not None
+    assert result.tree == descent_result(edited, lexer).tree
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    def use(name):
+        monkeypatch.setattr(config, "PARSER_ENGINE", name)
+    return use
+
+
+@pytest.mark.parametrize("name", ["lr", "table", "descent"])
+def test_document_versions_parse_like_sources(engine, name):
+    engine(name)
+    code = repeated_program(20)
+    edited = code.replace("total - 1", "count", 1)
+    document = f"test-{name}"
+    parse_document(document, code, LineIndex(code))
+    parsed = parse_document(document, edited, LineIndex(edited))
+    expected = parse_source(edited, LineIndex(edited))
+    assert parsed.tree == expected.tree
+    assert parsed.errors == expected.errors
+    assert parsed.boundaries == expected.boundaries
+    assert buffer_columns(parsed.buffer) == buffer_columns(expected.buffer)
+
+
+def test_document_keeps_statements_before_the_edit_under_descent(engine):
+    engine("descent")
+    code = repeated_program(20)
+    edited = code[:code.rindex("total - 1")] + "count" + code[code.rindex("total - 1") + 5:]
+    first = parse_document("test-kept", code, LineIndex(code))
+    second = parse_document("test-kept", edited, LineIndex(edited))
+    assert second.tree.statements[0] is first.tree.statements[0]
+
+
+def test_document_parses_whole_under_lr(engine):
+    engine("lr")
+    code = repeated_program(20)
+    edited = code.replace("total - 1", "count", 1)
+    first = parse_document("test-whole", code, LineIndex(code))
+    second = parse_document("test-whole", edited, LineIndex(edited))
+    assert second.boundaries is None
+    assert second.tree.statements[-1] is not first.tree.statements[-1]
@@ -0,0 +1,47 @@
+"""Shared trees read, interpret and encode like node trees"""
+import concurrent.futures
+import multiprocessing
+
+import pytest
+
+from proj.models import tree_codec
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.syntax_tree import NodeBuilder, to_json
+from tests.support import SAMPLE_PROGRAM, generate_program, parse_tree, repeated_program
+
+
+def interpreted(tree):
+    """What the semantic analyzer makes of `tree`: its results and errors, or the exception"""
+    analyzer = SemanticAnalyzer()
+    try:
+        analyzer.interpret(tree)
+    except Exception as e:
+        return repr(e)
+    return analyzer.compile_results, analyzer.semantic_errors
+
+
+def sample_digest():
+    return parse_tree(SAMPLE_PROGRAM, SharedTreeBuilder()).digest
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_shared_trees_match_node_trees(seed):
+    code = generate_program(seed, statements=40)
+    nodes, shared = parse_tree(code, NodeBuilder()), parse_tree(code, SharedTreeBuilder())
+    assert to_json(shared) == to_json(nodes)
+    assert interpreted(shared) == interpreted(nodes)
+    assert tree_codec.encode(shared) == tree_codec.encode(nodes)
+
+
+def test_digests_depend_on_structure_alone():
+    copies = parse_tree(repeated_program(3), SharedTreeBuilder()).statements
+    per_copy = len(copies) // 3
+    assert [s.digest for s in copies[:per_copy]] == [s.digest for s in copies[per_copy:2 * per_copy]]
+    assert len({s.digest for s in copies[:per_copy]}) > 1
+
+
+def test_digests_equal_across_processes():
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        assert pool.submit(sample_digest).result() == sample_digest()
@@ -0,0 +1,36 @@
+"""One TokenBuffer serves the token report and the parser as lexing twice did"""
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.line_index import LineIndex
+from proj.models.parser import parser_pool
+from proj.models.syntax_tree import to_json
+from proj.services.compiler_service import parse_source
+from tests.support import SAMPLE_PROGRAM, generate_program
+
+SOURCES = [
+    SAMPLE_PROGRAM,
+    SAMPLE_PROGRAM * 20,
+    generate_program(5, statements=40),
+    generate_program(6, statements=40, mutations=2),
+    "let a = 1 @ 2;\nprint(a $);",
+]
+
+
+def lexed_twice(code, line_index):
+    """The legacy report and parse from before: a lexer for each"""
+    report = Lexer.prebuilt().analyze_tokens(code, line_index)
+    lex = Lexer.prebuilt().lexer
+    with parser_pool.checkout(lex, line_index) as parser:
+        tree = parser.parser.parse(code, lexer=lex)
+        return report, to_json(tree), parser.parseErrorMessage
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_lexed_once_as_twice(code):
+    line_index = LineIndex(code)
+    report, tree, errors = lexed_twice(code, line_index)
+    parsed = parse_source(code, line_index, descent=False)
+    assert parsed.buffer.legacy_report(line_index) == report
+    assert to_json(parsed.tree) == tree
+    assert parsed.errors == errors
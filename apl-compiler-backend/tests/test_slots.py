@@ -0,0 +1,72 @@
+"""Variables in frame slots behave as the analyzer's scope dicts do
+
+The scope dicts of the tree interpreter are the reference: the first test
+pins what they give for each edge case, the second that the VM agrees.
+"""
+import pytest
+
+from proj.models import vm
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.shared_tree import SharedTreeBuilder
+from proj.models.syntax_tree import NodeBuilder
+from tests.support import SCOPE_EDGE_CASES, analyzed, parse_tree
+
+BUILDERS = [NodeBuilder, FlatTreeBuilder, SharedTreeBuilder]
+
+# What the tree interpreter prints and reports for each of SCOPE_EDGE_CASES,
+# and how many scopes it leaves open
+SCOPE_RESULTS = [
+    (['11', '2'], [], 1),
+    (['1', '0', '5', '1'], [], 1),
+    (['None'], [
+        "🧠💥Variable 'm' is not defined at line 1",
+        "🧠💥Variable 'm' does not have a value at line 1",
+    ], 1),
+    ([], [
+        "🧠💥Variable 'a' already declared in current scope at line 1",
+    ], 1),
+    (['1'], [
+        "🧠💥Variable 'a' already declared in current scope at line 1",
+    ], 1),
+    (['5'], [], 1),
+    ([], [
+        "🧠💥Variable 'local' already declared in current scope at line 1",
+    ], 1),
+    (['None'], [], 1),
+    (['None'], [
+        "🧠💥Variable 'nope' is not defined at line 1",
+        "🧠💥Variable 'nope' does not have a value at line 1",
+    ], 1),
+    (['100', '100', '100', '100', '1'], [], 1),
+    (['None'], [
+        "🧠💥Cannot perform binary operation '*' on strings at line 1",
+        "🧠💥Invalid operands for binary operation '+' at line 1",
+        "🧠💥Function 'f' expects 1 arguments, got 2 at line 1",
+        "🧠💥Cannot perform binary operation '*' on strings at line 1",
+        "🧠💥Invalid operands for binary operation '+' at line 1",
+    ], 1),
+    (['5'], [
+        "🧠💥Variable 'q' is not defined at line 1",
+    ], 2),
+    ([], [], 2),
+    (['1', '2', '1'], [], 1),
+    (['1', '2', '3', '4', '4'], [], 1),
+    (['0', '10', '10', '20'], [], 1),
+    (['1'], [], 1),
+]
+
+
+@pytest.mark.parametrize("builder_class", BUILDERS, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("code, expected", list(zip(SCOPE_EDGE_CASES, SCOPE_RESULTS)), ids=range(len(SCOPE_EDGE_CASES)))
+def test_scope_dicts(code, expected, builder_class):
+    analyzer = SemanticAnalyzer()
+    analyzer.interpret(parse_tree(f"begin {code} end", builder_class()))
+    assert (analyzer.compile_results, analyzer.semantic_errors, len(analyzer.scope_stack)) == expected
+
+
+@pytest.mark.parametrize("builder_class", BUILDERS, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("code", SCOPE_EDGE_CASES, ids=range(len(SCOPE_EDGE_CASES)))
+def test_slots_match_scope_dicts(code, builder_class):
+    tree = parse_tree(f"begin {code} end", builder_class())
+    assert analyzed(tree, vm.run) == analyzed(tree, SemanticAnalyzer.interpret)
@@ -0,0 +1,44 @@
+"""Slotted nodes send and run as the tuple tree they replace did"""
+import json
+
+import pytest
+
+from proj.models.parser import Parser
+from proj.models.semantics import SemanticAnalyzer
+from proj.models.syntax_tree import NODE_TYPES, BinOp, NodeBuilder, to_json
+from tests.support import SAMPLE_PROGRAM, as_tuples, generate_program, parse_result, parse_tree
+
+PROGRAMS = [SAMPLE_PROGRAM] + [generate_program(seed, statements=40) for seed in range(100)]
+
+
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_parse_tree_json_is_the_tuple_form(code):
+    tree = parse_tree(code, NodeBuilder())
+    assert json.dumps(to_json(tree)) == json.dumps(as_tuples(tree))
+
+
+def test_to_json():
+    tree = parse_tree("let a = 1 + 2;", NodeBuilder())
+    assert to_json(tree) == [
+        "program", [["declare", "a", ["binop", "+", ["literal", 1, 1], ["literal", 2, 1], 1], 1]], 0,
+    ]
+
+
+def test_nodes_are_slotted():
+    node = parse_tree("let a = 1 + 2;", NodeBuilder()).statements[0].value
+    assert type(node) is BinOp
+    assert not hasattr(node, "__dict__")
+    assert (node.op, node.line, node.lexpos, node.endlexpos) == ("+", 1, 8, 13)
+    # A node's kind is its index in NODE_TYPES, which the analyzer dispatches on
+    assert NODE_TYPES[node.kind] is BinOp
+
+
+def test_sample_program_runs():
+    analyzer = SemanticAnalyzer()
+    analyzer.interpret(parse_result(Parser, SAMPLE_PROGRAM)[0])
+    assert analyzer.semantic_errors == []
+    assert analyzer.compile_results == [
+        "Loop index: 1", "Loop index: 2", "Loop index: 3", "Loop index: 4", "Loop index: 5",
+        "After adding 10 and 20 The result is: 500110",
+        "Result of recursive function: Limit reached",
+    ]
@@ -0,0 +1,66 @@
+"""The table driver gives PLY's trees, spans and error messages"""
+import random
+
+import pytest
+
+from proj.models import tree_codec
+from proj.models.finallexer import Lexer
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.line_index import LineIndex
+from proj.models.parser import parser_pool
+from proj.models.syntax_tree import NodeBuilder
+from proj.models.table_parser import TableParser
+from proj.models.token_buffer import TokenBuffer
+from tests.support import ENGINE_EDGE_CASES, example_programs, generate_program
+
+# Words strung together at random, for programs broken in every way error recovery can meet
+SOUP_WORDS = [
+    "x", "f", "=", ";", ",", "(", ")", "+", "*", "<", "1", "2.5", '"s"', "true", "begin", "end",
+    "let", "if", "else", "for", "to", "step", "while", "and", "not", "print", "function",
+    "return", "set", "is", "then",
+]
+
+
+def token_soup(seed):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(SOUP_WORDS) for _ in range(rng.randint(0, 40)))
+
+
+PROGRAMS = ENGINE_EDGE_CASES + example_programs() + [
+    generate_program(seed, statements=20, mutations=seed % 4) for seed in range(1000)
+] + [token_soup(seed) for seed in range(1000)]
+
+
+def lr_result(code, buffer, builder):
+    """The tree and error messages PLY's LR parser gives for `code`, lexed into `buffer`"""
+    lex = buffer.feeder()
+    with parser_pool.checkout(lex, LineIndex(code), builder) as parser:
+        tree = builder.finish(parser.parser.parse(code, lexer=lex))
+        return tree, list(parser.parseErrorMessage)
+
+
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+@pytest.mark.parametrize("builder_class", [NodeBuilder, FlatTreeBuilder], ids=lambda cls: cls.__name__)
+def test_table_parser_matches_ply(code, builder_class):
+    # On broken programs error recovery has to resume at the same tokens
+    # for the partial trees and later messages to come out the same
+    buffer = TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+    expected, errors = lr_result(code, buffer, builder_class())
+    parser = TableParser(buffer, builder_class(), LineIndex(code))
+    actual = parser.parse()
+    assert parser.errors == errors
+    if expected is None:
+        assert actual is None
+    else:
+        assert tree_codec.encode(actual) == tree_codec.encode(expected)
+
+
+def test_reports_every_error():
+    code = "let a = 1;\nlet b = ;\nprint(a);\nlet c = * 2;\nprint(c);"
+    parser = TableParser(TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code), NodeBuilder(), LineIndex(code))
+    tree = parser.parse()
+    assert [error.split(":")[0] for error in parser.errors] == [
+        "❌ Syntax error at line 2, column 9",
+        "❌ Syntax error at line 4, column 9",
+    ]
+    assert [statement.tag for statement in tree.statements] == ["declare", "print", "print"]
@@ -0,0 +1,73 @@
+"""Token buffers hold what the lexer's tokens did, and feed the parser like the lexer"""
+import pytest
+
+from proj.models.finallexer import Lexer
+from proj.models.parser import parser_pool
+from proj.models.syntax_tree import NodeBuilder, to_json
+from proj.models.token_buffer import TokenBuffer
+from tests.support import SAMPLE_PROGRAM, generate_program, token_tuples
+
+SOURCES = [
+    SAMPLE_PROGRAM,
+    generate_program(3, statements=40),
+    'let s = "tab\\t and \\"quote\\""; let f = 2.50; let n = 007;\nprint(s, f, n);',
+]
+
+
+def lexed(code):
+    return TokenBuffer.from_lexer(Lexer.prebuilt().lexer, code)
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_columns_hold_the_lexer_tokens(code):
+    buffer = lexed(code)
+    expected = token_tuples(Lexer.prebuilt().lexer, code)
+    assert [
+        (buffer.type(i), buffer.value(i), buffer.lines[i], buffer.starts[i]) for i in range(len(buffer))
+    ] == expected
+    # Values convert to the lexer's types, not just equal values
+    assert [type(buffer.value(i)) for i in range(len(buffer))] == [type(value) for _, value, _, _ in expected]
+    assert [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in buffer] == expected
+
+
+def test_columns_are_typed_arrays():
+    buffer = lexed("let a = 1.5;")
+    assert [column.typecode for column in (buffer.types, buffer.starts, buffer.ends, buffer.lines)] == [
+        "B", "I", "I", "I",
+    ]
+    assert [buffer.text(i) for i in range(len(buffer))] == ["let", "a", "=", "1.5", ";"]
+    assert list(buffer.ends) == [3, 5, 7, 11, 12]
+    assert buffer.lex_token(3).endlexpos == 11
+
+
+def test_feeder_follows_the_lexer_protocol():
+    code = "let a = 1;\nprint(a);"
+    buffer = lexed(code)
+    feeder = buffer.feeder()
+    seen = []
+    tok = feeder.token()
+    while tok is not None:
+        # lexpos and lineno are left as the lexer leaves them after a token
+        seen.append((tok.type, tok.value, tok.lineno, tok.lexpos, feeder.lexpos, feeder.lineno))
+        tok = feeder.token()
+    assert seen == [
+        ("KEYWORD_LET", "let", 1, 0, 3, 1), ("IDENTIFIER", "a", 1, 4, 5, 1),
+        ("ASSIGNMENT_OP", "=", 1, 6, 7, 1), ("INTEGER", 1, 1, 8, 9, 1), ("SEMICOLON", ";", 1, 9, 10, 1),
+        ("KEYWORD_PRINT", "print", 2, 11, 16, 2),
+        ("LPAREN", "(", 2, 16, 17, 2), ("IDENTIFIER", "a", 2, 17, 18, 2), ("RPAREN", ")", 2, 18, 19, 2),
+        ("SEMICOLON", ";", 2, 19, 20, 2),
+    ]
+    assert feeder.token() is None
+    # input() starts over, whatever source it is given
+    feeder.input("ignored")
+    assert [tok.lexpos for tok in feeder] == [row[3] for row in seen]
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_parser_reads_the_feeder_like_the_lexer(code):
+    trees = []
+    for lex in (lexed(code).feeder(), Lexer.prebuilt().lexer):
+        builder = NodeBuilder()
+        with parser_pool.checkout(lex, None, builder) as parser:
+            trees.append(to_json(builder.finish(parser.parser.parse(code, lexer=lex))))
+    assert trees[0] == trees[1]
@@ -0,0 +1,59 @@
+"""The structured token report and the legacy one describe the same tokens"""
+import re
+
+import pytest
+
+from proj.models.line_index import LineIndex
+from proj.services.compiler_service import token_fields, tokenize
+from tests.support import SAMPLE_PROGRAM, generate_program
+
+SOURCES = [SAMPLE_PROGRAM, generate_program(4, statements=40), "let a = 1;\r\n\tprint(a);\n"]
+
+
+def test_structured_report():
+    code = "let a = 1;\n  print(a);"
+    fields = token_fields(tokenize(code), LineIndex(code), "structured")
+    assert fields == {
+        "tokens": {
+            "type": [
+                "KEYWORD_LET", "IDENTIFIER", "ASSIGNMENT_OP", "INTEGER", "SEMICOLON",
+                "KEYWORD_PRINT", "LPAREN", "IDENTIFIER", "RPAREN", "SEMICOLON",
+            ],
+            "value": ["let", "a", "=", 1, ";", "print", "(", "a", ")", ";"],
+            "line": [1, 1, 1, 1, 1, 2, 2, 2, 2, 2],
+            "col": [1, 5, 7, 9, 10, 3, 8, 9, 10, 11],
+        },
+        "sourceLines": ["let a = 1;", "  print(a);"],
+    }
+
+
+def test_legacy_report():
+    code = "let a = 1;\n  print(a);"
+    fields = token_fields(tokenize(code), LineIndex(code), "legacy")
+    assert list(fields) == ["tokens"]
+    assert fields["tokens"][:6] == [
+        "LexToken(KEYWORD_LET,'let',1,0)", "  Line 1: let a = 1;", "  Column 1: ^",
+        "LexToken(IDENTIFIER,'a',1,4)", "  Line 1: let a = 1;", "  Column 5:     ^",
+    ]
+    assert fields["tokens"][-3:] == [
+        "LexToken(SEMICOLON,';',2,21)", "  Line 2:   print(a);", "  Column 11:           ^",
+    ]
+
+
+@pytest.mark.parametrize("code", SOURCES, ids=range(len(SOURCES)))
+def test_formats_agree(code):
+    buffer, line_index = tokenize(code), LineIndex(code)
+    tokens = token_fields(buffer, line_index, "structured")["tokens"]
+    legacy = token_fields(buffer, line_index, "legacy")["tokens"]
+    # Every token has its three strings: the LexToken, its line and its column
+    assert len(legacy) == 3 * len(tokens["type"])
+    parsed = [
+        (match[1], int(match[2]), int(re.match(r"  Column (\d+):", column)[1]))
+        for match, column in zip(
+            (re.fullmatch(r"LexToken\((\w+),'.*',(\d+),\d+\)", line, re.S) for line in legacy[::3]),
+            legacy[2::3],
+        )
+    ]
+    assert parsed == list(zip(tokens["type"], tokens["line"], tokens["col"]))
+    source_lines = token_fields(buffer, line_index, "structured")["sourceLines"]
+    assert legacy[1::3] == [f"  Line {line}: {source_lines[line - 1]}" for line in tokens["line"]]
@@ -0,0 +1,39 @@
+"""Streaming a source in chunks gives the tokens of lexing it whole"""
+import io
+
+import pytest
+
+from proj.models.regexlexer import RegexLexer
+from tests.support import SAMPLE_PROGRAM, generate_corpus, token_tuples
+
+CHUNK_SIZES = (1, 2, 3, 7, 64, 4096)
+
+
+def streamed(lexer, source, chunk_size=None):
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer.stream(source, chunk_size)]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_chunked_stream_matches_whole_lex(seed):
+    code = generate_corpus(seed, fragments=150)
+    whole = RegexLexer.prebuilt()
+    expected = token_tuples(whole.lexer, code)
+    for chunk_size in CHUNK_SIZES:
+        lexer = RegexLexer.prebuilt()
+        assert streamed(lexer, io.StringIO(code), chunk_size) == expected, f"chunk size {chunk_size}"
+        assert lexer.lexer.lineno == whole.lexer.lineno
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_tokens_held_back_at_chunk_ends(chunk_size):
+    # "1." may continue as "1.5", and a string or comment may end in a later chunk
+    code = 'let x = 1.5; let s = "a;b"; /* c\n d */ x = 12.25;'
+    expected = token_tuples(RegexLexer.prebuilt().lexer, code)
+    assert streamed(RegexLexer.prebuilt(), io.StringIO(code), chunk_size) == expected
+
+
+def test_stream_from_file(tmp_path):
+    path = tmp_path / "program.apl"
+    path.write_bytes((SAMPLE_PROGRAM * 3).replace("\n", "\r\n").encode("utf-8"))
+    code = path.read_bytes().decode("utf-8")
+    assert streamed(RegexLexer.prebuilt(), str(path), 100) == token_tuples(RegexLexer.prebuilt().lexer, code)
@@ -0,0 +1,32 @@
+"""Trees survive the binary encoding, as nodes and flat"""
+import pytest
+
+from proj.models import tree_codec
+from proj.models.flat_tree import FlatTreeBuilder
+from proj.models.syntax_tree import NodeBuilder, to_json
+from tests.support import SAMPLE_PROGRAM, example_programs, generate_program, parse_tree
+
+PROGRAMS = example_programs() + [generate_program(seed, statements=30) for seed in range(300)]
+
+
+@pytest.mark.parametrize("code", PROGRAMS, ids=range(len(PROGRAMS)))
+def test_trees_round_trip(code):
+    tree = parse_tree(code, NodeBuilder())
+    data = tree_codec.encode(tree)
+    assert tree_codec.decode(data) == tree
+    flat = tree_codec.decode(data, FlatTreeBuilder())
+    assert to_json(flat) == to_json(tree)
+    assert tree_codec.encode(flat) == data
+
+
+def test_rejects_other_data():
+    data = tree_codec.encode(parse_tree(SAMPLE_PROGRAM, NodeBuilder()))
+    with pytest.raises(ValueError, match="Not an encoded syntax tree"):
+        tree_codec.decode(b"{}" + data)
+    with pytest.raises(ValueError, match="truncated"):
+        tree_codec.decode(data[:-3])
+    with pytest.raises(ValueError, match="bytes after"):
+        tree_codec.decode(data + b"\0")
+    newer = tree_codec.MAGIC + bytes([tree_codec.FORMAT_VERSION + 1]) + data[len(tree_codec.MAGIC) + 1:]
+    with pytest.raises(ValueError, match="format version"):
+        tree_codec.decode(newer)